@@ -0,0 +1,99 @@
+"""Benchmark JSON encode/decode time for a full 500-order bulk batch.
+
+Compares what ``requests`` did for us before (``json.dumps`` to a str
+that is then encoded, and ``response.json()`` decoding the body to a str
+before parsing) with every installed ``JSONCodec``.
+
+Usage:
+    python -m benchmarks.bench_codec [--orders N] [--repeat N]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from steadfast.codec import CODEC_NAMES, get_codec
+from steadfast.exceptions import ConfigurationError
+
+
+def make_batch(count: int) -> Dict[str, Any]:
+    """Build a create_bulk_order payload of ``count`` realistic orders."""
+    return {
+        "orders": [
+            {
+                "invoice": f"ORD-2026-{i:06d}",
+                "recipient_name": f"Customer {i}",
+                "recipient_phone": "01712345678",
+                "recipient_address": f"House {i}, Road 5, Dhanmondi, Dhaka",
+                "cod_amount": 1000.0 + i,
+                "delivery_type": i % 2,
+                "note": "Call before delivery",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+def make_response(batch: Dict[str, Any]) -> bytes:
+    """Build the matching create_bulk_order response body."""
+    results = [
+        dict(
+            order,
+            consignment_id=100000 + i,
+            tracking_code=f"SFR{100000 + i}",
+            status="success",
+        )
+        for i, order in enumerate(batch["orders"])
+    ]
+    return json.dumps({"results": results}).encode()
+
+
+def measure(label: str, func: Callable[[], Any], repeat: int) -> float:
+    """Run ``func`` ``repeat`` times and print the best time in milliseconds."""
+    func()  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best * 1000:9.3f} ms")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    batch = make_batch(args.orders)
+    body = make_response(batch)
+    print(f"request {len(json.dumps(batch)):,} bytes, response {len(body):,} bytes")
+
+    baseline: List[float] = [
+        measure(
+            "encode requests/json",
+            lambda: json.dumps(batch, allow_nan=False).encode("utf-8"),
+            args.repeat,
+        ),
+        measure(
+            "decode requests/json",
+            lambda: json.loads(body.decode("utf-8")),
+            args.repeat,
+        ),
+    ]
+
+    for name in CODEC_NAMES:
+        try:
+            codec = get_codec(name)
+        except ConfigurationError:
+            print(f"{name:<28} not installed")
+            continue
+        encode = measure(f"encode {name}", lambda: codec.dumps(batch), args.repeat)
+        decode = measure(f"decode {name}", lambda: codec.loads(body), args.repeat)
+        print(f"{name:<28} {sum(baseline) / (encode + decode):9.2f}x faster round trip")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark per-request latency with and without connection pooling.
+
+Starts a local HTTP/1.1 stand-in for the Steadfast API and compares the
+old one-connection-per-call path (``requests.request``) with the pooled
+``HTTPClient`` session.
+
+Usage:
+    python -m benchmarks.bench_connection_pool [--requests N]
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Tuple
+
+import requests
+
+from steadfast.http_client import HTTPClient
+
+BALANCE_BODY = json.dumps({"status": 200, "current_balance": 5000.5}).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive handler that answers every GET with a balance."""
+
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment so keep-alive connections are
+    # not penalised by Nagle/delayed-ACK interaction.
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BALANCE_BODY)))
+        self.end_headers()
+        self.wfile.write(BALANCE_BODY)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def start_server() -> Tuple[ThreadingHTTPServer, str]:
+    """Start the stand-in server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}"
+
+
+def measure(label: str, call: Callable[[], Any], count: int) -> float:
+    """Run ``call`` ``count`` times and print the mean latency in ms."""
+    call()  # warm up
+    start = time.perf_counter()
+    for _ in range(count):
+        call()
+    elapsed = time.perf_counter() - start
+    per_request_ms = elapsed / count * 1000
+    print(f"{label:<28} {per_request_ms:8.3f} ms/request")
+    return per_request_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server, base_url = start_server()
+    try:
+        url = f"{base_url}/get_balance"
+        unpooled = measure(
+            "requests.request (no pool)",
+            lambda: requests.request("GET", url, timeout=5).json(),
+            args.requests,
+        )
+        with HTTPClient(base_url=base_url, timeout=5) as client:
+            pooled = measure(
+                "HTTPClient (pooled session)",
+                lambda: client.get("/get_balance"),
+                args.requests,
+            )
+        print(f"speedup: {unpooled / pooled:.2f}x")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark memory per instance of the slotted high-volume models.
+
+Compares each model as a plain ``@dataclass`` with a per-instance
+``__dict__`` (as before) with the slotted model and its frozen variant,
+holding ``--count`` instances at once.
+
+Usage:
+    python -m benchmarks.bench_models [--count N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+from steadfast.models import (
+    BulkOrderResult,
+    FrozenBulkOrderResult,
+    FrozenOrder,
+    FrozenOrderStatus,
+    FrozenPayment,
+    FrozenPoliceStation,
+    FrozenReturnRequest,
+    Order,
+    OrderStatus,
+    Payment,
+    PoliceStation,
+    ReturnRequest,
+)
+
+
+def dict_based(model: type) -> type:
+    """Rebuild a model as a plain dataclass with a per-instance __dict__."""
+    return make_dataclass(
+        f"Dict{model.__name__}", [(f.name, f.type) for f in fields(model)]
+    )
+
+
+def sample_values(i: int) -> Dict[type, Tuple[Any, ...]]:
+    """Return realistic constructor arguments for every model."""
+    invoice = f"ORD-2026-{i:06d}"
+    address = f"House {i}, Road 5, Dhanmondi, Dhaka"
+    return {
+        Order: (i, invoice, f"SFR{i}", "Customer", "01712345678", address, 1000.0)
+        + ("in_review", None, None, None),
+        BulkOrderResult: (invoice, "Customer", address, "01712345678", 1000.0)
+        + (None, i, f"SFR{i}", "success", None),
+        OrderStatus: (200, "delivered"),
+        ReturnRequest: (i, 7, i, "Damaged", "pending", None, None),
+        Payment: (i, 1000.0, None, None),
+        PoliceStation: (i, "Dhanmondi", "Dhaka"),
+    }
+
+
+def bytes_per_instance(factory: Callable[[int], Any], count: int) -> float:
+    """Return traced bytes per instance while ``count`` are held at once."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held: List[Any] = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / count
+
+
+def measure_overhead(values: List[Dict[type, Tuple[Any, ...]]], count: int) -> float:
+    """Return bytes per item of the holding list itself."""
+    return bytes_per_instance(lambda i: values[i], count)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    variants = [
+        (Order, FrozenOrder),
+        (BulkOrderResult, FrozenBulkOrderResult),
+        (OrderStatus, FrozenOrderStatus),
+        (ReturnRequest, FrozenReturnRequest),
+        (Payment, FrozenPayment),
+        (PoliceStation, FrozenPoliceStation),
+    ]
+    values = [sample_values(i) for i in range(args.count)]
+    # The list holding the instances is the same for every variant
+    baseline = measure_overhead(values, args.count)
+
+    print(f"{'model':<18} {'dict':>10} {'slots':>10} {'frozen':>10}  bytes/instance")
+    for model, frozen in variants:
+        sizes = [
+            bytes_per_instance(lambda i: cls(*values[i][model]), args.count) - baseline
+            for cls in (dict_based(model), model, frozen)
+        ]
+        saving = 1 - sizes[1] / sizes[0]
+        print(
+            f"{model.__name__:<18} {sizes[0]:10.0f} {sizes[1]:10.0f} "
+            f"{sizes[2]:10.0f}  ({saving:.0%} smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark order validation throughput.
+
+Compares the previous per-field path (string patterns passed to ``re`` on
+every call, a list built per delivery type check, one validator call per
+field) with the compiled single-pass ``validate_order``.
+
+Usage:
+    python -m benchmarks.bench_validators [--orders N] [--repeat N]
+"""
+
+import argparse
+import re
+import time
+from typing import Any, Callable, Dict, List
+
+from steadfast.exceptions import ValidationError
+from steadfast.validators import validate_order
+
+
+def _legacy_invoice(value: str) -> str:
+    if not value or not isinstance(value, str):
+        raise ValidationError("Invoice cannot be empty", "invoice")
+    if not re.match(r"^[a-zA-Z0-9_-]+$", value):
+        raise ValidationError("Invalid invoice", "invoice")
+    return value.strip()
+
+
+def _legacy_phone(value: str) -> str:
+    if not value or not isinstance(value, str):
+        raise ValidationError("Phone number cannot be empty", "phone")
+    digits = re.sub(r"\D", "", value)
+    if len(digits) != 11:
+        raise ValidationError("Phone number must be exactly 11 digits", "phone")
+    return digits
+
+
+def _legacy_text(value: str, limit: int, field: str) -> str:
+    if not value or not isinstance(value, str):
+        raise ValidationError("Field cannot be empty", field)
+    stripped = value.strip()
+    if len(stripped) > limit:
+        raise ValidationError("Field too long", field)
+    return stripped
+
+
+def _legacy_cod_amount(value: Any) -> float:
+    amount = float(value)
+    if amount < 0:
+        raise ValidationError("COD amount cannot be negative", "cod_amount")
+    return amount
+
+
+def _legacy_delivery_type(value: int) -> int:
+    if value not in [0, 1]:
+        raise ValidationError("Invalid delivery type", "delivery_type")
+    return value
+
+
+def legacy_validate_order(**kwargs: Any) -> Dict[str, Any]:
+    """Order validation as it was before the single-pass validator."""
+    invoice = kwargs.get("invoice")
+    recipient_name = kwargs.get("recipient_name")
+    recipient_phone = kwargs.get("recipient_phone")
+    recipient_address = kwargs.get("recipient_address")
+    if not all([invoice, recipient_name, recipient_phone, recipient_address]):
+        raise ValidationError("Missing required fields")
+    if kwargs.get("cod_amount") is None:
+        raise ValidationError("COD amount is required", "cod_amount")
+
+    validated = {
+        "invoice": _legacy_invoice(str(invoice)),
+        "recipient_name": _legacy_text(str(recipient_name), 100, "recipient_name"),
+        "recipient_phone": _legacy_phone(str(recipient_phone)),
+        "recipient_address": _legacy_text(str(recipient_address), 250, "address"),
+        "cod_amount": _legacy_cod_amount(kwargs["cod_amount"]),
+        "delivery_type": _legacy_delivery_type(kwargs.get("delivery_type", 0)),
+    }
+    for field in ["note", "item_description", "total_lot"]:
+        if field in kwargs and kwargs[field] is not None:
+            validated[field] = kwargs[field]
+    return validated
+
+
+def make_orders(count: int) -> List[Dict[str, Any]]:
+    """Build ``count`` valid, realistic orders."""
+    return [
+        {
+            "invoice": f"ORD-2026-{i:06d}",
+            "recipient_name": f"Customer {i}",
+            "recipient_phone": "017-1234-5678",
+            "recipient_address": f"House {i}, Road 5, Dhanmondi, Dhaka",
+            "cod_amount": 1000 + i,
+            "delivery_type": i % 2,
+            "note": "Call before delivery",
+        }
+        for i in range(count)
+    ]
+
+
+def measure(
+    label: str,
+    validate: Callable[[Dict[str, Any]], Any],
+    orders: List[Dict[str, Any]],
+    repeat: int,
+) -> float:
+    """Validate every order ``repeat`` times and print orders per second."""
+    for order in orders[:100]:  # warm up
+        validate(order)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for order in orders:
+            validate(order)
+        best = min(best, time.perf_counter() - start)
+    rate = len(orders) / best
+    print(f"{label:<28} {rate:12,.0f} orders/s")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    orders = make_orders(args.orders)
+    before = measure(
+        "per-field (before)",
+        lambda order: legacy_validate_order(**order),
+        orders,
+        args.repeat,
+    )
+    after = measure("validate_order (after)", validate_order, orders, args.repeat)
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,4 +27,10 @@ setup(
         "requests>=2.28.0",
         "python-dotenv>=0.21.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.24.0"],
+        "pandas": ["pandas>=1.3.0", "numpy>=1.21.0"],
+        "fast": ["orjson>=3.6.0"],
+        "arrow": ["pyarrow>=8.0.0", "numpy>=1.21.0"],
+    },
 )
@@ -1,51 +1,126 @@
 """Steadfast Courier Python SDK."""
 
 from .client import SteadfastClient
+from .async_client import AsyncSteadfastClient
 from .exceptions import (
     SteadfastException,
     AuthenticationError,
     ValidationError,
+    DuplicateOrderError,
     NotFoundError,
     APIError,
     NetworkError,
+    CircuitOpenError,
     ConfigurationError,
 )
+from .batching import AsyncOrderBatcher, OrderBatcher
+from .cache import StatusCache
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .codec import JSONCodec, get_codec
+from .coalesce import RequestCoalescer
+from .columnar import BulkOrderColumns
+from .compression import RequestCompressor
+from .ledger import OrderLedger
+from .outbox import OrderOutbox
+from .pagination import AsyncPageIterator, PageIterator
+from .rate_limit import RateLimiter, RateLimit
+from .retry import Resend, RetryPolicy, RetryBudget
+from .readers import read_orders_csv, read_orders_jsonl
+from .frames import OrderErrorCode, validate_orders_frame
+from .watcher import AsyncStatusWatcher, PollingPolicy, StatusWatcher
 from .models import (
     Order,
     BulkOrderResult,
     BulkOrderResponse,
+    BulkChunkReport,
+    LedgerEntry,
+    OutboxEntry,
+    ValidationIssue,
+    RejectedOrder,
+    OrderValidationReport,
     OrderStatus,
+    StatusChange,
     Balance,
     ReturnRequest,
     ReturnRequestList,
     Payment,
     PaymentDetails,
+    PaymentFetch,
     PaymentList,
     PoliceStation,
     PoliceStationList,
+    FrozenOrder,
+    FrozenBulkOrderResult,
+    FrozenOrderStatus,
+    FrozenReturnRequest,
+    FrozenPayment,
+    FrozenPoliceStation,
 )
 
 __version__ = "0.3.0"
 
 __all__ = [
     "SteadfastClient",
+    "AsyncSteadfastClient",
     "SteadfastException",
     "AuthenticationError",
     "ValidationError",
+    "DuplicateOrderError",
     "NotFoundError",
     "APIError",
     "NetworkError",
+    "CircuitOpenError",
     "ConfigurationError",
+    "StatusCache",
+    "RequestCoalescer",
+    "RequestCompressor",
+    "JSONCodec",
+    "get_codec",
+    "OrderLedger",
+    "OrderOutbox",
+    "PageIterator",
+    "AsyncPageIterator",
+    "OrderBatcher",
+    "AsyncOrderBatcher",
+    "CircuitBreaker",
+    "CircuitState",
+    "RateLimiter",
+    "RateLimit",
+    "RetryPolicy",
+    "Resend",
+    "RetryBudget",
+    "read_orders_csv",
+    "read_orders_jsonl",
+    "OrderErrorCode",
+    "validate_orders_frame",
+    "StatusWatcher",
+    "AsyncStatusWatcher",
+    "PollingPolicy",
     "Order",
     "BulkOrderResult",
     "BulkOrderResponse",
+    "BulkOrderColumns",
+    "BulkChunkReport",
+    "LedgerEntry",
+    "OutboxEntry",
+    "ValidationIssue",
+    "RejectedOrder",
+    "OrderValidationReport",
     "OrderStatus",
+    "StatusChange",
     "Balance",
     "ReturnRequest",
     "ReturnRequestList",
     "Payment",
     "PaymentDetails",
+    "PaymentFetch",
     "PaymentList",
     "PoliceStation",
     "PoliceStationList",
+    "FrozenOrder",
+    "FrozenBulkOrderResult",
+    "FrozenOrderStatus",
+    "FrozenReturnRequest",
+    "FrozenPayment",
+    "FrozenPoliceStation",
 ]
@@ -0,0 +1,173 @@
+"""Asyncio Steadfast client for SDK."""
+
+from typing import Any, Optional
+from .async_http_client import AsyncHTTPClient
+from .client import _BaseSteadfastClient
+from .cache import StatusCache
+from .circuit_breaker import CircuitBreaker
+from .codec import JSONCodec
+from .coalesce import RequestCoalescer
+from .compression import RequestCompressor
+from .ledger import OrderLedger
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .modules.order import AsyncOrderModule
+from .modules.tracking import AsyncTrackingModule
+from .modules.balance import AsyncBalanceModule
+from .modules.return_request import AsyncReturnRequestModule
+from .modules.payment import AsyncPaymentModule
+from .modules.location import AsyncLocationModule
+
+
+class AsyncSteadfastClient(_BaseSteadfastClient):
+    """Asyncio client for Steadfast Courier API.
+
+    Mirrors SteadfastClient; every module method is awaitable. Use
+    ``asyncio.wait_for`` for per-call deadlines; cancelling the awaiting
+    task aborts the in-flight request.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        transport: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        status_cache: Optional[StatusCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        ledger: Optional[OrderLedger] = None,
+        codec: Optional[JSONCodec] = None,
+        compressor: Optional[RequestCompressor] = None,
+    ) -> None:
+        """Initialize async Steadfast client.
+
+        Args:
+            api_key: API key for authentication (or from .env)
+            secret_key: Secret key for authentication (or from .env)
+            base_url: Base URL for API (optional, defaults to production)
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts for failed requests
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Idle connections kept open for reuse
+            transport: Optional httpx transport (mainly for testing)
+            rate_limiter: Client-side rate limiter shared by all modules
+            retry_policy: Retry policy (overrides max_retries when given)
+            circuit_breaker: Per-endpoint circuit breaker
+            status_cache: Opt-in cache for tracking lookups
+            coalescer: Opt-in sharing of identical in-flight GET requests
+            ledger: Opt-in local record of created orders
+            codec: JSON codec for request and response bodies (defaults to
+                the fastest installed: orjson, ujson, then the stdlib)
+            compressor: Opt-in gzip compression of large request bodies
+
+        Raises:
+            ConfigurationError: If credentials are missing or httpx is not
+                installed
+        """
+        super().__init__(api_key, secret_key, base_url)
+        self._http_client = AsyncHTTPClient(
+            base_url=self._base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            transport=transport,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            coalescer=coalescer,
+            codec=codec,
+            compressor=compressor,
+        )
+
+        self._status_cache = status_cache
+        self._ledger = ledger
+        self._orders: Optional[AsyncOrderModule] = None
+        self._tracking: Optional[AsyncTrackingModule] = None
+        self._balance: Optional[AsyncBalanceModule] = None
+        self._returns: Optional[AsyncReturnRequestModule] = None
+        self._payments: Optional[AsyncPaymentModule] = None
+        self._locations: Optional[AsyncLocationModule] = None
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncSteadfastClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    @property
+    def orders(self) -> AsyncOrderModule:
+        """Get orders module.
+
+        Returns:
+            AsyncOrderModule instance
+        """
+        if self._orders is None:
+            self._orders = AsyncOrderModule(self._http_client, self._ledger)
+        return self._orders
+
+    @property
+    def tracking(self) -> AsyncTrackingModule:
+        """Get tracking module.
+
+        Returns:
+            AsyncTrackingModule instance
+        """
+        if self._tracking is None:
+            self._tracking = AsyncTrackingModule(self._http_client, self._status_cache)
+        return self._tracking
+
+    @property
+    def balance(self) -> AsyncBalanceModule:
+        """Get balance module.
+
+        Returns:
+            AsyncBalanceModule instance
+        """
+        if self._balance is None:
+            self._balance = AsyncBalanceModule(self._http_client)
+        return self._balance
+
+    @property
+    def returns(self) -> AsyncReturnRequestModule:
+        """Get return request module.
+
+        Returns:
+            AsyncReturnRequestModule instance
+        """
+        if self._returns is None:
+            self._returns = AsyncReturnRequestModule(self._http_client)
+        return self._returns
+
+    @property
+    def payments(self) -> AsyncPaymentModule:
+        """Get payment module.
+
+        Returns:
+            AsyncPaymentModule instance
+        """
+        if self._payments is None:
+            self._payments = AsyncPaymentModule(self._http_client)
+        return self._payments
+
+    @property
+    def locations(self) -> AsyncLocationModule:
+        """Get location module.
+
+        Returns:
+            AsyncLocationModule instance
+        """
+        if self._locations is None:
+            self._locations = AsyncLocationModule(self._http_client)
+        return self._locations
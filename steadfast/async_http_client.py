@@ -0,0 +1,335 @@
+"""Asyncio HTTP client for Steadfast SDK built on httpx."""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Any, Optional
+
+from .exceptions import (
+    APIError,
+    ConfigurationError,
+    NetworkError,
+    SteadfastException,
+)
+from .http_client import _BaseHTTPClient
+from .circuit_breaker import CircuitBreaker
+from .codec import JSONCodec
+from .coalesce import RequestCoalescer
+from .compression import RequestCompressor
+from .rate_limit import RateLimiter
+from .retry import Resend, RetryHookResult, RetryPolicy
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncHTTPClient(_BaseHTTPClient):
+    """Async HTTP client with a pooled connection set and retry logic.
+
+    Requests can be cancelled by cancelling the awaiting task; the
+    underlying connection is returned to the pool by httpx.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_backoff: float = 0.3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        transport: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        codec: Optional[JSONCodec] = None,
+        compressor: Optional[RequestCompressor] = None,
+    ) -> None:
+        """Initialize async HTTP client.
+
+        Args:
+            base_url: Base URL for API requests
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts
+            retry_backoff: Backoff factor for exponential backoff
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept alive
+            transport: Optional httpx transport (mainly for testing)
+            rate_limiter: Limiter every request attempt waits on
+            retry_policy: Retry policy (overrides max_retries and
+                retry_backoff when given)
+            circuit_breaker: Breaker that fails fast on unhealthy endpoints
+            coalescer: Shares identical in-flight GETs between callers
+            codec: JSON codec for bodies (defaults to the fastest installed)
+            compressor: Gzips large request bodies
+
+        Raises:
+            ConfigurationError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ConfigurationError(
+                "AsyncHTTPClient requires httpx. Install it with "
+                "'pip install steadfast-python[async]'"
+            )
+
+        super().__init__(
+            base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            coalescer=coalescer,
+            codec=codec,
+            compressor=compressor,
+        )
+        self._retryable_exceptions = (httpx.TimeoutException, httpx.NetworkError)
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.session = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            transport=transport,
+        )
+
+    async def aclose(self) -> None:
+        """Close the client and release pooled connections."""
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def get(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make GET request.
+
+        Args:
+            endpoint: API endpoint
+            headers: Request headers
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            APIError: For API-related errors
+            NetworkError: For network-related errors
+        """
+        if self.coalescer is None:
+            return await self._make_request(
+                "GET", endpoint, headers=headers, params=params
+            )
+
+        return await self.coalescer.do_async(
+            self._coalesce_key(endpoint, headers, params),
+            lambda: self._make_request("GET", endpoint, headers=headers, params=params),
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        before_retry: Optional[
+            Callable[[SteadfastException], Awaitable[RetryHookResult]]
+        ] = None,
+    ) -> Dict[str, Any]:
+        """Make POST request.
+
+        Args:
+            endpoint: API endpoint
+            headers: Request headers
+            data: Request payload
+            before_retry: Called before each retry with the error that
+                failed the previous attempt; it returns None to resend the
+                request, a Resend to send a changed payload and headers, or
+                a response to return instead of resending
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            APIError: For API-related errors
+            NetworkError: For network-related errors
+        """
+        return await self._make_request(
+            "POST", endpoint, headers=headers, data=data, before_retry=before_retry
+        )
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        before_retry: Optional[
+            Callable[[SteadfastException], Awaitable[RetryHookResult]]
+        ] = None,
+    ) -> Dict[str, Any]:
+        """Make HTTP request guarded by the circuit breaker, if configured.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            headers: Request headers
+            params: Query parameters
+            data: Request payload
+            before_retry: Hook run before each retry (see post())
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+            APIError: For API-related errors
+            NetworkError: For network-related errors
+        """
+        if self.circuit_breaker is None:
+            return await self._request_with_retries(
+                method, endpoint, headers, params, data, before_retry
+            )
+
+        circuit = self.circuit_breaker.before_call(endpoint)
+        try:
+            response = await self._request_with_retries(
+                method, endpoint, headers, params, data, before_retry
+            )
+        except BaseException as e:
+            self.circuit_breaker.record(circuit, e)
+            raise
+        self.circuit_breaker.record(circuit)
+        return response
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        before_retry: Optional[
+            Callable[[SteadfastException], Awaitable[RetryHookResult]]
+        ] = None,
+    ) -> Dict[str, Any]:
+        """Make HTTP request with retry logic.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            headers: Request headers
+            params: Query parameters
+            data: Request payload
+            before_retry: Hook run before each retry (see post())
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            APIError: For API-related errors
+            NetworkError: For network-related errors
+        """
+        url = self._build_url(endpoint)
+        headers = self._prepare_headers(headers, data)
+        body = self._encode_body(data, headers)
+        self.retry_policy.budget.record_request()
+        delay = 0.0
+        failure: Optional[SteadfastException] = None
+
+        for attempt in range(self.max_retries + 1):
+            if failure is not None and before_retry is not None:
+                outcome = await before_retry(failure)
+                if isinstance(outcome, Resend):
+                    data = outcome.data
+                    headers = self._prepare_headers(outcome.headers, data)
+                    body = self._encode_body(data, headers)
+                elif outcome is not None:
+                    return outcome
+
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(endpoint)
+
+                self._log_attempt(method, url, attempt)
+
+                response = await self.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    content=body,
+                )
+
+                # Handle HTTP errors
+                if not response.is_success:
+                    error_data = self._decode_error_body(response.content)
+                    error = self._error_from_response(
+                        response.status_code, error_data, response.text
+                    )
+
+                    if self.retry_policy.is_retryable_status(response.status_code):
+                        retry_after = self.retry_policy.parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        next_delay = self.retry_policy.next_delay(
+                            attempt, delay, retry_after
+                        )
+                        if next_delay is None:
+                            raise self._retry_status_error(error, retry_after)
+                        delay = next_delay
+                        failure = error
+                        await self._sleep_before_retry(delay)
+                        continue
+
+                    raise error
+
+                # Parse JSON response
+                try:
+                    response_data: Dict[str, Any] = self.codec.loads(response.content)
+                    return response_data
+                except ValueError as e:
+                    raise APIError(f"Invalid JSON response: {str(e)}")
+
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                next_delay = (
+                    self.retry_policy.next_delay(attempt, delay)
+                    if self._should_retry(e, attempt)
+                    else None
+                )
+                failure = NetworkError(f"Network error: {str(e)}")
+                if next_delay is None:
+                    raise failure
+
+                delay = next_delay
+                await self._sleep_before_retry(delay)
+
+            except httpx.HTTPError as e:
+                raise NetworkError(f"Request failed: {str(e)}")
+
+        # This should never be reached due to the retry logic
+        raise NetworkError("Max retries exceeded")
+
+    async def _sleep_before_retry(self, delay: float) -> None:
+        """Wait before the next attempt without blocking the event loop.
+
+        Args:
+            delay: Delay in seconds
+        """
+        self.logger.debug(f"Retrying in {delay:.2f} seconds...")
+        await asyncio.sleep(delay)
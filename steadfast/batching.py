@@ -0,0 +1,376 @@
+"""Micro-batching of single order creations into bulk requests."""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .exceptions import (
+    APIError,
+    ConfigurationError,
+    DuplicateOrderError,
+    SteadfastException,
+    ValidationError,
+)
+from .models import BulkOrderResult, Order
+from .modules.order import MAX_BULK_ORDERS, AsyncOrderModule, OrderModule
+from .validators import validate_order
+
+_Outcome = Union[Order, SteadfastException]
+
+
+class _OrderBatcherBase:
+    """Validation and result mapping shared by the sync and async batchers."""
+
+    def __init__(self, max_batch_size: int, max_delay: float) -> None:
+        if not 1 <= max_batch_size <= MAX_BULK_ORDERS:
+            raise ValidationError(
+                f"Batch size must be between 1 and {MAX_BULK_ORDERS}",
+                "max_batch_size",
+            )
+        if max_delay < 0:
+            raise ValidationError("Max delay cannot be negative", "max_delay")
+
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+
+    def _outcomes(
+        self, payloads: List[Dict[str, Any]], results: Sequence[BulkOrderResult]
+    ) -> List[_Outcome]:
+        """Match bulk results to the submitted orders by invoice."""
+        by_invoice: Dict[str, Deque[BulkOrderResult]] = defaultdict(deque)
+        for result in results:
+            by_invoice[result.invoice].append(result)
+
+        outcomes: List[_Outcome] = []
+        for payload in payloads:
+            matches = by_invoice.get(payload["invoice"])
+            if matches:
+                outcomes.append(self._to_order(payload, matches.popleft()))
+            else:
+                outcomes.append(
+                    APIError(f"No result returned for invoice {payload['invoice']}")
+                )
+        return outcomes
+
+    def _to_order(self, payload: Dict[str, Any], result: BulkOrderResult) -> _Outcome:
+        """Turn one bulk result into the caller's Order or error."""
+        if result.status == "duplicate":
+            return DuplicateOrderError(
+                f"Invoice {result.invoice} was already submitted",
+                result.invoice,
+                result.consignment_id,
+            )
+        if result.status != "success" or result.consignment_id is None:
+            return APIError(result.error or "Order was not created")
+
+        return Order(
+            consignment_id=result.consignment_id,
+            invoice=result.invoice,
+            tracking_code=result.tracking_code or "",
+            recipient_name=result.recipient_name,
+            recipient_phone=result.recipient_phone,
+            recipient_address=result.recipient_address,
+            cod_amount=result.cod_amount,
+            status="pending",
+            note=result.note,
+        )
+
+
+class OrderBatcher(_OrderBatcherBase):
+    """Collect concurrent single-order creations into bulk requests.
+
+    Orders submitted from any thread are gathered for up to ``max_delay``
+    seconds or ``max_batch_size`` orders, whichever comes first, and sent as
+    one ``create_bulk()`` request. Each caller gets a future resolving to
+    its own Order, or to the error for its order (DuplicateOrderError,
+    APIError, or the exception that failed the whole batch).
+    """
+
+    def __init__(
+        self,
+        orders: OrderModule,
+        max_batch_size: int = MAX_BULK_ORDERS,
+        max_delay: float = 0.05,
+        max_in_flight: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize order batcher.
+
+        Args:
+            orders: Order module used to send batches
+            max_batch_size: Maximum orders per bulk request (max 500)
+            max_delay: Seconds the first order of a batch waits for others
+            max_in_flight: Maximum bulk requests in flight at once
+            clock: Monotonic time source in seconds
+
+        Raises:
+            ValidationError: If an argument is out of range
+        """
+        super().__init__(max_batch_size, max_delay)
+        if max_in_flight < 1:
+            raise ValidationError("Max in flight must be at least 1", "max_in_flight")
+
+        self.orders = orders
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._pending: List[Tuple[Dict[str, Any], "Future[Order]"]] = []
+        self._deadline = 0.0
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, order: Dict[str, Any]) -> "Future[Order]":
+        """Queue an order for the next bulk request.
+
+        Args:
+            order: Order dictionary, as accepted by create_bulk()
+
+        Returns:
+            Future resolving to the created Order
+
+        Raises:
+            ValidationError: If the order is invalid
+            ConfigurationError: If the batcher is closed
+        """
+        payload = validate_order(order)
+        future: "Future[Order]" = Future()
+
+        with self._condition:
+            if self._closed:
+                raise ConfigurationError("OrderBatcher is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="steadfast-order-batcher", daemon=True
+                )
+                self._thread.start()
+
+            self._pending.append((payload, future))
+            if len(self._pending) == 1:
+                self._deadline = self._clock() + self.max_delay
+                self._condition.notify()
+            elif len(self._pending) >= self.max_batch_size:
+                self._condition.notify()
+        return future
+
+    def create(self, **order: Any) -> Order:
+        """Create one order as part of a bulk request, waiting for the result.
+
+        Takes the same keyword arguments as OrderModule.create().
+
+        Returns:
+            Order object with consignment details
+
+        Raises:
+            ValidationError: If the order is invalid
+            DuplicateOrderError: If the ledger shows the invoice was already
+                submitted
+            APIError: If the API rejects the order or the request
+            NetworkError: If the bulk request fails
+        """
+        return self.submit(order).result()
+
+    def flush(self) -> None:
+        """Send the orders collected so far without waiting for max_delay."""
+        with self._condition:
+            self._deadline = self._clock()
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Send the remaining orders and wait for every batch to finish."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "OrderBatcher":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """Dispatcher loop: hand each ready batch to the executor."""
+        while True:
+            with self._condition:
+                while not self._batch_ready():
+                    if self._closed and not self._pending:
+                        return
+                    timeout = self._deadline - self._clock() if self._pending else None
+                    self._condition.wait(timeout)
+
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+                if self._pending:
+                    self._deadline = self._clock() + self.max_delay
+
+            self._executor.submit(self._send, batch)
+
+    def _batch_ready(self) -> bool:
+        """Return True if pending orders should be sent now."""
+        return bool(self._pending) and (
+            self._closed
+            or len(self._pending) >= self.max_batch_size
+            or self._clock() >= self._deadline
+        )
+
+    def _send(self, batch: List[Tuple[Dict[str, Any], "Future[Order]"]]) -> None:
+        """Send one batch and resolve its futures."""
+        # Leave out orders whose caller cancelled the future meanwhile
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        payloads = [payload for payload, _ in batch]
+        try:
+            response = self.orders.create_bulk(payloads)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), outcome in zip(
+            batch, self._outcomes(payloads, response.results)
+        ):
+            if isinstance(outcome, Order):
+                future.set_result(outcome)
+            else:
+                future.set_exception(outcome)
+
+
+class AsyncOrderBatcher(_OrderBatcherBase):
+    """Collect concurrent single-order creations into bulk requests.
+
+    See OrderBatcher; batches are sent as tasks on the running event loop.
+    """
+
+    def __init__(
+        self,
+        orders: AsyncOrderModule,
+        max_batch_size: int = MAX_BULK_ORDERS,
+        max_delay: float = 0.05,
+    ) -> None:
+        """Initialize async order batcher.
+
+        Args:
+            orders: Async order module used to send batches
+            max_batch_size: Maximum orders per bulk request (max 500)
+            max_delay: Seconds the first order of a batch waits for others
+
+        Raises:
+            ValidationError: If an argument is out of range
+        """
+        super().__init__(max_batch_size, max_delay)
+        self.orders = orders
+        self._pending: List[Tuple[Dict[str, Any], "asyncio.Future[Order]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def submit(self, order: Dict[str, Any]) -> "asyncio.Future[Order]":
+        """Queue an order for the next bulk request.
+
+        Must be called from a running event loop.
+
+        Args:
+            order: Order dictionary, as accepted by create_bulk()
+
+        Returns:
+            Future resolving to the created Order
+
+        Raises:
+            ValidationError: If the order is invalid
+        """
+        payload = validate_order(order)
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[Order]" = loop.create_future()
+
+        self._pending.append((payload, future))
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self.flush)
+        return future
+
+    async def create(self, **order: Any) -> Order:
+        """Create one order as part of a bulk request.
+
+        Takes the same keyword arguments as AsyncOrderModule.create().
+
+        Returns:
+            Order object with consignment details
+
+        Raises:
+            ValidationError: If the order is invalid
+            DuplicateOrderError: If the ledger shows the invoice was already
+                submitted
+            APIError: If the API rejects the order or the request
+            NetworkError: If the bulk request fails
+        """
+        return await self.submit(order)
+
+    def flush(self) -> None:
+        """Send the orders collected so far without waiting for max_delay."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def aclose(self) -> None:
+        """Send the remaining orders and wait for every batch to finish."""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def __aenter__(self) -> "AsyncOrderBatcher":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _send(
+        self, batch: List[Tuple[Dict[str, Any], "asyncio.Future[Order]"]]
+    ) -> None:
+        """Send one batch and resolve its futures."""
+        batch = [item for item in batch if not item[1].done()]
+        if not batch:
+            return
+
+        payloads = [payload for payload, _ in batch]
+        try:
+            response = await self.orders.create_bulk(payloads)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), outcome in zip(
+            batch, self._outcomes(payloads, response.results)
+        ):
+            if future.done():
+                continue
+            if isinstance(outcome, Order):
+                future.set_result(outcome)
+            else:
+                future.set_exception(outcome)
@@ -0,0 +1,145 @@
+"""Delivery-status-aware cache for order tracking lookups."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable, Optional, Tuple
+
+from .exceptions import ConfigurationError
+from .models import OrderStatus
+
+# Statuses that never change once reached
+TERMINAL_STATUSES = frozenset({"delivered", "partial_delivered", "cancelled"})
+# Statuses of orders still moving through the network; they change soonest
+ACTIVE_STATUSES = frozenset({"pending", "in_review"})
+
+
+class StatusCache:
+    """LRU cache of order statuses with TTLs chosen by delivery status.
+
+    Terminal statuses (``delivered``, ``partial_delivered``, ``cancelled``)
+    are kept until evicted, ``*_approval_pending`` statuses for
+    ``approval_pending_ttl`` seconds, ``pending`` and ``in_review`` for
+    ``active_ttl`` seconds and anything else (``hold``, ``unknown``) for
+    ``default_ttl`` seconds. Once ``max_entries`` is reached the least
+    recently used entry is evicted. Errors are never cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        approval_pending_ttl: float = 600.0,
+        active_ttl: float = 60.0,
+        default_ttl: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize status cache.
+
+        Args:
+            max_entries: Maximum number of cached statuses
+            approval_pending_ttl: Seconds to keep ``*_approval_pending``
+            active_ttl: Seconds to keep ``pending`` and ``in_review``
+            default_ttl: Seconds to keep any other non-terminal status
+            clock: Monotonic time source in seconds
+        """
+        if max_entries < 1:
+            raise ConfigurationError("max_entries must be at least 1")
+        if min(approval_pending_ttl, active_ttl, default_ttl) < 0:
+            raise ConfigurationError("Cache TTLs cannot be negative")
+
+        self.max_entries = max_entries
+        self.approval_pending_ttl = approval_pending_ttl
+        self.active_ttl = active_ttl
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (status, expiry time or None for never)
+        self._entries: "OrderedDict[str, Tuple[OrderStatus, Optional[float]]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, delivery_status: str) -> Optional[float]:
+        """Return the TTL for a delivery status.
+
+        Args:
+            delivery_status: Status reported by the API
+
+        Returns:
+            Seconds to keep the status, or None to keep it until evicted
+        """
+        if delivery_status in TERMINAL_STATUSES:
+            return None
+        if delivery_status.endswith("_approval_pending"):
+            return self.approval_pending_ttl
+        if delivery_status in ACTIVE_STATUSES:
+            return self.active_ttl
+        return self.default_ttl
+
+    def get(self, key: str) -> Optional[OrderStatus]:
+        """Return a fresh cached status, counting a hit or a miss.
+
+        Args:
+            key: Cache key (the status endpoint path)
+
+        Returns:
+            Copy of the cached OrderStatus, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                status, expires_at = entry
+                if expires_at is None or self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return replace(status)
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, status: OrderStatus) -> None:
+        """Cache a status with the TTL its delivery status calls for.
+
+        Args:
+            key: Cache key (the status endpoint path)
+            status: Status returned by the API
+        """
+        ttl = self.ttl_for(status.delivery_status)
+        if ttl == 0:
+            return
+
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            self._entries[key] = (replace(status), expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        """Drop one cached status.
+
+        Args:
+            key: Cache key (the status endpoint path)
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached status and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,272 @@
+"""Per-endpoint circuit breaker for Steadfast SDK."""
+
+import math
+import re
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Pattern, Tuple
+
+from .exceptions import (
+    APIError,
+    CircuitOpenError,
+    ConfigurationError,
+    NetworkError,
+    SteadfastException,
+)
+
+# Routes whose last path segment is an identifier
+_ENDPOINT_TEMPLATES: List[Tuple[Pattern[str], str]] = [
+    (re.compile(r"^/status_by_cid/[^/]+$"), "/status_by_cid/{id}"),
+    (re.compile(r"^/status_by_invoice/[^/]+$"), "/status_by_invoice/{invoice}"),
+    (
+        re.compile(r"^/status_by_trackingcode/[^/]+$"),
+        "/status_by_trackingcode/{tracking_code}",
+    ),
+]
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+StateChangeListener = Callable[[str, str, str], None]
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Collapse identifiers in an endpoint path into placeholders.
+
+    Args:
+        endpoint: Endpoint path, e.g. ``/status_by_cid/1424107``
+
+    Returns:
+        Path template, e.g. ``/status_by_cid/{id}``
+    """
+    path = "/" + endpoint.split("?", 1)[0].strip("/")
+    for pattern, template in _ENDPOINT_TEMPLATES:
+        if pattern.match(path):
+            return template
+    return _NUMERIC_SEGMENT.sub("/{id}", path)
+
+
+class CircuitState:
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class _Circuit:
+    """Mutable state for one endpoint template."""
+
+    def __init__(self, window_size: int) -> None:
+        self.state = CircuitState.CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.half_open_successes = 0
+
+
+class CircuitBreaker:
+    """Fails fast on endpoints whose recent failure rate is too high.
+
+    Each endpoint template has its own circuit. A closed circuit opens once
+    at least ``minimum_calls`` outcomes are in the sliding window and the
+    failure rate reaches ``failure_rate_threshold``. An open circuit
+    rejects calls with CircuitOpenError until ``open_timeout`` passes, then
+    lets ``half_open_max_calls`` trial calls through; if they all succeed
+    the circuit closes, and any failure opens it again.
+
+    Network errors and 5xx responses count as failures. Other API errors
+    (validation, not found, authentication) mean the server is healthy.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[StateChangeListener] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            failure_rate_threshold: Failure fraction (0-1] that opens the circuit
+            minimum_calls: Outcomes required before the rate is evaluated
+            window_size: Number of recent outcomes kept per endpoint
+            open_timeout: Seconds a circuit stays open before a trial call
+            half_open_max_calls: Trial calls allowed while half-open
+            on_state_change: Callback ``(endpoint_template, old, new)``
+            clock: Monotonic time source in seconds
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ConfigurationError("failure_rate_threshold must be in (0, 1]")
+        if minimum_calls < 1 or window_size < minimum_calls:
+            raise ConfigurationError(
+                "window_size must be at least minimum_calls, which must be >= 1"
+            )
+        if half_open_max_calls < 1:
+            raise ConfigurationError("half_open_max_calls must be at least 1")
+
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.window_size = window_size
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+        self._listeners: List[StateChangeListener] = []
+        if on_state_change is not None:
+            self._listeners.append(on_state_change)
+
+    def add_listener(self, listener: StateChangeListener) -> None:
+        """Register a state change callback ``(endpoint_template, old, new)``."""
+        self._listeners.append(listener)
+
+    def state(self, endpoint: str) -> str:
+        """Return the current state for an endpoint.
+
+        Args:
+            endpoint: Endpoint path or template
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint_template(endpoint))
+            if circuit is None:
+                return CircuitState.CLOSED
+            if circuit.state == CircuitState.OPEN and self._open_expired(circuit):
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def before_call(self, endpoint: str) -> str:
+        """Admit a call or fail fast.
+
+        Args:
+            endpoint: Endpoint about to be called
+
+        Returns:
+            Endpoint template to pass to record()
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open
+        """
+        template = endpoint_template(endpoint)
+        changes: List[Tuple[str, str, str]] = []
+        try:
+            with self._lock:
+                circuit = self._circuits.setdefault(
+                    template, _Circuit(self.window_size)
+                )
+                if circuit.state == CircuitState.OPEN:
+                    if not self._open_expired(circuit):
+                        raise self._open_error(template, circuit)
+                    self._transition(template, circuit, CircuitState.HALF_OPEN, changes)
+
+                if circuit.state == CircuitState.HALF_OPEN:
+                    if circuit.half_open_calls >= self.half_open_max_calls:
+                        raise self._open_error(template, circuit)
+                    circuit.half_open_calls += 1
+        finally:
+            self._notify(changes)
+
+        return template
+
+    def record(self, template: str, error: Optional[BaseException] = None) -> None:
+        """Record the outcome of an admitted call.
+
+        Args:
+            template: Value returned by before_call()
+            error: Exception raised by the call, or None on success
+        """
+        changes: List[Tuple[str, str, str]] = []
+        with self._lock:
+            circuit = self._circuits.setdefault(template, _Circuit(self.window_size))
+            half_open = circuit.state == CircuitState.HALF_OPEN
+            if half_open:
+                circuit.half_open_calls = max(0, circuit.half_open_calls - 1)
+
+            # Cancellation and non-SDK errors say nothing about the endpoint
+            if error is not None and not isinstance(error, SteadfastException):
+                return
+
+            failed = self._is_failure(error)
+            if half_open:
+                if failed:
+                    self._open(template, circuit, changes)
+                else:
+                    circuit.half_open_successes += 1
+                    if circuit.half_open_successes >= self.half_open_max_calls:
+                        circuit.outcomes.clear()
+                        self._transition(
+                            template, circuit, CircuitState.CLOSED, changes
+                        )
+            elif circuit.state == CircuitState.CLOSED:
+                circuit.outcomes.append(failed)
+                if self._failure_rate_exceeded(circuit):
+                    self._open(template, circuit, changes)
+
+        self._notify(changes)
+
+    def reset(self) -> None:
+        """Close every circuit and forget recorded outcomes."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _is_failure(self, error: Optional[BaseException]) -> bool:
+        """Return True if an outcome should count against the endpoint."""
+        if error is None:
+            return False
+        if isinstance(error, NetworkError):
+            return True
+        if isinstance(error, APIError):
+            return error.status_code is None or error.status_code >= 500
+        return False
+
+    def _failure_rate_exceeded(self, circuit: _Circuit) -> bool:
+        """Return True if a closed circuit should open."""
+        calls = len(circuit.outcomes)
+        if calls < self.minimum_calls:
+            return False
+        return sum(circuit.outcomes) / calls >= self.failure_rate_threshold
+
+    def _open_expired(self, circuit: _Circuit) -> bool:
+        """Return True if an open circuit may move to half-open."""
+        return self._clock() - circuit.opened_at >= self.open_timeout
+
+    def _open(
+        self, template: str, circuit: _Circuit, changes: List[Tuple[str, str, str]]
+    ) -> None:
+        """Move a circuit to the open state."""
+        circuit.opened_at = self._clock()
+        circuit.outcomes.clear()
+        self._transition(template, circuit, CircuitState.OPEN, changes)
+
+    def _transition(
+        self,
+        template: str,
+        circuit: _Circuit,
+        new_state: str,
+        changes: List[Tuple[str, str, str]],
+    ) -> None:
+        """Change state and queue a listener notification."""
+        old_state = circuit.state
+        circuit.state = new_state
+        circuit.half_open_calls = 0
+        circuit.half_open_successes = 0
+        if old_state != new_state:
+            changes.append((template, old_state, new_state))
+
+    def _open_error(self, template: str, circuit: _Circuit) -> CircuitOpenError:
+        """Build the fast-fail error for an open circuit."""
+        remaining = self.open_timeout - (self._clock() - circuit.opened_at)
+        return CircuitOpenError(
+            f"Circuit open for {template}",
+            template,
+            retry_after=max(1, int(math.ceil(remaining))),
+        )
+
+    def _notify(self, changes: List[Tuple[str, str, str]]) -> None:
+        """Invoke listeners outside the lock."""
+        for template, old_state, new_state in changes:
+            for listener in self._listeners:
+                listener(template, old_state, new_state)
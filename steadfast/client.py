@@ -1,7 +1,7 @@
 """Main Steadfast client for SDK."""
 
 import os
-from typing import Optional
+from typing import Any, Optional
 from .http_client import HTTPClient
 from .modules.order import OrderModule
 from .modules.tracking import TrackingModule
@@ -10,10 +10,20 @@ from .modules.return_request import ReturnRequestModule
 from .modules.payment import PaymentModule
 from .modules.location import LocationModule
 from .exceptions import ConfigurationError
+from .cache import StatusCache
+from .circuit_breaker import CircuitBreaker
+from .codec import JSONCodec
+from .coalesce import RequestCoalescer
+from .compression import RequestCompressor
+from .ledger import OrderLedger
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
 
+DEFAULT_BASE_URL = "https://api.steadfast.io/v1"
 
-class SteadfastClient:
-    """Main client for Steadfast Courier API."""
+
+class _BaseSteadfastClient:
+    """Credential handling shared by the sync and async clients."""
 
     def __init__(
         self,
@@ -21,30 +31,12 @@ class SteadfastClient:
         secret_key: Optional[str] = None,
         base_url: Optional[str] = None,
     ) -> None:
-        """Initialize Steadfast client.
-
-        Args:
-            api_key: API key for authentication (or from .env)
-            secret_key: Secret key for authentication (or from .env)
-            base_url: Base URL for API (optional, defaults to production)
-
-        Raises:
-            ConfigurationError: If credentials are missing
-        """
         self._api_key = api_key or os.getenv("STEADFAST_API_KEY")
         self._secret_key = secret_key or os.getenv("STEADFAST_SECRET_KEY")
 
         self._validate_credentials()
 
-        self._base_url = base_url or "https://api.steadfast.io/v1"
-        self._http_client = HTTPClient(base_url=self._base_url)
-
-        self._orders: Optional[OrderModule] = None
-        self._tracking: Optional[TrackingModule] = None
-        self._balance: Optional[BalanceModule] = None
-        self._returns: Optional[ReturnRequestModule] = None
-        self._payments: Optional[PaymentModule] = None
-        self._locations: Optional[LocationModule] = None
+        self._base_url = base_url or DEFAULT_BASE_URL
 
     def _validate_credentials(self) -> None:
         """Validate that credentials are provided.
@@ -64,6 +56,88 @@ class SteadfastClient:
                 "STEADFAST_SECRET_KEY environment variable"
             )
 
+
+class SteadfastClient(_BaseSteadfastClient):
+    """Main client for Steadfast Courier API."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        status_cache: Optional[StatusCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        ledger: Optional[OrderLedger] = None,
+        codec: Optional[JSONCodec] = None,
+        compressor: Optional[RequestCompressor] = None,
+    ) -> None:
+        """Initialize Steadfast client.
+
+        Args:
+            api_key: API key for authentication (or from .env)
+            secret_key: Secret key for authentication (or from .env)
+            base_url: Base URL for API (optional, defaults to production)
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts for failed requests
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum keep-alive connections per host
+            pool_block: Block when the connection pool is exhausted
+            rate_limiter: Client-side rate limiter shared by all modules
+            retry_policy: Retry policy (overrides max_retries when given)
+            circuit_breaker: Per-endpoint circuit breaker
+            status_cache: Opt-in cache for tracking lookups
+            coalescer: Opt-in sharing of identical in-flight GET requests
+            ledger: Opt-in local record of created orders
+            codec: JSON codec for request and response bodies (defaults to
+                the fastest installed: orjson, ujson, then the stdlib)
+            compressor: Opt-in gzip compression of large request bodies
+
+        Raises:
+            ConfigurationError: If credentials are missing
+        """
+        super().__init__(api_key, secret_key, base_url)
+        self._http_client = HTTPClient(
+            base_url=self._base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            coalescer=coalescer,
+            codec=codec,
+            compressor=compressor,
+        )
+
+        self._status_cache = status_cache
+        self._ledger = ledger
+        self._orders: Optional[OrderModule] = None
+        self._tracking: Optional[TrackingModule] = None
+        self._balance: Optional[BalanceModule] = None
+        self._returns: Optional[ReturnRequestModule] = None
+        self._payments: Optional[PaymentModule] = None
+        self._locations: Optional[LocationModule] = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._http_client.close()
+
+    def __enter__(self) -> "SteadfastClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     @property
     def orders(self) -> OrderModule:
         """Get orders module.
@@ -72,7 +146,7 @@ class SteadfastClient:
             OrderModule instance
         """
         if self._orders is None:
-            self._orders = OrderModule(self._http_client)
+            self._orders = OrderModule(self._http_client, self._ledger)
         return self._orders
 
     @property
@@ -83,7 +157,7 @@ class SteadfastClient:
             TrackingModule instance
         """
         if self._tracking is None:
-            self._tracking = TrackingModule(self._http_client)
+            self._tracking = TrackingModule(self._http_client, self._status_cache)
         return self._tracking
 
     @property
@@ -0,0 +1,126 @@
+"""Request coalescing (singleflight) for identical in-flight GETs."""
+
+import asyncio
+import threading
+from copy import deepcopy
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+Response = Dict[str, Any]
+
+
+class _Call:
+    """An in-flight request shared by every caller with the same key."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[Response] = None
+        self.error: Optional[Exception] = None
+
+
+class RequestCoalescer:
+    """Share one upstream call between identical concurrent requests.
+
+    While a request for a key is in flight, later callers with the same key
+    wait for it and receive a copy of its response (or the same error)
+    instead of issuing their own request. Nothing is cached: once the call
+    finishes the next caller starts a new one.
+
+    Use one coalescer per client. ``executed`` counts upstream calls made
+    and ``coalesced`` counts callers that waited on another caller's call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize request coalescer."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, "asyncio.Future[Response]"] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Response]) -> Response:
+        """Call ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identity of the request
+            func: Function making the request
+
+        Returns:
+            The response; callers that joined an in-flight call get a copy
+
+        Raises:
+            SteadfastException: Whatever the shared call raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                call.result = func()
+                return call.result
+            except Exception as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        if call.result is None:
+            # The leading caller was interrupted; make the request ourselves
+            return func()
+        return deepcopy(call.result)
+
+    async def do_async(
+        self, key: Hashable, func: Callable[[], Awaitable[Response]]
+    ) -> Response:
+        """Await ``func`` unless a call for ``key`` is already in flight.
+
+        The shared call runs as its own task, so cancelling one caller does
+        not cancel the request for the others.
+
+        Args:
+            key: Identity of the request
+            func: Coroutine function making the request
+
+        Returns:
+            The response; callers that joined an in-flight call get a copy
+
+        Raises:
+            SteadfastException: Whatever the shared call raised
+        """
+        task = self._tasks.get(key)
+        leader = task is None
+        with self._lock:
+            if task is None:
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        result = await asyncio.shield(task)
+        return result if leader else deepcopy(result)
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Response]") -> None:
+        """Drop a finished task and mark its error as retrieved."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        return len(self._calls) + len(self._tasks)
@@ -0,0 +1,73 @@
+"""JSON codecs for request and response bodies."""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+from .exceptions import ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ujson = None
+
+# Backends in order of preference when none is named
+CODEC_NAMES = ("orjson", "ujson", "json")
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """Encode request bodies to bytes and decode response bodies from bytes.
+
+    ``loads`` must raise ValueError (or a subclass) on malformed input.
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[Union[bytes, str]], Any]
+
+
+def _stdlib_dumps(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
+def _ujson_dumps(data: Any) -> bytes:
+    return ujson.dumps(data, ensure_ascii=False).encode("utf-8")  # type: ignore
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Return a JSON codec by name, or the fastest one installed.
+
+    Args:
+        name: "orjson", "ujson" or "json"; None picks the first installed
+            in that order
+
+    Returns:
+        JSONCodec for the backend
+
+    Raises:
+        ConfigurationError: If the backend is unknown or not installed
+    """
+    if name is None:
+        name = next(n for n in CODEC_NAMES if n == "json" or _installed(n))
+
+    if name == "orjson" and orjson is not None:
+        return JSONCodec("orjson", orjson.dumps, orjson.loads)
+    if name == "ujson" and ujson is not None:
+        return JSONCodec("ujson", _ujson_dumps, ujson.loads)
+    if name == "json":
+        return JSONCodec("json", _stdlib_dumps, json.loads)
+
+    if name in CODEC_NAMES:
+        raise ConfigurationError(f"JSON codec {name!r} is not installed")
+    raise ConfigurationError("JSON codec must be one of: " + ", ".join(CODEC_NAMES))
+
+
+def _installed(name: str) -> bool:
+    """Return True if the backend's package is importable."""
+    return {"orjson": orjson, "ujson": ujson}[name] is not None
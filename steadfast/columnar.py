@@ -0,0 +1,373 @@
+"""Column-oriented storage of bulk order results."""
+
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
+
+from .exceptions import ConfigurationError
+from .models import BulkOrderResponse, BulkOrderResult
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None  # type: ignore[assignment]
+    pd = None  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - exercised only without the extra
+    pa = None
+
+# Stored in the consignment ID column for results without one
+NO_CONSIGNMENT_ID = 0
+
+_TEXT_COLUMNS = (
+    "invoice",
+    "recipient_name",
+    "recipient_address",
+    "recipient_phone",
+    "note",
+    "tracking_code",
+    "status",
+    "error",
+)
+
+
+class BulkOrderColumns(Sequence[BulkOrderResult]):
+    """Bulk order results kept as parallel columns.
+
+    Invoices, tracking codes, statuses, errors and the other text fields are
+    lists; consignment IDs, COD amounts and the success flags are typed
+    ``array`` columns that NumPy can view without copying. Failed rows and
+    the invoice index are built once, so ``success_mask``, ``failed()`` and
+    ``by_invoice()`` return immediately. Row objects (``BulkOrderResult``)
+    are only created when a row is read. ``create_bulk(columnar=True)`` and
+    ``create_bulk_many(columnar=True)`` build it straight from the API's
+    result dictionaries.
+
+    Results without a consignment ID hold ``NO_CONSIGNMENT_ID`` (0) in the
+    ``consignment_id`` column.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty container; use a ``from_*`` constructor."""
+        self.invoice: List[str] = []
+        self.recipient_name: List[str] = []
+        self.recipient_address: List[str] = []
+        self.recipient_phone: List[str] = []
+        self.note: List[Optional[str]] = []
+        self.tracking_code: List[Optional[str]] = []
+        self.status: List[str] = []
+        self.error: List[Optional[str]] = []
+        self.consignment_id = array("q")
+        self.cod_amount = array("d")
+        self._success = array("b")
+        self._failed = array("q")
+        self._index: Dict[str, int] = {}
+        self.succeeded = 0
+
+    @classmethod
+    def from_results(cls, results: Iterable[BulkOrderResult]) -> "BulkOrderColumns":
+        """Build columns from bulk order results.
+
+        Args:
+            results: Results, e.g. ``BulkOrderResponse.results``
+
+        Returns:
+            BulkOrderColumns holding the results in order
+        """
+        columns = cls()
+        for result in results:
+            columns.append_result(result)
+        return columns
+
+    @classmethod
+    def from_response(cls, response: BulkOrderResponse) -> "BulkOrderColumns":
+        """Build columns from a create_bulk() response."""
+        return cls.from_results(response.results)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "BulkOrderColumns":
+        """Build columns straight from create_bulk_order result dictionaries.
+
+        No row objects are created, so this is the cheapest way to load a
+        raw API response (its ``"results"`` list).
+
+        Args:
+            records: Result dictionaries as returned by the API
+
+        Returns:
+            BulkOrderColumns holding the results in order
+        """
+        columns = cls()
+        for record in records:
+            columns.append_record(record)
+        return columns
+
+    def append_result(self, result: BulkOrderResult) -> None:
+        """Add one bulk order result as the last row."""
+        self._append(
+            result.invoice,
+            result.recipient_name,
+            result.recipient_address,
+            result.recipient_phone,
+            result.cod_amount,
+            result.note,
+            result.consignment_id,
+            result.tracking_code,
+            result.status,
+            result.error,
+        )
+
+    def append_record(self, record: Mapping[str, Any]) -> None:
+        """Add one create_bulk_order result dictionary as the last row."""
+        self._append(
+            record["invoice"],
+            record["recipient_name"],
+            record["recipient_address"],
+            record["recipient_phone"],
+            record["cod_amount"],
+            record.get("note"),
+            record.get("consignment_id"),
+            record.get("tracking_code"),
+            record.get("status", "error"),
+            record.get("error"),
+        )
+
+    def extend(self, other: "BulkOrderColumns") -> None:
+        """Append every row of another container, column by column."""
+        offset = len(self)
+        for name in _TEXT_COLUMNS:
+            getattr(self, name).extend(getattr(other, name))
+        self.consignment_id.extend(other.consignment_id)
+        self.cod_amount.extend(other.cod_amount)
+        self._success.extend(other._success)
+        self._failed.extend(row + offset for row in other._failed)
+        self._index.update(
+            (invoice, row + offset) for invoice, row in other._index.items()
+        )
+        self.succeeded += other.succeeded
+
+    def _append(
+        self,
+        invoice: str,
+        recipient_name: str,
+        recipient_address: str,
+        recipient_phone: str,
+        cod_amount: float,
+        note: Optional[str],
+        consignment_id: Optional[int],
+        tracking_code: Optional[str],
+        status: str,
+        error: Optional[str],
+    ) -> None:
+        """Add one result to every column."""
+        row = len(self.invoice)
+        self.invoice.append(invoice)
+        self.recipient_name.append(recipient_name)
+        self.recipient_address.append(recipient_address)
+        self.recipient_phone.append(recipient_phone)
+        self.cod_amount.append(float(cod_amount))
+        self.note.append(note)
+        self.consignment_id.append(
+            NO_CONSIGNMENT_ID if consignment_id is None else int(consignment_id)
+        )
+        self.tracking_code.append(tracking_code)
+        self.status.append(status)
+        self.error.append(error)
+
+        success = status == "success"
+        self._success.append(success)
+        self.succeeded += success
+        if status == "error":
+            self._failed.append(row)
+        self._index[invoice] = row
+
+    def __len__(self) -> int:
+        return len(self.invoice)
+
+    @overload
+    def __getitem__(self, index: int) -> BulkOrderResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BulkOrderResult]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[BulkOrderResult, List[BulkOrderResult]]:
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("result index out of range")
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[BulkOrderResult]:
+        return (self.row(i) for i in range(len(self)))
+
+    def row(self, index: int) -> BulkOrderResult:
+        """Build the BulkOrderResult for one row.
+
+        Args:
+            index: Row position
+
+        Returns:
+            BulkOrderResult for the row
+        """
+        consignment_id = self.consignment_id[index]
+        return BulkOrderResult(
+            invoice=self.invoice[index],
+            recipient_name=self.recipient_name[index],
+            recipient_address=self.recipient_address[index],
+            recipient_phone=self.recipient_phone[index],
+            cod_amount=self.cod_amount[index],
+            note=self.note[index],
+            consignment_id=(
+                None if consignment_id == NO_CONSIGNMENT_ID else consignment_id
+            ),
+            tracking_code=self.tracking_code[index],
+            status=self.status[index],
+            error=self.error[index],
+        )
+
+    @property
+    def success_mask(self) -> "array[int]":
+        """1 for each row with status "success", else 0 (a typed array)."""
+        return self._success
+
+    @property
+    def failed_count(self) -> int:
+        """Number of rows with status "error"."""
+        return len(self._failed)
+
+    def failed(self) -> Sequence[BulkOrderResult]:
+        """Rows with status "error", as a lazy sequence of results."""
+        return _RowsView(self, self._failed)
+
+    def by_invoice(self) -> Mapping[str, BulkOrderResult]:
+        """Results keyed by invoice, as a lazy read-only mapping."""
+        return _InvoiceView(self)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Export every column as a NumPy array.
+
+        ``consignment_id``, ``cod_amount`` and ``success`` are read-only views
+        of the stored arrays and are not copied, so they reflect later
+        changes to the columns; text columns become object arrays.
+
+        Returns:
+            Mapping of column name to array
+
+        Raises:
+            ConfigurationError: If numpy is not installed
+        """
+        if np is None:
+            raise ConfigurationError(
+                "to_numpy requires numpy. Install it with "
+                "'pip install steadfast-python[pandas]'"
+            )
+
+        arrays: Dict[str, Any] = {
+            name: np.array(getattr(self, name), dtype=object) for name in _TEXT_COLUMNS
+        }
+        views = {
+            "consignment_id": np.frombuffer(self.consignment_id, dtype=np.int64),
+            "cod_amount": np.frombuffer(self.cod_amount, dtype=np.float64),
+            "success": np.frombuffer(self._success, dtype=np.bool_),
+        }
+        for view in views.values():
+            # Writes would bypass the success count and failed-row index
+            view.flags.writeable = False
+        arrays.update(views)
+        return arrays
+
+    def to_pandas(self) -> Any:
+        """Export the results as a pandas DataFrame, one row per result.
+
+        Raises:
+            ConfigurationError: If pandas is not installed
+        """
+        if pd is None:
+            raise ConfigurationError(
+                "to_pandas requires pandas. Install it with "
+                "'pip install steadfast-python[pandas]'"
+            )
+        return pd.DataFrame(self.to_numpy())
+
+    def to_arrow(self) -> Any:
+        """Export the results as a pyarrow Table.
+
+        Numeric columns are handed to Arrow without copying.
+
+        Raises:
+            ConfigurationError: If pyarrow is not installed
+        """
+        if pa is None or np is None:
+            raise ConfigurationError(
+                "to_arrow requires pyarrow and numpy. Install them with "
+                "'pip install steadfast-python[arrow]'"
+            )
+
+        columns = self.to_numpy()
+        return pa.table(
+            {
+                name: (
+                    pa.array(list(values), type=pa.string())
+                    if name in _TEXT_COLUMNS
+                    else pa.array(values)
+                )
+                for name, values in columns.items()
+            }
+        )
+
+
+class _RowsView(Sequence[BulkOrderResult]):
+    """Selected rows of a BulkOrderColumns, built on access."""
+
+    def __init__(self, columns: BulkOrderColumns, rows: "array[int]") -> None:
+        self._columns = columns
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> BulkOrderResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BulkOrderResult]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[BulkOrderResult, List[BulkOrderResult]]:
+        if isinstance(index, slice):
+            return [self._columns.row(row) for row in self._rows[index]]
+        return self._columns.row(self._rows[index])
+
+
+class _InvoiceView(Mapping[str, BulkOrderResult]):
+    """Invoice-keyed access to a BulkOrderColumns, built on access."""
+
+    def __init__(self, columns: BulkOrderColumns) -> None:
+        self._columns = columns
+
+    def __getitem__(self, invoice: str) -> BulkOrderResult:
+        return self._columns.row(self._columns._index[invoice])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns._index)
+
+    def __len__(self) -> int:
+        return len(self._columns._index)
@@ -0,0 +1,133 @@
+"""Bounded concurrent fan-out helpers for Steadfast SDK."""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .exceptions import SteadfastException, ValidationError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Per-item outcome: the call's result, or the SDK error it raised
+Outcome = Union[R, SteadfastException]
+
+
+def _check_concurrency(concurrency: int) -> None:
+    """Raise ValidationError if concurrency is out of range."""
+    if concurrency < 1:
+        raise ValidationError("Concurrency must be at least 1", "concurrency")
+
+
+def fan_out(
+    func: Callable[[T], R], items: Iterable[T], concurrency: int
+) -> Iterator[Tuple[T, Outcome[R]]]:
+    """Call ``func`` for each item on up to ``concurrency`` threads.
+
+    Items are pulled from ``items`` only as slots free up, so at most
+    ``concurrency`` calls are in flight. SDK errors are returned in place
+    of a result rather than raised; any other exception propagates.
+
+    Args:
+        func: Function to call with each item
+        items: Items to process
+        concurrency: Maximum calls in flight at once
+
+    Returns:
+        Iterator of (item, result or SteadfastException) in completion order
+
+    Raises:
+        ValidationError: If concurrency is less than 1
+    """
+    _check_concurrency(concurrency)
+    return _fan_out(func, iter(items), concurrency)
+
+
+def _fan_out(
+    func: Callable[[T], R], items: Iterator[T], concurrency: int
+) -> Iterator[Tuple[T, Outcome[R]]]:
+    """Generator behind fan_out()."""
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending: Dict["Future[R]", T] = {}
+        try:
+            for item in islice(items, concurrency):
+                pending[executor.submit(func, item)] = item
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                # Refill before yielding so the caller's work overlaps requests
+                for item in islice(items, len(done)):
+                    pending[executor.submit(func, item)] = item
+                for future in done:
+                    item = pending.pop(future)
+                    outcome: Outcome[R]
+                    try:
+                        outcome = future.result()
+                    except SteadfastException as e:
+                        outcome = e
+                    yield item, outcome
+        finally:
+            # Stop queued calls if the caller abandons the iterator
+            for future in pending:
+                future.cancel()
+
+
+def fan_out_async(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int
+) -> AsyncIterator[Tuple[T, Outcome[R]]]:
+    """Await ``func`` for each item with up to ``concurrency`` tasks.
+
+    See fan_out(); use ``async for`` to consume.
+
+    Args:
+        func: Coroutine function to call with each item
+        items: Items to process
+        concurrency: Maximum calls in flight at once
+
+    Returns:
+        Async iterator of (item, result or SteadfastException) in
+        completion order
+
+    Raises:
+        ValidationError: If concurrency is less than 1
+    """
+    _check_concurrency(concurrency)
+    return _fan_out_async(func, iter(items), concurrency)
+
+
+async def _fan_out_async(
+    func: Callable[[T], Awaitable[R]], items: Iterator[T], concurrency: int
+) -> AsyncIterator[Tuple[T, Outcome[R]]]:
+    """Async generator behind fan_out_async()."""
+    pending: Dict["asyncio.Future[R]", T] = {}
+    try:
+        for item in islice(items, concurrency):
+            pending[asyncio.ensure_future(func(item))] = item
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for item in islice(items, len(done)):
+                pending[asyncio.ensure_future(func(item))] = item
+            for task in done:
+                item = pending.pop(task)
+                outcome: Outcome[R]
+                try:
+                    outcome = task.result()
+                except SteadfastException as e:
+                    outcome = e
+                yield item, outcome
+    finally:
+        # Cancel in-flight calls if the caller abandons the iterator
+        for task in pending:
+            task.cancel()
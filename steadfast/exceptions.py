@@ -33,6 +33,17 @@ class ValidationError(SteadfastException):
         return f"Validation error: {self.message}"
 
 
+class DuplicateOrderError(ValidationError):
+    """Raised instead of submitting an order whose invoice was already created."""
+
+    def __init__(
+        self, message: str, invoice: str, consignment_id: Optional[int] = None
+    ) -> None:
+        super().__init__(message, "invoice")
+        self.invoice = invoice
+        self.consignment_id = consignment_id  # None if not known locally
+
+
 class NotFoundError(SteadfastException):
     """Raised when requested resource is not found."""
 
@@ -42,9 +53,15 @@ class NotFoundError(SteadfastException):
 class APIError(SteadfastException):
     """Raised for general API errors."""
 
-    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[int] = None,
+    ) -> None:
         super().__init__(message)
         self.status_code = status_code
+        self.retry_after = retry_after  # Seconds, from a Retry-After header
 
     def __str__(self) -> str:
         if self.status_code:
@@ -67,6 +84,16 @@ class NetworkError(SteadfastException):
         return f"Network error: {self.message}"
 
 
+class CircuitOpenError(NetworkError):
+    """Raised without a request when an endpoint's circuit breaker is open."""
+
+    def __init__(
+        self, message: str, endpoint: str, retry_after: Optional[int] = None
+    ) -> None:
+        super().__init__(message, retry_after)
+        self.endpoint = endpoint
+
+
 class ConfigurationError(SteadfastException):
     """Raised for configuration-related errors."""
 
@@ -0,0 +1,259 @@
+"""Vectorized validation of columnar (pandas) order input for Steadfast SDK."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from .exceptions import ConfigurationError
+from .models import RejectedOrder, ValidationIssue
+from .validators import _EMAIL_PATTERN, _INVOICE_PATTERN
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None  # type: ignore[assignment]
+    pd = None  # type: ignore[assignment]
+
+
+class OrderErrorCode:
+    """Bit flags for per-row validation failures; a row may carry several."""
+
+    OK = 0
+    INVOICE = 1
+    RECIPIENT_NAME = 2
+    RECIPIENT_PHONE = 4
+    RECIPIENT_ADDRESS = 8
+    COD_AMOUNT = 16
+    DELIVERY_TYPE = 32
+    ALTERNATIVE_PHONE = 64
+    RECIPIENT_EMAIL = 128
+
+
+# (code, field, message) for every flag, in payload field order
+_ERRORS: Tuple[Tuple[int, str, str], ...] = (
+    (
+        OrderErrorCode.INVOICE,
+        "invoice",
+        "Invoice is required and must contain only alphanumeric characters, "
+        "hyphens, and underscores",
+    ),
+    (
+        OrderErrorCode.RECIPIENT_NAME,
+        "recipient_name",
+        "Recipient name is required and cannot exceed 100 characters",
+    ),
+    (
+        OrderErrorCode.RECIPIENT_PHONE,
+        "recipient_phone",
+        "Phone number is required and must be exactly 11 digits",
+    ),
+    (
+        OrderErrorCode.RECIPIENT_ADDRESS,
+        "recipient_address",
+        "Address is required and cannot exceed 250 characters",
+    ),
+    (
+        OrderErrorCode.COD_AMOUNT,
+        "cod_amount",
+        "COD amount is required and must be a non-negative number",
+    ),
+    (
+        OrderErrorCode.DELIVERY_TYPE,
+        "delivery_type",
+        "Delivery type must be 0 (home) or 1 (point)",
+    ),
+    (
+        OrderErrorCode.ALTERNATIVE_PHONE,
+        "alternative_phone",
+        "Phone number must be exactly 11 digits",
+    ),
+    (OrderErrorCode.RECIPIENT_EMAIL, "recipient_email", "Invalid email format"),
+)
+
+_PASSTHROUGH_COLUMNS = ("note", "item_description", "total_lot")
+# Integer fields that become floats in columns holding empty cells
+_INTEGER_COLUMNS = ("delivery_type", "total_lot")
+
+
+def error_fields(code: int) -> List[str]:
+    """Return the names of the fields flagged in an error code.
+
+    Args:
+        code: Value from FrameValidationResult.error_codes
+
+    Returns:
+        Field names, in payload order
+    """
+    return [field for flag, field, _ in _ERRORS if code & flag]
+
+
+@dataclass
+class FrameValidationResult:
+    """Outcome of validate_orders_frame()."""
+
+    valid: Any  # pandas.Series of bool, aligned with the input index
+    error_codes: Any  # pandas.Series of int, OrderErrorCode flags per row
+    orders: Any  # pandas.DataFrame of normalised payload columns
+    frame: Any  # The validated input DataFrame
+
+    @property
+    def is_valid(self) -> bool:
+        """True if every row passed validation."""
+        return bool(self.valid.all())
+
+    def valid_orders(self) -> List[Dict[str, Any]]:
+        """Return the valid rows as order dictionaries ready to submit.
+
+        Empty cells are left out and NumPy scalars become Python values.
+        """
+        records = self.orders[self.valid.to_numpy()].to_dict("records")
+        return [_clean_record(record) for record in records]
+
+    def rejected(self) -> List[RejectedOrder]:
+        """Return the invalid input rows with one issue per flagged field.
+
+        Indexes are 0-based row positions, not index labels.
+        """
+        positions = np.flatnonzero(~self.valid.to_numpy())
+        codes = self.error_codes.to_numpy()
+        records = self.frame.iloc[positions].to_dict("records")
+
+        rejected = []
+        for position, record in zip(positions.tolist(), records):
+            issues = [
+                ValidationIssue(position, field, message)
+                for flag, field, message in _ERRORS
+                if codes[position] & flag
+            ]
+            rejected.append(
+                RejectedOrder(
+                    index=position, order=_clean_record(record), issues=issues
+                )
+            )
+        return rejected
+
+
+def validate_orders_frame(frame: Any) -> FrameValidationResult:
+    """Validate a DataFrame of orders with column-wide operations.
+
+    Columns are named like create_bulk() order fields. Applies the same
+    rules as the row validators (invoice pattern, phone digit-stripping and
+    length, name and address length limits, non-negative COD amount,
+    delivery type 0/1, optional alternative phone and email) to whole
+    columns at once. Missing ``delivery_type`` cells default to 0.
+
+    Args:
+        frame: pandas DataFrame, one order per row
+
+    Returns:
+        FrameValidationResult with a boolean ``valid`` mask, per-row
+        OrderErrorCode flags and the normalised order columns
+
+    Raises:
+        ConfigurationError: If pandas or NumPy is not installed
+    """
+    if pd is None:
+        raise ConfigurationError(
+            "validate_orders_frame requires pandas and numpy. Install them with "
+            "'pip install steadfast-python[pandas]'"
+        )
+
+    index = frame.index
+    codes = np.zeros(len(frame), dtype=np.int64)
+    orders = pd.DataFrame(index=index)
+
+    def flag(code: int, failed: Any) -> None:
+        codes[np.asarray(failed, dtype=bool)] |= code
+
+    invoice, present = _text_column(frame, "invoice")
+    invoice_ok = invoice.str.match(_INVOICE_PATTERN.pattern)
+    flag(OrderErrorCode.INVOICE, ~present | ~invoice_ok.fillna(False).astype(bool))
+    orders["invoice"] = invoice.str.strip()
+
+    name, _ = _text_column(frame, "recipient_name")
+    name = name.str.strip()
+    # Blank after stripping counts as missing, as in validate_order
+    flag(OrderErrorCode.RECIPIENT_NAME, (name == "") | (name.str.len() > 100))
+    orders["recipient_name"] = name
+
+    phone, present = _text_column(frame, "recipient_phone")
+    phone = phone.str.replace(r"\D", "", regex=True)
+    flag(OrderErrorCode.RECIPIENT_PHONE, ~present | (phone.str.len() != 11))
+    orders["recipient_phone"] = phone
+
+    address, _ = _text_column(frame, "recipient_address")
+    address = address.str.strip()
+    flag(OrderErrorCode.RECIPIENT_ADDRESS, (address == "") | (address.str.len() > 250))
+    orders["recipient_address"] = address
+
+    if "cod_amount" in frame:
+        cod_amount = pd.to_numeric(frame["cod_amount"], errors="coerce")
+    else:
+        cod_amount = pd.Series(np.nan, index=index)
+    cod_amount = cod_amount.astype(float)
+    # Same rule as validate_cod_amount: missing, NaN and infinite are invalid
+    flag(OrderErrorCode.COD_AMOUNT, ~np.isfinite(cod_amount) | (cod_amount < 0))
+    orders["cod_amount"] = cod_amount
+
+    if "delivery_type" in frame:
+        delivery_type = frame["delivery_type"].astype(object)
+        delivery_type = delivery_type.where(delivery_type.notna(), 0)
+    else:
+        delivery_type = pd.Series(0, index=index, dtype=object)
+    flag(OrderErrorCode.DELIVERY_TYPE, ~delivery_type.isin([0, 1]))
+    orders["delivery_type"] = delivery_type
+
+    if "alternative_phone" in frame:
+        alternative, present = _text_column(frame, "alternative_phone")
+        alternative = alternative.str.replace(r"\D", "", regex=True)
+        flag(
+            OrderErrorCode.ALTERNATIVE_PHONE,
+            present & (alternative.str.len() != 11),
+        )
+        orders["alternative_phone"] = alternative.where(present, None)
+
+    if "recipient_email" in frame:
+        email, present = _text_column(frame, "recipient_email")
+        email_ok = email.str.match(_EMAIL_PATTERN.pattern).fillna(False).astype(bool)
+        flag(OrderErrorCode.RECIPIENT_EMAIL, present & ~email_ok)
+        orders["recipient_email"] = email.str.strip().where(present, None)
+
+    for column in _PASSTHROUGH_COLUMNS:
+        if column in frame:
+            orders[column] = frame[column]
+
+    error_codes = pd.Series(codes, index=index, name="error_code")
+    return FrameValidationResult(
+        valid=error_codes == OrderErrorCode.OK,
+        error_codes=error_codes,
+        orders=orders,
+        frame=frame,
+    )
+
+
+def _text_column(frame: Any, column: str) -> Tuple[Any, Any]:
+    """Return a column as strings ("" when empty) and a non-empty mask."""
+    if column not in frame:
+        empty = pd.Series("", index=frame.index, dtype=object)
+        return empty, pd.Series(False, index=frame.index)
+
+    values = frame[column]
+    missing = values.isna()
+    text = values.astype(object).where(~missing, "").astype(str)
+    return text, text != ""
+
+
+def _clean_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop empty cells and convert NumPy scalars to Python values."""
+    clean = {}
+    for key, value in record.items():
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            continue
+        if isinstance(value, np.generic):
+            value = value.item()
+            if isinstance(value, float) and np.isnan(value):
+                continue
+        if key in _INTEGER_COLUMNS and isinstance(value, float) and value.is_integer():
+            value = int(value)
+        clean[key] = value
+    return clean
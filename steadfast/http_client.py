@@ -1,29 +1,213 @@
 """HTTP client for Steadfast SDK with retry logic and error handling."""
 
+import json
+import math
 import time
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple, Type
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import (
     ConnectionError,
     Timeout,
     RequestException,
-    JSONDecodeError,
 )
 
-from .exceptions import APIError, NetworkError
+from .exceptions import (
+    APIError,
+    AuthenticationError,
+    NetworkError,
+    NotFoundError,
+    SteadfastException,
+)
 from .logger import get_logger, sanitize_log_message
+from .circuit_breaker import CircuitBreaker
+from .codec import JSONCodec, get_codec
+from .coalesce import RequestCoalescer
+from .compression import RequestCompressor
+from .rate_limit import RateLimiter
+from .retry import Resend, RetryHookResult, RetryPolicy
+
+
+class _BaseHTTPClient:
+    """Transport-independent configuration and helpers shared by clients."""
+
+    # Exceptions raised by the transport that are safe to retry
+    _retryable_exceptions: Tuple[Type[Exception], ...] = ()
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_backoff: float = 0.3,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        codec: Optional[JSONCodec] = None,
+        compressor: Optional[RequestCompressor] = None,
+    ) -> None:
+        if retry_policy is None:
+            retry_policy = RetryPolicy(
+                max_retries=max_retries, base_delay=retry_backoff
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retry_policy = retry_policy
+        self.max_retries = retry_policy.max_retries
+        self.retry_backoff = retry_policy.base_delay
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.coalescer = coalescer
+        self.codec = codec or get_codec()
+        self.compressor = compressor
+        self.logger = get_logger(__name__)
+
+    def _build_url(self, endpoint: str) -> str:
+        """Join the base URL and endpoint."""
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _coalesce_key(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+    ) -> str:
+        """Return the key identifying identical GET requests."""
+        return json.dumps(
+            [endpoint.lstrip("/"), headers or {}, params or {}],
+            sort_keys=True,
+            default=str,
+        )
+
+    def _encode_body(
+        self, data: Optional[Dict[str, Any]], headers: Dict[str, str]
+    ) -> Optional[bytes]:
+        """Encode a request payload once, to be reused by every attempt.
+
+        Large bodies are gzipped when a compressor is configured, and
+        ``headers`` gets the matching Content-Encoding.
+        """
+        if data is None:
+            return None
+
+        body = self.codec.dumps(data)
+        if self.compressor is None:
+            return body
+        if self.compressor.should_compress(body):
+            headers["Content-Encoding"] = "gzip"
+            return self.compressor.compress(body)
+
+        self.compressor.skip()
+        headers.pop("Content-Encoding", None)
+        return body
+
+    def _decode_error_body(self, content: bytes) -> Any:
+        """Decode an error response body, or return None if it is not JSON."""
+        try:
+            return self.codec.loads(content)
+        except ValueError:
+            return None
+
+    def _prepare_headers(
+        self, headers: Optional[Dict[str, str]], data: Optional[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """Return a copy of the request headers with defaults applied."""
+        headers = dict(headers or {})
+
+        # Set default headers
+        if "Content-Type" not in headers and data is not None:
+            headers["Content-Type"] = "application/json"
+
+        return headers
+
+    def _log_attempt(self, method: str, url: str, attempt: int) -> None:
+        """Log a request attempt at debug level."""
+        self.logger.debug(
+            sanitize_log_message(
+                f"Making {method} request to {url} "
+                f"(attempt {attempt + 1}/{self.max_retries + 1})"
+            )
+        )
 
+    def _error_from_response(
+        self, status_code: int, error_data: Any, text: str
+    ) -> SteadfastException:
+        """Build the SDK exception for a non-2xx response.
 
-class HTTPClient:
+        Args:
+            status_code: HTTP status code
+            error_data: Decoded JSON body, or None if it was not JSON
+            text: Raw response text
+
+        Returns:
+            Exception to raise
+        """
+        error_msg = f"HTTP {status_code}"
+        if error_data is None:
+            error_msg = text or error_msg
+        elif isinstance(error_data, dict):
+            if "message" in error_data:
+                error_msg = error_data["message"]
+            elif "error" in error_data:
+                error_msg = error_data["error"]
+
+        if status_code == 404:
+            return NotFoundError(error_msg)
+        elif status_code == 401:
+            return AuthenticationError(error_msg)
+        return APIError(error_msg, status_code)
+
+    def _should_retry(self, exception: Exception, attempt: int) -> bool:
+        """Determine if request should be retried.
+
+        Args:
+            exception: Exception that occurred
+            attempt: Current attempt number
+
+        Returns:
+            True if should retry, False otherwise
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        # Retry on connection errors and timeouts
+        return isinstance(exception, self._retryable_exceptions)
+
+    def _retry_status_error(
+        self, error: SteadfastException, retry_after: Optional[float]
+    ) -> SteadfastException:
+        """Return the error for a retryable status that will not be retried.
+
+        The server's Retry-After, if any, is stored on the APIError.
+        """
+        if isinstance(error, APIError) and retry_after is not None:
+            error.retry_after = int(math.ceil(retry_after))
+        return error
+
+
+class HTTPClient(_BaseHTTPClient):
     """HTTP client wrapper with retry logic and error handling."""
 
+    _retryable_exceptions = (ConnectionError, Timeout)
+
     def __init__(
         self,
         base_url: str,
         timeout: int = 30,
         max_retries: int = 3,
         retry_backoff: float = 0.3,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        codec: Optional[JSONCodec] = None,
+        compressor: Optional[RequestCompressor] = None,
     ) -> None:
         """Initialize HTTP client.
 
@@ -32,12 +216,61 @@ class HTTPClient:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             retry_backoff: Backoff factor for exponential backoff
+            pool_connections: Number of host connection pools to cache
+            pool_maxsize: Maximum connections kept alive per host
+            pool_block: Block when the pool is exhausted instead of opening
+                extra, non-reusable connections
+            rate_limiter: Limiter every request attempt waits on
+            retry_policy: Retry policy (overrides max_retries and
+                retry_backoff when given)
+            circuit_breaker: Breaker that fails fast on unhealthy endpoints
+            coalescer: Shares identical in-flight GETs between callers
+            codec: JSON codec for bodies (defaults to the fastest installed)
+            compressor: Gzips large request bodies
         """
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.retry_backoff = retry_backoff
-        self.logger = get_logger(__name__)
+        super().__init__(
+            base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_backoff=retry_backoff,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            coalescer=coalescer,
+            codec=codec,
+            compressor=compressor,
+        )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create a keep-alive session with a sized connection pool.
+
+        Returns:
+            Configured requests Session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
+
+    def close(self) -> None:
+        """Close the session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def get(
         self,
@@ -59,13 +292,20 @@ class HTTPClient:
             APIError: For API-related errors
             NetworkError: For network-related errors
         """
-        return self._make_request("GET", endpoint, headers=headers, params=params)
+        if self.coalescer is None:
+            return self._make_request("GET", endpoint, headers=headers, params=params)
+
+        return self.coalescer.do(
+            self._coalesce_key(endpoint, headers, params),
+            lambda: self._make_request("GET", endpoint, headers=headers, params=params),
+        )
 
     def post(
         self,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         data: Optional[Dict[str, Any]] = None,
+        before_retry: Optional[Callable[[SteadfastException], RetryHookResult]] = None,
     ) -> Dict[str, Any]:
         """Make POST request.
 
@@ -73,6 +313,10 @@ class HTTPClient:
             endpoint: API endpoint
             headers: Request headers
             data: Request payload
+            before_retry: Called before each retry with the error that
+                failed the previous attempt; it returns None to resend the
+                request, a Resend to send a changed payload and headers, or
+                a response to return instead of resending
 
         Returns:
             Parsed JSON response
@@ -81,7 +325,9 @@ class HTTPClient:
             APIError: For API-related errors
             NetworkError: For network-related errors
         """
-        return self._make_request("POST", endpoint, headers=headers, data=data)
+        return self._make_request(
+            "POST", endpoint, headers=headers, data=data, before_retry=before_retry
+        )
 
     def _make_request(
         self,
@@ -90,8 +336,9 @@ class HTTPClient:
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
+        before_retry: Optional[Callable[[SteadfastException], RetryHookResult]] = None,
     ) -> Dict[str, Any]:
-        """Make HTTP request with retry logic.
+        """Make HTTP request guarded by the circuit breaker, if configured.
 
         Args:
             method: HTTP method
@@ -99,75 +346,132 @@ class HTTPClient:
             headers: Request headers
             params: Query parameters
             data: Request payload
+            before_retry: Hook run before each retry (see post())
 
         Returns:
             Parsed JSON response
 
         Raises:
+            CircuitOpenError: If the endpoint's circuit is open
             APIError: For API-related errors
             NetworkError: For network-related errors
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = headers or {}
+        if self.circuit_breaker is None:
+            return self._request_with_retries(
+                method, endpoint, headers, params, data, before_retry
+            )
+
+        circuit = self.circuit_breaker.before_call(endpoint)
+        try:
+            response = self._request_with_retries(
+                method, endpoint, headers, params, data, before_retry
+            )
+        except BaseException as e:
+            self.circuit_breaker.record(circuit, e)
+            raise
+        self.circuit_breaker.record(circuit)
+        return response
+
+    def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        before_retry: Optional[Callable[[SteadfastException], RetryHookResult]] = None,
+    ) -> Dict[str, Any]:
+        """Make HTTP request with retry logic.
 
-        # Set default headers
-        if "Content-Type" not in headers and data is not None:
-            headers["Content-Type"] = "application/json"
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            headers: Request headers
+            params: Query parameters
+            data: Request payload
+            before_retry: Hook run before each retry (see post())
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            APIError: For API-related errors
+            NetworkError: For network-related errors
+        """
+        url = self._build_url(endpoint)
+        headers = self._prepare_headers(headers, data)
+        body = self._encode_body(data, headers)
+        self.retry_policy.budget.record_request()
+        delay = 0.0
+        failure: Optional[SteadfastException] = None
 
         for attempt in range(self.max_retries + 1):
+            if failure is not None and before_retry is not None:
+                outcome = before_retry(failure)
+                if isinstance(outcome, Resend):
+                    data = outcome.data
+                    headers = self._prepare_headers(outcome.headers, data)
+                    body = self._encode_body(data, headers)
+                elif outcome is not None:
+                    return outcome
+
             try:
-                self.logger.debug(
-                    sanitize_log_message(
-                        f"Making {method} request to {url} "
-                        f"(attempt {attempt + 1}/{self.max_retries + 1})"
-                    )
-                )
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(endpoint)
 
-                response = requests.request(
+                self._log_attempt(method, url, attempt)
+
+                response = self.session.request(
                     method=method,
                     url=url,
                     headers=headers,
                     params=params,
-                    json=data,
+                    data=body,
                     timeout=self.timeout,
                 )
 
                 # Handle HTTP errors
                 if not response.ok:
-                    error_msg = f"HTTP {response.status_code}"
-                    try:
-                        error_data = response.json()
-                        if "message" in error_data:
-                            error_msg = error_data["message"]
-                        elif "error" in error_data:
-                            error_msg = error_data["error"]
-                    except (JSONDecodeError, ValueError):
-                        error_msg = response.text or error_msg
-
-                    if response.status_code == 404:
-                        from .exceptions import NotFoundError
-
-                        raise NotFoundError(error_msg)
-                    elif response.status_code == 401:
-                        from .exceptions import AuthenticationError
-
-                        raise AuthenticationError(error_msg)
-                    else:
-                        raise APIError(error_msg, response.status_code)
+                    error_data = self._decode_error_body(response.content)
+                    error = self._error_from_response(
+                        response.status_code, error_data, response.text
+                    )
+
+                    if self.retry_policy.is_retryable_status(response.status_code):
+                        retry_after = self.retry_policy.parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        next_delay = self.retry_policy.next_delay(
+                            attempt, delay, retry_after
+                        )
+                        if next_delay is None:
+                            raise self._retry_status_error(error, retry_after)
+                        delay = next_delay
+                        failure = error
+                        self._sleep_before_retry(delay)
+                        continue
+
+                    raise error
 
                 # Parse JSON response
                 try:
-                    response_data: Dict[str, Any] = response.json()
+                    response_data: Dict[str, Any] = self.codec.loads(response.content)
                     return response_data
-                except (JSONDecodeError, ValueError) as e:
+                except ValueError as e:
                     raise APIError(f"Invalid JSON response: {str(e)}")
 
             except (ConnectionError, Timeout) as e:
-                if not self._should_retry(e, attempt):
-                    raise NetworkError(f"Network error: {str(e)}")
+                next_delay = (
+                    self.retry_policy.next_delay(attempt, delay)
+                    if self._should_retry(e, attempt)
+                    else None
+                )
+                failure = NetworkError(f"Network error: {str(e)}")
+                if next_delay is None:
+                    raise failure
 
-                if attempt < self.max_retries:
-                    self._exponential_backoff(attempt)
+                delay = next_delay
+                self._sleep_before_retry(delay)
 
             except RequestException as e:
                 raise NetworkError(f"Request failed: {str(e)}")
@@ -175,28 +479,11 @@ class HTTPClient:
         # This should never be reached due to the retry logic
         raise NetworkError("Max retries exceeded")
 
-    def _should_retry(self, exception: Exception, attempt: int) -> bool:
-        """Determine if request should be retried.
+    def _sleep_before_retry(self, delay: float) -> None:
+        """Wait before the next attempt.
 
         Args:
-            exception: Exception that occurred
-            attempt: Current attempt number
-
-        Returns:
-            True if should retry, False otherwise
-        """
-        if attempt >= self.max_retries:
-            return False
-
-        # Retry on connection errors and timeouts
-        return isinstance(exception, (ConnectionError, Timeout))
-
-    def _exponential_backoff(self, attempt: int) -> None:
-        """Apply exponential backoff delay.
-
-        Args:
-            attempt: Current attempt number
+            delay: Delay in seconds
         """
-        delay = self.retry_backoff * (2**attempt)
         self.logger.debug(f"Retrying in {delay:.2f} seconds...")
         time.sleep(delay)
@@ -0,0 +1,152 @@
+"""Lazily decoded response models."""
+
+from dataclasses import fields
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+_T = TypeVar("_T")
+
+# Decodes one model field from a raw response item
+FieldDecoder = Callable[[Dict[str, Any]], Any]
+
+
+def decode_fields(
+    model: Callable[..., _T], decoders: Mapping[str, FieldDecoder], item: Dict[str, Any]
+) -> _T:
+    """Build a model eagerly, decoding every field from a response item."""
+    return model(**{name: decode(item) for name, decode in decoders.items()})
+
+
+def lazy_model(
+    model: Type[_T], decoders: Mapping[str, FieldDecoder], module: str
+) -> Type[_T]:
+    """Build a subclass of a slotted model that decodes fields on first read.
+
+    Instances are created from the raw response item, ``Lazy<Model>(item)``.
+    Each field is decoded the first time it is read and then stored in the
+    model's slot, so later reads cost nothing extra. Lazy instances compare
+    equal to eager models with the same field values, and can also be built
+    from field values, so ``dataclasses.replace()`` works on them.
+
+    Args:
+        model: Slotted model class to extend
+        decoders: Decoder for each of the model's fields
+        module: Module the subclass is defined in, for pickling
+
+    Returns:
+        The lazy subclass
+    """
+
+    class_name = f"Lazy{model.__name__}"
+    names = tuple(f.name for f in fields(model))  # type: ignore[arg-type]
+
+    def __init__(
+        self: Any, item: Optional[Dict[str, Any]] = None, **values: Any
+    ) -> None:
+        if item is not None and not values:
+            self._raw = item
+            return
+        if item is not None:
+            raise TypeError(
+                f"{class_name}() takes a raw item or field values, not both"
+            )
+        # Built from field values, e.g. by dataclasses.replace()
+        eager = model(**values)
+        self._raw = {}
+        for field_name in names:
+            setattr(self, field_name, getattr(eager, field_name))
+
+    def __eq__(self: Any, other: object) -> bool:
+        # Equal to the eager model, and its other lazy forms, with equal fields
+        if not isinstance(other, model):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in names)
+
+    def __getattr__(self: Any, name: str) -> Any:
+        # Only called while the field's slot is still empty
+        decode = decoders.get(name)
+        if decode is None:
+            raise AttributeError(name)
+        value = decode(self._raw)
+        setattr(self, name, value)
+        return value
+
+    return type(
+        class_name,
+        (model,),
+        {
+            "__slots__": ("_raw",),
+            "__init__": __init__,
+            "__eq__": __eq__,
+            "__hash__": model.__hash__,
+            "__getattr__": __getattr__,
+            "__doc__": f"{model.__name__} decoded from the raw item on first read.",
+            "__module__": module,
+            "__qualname__": class_name,
+        },
+    )
+
+
+class LazyList(Sequence[_T]):
+    """Read-only list of response items, each built on first access."""
+
+    def __init__(
+        self, items: List[Dict[str, Any]], build: Callable[[Dict[str, Any]], _T]
+    ) -> None:
+        """Initialize lazy list.
+
+        Args:
+            items: Raw items from the decoded response
+            build: Builds the model for one item
+        """
+        self._raw = items
+        self._build = build
+        self._items: List[Optional[_T]] = [None] * len(items)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[_T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[_T, List[_T]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("list index out of range")
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[_T]:
+        return (self._item(i) for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def _item(self, index: int) -> _T:
+        """Return the model for one item, building it if needed."""
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._build(self._raw[index])
+        return item
@@ -0,0 +1,381 @@
+"""Local SQLite ledger of created orders for Steadfast SDK."""
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .columnar import NO_CONSIGNMENT_ID, BulkOrderColumns
+from .exceptions import ValidationError
+from .models import BulkOrderResult, LedgerEntry, Order
+
+# Invoices per lookup query, well under SQLite's bound-parameter limit
+_LOOKUP_BATCH = 500
+
+_COLUMNS = "invoice, consignment_id, tracking_code, cod_amount, recorded_at"
+_LOOKUP_COLUMNS = ("invoice", "consignment_id", "tracking_code")
+
+
+class OrderLedger:
+    """Record of created orders keyed by invoice, consignment ID and tracking code.
+
+    Every order created through a client with a ledger is recorded, so any
+    one identifier can be turned into the others locally with an indexed
+    lookup. Orders whose invoice is already in the ledger are not submitted
+    again. Use a file path to keep the ledger between runs; the default
+    ``":memory:"`` ledger lasts as long as the object.
+
+    The ledger also keeps the idempotency key of every submission that has
+    not been confirmed yet, so that after a crash or lost response the
+    order is looked up before it is sent again.
+    """
+
+    def __init__(self, path: str = ":memory:", lock_timeout: float = 10.0) -> None:
+        """Initialize order ledger.
+
+        Args:
+            path: SQLite database file, or ``":memory:"``
+            lock_timeout: Seconds to wait for the database lock
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        # Invoices reserved through this object whose submission is in flight
+        self._submitting: Set[str] = set()
+        self._conn = sqlite3.connect(
+            path,
+            timeout=lock_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS orders ("
+            "invoice TEXT PRIMARY KEY, "
+            "consignment_id INTEGER UNIQUE, "
+            "tracking_code TEXT UNIQUE, "
+            "cod_amount REAL, "
+            "recorded_at TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pending_submissions ("
+            "invoice TEXT PRIMARY KEY, "
+            "idempotency_key TEXT NOT NULL, "
+            "submitted_at TEXT NOT NULL)"
+        )
+
+    def record(self, order: Union[Order, BulkOrderResult]) -> bool:
+        """Record a created order.
+
+        Bulk results without a consignment ID (failed orders) are ignored.
+        Recording an invoice again replaces its entry and clears any
+        pending submission of it.
+
+        Args:
+            order: Order from create() or a result from create_bulk()
+
+        Returns:
+            True if the order was recorded
+
+        Raises:
+            sqlite3.IntegrityError: If its consignment ID or tracking code is
+                recorded for another invoice
+        """
+        return self.record_many([order]) == 1
+
+    def record_many(
+        self,
+        orders: Union[BulkOrderColumns, Iterable[Union[Order, BulkOrderResult]]],
+    ) -> int:
+        """Record several created orders in one transaction.
+
+        Args:
+            orders: Orders, bulk results or BulkOrderColumns; failed results
+                are ignored
+
+        Returns:
+            Number of orders recorded
+
+        Raises:
+            sqlite3.IntegrityError: If a consignment ID or tracking code is
+                recorded for another invoice; nothing is recorded
+        """
+        recorded_at = datetime.now(timezone.utc).isoformat()
+        if isinstance(orders, BulkOrderColumns):
+            # Read the columns directly rather than building every row
+            rows = [
+                (invoice, consignment_id, tracking_code, cod_amount, recorded_at)
+                for invoice, consignment_id, tracking_code, cod_amount in zip(
+                    orders.invoice,
+                    orders.consignment_id,
+                    orders.tracking_code,
+                    orders.cod_amount,
+                )
+                if consignment_id != NO_CONSIGNMENT_ID
+            ]
+        else:
+            rows = [
+                (
+                    order.invoice,
+                    order.consignment_id,
+                    order.tracking_code,
+                    order.cod_amount,
+                    recorded_at,
+                )
+                for order in orders
+                if order.consignment_id is not None
+            ]
+        return self._insert(
+            f"INSERT INTO orders ({_COLUMNS}) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(invoice) DO UPDATE SET "
+            "consignment_id = excluded.consignment_id, "
+            "tracking_code = excluded.tracking_code, "
+            "cod_amount = excluded.cod_amount, "
+            "recorded_at = excluded.recorded_at",
+            rows,
+        )
+
+    def record_existing(self, orders: Iterable[Union[Order, BulkOrderResult]]) -> int:
+        """Record orders the API confirmed were created by an earlier attempt.
+
+        The lookup that confirms them does not return a consignment ID or
+        tracking code, so these may be unknown and are stored as NULL. An
+        invoice already in the ledger keeps its entry. Pending submissions
+        of the invoices are cleared.
+
+        Args:
+            orders: Orders or bulk results confirmed to exist
+
+        Returns:
+            Number of orders given
+        """
+        recorded_at = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                order.invoice,
+                order.consignment_id or None,
+                order.tracking_code or None,
+                order.cod_amount,
+                recorded_at,
+            )
+            for order in orders
+        ]
+        return self._insert(
+            f"INSERT INTO orders ({_COLUMNS}) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(invoice) DO NOTHING",
+            rows,
+        )
+
+    def _insert(self, statement: str, rows: List[Tuple[Any, ...]]) -> int:
+        """Insert order rows and clear their pending submissions atomically."""
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(statement, rows)
+                self._conn.executemany(
+                    "DELETE FROM pending_submissions WHERE invoice = ?",
+                    [row[:1] for row in rows],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._submitting.difference_update(row[0] for row in rows)
+        return len(rows)
+
+    def reserve(
+        self,
+        invoices: Iterable[str],
+        idempotency_key: str,
+        takeover: Iterable[str] = (),
+    ) -> Set[str]:
+        """Atomically record that orders are about to be submitted.
+
+        An invoice cannot be reserved while it is recorded, being submitted
+        through this ledger, or pending from an earlier submission; callers
+        treat such an invoice as a duplicate. Either every invoice is
+        reserved or none is.
+
+        Args:
+            invoices: Invoices being submitted
+            idempotency_key: Key sent with the submission
+            takeover: Invoices whose earlier pending submission was
+                confirmed not to have created the order; their pending
+                entries are replaced
+
+        Returns:
+            The invoices that could not be reserved; empty on success
+        """
+        # A repeated invoice would fail the INSERT below
+        invoices = list(dict.fromkeys(invoices))
+        takeover = set(takeover)
+        submitted_at = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            held = self._submitting.intersection(invoices)
+            if held:
+                return held
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "DELETE FROM pending_submissions WHERE invoice = ?",
+                    [(invoice,) for invoice in invoices if invoice in takeover],
+                )
+                held = self._select_invoices("orders", invoices)
+                if not held:
+                    self._conn.executemany(
+                        "INSERT INTO pending_submissions "
+                        "(invoice, idempotency_key, submitted_at) VALUES (?, ?, ?)",
+                        [
+                            (invoice, idempotency_key, submitted_at)
+                            for invoice in invoices
+                        ],
+                    )
+            except sqlite3.IntegrityError:
+                self._conn.execute("ROLLBACK")
+                return self._select_invoices("pending_submissions", invoices)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            if held:
+                self._conn.execute("ROLLBACK")
+                return held
+            self._conn.execute("COMMIT")
+            self._submitting.update(invoices)
+        return set()
+
+    def release(self, invoices: Iterable[str]) -> None:
+        """End a submission reserved with reserve().
+
+        Invoices whose outcome was not recorded stay pending, so the next
+        submission of them is confirmed with the API first.
+
+        Args:
+            invoices: Invoices passed to reserve()
+        """
+        with self._lock:
+            self._submitting.difference_update(invoices)
+
+    def _select_invoices(self, table: str, invoices: List[str]) -> Set[str]:
+        """Return which invoices are in a table; the caller holds the lock."""
+        found: Set[str] = set()
+        for batch in _batches(invoices, _LOOKUP_BATCH):
+            placeholders = ", ".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT invoice FROM {table} WHERE invoice IN ({placeholders})",
+                batch,
+            ).fetchall()
+            found.update(row[0] for row in rows)
+        return found
+
+    def get_pending(self, invoices: Iterable[str]) -> Set[str]:
+        """Return the invoices submitted without a confirmed outcome.
+
+        Args:
+            invoices: Invoices to check
+
+        Returns:
+            The invoices that may already have been created
+        """
+        pending: Set[str] = set()
+        for batch in _batches(invoices, _LOOKUP_BATCH):
+            placeholders = ", ".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT invoice FROM pending_submissions "
+                    f"WHERE invoice IN ({placeholders})",
+                    batch,
+                ).fetchall()
+            pending.update(row[0] for row in rows)
+        return pending
+
+    def get(
+        self, identifier: Union[int, str], identifier_type: str = "invoice"
+    ) -> Optional[LedgerEntry]:
+        """Look up an order by any of its identifiers.
+
+        Args:
+            identifier: Invoice, consignment ID or tracking code
+            identifier_type: "invoice", "consignment_id" or "tracking_code"
+
+        Returns:
+            LedgerEntry, or None if the order is not in the ledger
+
+        Raises:
+            ValidationError: If identifier_type is not recognised
+        """
+        if identifier_type not in _LOOKUP_COLUMNS:
+            raise ValidationError(
+                "Identifier type must be one of: " + ", ".join(_LOOKUP_COLUMNS),
+                "identifier_type",
+            )
+
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM orders WHERE {identifier_type} = ?",
+                (identifier,),
+            ).fetchone()
+        return LedgerEntry(*row) if row else None
+
+    def get_by_invoice(self, invoice: str) -> Optional[LedgerEntry]:
+        """Look up an order by invoice."""
+        return self.get(invoice, "invoice")
+
+    def get_by_consignment_id(self, consignment_id: int) -> Optional[LedgerEntry]:
+        """Look up an order by consignment ID."""
+        return self.get(consignment_id, "consignment_id")
+
+    def get_by_tracking_code(self, tracking_code: str) -> Optional[LedgerEntry]:
+        """Look up an order by tracking code."""
+        return self.get(tracking_code, "tracking_code")
+
+    def get_many(self, invoices: Iterable[str]) -> Dict[str, LedgerEntry]:
+        """Look up several invoices at once.
+
+        Args:
+            invoices: Invoices to look up
+
+        Returns:
+            Mapping of invoice to LedgerEntry for the invoices in the ledger
+        """
+        entries: Dict[str, LedgerEntry] = {}
+        for batch in _batches(invoices, _LOOKUP_BATCH):
+            placeholders = ", ".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM orders WHERE invoice IN ({placeholders})",
+                    batch,
+                ).fetchall()
+            for row in rows:
+                entries[row[0]] = LedgerEntry(*row)
+        return entries
+
+    def __contains__(self, invoice: Any) -> bool:
+        return self.get_by_invoice(invoice) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM orders").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "OrderLedger":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _batches(items: Iterable[str], size: int) -> Iterator[Tuple[str, ...]]:
+    """Yield tuples of up to ``size`` items."""
+    iterator = iter(items)
+    while True:
+        batch: List[str] = list(islice(iterator, size))
+        if not batch:
+            return
+        yield tuple(batch)
@@ -1,9 +1,78 @@
 """Data models for Steadfast SDK."""
 
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
-
-
+from dataclasses import MISSING, dataclass, field, fields, make_dataclass
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .exceptions import SteadfastException
+
+_T = TypeVar("_T")
+
+
+def _slotted(cls: Type[_T]) -> Type[_T]:
+    """Rebuild a dataclass with ``__slots__`` instead of a per-instance dict.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10.
+    """
+    names = tuple(f.name for f in fields(cls))  # type: ignore[arg-type]
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        # Frozen instances cannot be restored with setattr when unpickled
+        namespace["__getstate__"] = _frozen_getstate
+        namespace["__setstate__"] = _frozen_setstate
+
+    slotted = cast(Type[_T], type(cls.__name__, cls.__bases__, namespace))
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def _frozen_getstate(self: Any) -> Tuple[Any, ...]:
+    return tuple(getattr(self, f.name) for f in fields(self))
+
+
+def _frozen_setstate(self: Any, state: Tuple[Any, ...]) -> None:
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def _frozen(cls: Type[_T]) -> Type[_T]:
+    """Build an immutable, hashable, slotted copy of a model.
+
+    The copy has the same fields and constructor but is a separate class,
+    so its instances are not instances of ``cls``.
+    """
+    frozen = make_dataclass(
+        f"Frozen{cls.__name__}",
+        [
+            (
+                (f.name, f.type)
+                if f.default is MISSING
+                else (f.name, f.type, field(default=f.default))
+            )
+            for f in fields(cls)  # type: ignore[arg-type]
+        ],
+        namespace={"__doc__": f"Immutable {cls.__name__}.", "__module__": __name__},
+        frozen=True,
+    )
+    return _slotted(frozen)
+
+
+@_slotted
 @dataclass
 class Order:
     """Single order response model."""
@@ -21,6 +90,7 @@ class Order:
     updated_at: Optional[str] = None
 
 
+@_slotted
 @dataclass
 class BulkOrderResult:
     """Individual result in bulk order response."""
@@ -33,17 +103,97 @@ class BulkOrderResult:
     note: Optional[str] = None
     consignment_id: Optional[int] = None
     tracking_code: Optional[str] = None
-    status: str = "error"  # "success" or "error"
+    status: str = "error"  # "success", "error" or "duplicate"
+    error: Optional[str] = None
+
+
+@dataclass
+class LedgerEntry:
+    """Identifiers of a created order, as recorded in an OrderLedger."""
+
+    invoice: str
+    consignment_id: Optional[int]  # None if only confirmed by a status lookup
+    tracking_code: Optional[str]
+    cod_amount: Optional[float]
+    recorded_at: str  # ISO 8601 UTC time the order was recorded
+
+
+@dataclass
+class OutboxEntry:
+    """An order queued in an OrderOutbox and the outcome of sending it."""
+
+    id: int
+    invoice: str
+    status: str  # "pending", "sent" or "failed"
+    attempts: int
+    consignment_id: Optional[int] = None
+    tracking_code: Optional[str] = None
+    error: Optional[str] = None
+    enqueued_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    # Key of the last send attempt; set on a pending entry whose send was
+    # interrupted
+    idempotency_key: Optional[str] = None
+
+
+@dataclass
+class BulkChunkReport:
+    """Outcome and timing of one chunk of a chunked bulk submission."""
+
+    index: int
+    start: int  # Position of the chunk's first order in the input
+    size: int
+    elapsed: float  # Seconds spent on the request
     error: Optional[str] = None
 
 
+@dataclass
+class ValidationIssue:
+    """A single field that failed validation in a bulk order list."""
+
+    index: int  # Position of the order in the input list (0-based)
+    field: str
+    message: str
+
+
+@dataclass
+class RejectedOrder:
+    """An order left out of a bulk submission because it is invalid."""
+
+    index: int  # Position of the order in the input list (0-based)
+    order: Dict[str, Any]
+    issues: List[ValidationIssue]
+
+
+@dataclass
+class OrderValidationReport:
+    """Result of validating every order in a bulk order list."""
+
+    valid_orders: List[Dict[str, Any]]
+    rejected: List[RejectedOrder]
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no order was rejected."""
+        return not self.rejected
+
+    @property
+    def issues(self) -> List[ValidationIssue]:
+        """Every validation issue, in input order."""
+        return [issue for rejected in self.rejected for issue in rejected.issues]
+
+
 @dataclass
 class BulkOrderResponse:
     """Bulk order creation response."""
 
-    results: List[BulkOrderResult]
+    # A list, or a BulkOrderColumns when created with columnar=True
+    results: Sequence[BulkOrderResult]
+    chunks: List[BulkChunkReport] = field(default_factory=list)
+    rejected: List[RejectedOrder] = field(default_factory=list)
 
 
+@_slotted
 @dataclass
 class OrderStatus:
     """Order status response model."""
@@ -52,6 +202,17 @@ class OrderStatus:
     delivery_status: str  # Current delivery status
 
 
+@dataclass
+class StatusChange:
+    """A change in the delivery status of a watched order."""
+
+    identifier: Union[int, str]
+    identifier_type: str  # consignment_id, invoice or tracking_code
+    previous_status: Optional[str]  # None on the first observation
+    status: OrderStatus
+    final: bool = False  # Terminal status; the order is no longer watched
+
+
 @dataclass
 class Balance:
     """Account balance response model."""
@@ -60,6 +221,7 @@ class Balance:
     current_balance: float
 
 
+@_slotted
 @dataclass
 class ReturnRequest:
     """Return request model."""
@@ -78,9 +240,10 @@ class ReturnRequest:
 class ReturnRequestList:
     """List of return requests."""
 
-    data: List[ReturnRequest]
+    data: Sequence[ReturnRequest]
 
 
+@_slotted
 @dataclass
 class Payment:
     """Payment information model."""
@@ -102,13 +265,30 @@ class PaymentDetails:
     updated_at: Optional[str] = None
 
 
+@dataclass
+class PaymentFetch:
+    """Outcome and timing of one payment fetched by get_many()."""
+
+    payment_id: int
+    details: Optional[PaymentDetails] = None
+    elapsed: float = 0.0  # Seconds spent on the last attempt
+    attempts: int = 1
+    error: Optional[SteadfastException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the payment details were fetched."""
+        return self.error is None
+
+
 @dataclass
 class PaymentList:
     """List of payments."""
 
-    data: List[Payment]
+    data: Sequence[Payment]
 
 
+@_slotted
 @dataclass
 class PoliceStation:
     """Police station information."""
@@ -122,4 +302,13 @@ class PoliceStation:
 class PoliceStationList:
     """List of police stations."""
 
-    data: List[PoliceStation]
+    data: Sequence[PoliceStation]
+
+
+# Immutable, hashable variants of the high-volume models
+FrozenOrder = _frozen(Order)
+FrozenBulkOrderResult = _frozen(BulkOrderResult)
+FrozenOrderStatus = _frozen(OrderStatus)
+FrozenReturnRequest = _frozen(ReturnRequest)
+FrozenPayment = _frozen(Payment)
+FrozenPoliceStation = _frozen(PoliceStation)
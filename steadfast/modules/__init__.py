@@ -1,11 +1,11 @@
 """Steadfast SDK modules."""
 
-from .order import OrderModule
-from .tracking import TrackingModule
-from .balance import BalanceModule
-from .return_request import ReturnRequestModule
-from .payment import PaymentModule
-from .location import LocationModule
+from .order import OrderModule, AsyncOrderModule
+from .tracking import TrackingModule, AsyncTrackingModule
+from .balance import BalanceModule, AsyncBalanceModule
+from .return_request import ReturnRequestModule, AsyncReturnRequestModule
+from .payment import PaymentModule, AsyncPaymentModule
+from .location import LocationModule, AsyncLocationModule
 
 __all__ = [
     "OrderModule",
@@ -14,4 +14,10 @@ __all__ = [
     "ReturnRequestModule",
     "PaymentModule",
     "LocationModule",
+    "AsyncOrderModule",
+    "AsyncTrackingModule",
+    "AsyncBalanceModule",
+    "AsyncReturnRequestModule",
+    "AsyncPaymentModule",
+    "AsyncLocationModule",
 ]
@@ -1,10 +1,24 @@
 """Balance management module for Steadfast SDK."""
 
+from typing import Any, Dict
+
 from ..http_client import HTTPClient
+from ..async_http_client import AsyncHTTPClient
 from ..models import Balance
 
 
-class BalanceModule:
+class _BalanceModuleBase:
+    """Parsing shared by the sync and async balance modules."""
+
+    def _parse_balance(self, response: Dict[str, Any]) -> Balance:
+        """Build a Balance from a get_balance response."""
+        return Balance(
+            status=response.get("status", 200),
+            current_balance=response.get("current_balance", 0.0),
+        )
+
+
+class BalanceModule(_BalanceModuleBase):
     """Module for account balance management."""
 
     def __init__(self, http_client: HTTPClient) -> None:
@@ -29,7 +43,29 @@ class BalanceModule:
         response = self.http_client.get("/get_balance")
 
         # Parse and return response
-        return Balance(
-            status=response.get("status", 200),
-            current_balance=response.get("current_balance", 0.0),
-        )
+        return self._parse_balance(response)
+
+
+class AsyncBalanceModule(_BalanceModuleBase):
+    """Async module for account balance management."""
+
+    def __init__(self, http_client: AsyncHTTPClient) -> None:
+        """Initialize async balance module.
+
+        Args:
+            http_client: Async HTTP client instance
+        """
+        self.http_client = http_client
+
+    async def get_current_balance(self) -> Balance:
+        """Get current account balance.
+
+        Returns:
+            Balance object with current balance
+
+        Raises:
+            APIError: If API request fails
+            NetworkError: If network request fails
+        """
+        response = await self.http_client.get("/get_balance")
+        return self._parse_balance(response)
@@ -1,10 +1,41 @@
 """Location module for Steadfast SDK."""
 
+from typing import Any, Dict
+
 from ..http_client import HTTPClient
+from ..async_http_client import AsyncHTTPClient
 from ..models import PoliceStation, PoliceStationList
+from ..lazy import FieldDecoder, LazyList, decode_fields, lazy_model
+
+_POLICE_STATION_FIELDS: Dict[str, FieldDecoder] = {
+    "id": lambda item: item.get("id", 0),
+    "name": lambda item: item.get("name", ""),
+    "location": lambda item: item.get("location", ""),
+}
+
+LazyPoliceStation = lazy_model(PoliceStation, _POLICE_STATION_FIELDS, __name__)
+
+
+class _LocationModuleBase:
+    """Parsing shared by the sync and async location modules."""
+
+    def _parse_police_stations(
+        self, response: Dict[str, Any], lazy: bool = False
+    ) -> PoliceStationList:
+        """Build a PoliceStationList from a police-stations response."""
+        items = response.get("data", [])
+        if lazy:
+            return PoliceStationList(data=LazyList(items, LazyPoliceStation))
+
+        return PoliceStationList(
+            data=[
+                decode_fields(PoliceStation, _POLICE_STATION_FIELDS, item)
+                for item in items
+            ]
+        )
 
 
-class LocationModule:
+class LocationModule(_LocationModuleBase):
     """Module for managing locations."""
 
     def __init__(self, http_client: HTTPClient) -> None:
@@ -15,9 +46,13 @@ class LocationModule:
         """
         self.http_client = http_client
 
-    def get_police_stations(self) -> PoliceStationList:
+    def get_police_stations(self, lazy: bool = False) -> PoliceStationList:
         """Get list of police stations.
 
+        Args:
+            lazy: Build each police station, and decode each of its fields,
+                only when it is first read
+
         Returns:
             PoliceStationList object with police stations
 
@@ -26,15 +61,33 @@ class LocationModule:
             NetworkError: If network error occurs
         """
         response = self.http_client.get("/location/police-stations")
+        return self._parse_police_stations(response, lazy)
+
+
+class AsyncLocationModule(_LocationModuleBase):
+    """Async module for managing locations."""
 
-        stations = []
-        for item in response.get("data", []):
-            stations.append(
-                PoliceStation(
-                    id=item.get("id", 0),
-                    name=item.get("name", ""),
-                    location=item.get("location", ""),
-                )
-            )
-
-        return PoliceStationList(data=stations)
+    def __init__(self, http_client: AsyncHTTPClient) -> None:
+        """Initialize async location module.
+
+        Args:
+            http_client: AsyncHTTPClient instance for API calls
+        """
+        self.http_client = http_client
+
+    async def get_police_stations(self, lazy: bool = False) -> PoliceStationList:
+        """Get list of police stations.
+
+        Args:
+            lazy: Build each police station, and decode each of its fields,
+                only when it is first read
+
+        Returns:
+            PoliceStationList object with police stations
+
+        Raises:
+            APIError: If API returns error
+            NetworkError: If network error occurs
+        """
+        response = await self.http_client.get("/location/police-stations")
+        return self._parse_police_stations(response, lazy)
@@ -1,9 +1,41 @@
 """Order management module for Steadfast SDK."""
 
-from typing import List, Dict, Any, Optional, Union
+import asyncio
+import hashlib
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..http_client import HTTPClient
-from ..models import Order, BulkOrderResult, BulkOrderResponse
+from ..async_http_client import AsyncHTTPClient
+from ..columnar import BulkOrderColumns
+from ..ledger import OrderLedger
+from ..models import (
+    Order,
+    BulkOrderResult,
+    BulkOrderResponse,
+    BulkChunkReport,
+    OrderStatus,
+    OrderValidationReport,
+    RejectedOrder,
+    ValidationIssue,
+)
 from ..validators import (
     validate_invoice,
     validate_recipient_name,
@@ -12,22 +44,80 @@ from ..validators import (
     validate_email,
     validate_cod_amount,
     validate_delivery_type,
+    validate_order,
 )
-from ..exceptions import ValidationError
+from ..exceptions import (
+    APIError,
+    DuplicateOrderError,
+    NetworkError,
+    NotFoundError,
+    SteadfastException,
+    ValidationError,
+)
+from ..frames import validate_orders_frame
+from ..retry import Resend, RetryHookResult
+from .tracking import AsyncTrackingModule, StatusResult, TrackingModule
 
+# Maximum orders accepted by /create_bulk_order
+MAX_BULK_ORDERS = 500
 
-class OrderModule:
-    """Module for order creation and management."""
+# Header carrying the idempotency key of an order submission
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+# Concurrent status_by_invoice lookups when confirming a bulk submission
+_CONFIRM_CONCURRENCY = 8
 
-    def __init__(self, http_client: HTTPClient) -> None:
-        """Initialize order module.
+# Required text fields and their validators, in payload order
+_REQUIRED_TEXT_FIELDS: Tuple[Tuple[str, Callable[[str], str]], ...] = (
+    ("invoice", validate_invoice),
+    ("recipient_name", validate_recipient_name),
+    ("recipient_phone", validate_phone),
+    ("recipient_address", validate_address),
+)
+_OPTIONAL_CONTACT_FIELDS: Tuple[Tuple[str, Callable[[str], str]], ...] = (
+    ("alternative_phone", validate_phone),
+    ("recipient_email", validate_email),
+)
+_PASSTHROUGH_FIELDS = ("note", "item_description", "total_lot")
+# An invoice can be reserved and created only once per bulk request
+_REPEATED_INVOICE = "Invoice {} appears more than once in the orders list"
 
-        Args:
-            http_client: HTTP client instance
-        """
-        self.http_client = http_client
+_Chunk = Tuple[int, int, List[Dict[str, Any]]]
+# (report, results, orders rejected by validation with input positions)
+_ChunkOutcome = Tuple[BulkChunkReport, Sequence[BulkOrderResult], List[RejectedOrder]]
 
-    def create(
+
+def idempotency_key(invoices: Iterable[str]) -> str:
+    """Return the idempotency key for a submission of the given invoices.
+
+    The key is derived only from the invoices, so every attempt to submit
+    the same orders carries the same key.
+
+    Args:
+        invoices: Invoices in submission order
+
+    Returns:
+        Hex SHA-256 digest of the invoices
+    """
+    return hashlib.sha256("\n".join(invoices).encode("utf-8")).hexdigest()
+
+
+def _may_have_created(error: SteadfastException) -> bool:
+    """Return True if a failed create attempt may still have created orders.
+
+    Timeouts, connection errors and server errors can come after the
+    server acted on the request; a 429 means it was turned away.
+    """
+    if isinstance(error, APIError):
+        return error.status_code is None or error.status_code >= 500
+    return True
+
+
+class _OrderModuleBase:
+    """Validation and parsing shared by the sync and async order modules."""
+
+    ledger: Optional[OrderLedger]
+
+    def _build_order_payload(
         self,
         invoice: str,
         recipient_name: str,
@@ -40,28 +130,11 @@ class OrderModule:
         note: Optional[str] = None,
         item_description: Optional[str] = None,
         total_lot: Optional[int] = None,
-    ) -> Order:
-        """Create a single order.
-
-        Args:
-            invoice: Unique order identifier
-            recipient_name: Recipient's full name
-            recipient_phone: Recipient's phone number (11 digits)
-            recipient_address: Delivery address
-            cod_amount: Cash on delivery amount
-            delivery_type: 0 for home delivery, 1 for point delivery
-            alternative_phone: Secondary contact number
-            recipient_email: Recipient's email address
-            note: Delivery instructions
-            item_description: Description of items
-            total_lot: Total lot of items
-
-        Returns:
-            Order object with consignment details
+    ) -> Dict[str, Any]:
+        """Validate single-order arguments and build the request payload.
 
         Raises:
             ValidationError: If input validation fails
-            APIError: If API request fails
         """
         # Validate required fields
         validated_invoice = validate_invoice(invoice)
@@ -81,7 +154,7 @@ class OrderModule:
             validated_email = validate_email(recipient_email)
 
         # Build payload
-        payload = {
+        payload: Dict[str, Any] = {
             "invoice": validated_invoice,
             "recipient_name": validated_name,
             "recipient_phone": validated_phone,
@@ -102,65 +175,459 @@ class OrderModule:
         if total_lot is not None:
             payload["total_lot"] = total_lot
 
-        # Make API call
-        response = self.http_client.post("/create_order", data=payload)
+        return payload
 
-        # Parse response and return Order object
-        return Order(
-            consignment_id=response["consignment_id"],
-            invoice=response["invoice"],
-            tracking_code=response["tracking_code"],
-            recipient_name=response["recipient_name"],
-            recipient_phone=response["recipient_phone"],
-            recipient_address=response["recipient_address"],
-            cod_amount=response["cod_amount"],
-            status=response.get("status", "pending"),
-            note=response.get("note"),
-            created_at=response.get("created_at"),
-            updated_at=response.get("updated_at"),
-        )
-
-    def create_bulk(self, orders: List[Dict[str, Any]]) -> BulkOrderResponse:
-        """Create multiple orders in a single request.
-
-        Args:
-            orders: List of order dictionaries (max 500)
-
-        Returns:
-            BulkOrderResponse with individual results
+    def _build_bulk_payload(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Validate a bulk order list and build the request payload.
 
         Raises:
             ValidationError: If validation fails
-            APIError: If API request fails
         """
         # Validate orders list
         if not orders:
             raise ValidationError("Orders list cannot be empty", "orders")
 
-        if len(orders) > 500:
+        if len(orders) > MAX_BULK_ORDERS:
             raise ValidationError(
                 "Cannot create more than 500 orders at once", "orders"
             )
 
         # Validate each order
         validated_orders = []
+        invoices: Set[str] = set()
         for i, order in enumerate(orders):
             try:
-                validated_order = self._validate_order(**order)
-                validated_orders.append(validated_order)
+                validated = validate_order(order)
+                if validated["invoice"] in invoices:
+                    raise ValidationError(
+                        _REPEATED_INVOICE.format(validated["invoice"]), "invoice"
+                    )
             except ValidationError as e:
                 # Add order index to error message
                 raise ValidationError(
                     f"Order {i + 1}: {e.message}", e.field or "orders"
                 )
+            invoices.add(validated["invoice"])
+            validated_orders.append(validated)
 
-        # Build payload
-        payload = {"orders": validated_orders}
+        return {"orders": validated_orders}
+
+    def validate_bulk(self, orders: Sequence[Dict[str, Any]]) -> OrderValidationReport:
+        """Run every validator over every order without raising.
+
+        Unlike create_bulk(), which stops at the first invalid order, this
+        collects all failures so a whole batch can be fixed in one pass. An
+        order repeating the invoice of an earlier valid order is rejected.
+
+        Args:
+            orders: Order dictionaries
+
+        Returns:
+            OrderValidationReport with the validated orders and the rejected
+            orders, each listing all of its issues
+        """
+        valid_orders = []
+        rejected = []
+        invoices: Set[str] = set()
+        for index, order in enumerate(orders):
+            validated, issues = self._collect_order_issues(index, order)
+            if not issues and validated["invoice"] in invoices:
+                message = _REPEATED_INVOICE.format(validated["invoice"])
+                issues.append(ValidationIssue(index, "invoice", message))
+            if issues:
+                rejected.append(RejectedOrder(index=index, order=order, issues=issues))
+            else:
+                invoices.add(validated["invoice"])
+                valid_orders.append(validated)
+
+        return OrderValidationReport(valid_orders=valid_orders, rejected=rejected)
+
+    def _collect_order_issues(
+        self, index: int, order: Any
+    ) -> Tuple[Dict[str, Any], List[ValidationIssue]]:
+        """Validate one order, collecting an issue per failing field.
+
+        Returns:
+            Tuple of (validated order, issues); the order is only complete
+            when there are no issues
+        """
+        if not isinstance(order, dict):
+            return {}, [ValidationIssue(index, "order", "Order must be a dictionary")]
+
+        validated: Dict[str, Any] = {}
+        issues: List[ValidationIssue] = []
+
+        def check(field: str, validator: Callable[[Any], Any], value: Any) -> None:
+            try:
+                validated[field] = validator(value)
+            except ValidationError as e:
+                issues.append(ValidationIssue(index, field, e.message))
+
+        for field, validator in _REQUIRED_TEXT_FIELDS:
+            value = order.get(field)
+            check(field, validator, str(value) if value else "")
+        check("cod_amount", validate_cod_amount, order.get("cod_amount"))
+        check("delivery_type", validate_delivery_type, order.get("delivery_type", 0))
+
+        for field, validator in _OPTIONAL_CONTACT_FIELDS:
+            if order.get(field):
+                check(field, validator, order[field])
 
-        # Make API call
-        response = self.http_client.post("/create_bulk_order", data=payload)
+        for field in _PASSTHROUGH_FIELDS:
+            if order.get(field) is not None:
+                validated[field] = order[field]
 
-        # Parse response
+        return validated, issues
+
+    def _build_partial_bulk_payload(
+        self, orders: List[Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], List[RejectedOrder]]:
+        """Build a payload from the valid orders only.
+
+        Returns:
+            Tuple of (payload, or None if no order is valid; rejected orders)
+
+        Raises:
+            ValidationError: If the list is empty or too long
+        """
+        if not orders:
+            raise ValidationError("Orders list cannot be empty", "orders")
+
+        if len(orders) > MAX_BULK_ORDERS:
+            raise ValidationError(
+                "Cannot create more than 500 orders at once", "orders"
+            )
+
+        report = self.validate_bulk(orders)
+        if not report.valid_orders:
+            return None, report.rejected
+        return {"orders": report.valid_orders}, report.rejected
+
+    def _prepare_bulk(
+        self, orders: List[Dict[str, Any]], skip_invalid: bool
+    ) -> Tuple[List[Dict[str, Any]], List[RejectedOrder], Dict[str, BulkOrderResult]]:
+        """Validate a bulk order list and find orders already in the ledger.
+
+        An invoice repeated within the list is invalid, since the ledger
+        can reserve it only once.
+
+        Returns:
+            Tuple of (validated orders; rejected orders; duplicate results
+            keyed by invoice)
+
+        Raises:
+            ValidationError: If validation fails and skip_invalid is False
+        """
+        if skip_invalid:
+            payload, rejected = self._build_partial_bulk_payload(orders)
+        else:
+            payload, rejected = self._build_bulk_payload(orders), []
+        validated = payload["orders"] if payload is not None else []
+
+        return validated, rejected, self._recorded_duplicates(validated)
+
+    def _recorded_duplicates(
+        self, orders: List[Dict[str, Any]], held: Optional[Set[str]] = None
+    ) -> Dict[str, BulkOrderResult]:
+        """Build duplicate results for orders the ledger has recorded.
+
+        If ``held`` is given, those orders are duplicates even if they are
+        not recorded yet (another submission of them is in flight).
+        """
+        if not orders or self.ledger is None:
+            return {}
+        submitted = self.ledger.get_many(order["invoice"] for order in orders)
+        duplicates = {}
+        for order in orders:
+            entry = submitted.get(order["invoice"])
+            if entry is not None:
+                duplicates[order["invoice"]] = self._duplicate_result(
+                    order, entry.consignment_id, entry.tracking_code
+                )
+            elif held is not None and order["invoice"] in held:
+                duplicates[order["invoice"]] = self._duplicate_result(order)
+        return duplicates
+
+    def _finish_bulk(
+        self,
+        validated: List[Dict[str, Any]],
+        response: Optional[Dict[str, Any]],
+        rejected: List[RejectedOrder],
+        duplicates: Dict[str, BulkOrderResult],
+        columnar: bool = False,
+    ) -> BulkOrderResponse:
+        """Parse and record a bulk response, restoring duplicates in place."""
+        if columnar:
+            columns = self._bulk_columns(validated, response, duplicates)
+            return BulkOrderResponse(results=columns, rejected=rejected)
+
+        results = (
+            [] if response is None else self._parse_bulk_response(response).results
+        )
+        if self.ledger is not None:
+            self.ledger.record_many(results)
+
+        if duplicates:
+            sent = iter(results)
+            merged = [
+                duplicates.get(order["invoice"]) or next(sent, None)
+                for order in validated
+            ]
+            results = [result for result in merged if result is not None]
+        return BulkOrderResponse(results=results, rejected=rejected)
+
+    def _bulk_columns(
+        self,
+        validated: List[Dict[str, Any]],
+        response: Optional[Dict[str, Any]],
+        duplicates: Dict[str, BulkOrderResult],
+    ) -> BulkOrderColumns:
+        """Load a bulk response's result dictionaries straight into columns."""
+        records = [] if response is None else response.get("results", [])
+        columns = BulkOrderColumns.from_records(records)
+        if self.ledger is not None:
+            self.ledger.record_many(columns)
+        if not duplicates:
+            return columns
+
+        merged = BulkOrderColumns()
+        sent = iter(records)
+        for order in validated:
+            duplicate = duplicates.get(order["invoice"])
+            if duplicate is not None:
+                merged.append_result(duplicate)
+            else:
+                record = next(sent, None)
+                if record is not None:
+                    merged.append_record(record)
+        return merged
+
+    def _duplicate_result(
+        self,
+        order: Dict[str, Any],
+        consignment_id: Optional[int] = None,
+        tracking_code: Optional[str] = None,
+    ) -> BulkOrderResult:
+        """Build the result for an order that was already created."""
+        return BulkOrderResult(
+            invoice=order["invoice"],
+            recipient_name=order["recipient_name"],
+            recipient_address=order["recipient_address"],
+            recipient_phone=order["recipient_phone"],
+            cod_amount=order["cod_amount"],
+            note=order.get("note"),
+            consignment_id=consignment_id,
+            tracking_code=tracking_code,
+            status="duplicate",
+        )
+
+    def _check_not_submitted(self, invoice: str) -> None:
+        """Refuse to resend an invoice the ledger already holds.
+
+        Raises:
+            DuplicateOrderError: If the invoice was already submitted
+        """
+        if self.ledger is None:
+            return
+        entry = self.ledger.get_by_invoice(invoice)
+        if entry is not None:
+            message = f"Invoice {invoice} was already submitted"
+            if entry.consignment_id is not None:
+                message += f" (consignment {entry.consignment_id})"
+            raise DuplicateOrderError(message, invoice, entry.consignment_id)
+
+    def _already_created(
+        self, order: Dict[str, Any], status: OrderStatus
+    ) -> DuplicateOrderError:
+        """Record an order an earlier attempt created and return the error.
+
+        status_by_invoice does not return the consignment ID, so the error
+        carries none.
+        """
+        invoice = order["invoice"]
+        if self.ledger is not None:
+            self.ledger.record_existing([self._duplicate_result(order)])
+        return DuplicateOrderError(
+            f"Invoice {invoice} was already created by an earlier attempt "
+            f"(status {status.delivery_status})",
+            invoice,
+        )
+
+    def _unconfirmed(self, orders: List[Dict[str, Any]]) -> List[str]:
+        """Return invoices an earlier, unconfirmed submission may have created."""
+        if self.ledger is None:
+            return []
+        pending = self.ledger.get_pending(order["invoice"] for order in orders)
+        return [order["invoice"] for order in orders if order["invoice"] in pending]
+
+    def _start_submission(
+        self, order: Dict[str, Any], takeover: Iterable[str] = ()
+    ) -> Dict[str, str]:
+        """Reserve an order's invoice in the ledger and return its headers.
+
+        Args:
+            order: Order payload
+            takeover: Invoices confirmed not created by a pending submission
+
+        Raises:
+            DuplicateOrderError: If the invoice is recorded or being submitted
+        """
+        invoice = order["invoice"]
+        key = idempotency_key([invoice])
+        if self.ledger is not None and self.ledger.reserve([invoice], key, takeover):
+            self._check_not_submitted(invoice)
+            raise DuplicateOrderError(
+                f"Invoice {invoice} is already being submitted", invoice
+            )
+        return {IDEMPOTENCY_HEADER: key}
+
+    def _start_bulk(
+        self,
+        orders: List[Dict[str, Any]],
+        duplicates: Dict[str, BulkOrderResult],
+        takeover: Iterable[str] = (),
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+        """Reserve a bulk submission's invoices in the ledger.
+
+        Orders another submission has recorded or is sending are added to
+        ``duplicates`` and left out.
+
+        Returns:
+            Tuple of (orders to send; request headers)
+        """
+        takeover = list(takeover)
+        while True:
+            invoices = [order["invoice"] for order in orders]
+            key = idempotency_key(invoices)
+            if self.ledger is None or not orders:
+                return orders, {IDEMPOTENCY_HEADER: key}
+            held = self.ledger.reserve(invoices, key, takeover)
+            if not held:
+                return orders, {IDEMPOTENCY_HEADER: key}
+            duplicates.update(self._recorded_duplicates(orders, held))
+            orders = [order for order in orders if order["invoice"] not in held]
+
+    def _end_submission(self, invoices: List[str]) -> None:
+        """Release invoices reserved by _start_submission or _start_bulk."""
+        if self.ledger is not None:
+            self.ledger.release(invoices)
+
+    def _drop_created(
+        self,
+        orders: List[Dict[str, Any]],
+        duplicates: Dict[str, BulkOrderResult],
+        created: Dict[str, OrderStatus],
+    ) -> List[Dict[str, Any]]:
+        """Split orders the API already created off a pending bulk request.
+
+        The created orders are added to ``duplicates`` and recorded in the
+        ledger, which clears their pending submission.
+
+        Returns:
+            The orders that still have to be sent
+        """
+        remaining = []
+        found = []
+        for order in orders:
+            if order["invoice"] in created:
+                duplicate = self._duplicate_result(order)
+                duplicates[order["invoice"]] = duplicate
+                found.append(duplicate)
+            else:
+                remaining.append(order)
+        if found and self.ledger is not None:
+            self.ledger.record_existing(found)
+        return remaining
+
+    def _resend(self, orders: List[Dict[str, Any]]) -> Resend:
+        """Return the bulk request resending ``orders`` under their own key."""
+        key = idempotency_key(order["invoice"] for order in orders)
+        return Resend({"orders": orders}, {IDEMPOTENCY_HEADER: key})
+
+    def _created(
+        self, lookups: Iterable[Tuple[Any, StatusResult]]
+    ) -> Dict[str, OrderStatus]:
+        """Interpret status_by_invoice lookups made before a resend.
+
+        Returns:
+            Status of each invoice the API already has
+
+        Raises:
+            NetworkError: If a lookup failed, so resending may not be safe
+        """
+        created = {}
+        for invoice, result in lookups:
+            if isinstance(result, NotFoundError):
+                continue
+            if isinstance(result, SteadfastException):
+                raise NetworkError(
+                    f"Could not confirm whether order {invoice} was created: "
+                    f"{result.message}"
+                )
+            created[str(invoice)] = result
+        return created
+
+    def _record_order(self, order: Order) -> Order:
+        """Record a created order in the ledger, if configured."""
+        if self.ledger is not None:
+            self.ledger.record(order)
+        return order
+
+    def _split_frame(
+        self, frame: Any
+    ) -> Tuple[List[Dict[str, Any]], List[int], List[RejectedOrder]]:
+        """Validate a DataFrame and split it into valid and rejected orders.
+
+        Returns:
+            Tuple of (valid orders; their row positions in the frame;
+            rejected orders)
+
+        Raises:
+            ConfigurationError: If pandas or NumPy is not installed
+        """
+        validation = validate_orders_frame(frame)
+        positions = validation.valid.to_numpy().nonzero()[0].tolist()
+        return validation.valid_orders(), positions, validation.rejected()
+
+    def _add_frame_rejected(
+        self,
+        response: BulkOrderResponse,
+        positions: List[int],
+        rejected: List[RejectedOrder],
+    ) -> BulkOrderResponse:
+        """Merge the frame's invalid rows with those create_bulk_many rejected.
+
+        create_bulk_many reports positions in the list of valid rows; they
+        are mapped back to row positions in the frame.
+        """
+        for order in response.rejected:
+            position = positions[order.index]
+            issues = [
+                ValidationIssue(position, issue.field, issue.message)
+                for issue in order.issues
+            ]
+            rejected.append(RejectedOrder(position, order.order, issues))
+        response.rejected = sorted(rejected, key=lambda order: order.index)
+        return response
+
+    def _parse_order(self, response: Dict[str, Any]) -> Order:
+        """Build an Order from a create_order response."""
+        return Order(
+            consignment_id=response["consignment_id"],
+            invoice=response["invoice"],
+            tracking_code=response["tracking_code"],
+            recipient_name=response["recipient_name"],
+            recipient_phone=response["recipient_phone"],
+            recipient_address=response["recipient_address"],
+            cod_amount=response["cod_amount"],
+            status=response.get("status", "pending"),
+            note=response.get("note"),
+            created_at=response.get("created_at"),
+            updated_at=response.get("updated_at"),
+        )
+
+    def _parse_bulk_response(self, response: Dict[str, Any]) -> BulkOrderResponse:
+        """Build a BulkOrderResponse from a create_bulk_order response."""
         results = []
         for result_data in response.get("results", []):
             result = BulkOrderResult(
@@ -179,6 +646,158 @@ class OrderModule:
 
         return BulkOrderResponse(results=results)
 
+    def _check_chunk_args(self, chunk_size: int, concurrency: int) -> None:
+        """Validate chunking arguments.
+
+        Raises:
+            ValidationError: If the arguments are out of range
+        """
+        if not 1 <= chunk_size <= MAX_BULK_ORDERS:
+            raise ValidationError(
+                f"Chunk size must be between 1 and {MAX_BULK_ORDERS}", "chunk_size"
+            )
+
+        if concurrency < 1:
+            raise ValidationError("Concurrency must be at least 1", "concurrency")
+
+    def _split_chunks(
+        self, orders: Sequence[Dict[str, Any]], chunk_size: int, concurrency: int
+    ) -> List[_Chunk]:
+        """Split orders into (index, start, chunk) tuples.
+
+        Raises:
+            ValidationError: If the arguments are out of range
+        """
+        if not orders:
+            raise ValidationError("Orders list cannot be empty", "orders")
+
+        self._check_chunk_args(chunk_size, concurrency)
+        return list(self._iter_chunks(orders, chunk_size))
+
+    def _iter_chunks(
+        self, orders: Iterable[Dict[str, Any]], chunk_size: int
+    ) -> Iterator[_Chunk]:
+        """Lazily group orders into (index, start, chunk) tuples.
+
+        Only one chunk is held at a time, so ``orders`` may be a generator
+        over an arbitrarily large source.
+        """
+        iterator = iter(orders)
+        index = start = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield index, start, chunk
+            index += 1
+            start += len(chunk)
+
+    def _failed_chunk_results(
+        self, chunk: List[Dict[str, Any]], message: str
+    ) -> List[BulkOrderResult]:
+        """Build error results for every order of a chunk that failed."""
+        results = []
+        for order in chunk:
+            try:
+                cod_amount = float(order.get("cod_amount") or 0)
+            except (TypeError, ValueError):
+                cod_amount = 0.0
+            results.append(
+                BulkOrderResult(
+                    invoice=str(order.get("invoice", "")),
+                    recipient_name=str(order.get("recipient_name", "")),
+                    recipient_address=str(order.get("recipient_address", "")),
+                    recipient_phone=str(order.get("recipient_phone", "")),
+                    cod_amount=cod_amount,
+                    note=order.get("note"),
+                    status="error",
+                    error=message,
+                )
+            )
+        return results
+
+    def _chunk_outcome(
+        self,
+        chunk: _Chunk,
+        started: float,
+        response: Optional[BulkOrderResponse],
+        error: Optional[Exception],
+    ) -> _ChunkOutcome:
+        """Pair a chunk's timing report with its results and rejected orders."""
+        index, start, orders = chunk
+        report = BulkChunkReport(
+            index=index,
+            start=start,
+            size=len(orders),
+            elapsed=time.perf_counter() - started,
+            error=str(error) if error is not None else None,
+        )
+        if response is None:
+            return report, self._failed_chunk_results(orders, str(error)), []
+
+        # Rejected orders are indexed within the chunk; shift them to the input
+        rejected = [
+            RejectedOrder(
+                index=start + order.index,
+                order=order.order,
+                issues=[
+                    ValidationIssue(start + issue.index, issue.field, issue.message)
+                    for issue in order.issues
+                ],
+            )
+            for order in response.rejected
+        ]
+        return report, response.results, rejected
+
+    def _chunk_rows(self, outcome: _ChunkOutcome) -> Iterator[BulkOrderResult]:
+        """Yield one result per order of a chunk, in input order.
+
+        Rejected orders are yielded in place as error results listing their
+        validation issues.
+        """
+        report, results, rejected = outcome
+        invalid = {order.index: order for order in rejected}
+        sent = iter(results)
+        for index in range(report.start, report.start + report.size):
+            if index in invalid:
+                yield self._rejected_result(invalid[index])
+            else:
+                result = next(sent, None)
+                if result is not None:
+                    yield result
+
+    def _rejected_result(self, rejected: RejectedOrder) -> BulkOrderResult:
+        """Build the error result for an order rejected by validation."""
+        message = "; ".join(
+            f"{issue.field}: {issue.message}" for issue in rejected.issues
+        )
+        order = rejected.order if isinstance(rejected.order, dict) else {}
+        return self._failed_chunk_results([order], message)[0]
+
+    def _merge_chunk_outcomes(
+        self, outcomes: List[_ChunkOutcome], columnar: bool = False
+    ) -> BulkOrderResponse:
+        """Merge per-chunk outcomes, in input order, into one response."""
+        results: List[BulkOrderResult] = []
+        columns = BulkOrderColumns()
+        chunks = []
+        rejected: List[RejectedOrder] = []
+        for report, chunk_results, chunk_rejected in sorted(
+            outcomes, key=lambda o: o[0].index
+        ):
+            chunks.append(report)
+            rejected.extend(chunk_rejected)
+            if not columnar:
+                results.extend(chunk_results)
+            elif isinstance(chunk_results, BulkOrderColumns):
+                columns.extend(chunk_results)
+            else:
+                columns.extend(BulkOrderColumns.from_results(chunk_results))
+
+        if columnar:
+            return BulkOrderResponse(results=columns, chunks=chunks, rejected=rejected)
+        return BulkOrderResponse(results=results, chunks=chunks, rejected=rejected)
+
     def _validate_order(self, **kwargs: Any) -> Dict[str, Any]:
         """Validate a single order's parameters.
 
@@ -191,41 +810,611 @@ class OrderModule:
         Raises:
             ValidationError: If validation fails
         """
-        # Extract required fields
-        invoice = kwargs.get("invoice")
-        recipient_name = kwargs.get("recipient_name")
-        recipient_phone = kwargs.get("recipient_phone")
-        recipient_address = kwargs.get("recipient_address")
-        cod_amount = kwargs.get("cod_amount")
+        return validate_order(kwargs)
 
-        if not all([invoice, recipient_name, recipient_phone, recipient_address]):
-            raise ValidationError("Missing required fields")
 
-        if cod_amount is None:
-            raise ValidationError("COD amount is required", "cod_amount")
+class OrderModule(_OrderModuleBase):
+    """Module for order creation and management."""
 
-        # Validate required fields
-        validated_order = {
-            "invoice": validate_invoice(str(invoice)),
-            "recipient_name": validate_recipient_name(str(recipient_name)),
-            "recipient_phone": validate_phone(str(recipient_phone)),
-            "recipient_address": validate_address(str(recipient_address)),
-            "cod_amount": validate_cod_amount(cod_amount),
-            "delivery_type": validate_delivery_type(kwargs.get("delivery_type", 0)),
-        }
+    def __init__(
+        self, http_client: HTTPClient, ledger: Optional[OrderLedger] = None
+    ) -> None:
+        """Initialize order module.
 
-        # Validate and add optional fields
-        alternative_phone = kwargs.get("alternative_phone")
-        if alternative_phone:
-            validated_order["alternative_phone"] = validate_phone(alternative_phone)
+        Args:
+            http_client: HTTP client instance
+            ledger: Optional ledger recording created orders
+        """
+        self.http_client = http_client
+        self.ledger = ledger
 
-        recipient_email = kwargs.get("recipient_email")
-        if recipient_email:
-            validated_order["recipient_email"] = validate_email(recipient_email)
+    def create(
+        self,
+        invoice: str,
+        recipient_name: str,
+        recipient_phone: str,
+        recipient_address: str,
+        cod_amount: Union[int, float],
+        delivery_type: int = 0,
+        alternative_phone: Optional[str] = None,
+        recipient_email: Optional[str] = None,
+        note: Optional[str] = None,
+        item_description: Optional[str] = None,
+        total_lot: Optional[int] = None,
+    ) -> Order:
+        """Create a single order.
 
-        # Add other optional fields without validation
-        for field in ["note", "item_description", "total_lot"]:
-            if field in kwargs and kwargs[field] is not None:
-                validated_order[field] = kwargs[field]
+        Args:
+            invoice: Unique order identifier
+            recipient_name: Recipient's full name
+            recipient_phone: Recipient's phone number (11 digits)
+            recipient_address: Delivery address
+            cod_amount: Cash on delivery amount
+            delivery_type: 0 for home delivery, 1 for point delivery
+            alternative_phone: Secondary contact number
+            recipient_email: Recipient's email address
+            note: Delivery instructions
+            item_description: Description of items
+            total_lot: Total lot of items
+
+        Returns:
+            Order object with consignment details
+
+        Raises:
+            ValidationError: If input validation fails
+            DuplicateOrderError: If the ledger shows the invoice was already
+                submitted, or a retry finds an earlier attempt created it
+                (``consignment_id`` is then None)
+            APIError: If API request fails
+        """
+        payload = self._build_order_payload(
+            invoice=invoice,
+            recipient_name=recipient_name,
+            recipient_phone=recipient_phone,
+            recipient_address=recipient_address,
+            cod_amount=cod_amount,
+            delivery_type=delivery_type,
+            alternative_phone=alternative_phone,
+            recipient_email=recipient_email,
+            note=note,
+            item_description=item_description,
+            total_lot=total_lot,
+        )
+
+        invoice = payload["invoice"]
+        self._check_not_submitted(invoice)
+        created: Dict[str, OrderStatus] = {}
+        unconfirmed = self._unconfirmed([payload])
+        if unconfirmed:
+            created = self._created_invoices([invoice])
+            if created:
+                raise self._already_created(payload, created[invoice])
+        headers = self._start_submission(payload, unconfirmed)
+
+        def before_retry(error: SteadfastException) -> Optional[Dict[str, Any]]:
+            # A timed-out attempt may still have created the order
+            if _may_have_created(error):
+                created.update(self._created_invoices([invoice]))
+            return {} if created else None
+
+        try:
+            # Make API call
+            response = self.http_client.post(
+                "/create_order",
+                headers=headers,
+                data=payload,
+                before_retry=before_retry,
+            )
+            if created:
+                raise self._already_created(payload, created[invoice])
+
+            # Parse response and return Order object
+            return self._record_order(self._parse_order(response))
+        finally:
+            self._end_submission([invoice])
+
+    def create_bulk(
+        self,
+        orders: List[Dict[str, Any]],
+        skip_invalid: bool = False,
+        columnar: bool = False,
+    ) -> BulkOrderResponse:
+        """Create multiple orders in a single request.
+
+        Args:
+            orders: List of order dictionaries (max 500)
+            skip_invalid: Submit only the valid orders and return the
+                invalid ones in ``rejected`` instead of raising
+            columnar: Return ``results`` as a BulkOrderColumns built from
+                the raw response, creating row objects only when read
 
-        return validated_order
+        Returns:
+            BulkOrderResponse with individual results; orders the ledger
+            shows were already submitted are not sent and get a
+            ``"duplicate"`` result
+
+        Raises:
+            ValidationError: If validation fails
+            APIError: If API request fails
+        """
+        validated, rejected, duplicates = self._prepare_bulk(orders, skip_invalid)
+        unsent = [order for order in validated if order["invoice"] not in duplicates]
+
+        # Make API call, unless every order was invalid or already submitted
+        response = self._post_bulk(unsent, duplicates) if unsent else None
+
+        return self._finish_bulk(validated, response, rejected, duplicates, columnar)
+
+    def create_bulk_many(
+        self,
+        orders: Sequence[Dict[str, Any]],
+        chunk_size: int = MAX_BULK_ORDERS,
+        concurrency: int = 4,
+        columnar: bool = False,
+    ) -> BulkOrderResponse:
+        """Create any number of orders as concurrent bulk requests.
+
+        Orders are split into chunks of ``chunk_size`` and sent over the
+        pooled connection by up to ``concurrency`` threads; keep
+        ``concurrency`` at or below the client's ``pool_maxsize``. Invalid
+        orders are left out of their chunk and returned in ``rejected``
+        with their input positions. A chunk that fails (API error) does not
+        abort the others: its orders come back as error results and its
+        report carries the error.
+
+        Args:
+            orders: Order dictionaries, any number
+            chunk_size: Orders per bulk request (max 500)
+            concurrency: Maximum chunks in flight at once
+            columnar: Return ``results`` as one BulkOrderColumns built from
+                the raw responses
+
+        Returns:
+            BulkOrderResponse with results in input order, invalid orders
+            in ``rejected`` and one BulkChunkReport per chunk
+
+        Raises:
+            ValidationError: If orders is empty or arguments are out of range
+        """
+        chunks = self._split_chunks(orders, chunk_size, concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(
+                executor.map(lambda chunk: self._send_chunk(chunk, columnar), chunks)
+            )
+
+        return self._merge_chunk_outcomes(outcomes, columnar)
+
+    def create_bulk_from_frame(
+        self,
+        frame: Any,
+        chunk_size: int = MAX_BULK_ORDERS,
+        concurrency: int = 4,
+    ) -> BulkOrderResponse:
+        """Validate a pandas DataFrame of orders and submit the valid rows.
+
+        Rows are validated with column-wide operations by
+        validate_orders_frame(); valid rows are sent with
+        create_bulk_many() and invalid rows are returned in ``rejected``.
+
+        Args:
+            frame: pandas DataFrame, one order per row
+            chunk_size: Orders per bulk request (max 500)
+            concurrency: Maximum chunks in flight at once
+
+        Returns:
+            BulkOrderResponse with results for the valid rows and the
+            invalid rows in ``rejected``
+
+        Raises:
+            ConfigurationError: If pandas or NumPy is not installed
+            ValidationError: If arguments are out of range
+        """
+        orders, positions, rejected = self._split_frame(frame)
+        self._check_chunk_args(chunk_size, concurrency)
+        if not orders:
+            return BulkOrderResponse(results=[], rejected=rejected)
+
+        response = self.create_bulk_many(orders, chunk_size, concurrency)
+        return self._add_frame_rejected(response, positions, rejected)
+
+    def create_bulk_stream(
+        self,
+        orders: Iterable[Dict[str, Any]],
+        chunk_size: int = MAX_BULK_ORDERS,
+        concurrency: int = 1,
+    ) -> Iterator[BulkOrderResult]:
+        """Create orders from an iterable of any size, yielding results.
+
+        Orders are pulled from ``orders`` only as chunks are filled and
+        validated when their chunk is sent, so memory use depends on
+        ``chunk_size * concurrency``, not on the size of the input. Pair it
+        with read_orders_csv() or read_orders_jsonl() for large files.
+        Results are yielded in input order as each chunk completes. An
+        invalid order yields an error result listing its validation issues
+        without failing its chunk; a chunk that fails yields error results
+        for its orders.
+
+        Args:
+            orders: Iterable or generator of order dictionaries
+            chunk_size: Orders per bulk request (max 500)
+            concurrency: Maximum chunks in flight at once
+
+        Returns:
+            Iterator of BulkOrderResult, one per input order
+
+        Raises:
+            ValidationError: If arguments are out of range
+        """
+        self._check_chunk_args(chunk_size, concurrency)
+        return self._stream_chunks(self._iter_chunks(orders, chunk_size), concurrency)
+
+    def _stream_chunks(
+        self, chunks: Iterator[_Chunk], concurrency: int
+    ) -> Iterator[BulkOrderResult]:
+        """Send chunks with at most ``concurrency`` in flight, in order."""
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending: Deque["Future[_ChunkOutcome]"] = deque()
+            try:
+                for chunk in chunks:
+                    pending.append(executor.submit(self._send_chunk, chunk))
+                    if len(pending) >= concurrency:
+                        yield from self._chunk_rows(pending.popleft().result())
+                while pending:
+                    yield from self._chunk_rows(pending.popleft().result())
+            finally:
+                # Stop queued chunks if the caller abandons the stream
+                for future in pending:
+                    future.cancel()
+
+    def _post_bulk(
+        self, orders: List[Dict[str, Any]], duplicates: Dict[str, BulkOrderResult]
+    ) -> Optional[Dict[str, Any]]:
+        """Send a bulk request, confirming with the API before any resend.
+
+        Orders found to exist already are added to ``duplicates`` and
+        recorded in the ledger.
+
+        Returns:
+            Bulk response, or None if every order already exists
+        """
+        unconfirmed = self._unconfirmed(orders)
+        if unconfirmed:
+            created = self._created_invoices(unconfirmed)
+            orders = self._drop_created(orders, duplicates, created)
+        orders, headers = self._start_bulk(orders, duplicates, unconfirmed)
+        if not orders:
+            return None
+        reserved = [order["invoice"] for order in orders]
+
+        def before_retry(error: SteadfastException) -> RetryHookResult:
+            # A timed-out attempt may still have created some of the orders
+            nonlocal orders
+            if not _may_have_created(error):
+                return None
+            invoices = [order["invoice"] for order in orders]
+            created = self._created_invoices(invoices)
+            if not created:
+                return None
+            orders = self._drop_created(orders, duplicates, created)
+            return self._resend(orders) if orders else {"results": []}
+
+        try:
+            return self.http_client.post(
+                "/create_bulk_order",
+                headers=headers,
+                data={"orders": orders},
+                before_retry=before_retry,
+            )
+        finally:
+            self._end_submission(reserved)
+
+    def _created_invoices(self, invoices: List[str]) -> Dict[str, OrderStatus]:
+        """Look up which invoices the API already has.
+
+        Raises:
+            NetworkError: If a lookup fails
+        """
+        return self._created(
+            TrackingModule(self.http_client).iter_statuses(
+                invoices, "invoice", concurrency=_CONFIRM_CONCURRENCY
+            )
+        )
+
+    def _send_chunk(self, chunk: _Chunk, columnar: bool = False) -> _ChunkOutcome:
+        """Send one chunk, capturing its failure instead of raising."""
+        started = time.perf_counter()
+        try:
+            response = self.create_bulk(chunk[2], skip_invalid=True, columnar=columnar)
+        except Exception as e:  # A failed chunk must not abort the others
+            return self._chunk_outcome(chunk, started, None, e)
+        return self._chunk_outcome(chunk, started, response, None)
+
+
+class AsyncOrderModule(_OrderModuleBase):
+    """Async module for order creation and management."""
+
+    def __init__(
+        self, http_client: AsyncHTTPClient, ledger: Optional[OrderLedger] = None
+    ) -> None:
+        """Initialize async order module.
+
+        Args:
+            http_client: Async HTTP client instance
+            ledger: Optional ledger recording created orders
+        """
+        self.http_client = http_client
+        self.ledger = ledger
+
+    async def create(
+        self,
+        invoice: str,
+        recipient_name: str,
+        recipient_phone: str,
+        recipient_address: str,
+        cod_amount: Union[int, float],
+        delivery_type: int = 0,
+        alternative_phone: Optional[str] = None,
+        recipient_email: Optional[str] = None,
+        note: Optional[str] = None,
+        item_description: Optional[str] = None,
+        total_lot: Optional[int] = None,
+    ) -> Order:
+        """Create a single order.
+
+        See OrderModule.create for argument details.
+
+        Returns:
+            Order object with consignment details
+
+        Raises:
+            ValidationError: If input validation fails
+            DuplicateOrderError: If the ledger shows the invoice was already
+                submitted, or a retry finds an earlier attempt created it
+                (``consignment_id`` is then None)
+            APIError: If API request fails
+        """
+        payload = self._build_order_payload(
+            invoice=invoice,
+            recipient_name=recipient_name,
+            recipient_phone=recipient_phone,
+            recipient_address=recipient_address,
+            cod_amount=cod_amount,
+            delivery_type=delivery_type,
+            alternative_phone=alternative_phone,
+            recipient_email=recipient_email,
+            note=note,
+            item_description=item_description,
+            total_lot=total_lot,
+        )
+
+        invoice = payload["invoice"]
+        self._check_not_submitted(invoice)
+        created: Dict[str, OrderStatus] = {}
+        unconfirmed = self._unconfirmed([payload])
+        if unconfirmed:
+            created = await self._created_invoices([invoice])
+            if created:
+                raise self._already_created(payload, created[invoice])
+        headers = self._start_submission(payload, unconfirmed)
+
+        async def before_retry(
+            error: SteadfastException,
+        ) -> Optional[Dict[str, Any]]:
+            if _may_have_created(error):
+                created.update(await self._created_invoices([invoice]))
+            return {} if created else None
+
+        try:
+            response = await self.http_client.post(
+                "/create_order",
+                headers=headers,
+                data=payload,
+                before_retry=before_retry,
+            )
+            if created:
+                raise self._already_created(payload, created[invoice])
+
+            return self._record_order(self._parse_order(response))
+        finally:
+            self._end_submission([invoice])
+
+    async def create_bulk(
+        self,
+        orders: List[Dict[str, Any]],
+        skip_invalid: bool = False,
+        columnar: bool = False,
+    ) -> BulkOrderResponse:
+        """Create multiple orders in a single request.
+
+        Args:
+            orders: List of order dictionaries (max 500)
+            skip_invalid: Submit only the valid orders and return the
+                invalid ones in ``rejected`` instead of raising
+            columnar: Return ``results`` as a BulkOrderColumns built from
+                the raw response, creating row objects only when read
+
+        Returns:
+            BulkOrderResponse with individual results; orders the ledger
+            shows were already submitted are not sent and get a
+            ``"duplicate"`` result
+
+        Raises:
+            ValidationError: If validation fails
+            APIError: If API request fails
+        """
+        validated, rejected, duplicates = self._prepare_bulk(orders, skip_invalid)
+        unsent = [order for order in validated if order["invoice"] not in duplicates]
+
+        response = await self._post_bulk(unsent, duplicates) if unsent else None
+
+        return self._finish_bulk(validated, response, rejected, duplicates, columnar)
+
+    async def create_bulk_many(
+        self,
+        orders: Sequence[Dict[str, Any]],
+        chunk_size: int = MAX_BULK_ORDERS,
+        concurrency: int = 4,
+        columnar: bool = False,
+    ) -> BulkOrderResponse:
+        """Create any number of orders as concurrent bulk requests.
+
+        See OrderModule.create_bulk_many; chunks run as tasks limited by a
+        semaphore instead of threads.
+
+        Args:
+            orders: Order dictionaries, any number
+            chunk_size: Orders per bulk request (max 500)
+            concurrency: Maximum chunks in flight at once
+            columnar: Return ``results`` as one BulkOrderColumns built from
+                the raw responses
+
+        Returns:
+            BulkOrderResponse with results in input order, invalid orders
+            in ``rejected`` and one BulkChunkReport per chunk
+
+        Raises:
+            ValidationError: If orders is empty or arguments are out of range
+        """
+        chunks = self._split_chunks(orders, chunk_size, concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(chunk: _Chunk) -> _ChunkOutcome:
+            async with semaphore:
+                return await self._send_chunk(chunk, columnar)
+
+        outcomes = await asyncio.gather(*(send(chunk) for chunk in chunks))
+        return self._merge_chunk_outcomes(list(outcomes), columnar)
+
+    async def create_bulk_from_frame(
+        self,
+        frame: Any,
+        chunk_size: int = MAX_BULK_ORDERS,
+        concurrency: int = 4,
+    ) -> BulkOrderResponse:
+        """Validate a pandas DataFrame of orders and submit the valid rows.
+
+        See OrderModule.create_bulk_from_frame.
+
+        Args:
+            frame: pandas DataFrame, one order per row
+            chunk_size: Orders per bulk request (max 500)
+            concurrency: Maximum chunks in flight at once
+
+        Returns:
+            BulkOrderResponse with results for the valid rows and the
+            invalid rows in ``rejected``
+
+        Raises:
+            ConfigurationError: If pandas or NumPy is not installed
+            ValidationError: If arguments are out of range
+        """
+        orders, positions, rejected = self._split_frame(frame)
+        self._check_chunk_args(chunk_size, concurrency)
+        if not orders:
+            return BulkOrderResponse(results=[], rejected=rejected)
+
+        response = await self.create_bulk_many(orders, chunk_size, concurrency)
+        return self._add_frame_rejected(response, positions, rejected)
+
+    def create_bulk_stream(
+        self,
+        orders: Iterable[Dict[str, Any]],
+        chunk_size: int = MAX_BULK_ORDERS,
+        concurrency: int = 1,
+    ) -> AsyncIterator[BulkOrderResult]:
+        """Create orders from an iterable of any size, yielding results.
+
+        See OrderModule.create_bulk_stream; use ``async for`` to consume.
+
+        Args:
+            orders: Iterable or generator of order dictionaries
+            chunk_size: Orders per bulk request (max 500)
+            concurrency: Maximum chunks in flight at once
+
+        Returns:
+            Async iterator of BulkOrderResult, one per input order
+
+        Raises:
+            ValidationError: If arguments are out of range
+        """
+        self._check_chunk_args(chunk_size, concurrency)
+        return self._stream_chunks(self._iter_chunks(orders, chunk_size), concurrency)
+
+    async def _stream_chunks(
+        self, chunks: Iterator[_Chunk], concurrency: int
+    ) -> AsyncIterator[BulkOrderResult]:
+        """Send chunks with at most ``concurrency`` in flight, in order."""
+        pending: Deque["asyncio.Task[_ChunkOutcome]"] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(asyncio.ensure_future(self._send_chunk(chunk)))
+                if len(pending) >= concurrency:
+                    for result in self._chunk_rows(await pending.popleft()):
+                        yield result
+            while pending:
+                for result in self._chunk_rows(await pending.popleft()):
+                    yield result
+        finally:
+            # Stop in-flight chunks if the caller abandons the stream
+            for task in pending:
+                task.cancel()
+
+    async def _post_bulk(
+        self, orders: List[Dict[str, Any]], duplicates: Dict[str, BulkOrderResult]
+    ) -> Optional[Dict[str, Any]]:
+        """Send a bulk request, confirming with the API before any resend.
+
+        See OrderModule._post_bulk.
+        """
+        unconfirmed = self._unconfirmed(orders)
+        if unconfirmed:
+            created = await self._created_invoices(unconfirmed)
+            orders = self._drop_created(orders, duplicates, created)
+        orders, headers = self._start_bulk(orders, duplicates, unconfirmed)
+        if not orders:
+            return None
+        reserved = [order["invoice"] for order in orders]
+
+        async def before_retry(error: SteadfastException) -> RetryHookResult:
+            nonlocal orders
+            if not _may_have_created(error):
+                return None
+            invoices = [order["invoice"] for order in orders]
+            created = await self._created_invoices(invoices)
+            if not created:
+                return None
+            orders = self._drop_created(orders, duplicates, created)
+            return self._resend(orders) if orders else {"results": []}
+
+        try:
+            return await self.http_client.post(
+                "/create_bulk_order",
+                headers=headers,
+                data={"orders": orders},
+                before_retry=before_retry,
+            )
+        finally:
+            self._end_submission(reserved)
+
+    async def _created_invoices(self, invoices: List[str]) -> Dict[str, OrderStatus]:
+        """Look up which invoices the API already has.
+
+        Raises:
+            NetworkError: If a lookup fails
+        """
+        lookups = AsyncTrackingModule(self.http_client).iter_statuses(
+            invoices, "invoice", concurrency=_CONFIRM_CONCURRENCY
+        )
+        return self._created([lookup async for lookup in lookups])
+
+    async def _send_chunk(self, chunk: _Chunk, columnar: bool = False) -> _ChunkOutcome:
+        """Send one chunk, capturing its failure instead of raising."""
+        started = time.perf_counter()
+        try:
+            response = await self.create_bulk(
+                chunk[2], skip_invalid=True, columnar=columnar
+            )
+        except Exception as e:  # A failed chunk must not abort the others
+            return self._chunk_outcome(chunk, started, None, e)
+        return self._chunk_outcome(chunk, started, response, None)
@@ -1,10 +1,116 @@
 """Payment module for Steadfast SDK."""
 
+import asyncio
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    cast,
+)
+
 from ..http_client import HTTPClient
-from ..models import Payment, PaymentDetails, PaymentList
+from ..async_http_client import AsyncHTTPClient
+from ..concurrency import fan_out, fan_out_async
+from ..models import Payment, PaymentDetails, PaymentFetch, PaymentList
+from ..exceptions import (
+    APIError,
+    CircuitOpenError,
+    NetworkError,
+    SteadfastException,
+    ValidationError,
+)
+from ..lazy import FieldDecoder, LazyList, decode_fields, lazy_model
+from ..pagination import AsyncPageIterator, PageIterator, Since, page_params
+from ..retry import RetryPolicy
+
+_PAYMENT_FIELDS: Dict[str, FieldDecoder] = {
+    "id": lambda item: item.get("id", 0),
+    "amount": lambda item: float(item.get("amount", 0)),
+    "created_at": lambda item: item.get("created_at"),
+    "updated_at": lambda item: item.get("updated_at"),
+}
+
+LazyPayment = lazy_model(Payment, _PAYMENT_FIELDS, __name__)
+
+
+class _PaymentModuleBase:
+    """Validation and parsing shared by the sync and async payment modules."""
+
+    def _payment_endpoint(self, payment_id: int) -> str:
+        """Validate a payment ID and return its details endpoint."""
+        if not isinstance(payment_id, int) or payment_id <= 0:
+            raise ValidationError("Payment ID must be a positive integer", "payment_id")
+
+        return f"/payment/{payment_id}"
+
+    def _unique(self, payment_ids: Iterable[int]) -> Iterator[int]:
+        """Yield each payment ID once, in input order.
+
+        The IDs already yielded are remembered, so this set grows with the
+        number of distinct IDs (a few dozen bytes each).
+        """
+        seen: Set[int] = set()
+        for payment_id in payment_ids:
+            if payment_id not in seen:
+                seen.add(payment_id)
+                yield payment_id
+
+    def _retry_delay(
+        self,
+        policy: RetryPolicy,
+        error: SteadfastException,
+        attempt: int,
+        previous_delay: float,
+    ) -> Optional[float]:
+        """Return the delay before refetching a payment, or None to give up.
+
+        Network errors, 429s and server errors are retried; validation,
+        authentication and not-found errors are not, nor is an open circuit,
+        which would only fail again until the breaker lets calls through.
+        """
+        if isinstance(error, CircuitOpenError):
+            return None
+        if not isinstance(error, (NetworkError, APIError)) or (
+            isinstance(error, APIError)
+            and error.status_code is not None
+            and error.status_code != 429
+            and error.status_code < 500
+        ):
+            return None
+
+        return policy.next_delay(attempt, previous_delay, error.retry_after)
+
+    def _parse_payment(self, item: Dict[str, Any]) -> Payment:
+        """Build a Payment from a response item."""
+        return decode_fields(Payment, _PAYMENT_FIELDS, item)
+
+    def _parse_payment_list(
+        self, response: Dict[str, Any], lazy: bool = False
+    ) -> PaymentList:
+        """Build a PaymentList from a payment list response."""
+        items = response.get("data", [])
+        if lazy:
+            return PaymentList(data=LazyList(items, LazyPayment))
+
+        return PaymentList(data=[self._parse_payment(item) for item in items])
+
+    def _parse_payment_details(self, response: Dict[str, Any]) -> PaymentDetails:
+        """Build PaymentDetails from a payment details response."""
+        return PaymentDetails(
+            id=response.get("id", 0),
+            amount=float(response.get("amount", 0)),
+            consignments=response.get("consignments", []),
+            created_at=response.get("created_at"),
+            updated_at=response.get("updated_at"),
+        )
 
 
-class PaymentModule:
+class PaymentModule(_PaymentModuleBase):
     """Module for managing payments."""
 
     def __init__(self, http_client: HTTPClient) -> None:
@@ -15,30 +121,59 @@ class PaymentModule:
         """
         self.http_client = http_client
 
-    def list(self) -> PaymentList:
-        """List all payments.
+    def list(self, lazy: bool = False, page: Optional[int] = None) -> PaymentList:
+        """List payments.
+
+        Args:
+            lazy: Build each payment, and decode each of its fields, only
+                when it is first read
+            page: Page to fetch; the API's first page if omitted
 
         Returns:
-            PaymentList object with paginated results
+            PaymentList object with one page of results
 
         Raises:
+            ValidationError: If page is invalid
             APIError: If API returns error
             NetworkError: If network error occurs
         """
-        response = self.http_client.get("/payment/list")
+        response = self.http_client.get("/payment/list", params=page_params(page))
+        return self._parse_payment_list(response, lazy)
 
-        payments = []
-        for item in response.get("data", []):
-            payments.append(
-                Payment(
-                    id=item.get("id", 0),
-                    amount=float(item.get("amount", 0)),
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                )
-            )
+    def iter_payments(
+        self,
+        start_page: int = 1,
+        since: Optional[Since] = None,
+        prefetch: bool = True,
+    ) -> PageIterator[Payment]:
+        """Iterate over the payments of every page.
 
-        return PaymentList(data=payments)
+        The next page is fetched in the background while the current one is
+        consumed. The iterator's ``page`` attribute is the page of the last
+        payment returned; pass it as ``start_page`` to resume.
+
+        Args:
+            start_page: First page to fetch
+            since: Skip payments created before this date or ISO 8601 time
+            prefetch: Fetch the next page while the current one is consumed
+
+        Returns:
+            PageIterator yielding Payment objects
+
+        Raises:
+            ValidationError: If start_page or since is invalid
+            APIError: If API returns error, while iterating
+            NetworkError: If network error occurs, while iterating
+        """
+        return PageIterator(
+            lambda page: self.http_client.get(
+                "/payment/list", params=page_params(page)
+            ),
+            self._parse_payment,
+            start_page=start_page,
+            since=since,
+            prefetch=prefetch,
+        )
 
     def get(self, payment_id: int) -> PaymentDetails:
         """Get payment details with consignments.
@@ -55,17 +190,193 @@ class PaymentModule:
             APIError: If API returns error
             NetworkError: If network error occurs
         """
-        if not isinstance(payment_id, int) or payment_id <= 0:
-            from ..exceptions import ValidationError
+        response = self.http_client.get(self._payment_endpoint(payment_id))
+        return self._parse_payment_details(response)
 
-            raise ValidationError("Payment ID must be a positive integer", "payment_id")
+    def get_many(
+        self,
+        payment_ids: Iterable[int],
+        concurrency: int = 8,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> Iterator[PaymentFetch]:
+        """Fetch the details of many payments, yielding them as they complete.
 
-        response = self.http_client.get(f"/payment/{payment_id}")
+        At most ``concurrency`` fetches are in flight and payment IDs are
+        read lazily, so at most ``concurrency`` responses are held at once
+        however many IDs are given. Duplicate IDs are fetched once; the IDs
+        already seen are kept to detect them, which grows with the number
+        of distinct IDs. Fetches share the client's pooled connection,
+        rate limiter, retry policy and circuit breaker; keep
+        ``concurrency`` at or below the client's ``pool_maxsize``. A fetch
+        that still fails after the client's own retries is retried on its
+        own, following ``retry_policy``; a CircuitOpenError is reported
+        straight away.
 
-        return PaymentDetails(
-            id=response.get("id", 0),
-            amount=float(response.get("amount", 0)),
-            consignments=response.get("consignments", []),
-            created_at=response.get("created_at"),
-            updated_at=response.get("updated_at"),
+        Args:
+            payment_ids: IDs of the payments, e.g. from list()
+            concurrency: Maximum fetches in flight at once
+            retry_policy: Retries of individual failed fetches (defaults to
+                two retries with jittered backoff)
+
+        Returns:
+            Iterator of PaymentFetch, with the details or the SDK error, in
+            completion order
+
+        Raises:
+            ValidationError: If concurrency is invalid
+        """
+        policy = retry_policy if retry_policy is not None else RetryPolicy(2)
+
+        def fetch(payment_id: int) -> PaymentFetch:
+            policy.budget.record_request()
+            attempt, delay = 0, 0.0
+            while True:
+                started = time.perf_counter()
+                try:
+                    details = self.get(payment_id)
+                except SteadfastException as e:
+                    elapsed = time.perf_counter() - started
+                    next_delay = self._retry_delay(policy, e, attempt, delay)
+                    if next_delay is None:
+                        return PaymentFetch(payment_id, None, elapsed, attempt + 1, e)
+                    time.sleep(next_delay)
+                    attempt, delay = attempt + 1, next_delay
+                    continue
+                elapsed = time.perf_counter() - started
+                return PaymentFetch(payment_id, details, elapsed, attempt + 1)
+
+        fetches = fan_out(fetch, self._unique(payment_ids), concurrency)
+        # fetch() reports every SDK error in its PaymentFetch
+        return (cast(PaymentFetch, result) for _, result in fetches)
+
+
+class AsyncPaymentModule(_PaymentModuleBase):
+    """Async module for managing payments."""
+
+    def __init__(self, http_client: AsyncHTTPClient) -> None:
+        """Initialize async payment module.
+
+        Args:
+            http_client: AsyncHTTPClient instance for API calls
+        """
+        self.http_client = http_client
+
+    async def list(self, lazy: bool = False, page: Optional[int] = None) -> PaymentList:
+        """List payments.
+
+        Args:
+            lazy: Build each payment, and decode each of its fields, only
+                when it is first read
+            page: Page to fetch; the API's first page if omitted
+
+        Returns:
+            PaymentList object with one page of results
+
+        Raises:
+            ValidationError: If page is invalid
+            APIError: If API returns error
+            NetworkError: If network error occurs
+        """
+        response = await self.http_client.get("/payment/list", params=page_params(page))
+        return self._parse_payment_list(response, lazy)
+
+    def iter_payments(
+        self,
+        start_page: int = 1,
+        since: Optional[Since] = None,
+        prefetch: bool = True,
+    ) -> AsyncPageIterator[Payment]:
+        """Iterate over the payments of every page.
+
+        The next page is fetched as a task while the current one is
+        consumed. The iterator's ``page`` attribute is the page of the last
+        payment returned; pass it as ``start_page`` to resume.
+
+        Args:
+            start_page: First page to fetch
+            since: Skip payments created before this date or ISO 8601 time
+            prefetch: Fetch the next page while the current one is consumed
+
+        Returns:
+            AsyncPageIterator yielding Payment objects
+
+        Raises:
+            ValidationError: If start_page or since is invalid
+            APIError: If API returns error, while iterating
+            NetworkError: If network error occurs, while iterating
+        """
+        return AsyncPageIterator(
+            self._fetch_page,
+            self._parse_payment,
+            start_page=start_page,
+            since=since,
+            prefetch=prefetch,
         )
+
+    async def _fetch_page(self, page: int) -> Dict[str, Any]:
+        """Fetch one page of the payment list."""
+        return await self.http_client.get("/payment/list", params=page_params(page))
+
+    async def get(self, payment_id: int) -> PaymentDetails:
+        """Get payment details with consignments.
+
+        Args:
+            payment_id: ID of the payment
+
+        Returns:
+            PaymentDetails object with consignments list
+
+        Raises:
+            ValidationError: If payment_id is invalid
+            NotFoundError: If payment not found
+            APIError: If API returns error
+            NetworkError: If network error occurs
+        """
+        response = await self.http_client.get(self._payment_endpoint(payment_id))
+        return self._parse_payment_details(response)
+
+    def get_many(
+        self,
+        payment_ids: Iterable[int],
+        concurrency: int = 8,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> AsyncIterator[PaymentFetch]:
+        """Fetch the details of many payments, yielding them as they complete.
+
+        See PaymentModule.get_many; use ``async for`` to consume.
+
+        Returns:
+            Async iterator of PaymentFetch, with the details or the SDK
+            error, in completion order
+
+        Raises:
+            ValidationError: If concurrency is invalid
+        """
+        policy = retry_policy if retry_policy is not None else RetryPolicy(2)
+
+        async def fetch(payment_id: int) -> PaymentFetch:
+            policy.budget.record_request()
+            attempt, delay = 0, 0.0
+            while True:
+                started = time.perf_counter()
+                try:
+                    details = await self.get(payment_id)
+                except SteadfastException as e:
+                    elapsed = time.perf_counter() - started
+                    next_delay = self._retry_delay(policy, e, attempt, delay)
+                    if next_delay is None:
+                        return PaymentFetch(payment_id, None, elapsed, attempt + 1, e)
+                    await asyncio.sleep(next_delay)
+                    attempt, delay = attempt + 1, next_delay
+                    continue
+                elapsed = time.perf_counter() - started
+                return PaymentFetch(payment_id, details, elapsed, attempt + 1)
+
+        fetches = fan_out_async(fetch, self._unique(payment_ids), concurrency)
+
+        async def results() -> AsyncIterator[PaymentFetch]:
+            async for _, result in fetches:
+                # fetch() reports every SDK error in its PaymentFetch
+                yield cast(PaymentFetch, result)
+
+        return results()
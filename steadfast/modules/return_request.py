@@ -1,16 +1,89 @@
 """Return request module for Steadfast SDK."""
 
-from typing import Union
+from typing import Any, Dict, Optional, Union
 from ..http_client import HTTPClient
+from ..async_http_client import AsyncHTTPClient
 from ..models import ReturnRequest, ReturnRequestList
 from ..validators import (
     validate_consignment_id,
     validate_invoice,
     validate_identifier_type,
 )
+from ..exceptions import ValidationError
+from ..lazy import FieldDecoder, LazyList, decode_fields, lazy_model
+from ..pagination import AsyncPageIterator, PageIterator, Since, page_params
 
+_RETURN_REQUEST_FIELDS: Dict[str, FieldDecoder] = {
+    "id": lambda item: item.get("id", 0),
+    "user_id": lambda item: item.get("user_id", 0),
+    "consignment_id": lambda item: item.get("consignment_id", 0),
+    "reason": lambda item: item.get("reason"),
+    "status": lambda item: item.get("status", "pending"),
+    "created_at": lambda item: item.get("created_at"),
+    "updated_at": lambda item: item.get("updated_at"),
+}
 
-class ReturnRequestModule:
+LazyReturnRequest = lazy_model(ReturnRequest, _RETURN_REQUEST_FIELDS, __name__)
+
+
+class _ReturnRequestModuleBase:
+    """Validation and parsing shared by the sync and async return modules."""
+
+    def _build_create_payload(
+        self,
+        identifier: Union[int, str],
+        identifier_type: str,
+        reason: str,
+    ) -> Dict[str, Any]:
+        """Validate return request arguments and build the payload.
+
+        Raises:
+            ValidationError: If inputs are invalid
+        """
+        validate_identifier_type(identifier_type)
+
+        if identifier_type == "consignment_id":
+            validate_consignment_id(int(identifier))
+        elif identifier_type == "invoice":
+            validate_invoice(str(identifier))
+
+        payload: dict = {
+            "identifier": identifier,
+            "identifier_type": identifier_type,
+        }
+        if reason:
+            payload["reason"] = reason
+
+        return payload
+
+    def _return_request_endpoint(self, return_request_id: int) -> str:
+        """Validate a return request ID and return its endpoint."""
+        if not isinstance(return_request_id, int) or return_request_id <= 0:
+            raise ValidationError(
+                "Return request ID must be a positive integer",
+                "return_request_id",
+            )
+
+        return f"/return-request/{return_request_id}"
+
+    def _parse_return_request(self, item: Dict[str, Any]) -> ReturnRequest:
+        """Build a ReturnRequest from a response item."""
+        return decode_fields(ReturnRequest, _RETURN_REQUEST_FIELDS, item)
+
+    def _parse_return_request_list(
+        self, response: Dict[str, Any], lazy: bool = False
+    ) -> ReturnRequestList:
+        """Build a ReturnRequestList from a list response."""
+        items = response.get("data", [])
+        if lazy:
+            return ReturnRequestList(data=LazyList(items, LazyReturnRequest))
+
+        return ReturnRequestList(
+            data=[self._parse_return_request(item) for item in items]
+        )
+
+
+class ReturnRequestModule(_ReturnRequestModuleBase):
     """Module for managing return requests."""
 
     def __init__(self, http_client: HTTPClient) -> None:
@@ -44,31 +117,11 @@ class ReturnRequestModule:
             APIError: If API returns error
             NetworkError: If network error occurs
         """
-        validate_identifier_type(identifier_type)
-
-        if identifier_type == "consignment_id":
-            validate_consignment_id(int(identifier))
-        elif identifier_type == "invoice":
-            validate_invoice(str(identifier))
-
-        payload: dict = {
-            "identifier": identifier,
-            "identifier_type": identifier_type,
-        }
-        if reason:
-            payload["reason"] = reason
+        payload = self._build_create_payload(identifier, identifier_type, reason)
 
-        response = self.http_client.post("/return-request/store", payload)
+        response = self.http_client.post("/return-request/store", data=payload)
 
-        return ReturnRequest(
-            id=response.get("id", 0),
-            user_id=response.get("user_id", 0),
-            consignment_id=response.get("consignment_id", 0),
-            reason=response.get("reason"),
-            status=response.get("status", "pending"),
-            created_at=response.get("created_at"),
-            updated_at=response.get("updated_at"),
-        )
+        return self._parse_return_request(response)
 
     def get(self, return_request_id: int) -> ReturnRequest:
         """Get a specific return request.
@@ -85,50 +138,190 @@ class ReturnRequestModule:
             APIError: If API returns error
             NetworkError: If network error occurs
         """
-        if not isinstance(return_request_id, int) or return_request_id <= 0:
-            from ..exceptions import ValidationError
+        endpoint = self._return_request_endpoint(return_request_id)
+        response = self.http_client.get(endpoint)
 
-            raise ValidationError(
-                "Return request ID must be a positive integer",
-                "return_request_id",
-            )
+        return self._parse_return_request(response)
+
+    def list(self, lazy: bool = False, page: Optional[int] = None) -> ReturnRequestList:
+        """List return requests.
+
+        Args:
+            lazy: Build each return request, and decode each of its fields,
+                only when it is first read
+            page: Page to fetch; the API's first page if omitted
+
+        Returns:
+            ReturnRequestList object with one page of results
+
+        Raises:
+            ValidationError: If page is invalid
+            APIError: If API returns error
+            NetworkError: If network error occurs
+        """
+        response = self.http_client.get(
+            "/return-request/list", params=page_params(page)
+        )
+
+        return self._parse_return_request_list(response, lazy)
+
+    def iter_returns(
+        self,
+        start_page: int = 1,
+        since: Optional[Since] = None,
+        prefetch: bool = True,
+    ) -> PageIterator[ReturnRequest]:
+        """Iterate over the return requests of every page.
+
+        The next page is fetched in the background while the current one is
+        consumed. The iterator's ``page`` attribute is the page of the last
+        return request returned; pass it as ``start_page`` to resume.
 
-        response = self.http_client.get(f"/return-request/{return_request_id}")
+        Args:
+            start_page: First page to fetch
+            since: Skip return requests created before this date or ISO 8601
+                time
+            prefetch: Fetch the next page while the current one is consumed
+
+        Returns:
+            PageIterator yielding ReturnRequest objects
 
-        return ReturnRequest(
-            id=response.get("id", 0),
-            user_id=response.get("user_id", 0),
-            consignment_id=response.get("consignment_id", 0),
-            reason=response.get("reason"),
-            status=response.get("status", "pending"),
-            created_at=response.get("created_at"),
-            updated_at=response.get("updated_at"),
+        Raises:
+            ValidationError: If start_page or since is invalid
+            APIError: If API returns error, while iterating
+            NetworkError: If network error occurs, while iterating
+        """
+        return PageIterator(
+            lambda page: self.http_client.get(
+                "/return-request/list", params=page_params(page)
+            ),
+            self._parse_return_request,
+            start_page=start_page,
+            since=since,
+            prefetch=prefetch,
         )
 
-    def list(self) -> ReturnRequestList:
-        """List all return requests.
+
+class AsyncReturnRequestModule(_ReturnRequestModuleBase):
+    """Async module for managing return requests."""
+
+    def __init__(self, http_client: AsyncHTTPClient) -> None:
+        """Initialize async return request module.
+
+        Args:
+            http_client: AsyncHTTPClient instance for API calls
+        """
+        self.http_client = http_client
+
+    async def create(
+        self,
+        identifier: Union[int, str],
+        identifier_type: str = "consignment_id",
+        reason: str = "",
+    ) -> ReturnRequest:
+        """Create a return request.
+
+        Args:
+            identifier: Consignment ID, invoice, or tracking code
+            identifier_type: Type of identifier (consignment_id, invoice,
+                tracking_code)
+            reason: Optional reason for return
 
         Returns:
-            ReturnRequestList object with paginated results
+            ReturnRequest object
 
         Raises:
+            ValidationError: If inputs are invalid
+            NotFoundError: If consignment not found
             APIError: If API returns error
             NetworkError: If network error occurs
         """
-        response = self.http_client.get("/return-request/list")
-
-        requests = []
-        for item in response.get("data", []):
-            requests.append(
-                ReturnRequest(
-                    id=item.get("id", 0),
-                    user_id=item.get("user_id", 0),
-                    consignment_id=item.get("consignment_id", 0),
-                    reason=item.get("reason"),
-                    status=item.get("status", "pending"),
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                )
-            )
+        payload = self._build_create_payload(identifier, identifier_type, reason)
+
+        response = await self.http_client.post("/return-request/store", data=payload)
+
+        return self._parse_return_request(response)
+
+    async def get(self, return_request_id: int) -> ReturnRequest:
+        """Get a specific return request.
+
+        Args:
+            return_request_id: ID of the return request
 
-        return ReturnRequestList(data=requests)
+        Returns:
+            ReturnRequest object
+
+        Raises:
+            ValidationError: If return_request_id is invalid
+            NotFoundError: If return request not found
+            APIError: If API returns error
+            NetworkError: If network error occurs
+        """
+        endpoint = self._return_request_endpoint(return_request_id)
+        response = await self.http_client.get(endpoint)
+
+        return self._parse_return_request(response)
+
+    async def list(
+        self, lazy: bool = False, page: Optional[int] = None
+    ) -> ReturnRequestList:
+        """List return requests.
+
+        Args:
+            lazy: Build each return request, and decode each of its fields,
+                only when it is first read
+            page: Page to fetch; the API's first page if omitted
+
+        Returns:
+            ReturnRequestList object with one page of results
+
+        Raises:
+            ValidationError: If page is invalid
+            APIError: If API returns error
+            NetworkError: If network error occurs
+        """
+        response = await self.http_client.get(
+            "/return-request/list", params=page_params(page)
+        )
+
+        return self._parse_return_request_list(response, lazy)
+
+    def iter_returns(
+        self,
+        start_page: int = 1,
+        since: Optional[Since] = None,
+        prefetch: bool = True,
+    ) -> AsyncPageIterator[ReturnRequest]:
+        """Iterate over the return requests of every page.
+
+        The next page is fetched as a task while the current one is
+        consumed. The iterator's ``page`` attribute is the page of the last
+        return request returned; pass it as ``start_page`` to resume.
+
+        Args:
+            start_page: First page to fetch
+            since: Skip return requests created before this date or ISO 8601
+                time
+            prefetch: Fetch the next page while the current one is consumed
+
+        Returns:
+            AsyncPageIterator yielding ReturnRequest objects
+
+        Raises:
+            ValidationError: If start_page or since is invalid
+            APIError: If API returns error, while iterating
+            NetworkError: If network error occurs, while iterating
+        """
+        return AsyncPageIterator(
+            self._fetch_page,
+            self._parse_return_request,
+            start_page=start_page,
+            since=since,
+            prefetch=prefetch,
+        )
+
+    async def _fetch_page(self, page: int) -> Dict[str, Any]:
+        """Fetch one page of the return request list."""
+        return await self.http_client.get(
+            "/return-request/list", params=page_params(page)
+        )
@@ -1,21 +1,99 @@
 """Order tracking module for Steadfast SDK."""
 
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
 from ..http_client import HTTPClient
+from ..async_http_client import AsyncHTTPClient
+from ..cache import StatusCache
+from ..concurrency import fan_out, fan_out_async
 from ..models import OrderStatus
-from ..validators import validate_consignment_id, validate_invoice
-from ..exceptions import ValidationError
+from ..validators import (
+    validate_consignment_id,
+    validate_identifier_type,
+    validate_invoice,
+)
+from ..exceptions import SteadfastException, ValidationError
+
+Identifier = Union[int, str]
+# A lookup's outcome: the status, or the SDK error raised for that identifier
+StatusResult = Union[OrderStatus, SteadfastException]
+
+
+class _TrackingModuleBase:
+    """Validation and parsing shared by the sync and async tracking modules."""
+
+    def _consignment_id_endpoint(self, consignment_id: int) -> str:
+        """Validate a consignment ID and return its status endpoint."""
+        validated_id = validate_consignment_id(consignment_id)
+        return f"/status_by_cid/{validated_id}"
+
+    def _invoice_endpoint(self, invoice: str) -> str:
+        """Validate an invoice and return its status endpoint."""
+        validated_invoice = validate_invoice(invoice)
+        return f"/status_by_invoice/{validated_invoice}"
+
+    def _tracking_code_endpoint(self, tracking_code: str) -> str:
+        """Validate a tracking code and return its status endpoint."""
+        if not tracking_code or not isinstance(tracking_code, str):
+            raise ValidationError("Tracking code cannot be empty", "tracking_code")
+
+        tracking_code = tracking_code.strip()
+        if not tracking_code:
+            raise ValidationError("Tracking code cannot be empty", "tracking_code")
+
+        return f"/status_by_trackingcode/{tracking_code}"
+
+    def _status_endpoint(self, identifier: Identifier, identifier_type: str) -> str:
+        """Validate an identifier of the given type and return its endpoint."""
+        builders: Dict[str, Callable[[Any], str]] = {
+            "consignment_id": self._consignment_id_endpoint,
+            "invoice": self._invoice_endpoint,
+            "tracking_code": self._tracking_code_endpoint,
+        }
+        return builders[identifier_type](identifier)
 
+    def _unique(self, identifiers: Iterable[Identifier]) -> Iterator[Identifier]:
+        """Yield each identifier once, in input order."""
+        seen: Set[Identifier] = set()
+        for identifier in identifiers:
+            if identifier not in seen:
+                seen.add(identifier)
+                yield identifier
 
-class TrackingModule:
+    def _parse_status(self, response: Dict[str, Any]) -> OrderStatus:
+        """Build an OrderStatus from a status response."""
+        return OrderStatus(
+            status=response.get("status", 200),
+            delivery_status=response.get("delivery_status", "unknown"),
+        )
+
+
+class TrackingModule(_TrackingModuleBase):
     """Module for order status tracking."""
 
-    def __init__(self, http_client: HTTPClient) -> None:
+    def __init__(
+        self, http_client: HTTPClient, cache: Optional[StatusCache] = None
+    ) -> None:
         """Initialize tracking module.
 
         Args:
             http_client: HTTP client instance
+            cache: Status cache consulted before every lookup
         """
         self.http_client = http_client
+        self.cache = cache
 
     def get_status_by_consignment_id(self, consignment_id: int) -> OrderStatus:
         """Get delivery status by consignment ID.
@@ -31,17 +109,7 @@ class TrackingModule:
             NotFoundError: If consignment not found
             APIError: If API request fails
         """
-        # Validate input
-        validated_id = validate_consignment_id(consignment_id)
-
-        # Make API call
-        response = self.http_client.get(f"/status_by_cid/{validated_id}")
-
-        # Parse and return response
-        return OrderStatus(
-            status=response.get("status", 200),
-            delivery_status=response.get("delivery_status", "unknown"),
-        )
+        return self._get_status(self._consignment_id_endpoint(consignment_id))
 
     def get_status_by_invoice(self, invoice: str) -> OrderStatus:
         """Get delivery status by invoice ID.
@@ -57,19 +125,141 @@ class TrackingModule:
             NotFoundError: If invoice not found
             APIError: If API request fails
         """
-        # Validate input
-        validated_invoice = validate_invoice(invoice)
+        return self._get_status(self._invoice_endpoint(invoice))
 
-        # Make API call
-        response = self.http_client.get(f"/status_by_invoice/{validated_invoice}")
+    def get_status_by_tracking_code(self, tracking_code: str) -> OrderStatus:
+        """Get delivery status by tracking code.
 
-        # Parse and return response
-        return OrderStatus(
-            status=response.get("status", 200),
-            delivery_status=response.get("delivery_status", "unknown"),
-        )
+        Args:
+            tracking_code: Tracking code identifier
 
-    def get_status_by_tracking_code(self, tracking_code: str) -> OrderStatus:
+        Returns:
+            OrderStatus with delivery status
+
+        Raises:
+            ValidationError: If tracking_code is invalid
+            NotFoundError: If tracking code not found
+            APIError: If API request fails
+        """
+        return self._get_status(self._tracking_code_endpoint(tracking_code))
+
+    def get_statuses(
+        self,
+        identifiers: Iterable[Identifier],
+        identifier_type: str = "consignment_id",
+        concurrency: int = 8,
+    ) -> Dict[Identifier, StatusResult]:
+        """Look up the status of many orders concurrently.
+
+        Args:
+            identifiers: Consignment IDs, invoices or tracking codes
+            identifier_type: "consignment_id", "invoice" or "tracking_code"
+            concurrency: Maximum lookups in flight at once
+
+        Returns:
+            Mapping of each identifier, in input order, to its OrderStatus
+            or to the SDK error raised for it (e.g. NotFoundError)
+
+        Raises:
+            ValidationError: If identifier_type or concurrency is invalid
+        """
+        identifiers = list(self._unique(identifiers))
+        results = dict(self.iter_statuses(identifiers, identifier_type, concurrency))
+        return {identifier: results[identifier] for identifier in identifiers}
+
+    def iter_statuses(
+        self,
+        identifiers: Iterable[Identifier],
+        identifier_type: str = "consignment_id",
+        concurrency: int = 8,
+    ) -> Iterator[Tuple[Identifier, StatusResult]]:
+        """Look up the status of many orders, yielding results as they complete.
+
+        Lookups share the client's pooled connection, rate limiter, retry
+        policy and circuit breaker; keep ``concurrency`` at or below the
+        client's ``pool_maxsize``. Identifiers are read lazily and
+        duplicates are looked up once.
+
+        Args:
+            identifiers: Consignment IDs, invoices or tracking codes
+            identifier_type: "consignment_id", "invoice" or "tracking_code"
+            concurrency: Maximum lookups in flight at once
+
+        Returns:
+            Iterator of (identifier, OrderStatus or SDK error) in completion
+            order
+
+        Raises:
+            ValidationError: If identifier_type or concurrency is invalid
+        """
+        validate_identifier_type(identifier_type)
+
+        def lookup(identifier: Identifier) -> OrderStatus:
+            return self._get_status(self._status_endpoint(identifier, identifier_type))
+
+        return fan_out(lookup, self._unique(identifiers), concurrency)
+
+    def _get_status(self, endpoint: str) -> OrderStatus:
+        """Fetch a status, serving it from the cache when fresh."""
+        if self.cache is not None:
+            cached = self.cache.get(endpoint)
+            if cached is not None:
+                return cached
+
+        status = self._parse_status(self.http_client.get(endpoint))
+        if self.cache is not None:
+            self.cache.set(endpoint, status)
+        return status
+
+
+class AsyncTrackingModule(_TrackingModuleBase):
+    """Async module for order status tracking."""
+
+    def __init__(
+        self, http_client: AsyncHTTPClient, cache: Optional[StatusCache] = None
+    ) -> None:
+        """Initialize async tracking module.
+
+        Args:
+            http_client: Async HTTP client instance
+            cache: Status cache consulted before every lookup
+        """
+        self.http_client = http_client
+        self.cache = cache
+
+    async def get_status_by_consignment_id(self, consignment_id: int) -> OrderStatus:
+        """Get delivery status by consignment ID.
+
+        Args:
+            consignment_id: Consignment identifier
+
+        Returns:
+            OrderStatus with delivery status
+
+        Raises:
+            ValidationError: If consignment_id is invalid
+            NotFoundError: If consignment not found
+            APIError: If API request fails
+        """
+        return await self._get_status(self._consignment_id_endpoint(consignment_id))
+
+    async def get_status_by_invoice(self, invoice: str) -> OrderStatus:
+        """Get delivery status by invoice ID.
+
+        Args:
+            invoice: Invoice/order identifier
+
+        Returns:
+            OrderStatus with delivery status
+
+        Raises:
+            ValidationError: If invoice format is invalid
+            NotFoundError: If invoice not found
+            APIError: If API request fails
+        """
+        return await self._get_status(self._invoice_endpoint(invoice))
+
+    async def get_status_by_tracking_code(self, tracking_code: str) -> OrderStatus:
         """Get delivery status by tracking code.
 
         Args:
@@ -83,19 +273,67 @@ class TrackingModule:
             NotFoundError: If tracking code not found
             APIError: If API request fails
         """
-        # Validate input
-        if not tracking_code or not isinstance(tracking_code, str):
-            raise ValidationError("Tracking code cannot be empty", "tracking_code")
+        return await self._get_status(self._tracking_code_endpoint(tracking_code))
 
-        tracking_code = tracking_code.strip()
-        if not tracking_code:
-            raise ValidationError("Tracking code cannot be empty", "tracking_code")
+    async def get_statuses(
+        self,
+        identifiers: Iterable[Identifier],
+        identifier_type: str = "consignment_id",
+        concurrency: int = 8,
+    ) -> Dict[Identifier, StatusResult]:
+        """Look up the status of many orders concurrently.
 
-        # Make API call
-        response = self.http_client.get(f"/status_by_trackingcode/{tracking_code}")
+        See TrackingModule.get_statuses.
 
-        # Parse and return response
-        return OrderStatus(
-            status=response.get("status", 200),
-            delivery_status=response.get("delivery_status", "unknown"),
-        )
+        Returns:
+            Mapping of each identifier, in input order, to its OrderStatus
+            or to the SDK error raised for it
+
+        Raises:
+            ValidationError: If identifier_type or concurrency is invalid
+        """
+        unique: List[Identifier] = list(self._unique(identifiers))
+        results = {
+            identifier: result
+            async for identifier, result in self.iter_statuses(
+                unique, identifier_type, concurrency
+            )
+        }
+        return {identifier: results[identifier] for identifier in unique}
+
+    def iter_statuses(
+        self,
+        identifiers: Iterable[Identifier],
+        identifier_type: str = "consignment_id",
+        concurrency: int = 8,
+    ) -> AsyncIterator[Tuple[Identifier, StatusResult]]:
+        """Look up the status of many orders, yielding results as they complete.
+
+        See TrackingModule.iter_statuses; use ``async for`` to consume.
+
+        Returns:
+            Async iterator of (identifier, OrderStatus or SDK error) in
+            completion order
+
+        Raises:
+            ValidationError: If identifier_type or concurrency is invalid
+        """
+        validate_identifier_type(identifier_type)
+
+        async def lookup(identifier: Identifier) -> OrderStatus:
+            endpoint = self._status_endpoint(identifier, identifier_type)
+            return await self._get_status(endpoint)
+
+        return fan_out_async(lookup, self._unique(identifiers), concurrency)
+
+    async def _get_status(self, endpoint: str) -> OrderStatus:
+        """Fetch a status, serving it from the cache when fresh."""
+        if self.cache is not None:
+            cached = self.cache.get(endpoint)
+            if cached is not None:
+                return cached
+
+        status = self._parse_status(await self.http_client.get(endpoint))
+        if self.cache is not None:
+            self.cache.set(endpoint, status)
+        return status
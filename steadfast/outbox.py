@@ -0,0 +1,502 @@
+"""Durable local outbox for order submission."""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .exceptions import (
+    APIError,
+    AuthenticationError,
+    NetworkError,
+    NotFoundError,
+    SteadfastException,
+    ValidationError,
+)
+from .logger import get_logger
+from .models import BulkOrderResult, OutboxEntry
+from .modules.order import MAX_BULK_ORDERS, OrderModule, idempotency_key
+from .modules.tracking import TrackingModule
+from .retry import RetryPolicy
+from .validators import validate_order
+
+_COLUMNS = (
+    "id, invoice, status, attempts, consignment_id, tracking_code, error, "
+    "enqueued_at, updated_at, idempotency_key"
+)
+
+# Bulk result statuses that mean the order exists upstream
+_SENT_STATUSES = ("success", "duplicate")
+
+_Row = Tuple[int, str, str]  # (id, invoice, payload JSON)
+
+
+class OrderOutbox:
+    """SQLite-backed queue that submits orders in the background.
+
+    ``enqueue()`` validates an order and writes it to the local database,
+    without a request to the API. A worker thread started by ``start()``
+    sends queued orders with ``create_bulk()`` in batches of up to
+    ``batch_size`` and records each order's outcome. When the API is
+    unreachable (network errors, 429 and 5xx responses, an open circuit) the
+    batch stays queued and the worker backs off using ``backoff``; so does
+    an authentication failure. A batch the API refuses is split until the
+    refused orders are isolated, so only they are marked failed. Queued
+    orders survive process restarts when ``path`` is a file.
+
+    Before a batch is sent, its idempotency key is stored on its entries.
+    An entry still pending with a key was interrupted mid-request, so it is
+    looked up with ``status_by_invoice`` before being sent again.
+    """
+
+    def __init__(
+        self,
+        orders: OrderModule,
+        path: str = ":memory:",
+        batch_size: int = MAX_BULK_ORDERS,
+        flush_interval: float = 1.0,
+        backoff: Optional[RetryPolicy] = None,
+        on_result: Optional[Callable[[OutboxEntry], None]] = None,
+        lock_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize order outbox.
+
+        Args:
+            orders: Order module used to submit batches
+            path: SQLite database file, or ``":memory:"``
+            batch_size: Maximum orders per bulk request (max 500)
+            flush_interval: Seconds the worker waits for a batch to fill
+            backoff: Delay policy after a failed batch (defaults to 1 second
+                growing to 5 minutes, with jitter)
+            on_result: Called with each order's entry once it is sent or
+                has failed
+            lock_timeout: Seconds to wait for the database lock
+            clock: Monotonic time source in seconds
+
+        Raises:
+            ValidationError: If batch_size is out of range
+        """
+        if not 1 <= batch_size <= MAX_BULK_ORDERS:
+            raise ValidationError(
+                f"Batch size must be between 1 and {MAX_BULK_ORDERS}", "batch_size"
+            )
+
+        self.orders = orders
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backoff = backoff or RetryPolicy(base_delay=1.0, max_delay=300.0)
+        self.on_result = on_result
+        self.logger = get_logger(__name__)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Backoff state shared by flush() callers and the worker; guarded
+        # by _lock
+        self._delay = 0.0  # Last backoff delay; 0 while healthy
+        self._retry_at = 0.0
+        self._unflushed = 0  # Orders enqueued since the last flush started
+
+        self._conn = sqlite3.connect(
+            path,
+            timeout=lock_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        # WAL keeps enqueue() cheap and lets readers run alongside the worker
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "invoice TEXT NOT NULL, "
+            "payload TEXT NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'pending', "
+            "attempts INTEGER NOT NULL DEFAULT 0, "
+            "consignment_id INTEGER, "
+            "tracking_code TEXT, "
+            "error TEXT, "
+            "enqueued_at TEXT NOT NULL, "
+            "updated_at TEXT, "
+            "idempotency_key TEXT)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, id)"
+        )
+
+    def enqueue(self, order: Dict[str, Any]) -> int:
+        """Validate an order and queue it for submission.
+
+        Args:
+            order: Order dictionary, as accepted by create_bulk()
+
+        Returns:
+            Outbox entry ID
+
+        Raises:
+            ValidationError: If the order is invalid
+        """
+        return self.enqueue_many([order])[0]
+
+    def enqueue_many(self, orders: Iterable[Dict[str, Any]]) -> List[int]:
+        """Validate orders and queue them in one transaction.
+
+        Args:
+            orders: Order dictionaries
+
+        Returns:
+            Outbox entry IDs, in input order
+
+        Raises:
+            ValidationError: If any order is invalid; nothing is queued
+        """
+        rows = []
+        for i, order in enumerate(orders):
+            try:
+                validated = validate_order(order)
+            except ValidationError as e:
+                raise ValidationError(f"Order {i + 1}: {e.message}", e.field)
+            rows.append((validated["invoice"], json.dumps(validated)))
+
+        enqueued_at = _now()
+        ids = []
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for invoice, payload in rows:
+                    cursor = self._conn.execute(
+                        "INSERT INTO outbox (invoice, payload, enqueued_at) "
+                        "VALUES (?, ?, ?)",
+                        (invoice, payload, enqueued_at),
+                    )
+                    ids.append(int(cursor.lastrowid or 0))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._unflushed += len(ids)
+            full = self._unflushed >= self.batch_size
+
+        if full:
+            self._wake.set()
+        return ids
+
+    def flush(self) -> int:
+        """Send one batch of queued orders now, ignoring any backoff.
+
+        Returns:
+            Number of orders whose outcome was recorded (0 if the queue is
+            empty or the batch will be retried)
+        """
+        with self._flush_lock:
+            with self._lock:
+                self._unflushed = 0
+                found = self._conn.execute(
+                    "SELECT id, invoice, payload, idempotency_key FROM outbox "
+                    "WHERE status = 'pending' ORDER BY id LIMIT ?",
+                    (self.batch_size,),
+                ).fetchall()
+            if not found:
+                return 0
+
+            rows: List[_Row] = [row[:3] for row in found]
+            interrupted = [row[:3] for row in found if row[3] is not None]
+            recorded = 0
+            error: Optional[SteadfastException] = None
+            try:
+                if interrupted:
+                    created = self._confirm_interrupted(interrupted)
+                    recorded += len(created)
+                    rows = [row for row in rows if row[0] not in created]
+            except SteadfastException as e:
+                error = e
+            else:
+                if rows:
+                    sent, error = self._submit(rows)
+                    recorded += sent
+
+            if error is not None:
+                self._defer(rows, error)
+            else:
+                with self._lock:
+                    self._delay = 0.0
+            return recorded
+
+    def start(self) -> None:
+        """Start the background worker thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._work, name="steadfast-outbox", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker after its current batch.
+
+        Args:
+            timeout: Seconds to wait for the worker to finish
+        """
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get(self, entry_id: int) -> Optional[OutboxEntry]:
+        """Return an outbox entry by ID.
+
+        Args:
+            entry_id: ID returned by enqueue()
+
+        Returns:
+            OutboxEntry, or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE id = ?", (entry_id,)
+            ).fetchone()
+        return OutboxEntry(*row) if row else None
+
+    def entries(self, status: Optional[str] = None) -> List[OutboxEntry]:
+        """Return outbox entries, oldest first.
+
+        Args:
+            status: Only entries with this status ("pending", "sent" or
+                "failed")
+
+        Returns:
+            List of OutboxEntry
+        """
+        query = f"SELECT {_COLUMNS} FROM outbox"
+        params: Tuple[Any, ...] = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id", params).fetchall()
+        return [OutboxEntry(*row) for row in rows]
+
+    @property
+    def pending_count(self) -> int:
+        """Number of orders waiting to be sent."""
+        with self._lock:
+            return self._count("pending")
+
+    def close(self) -> None:
+        """Stop the worker and close the database connection."""
+        self.stop()
+        self._conn.close()
+
+    def __enter__(self) -> "OrderOutbox":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _work(self) -> None:
+        """Worker loop: send full batches at once, partial ones each interval."""
+        while not self._stopping.is_set():
+            with self._lock:
+                backing_off = bool(self._delay)
+                wait = self._retry_at - self._clock() if backing_off else 0.0
+            if wait <= 0:
+                try:
+                    self.flush()
+                except Exception:  # Keep the worker alive; orders stay queued
+                    self.logger.exception("Outbox flush failed")
+                    self._back_off()
+                with self._lock:
+                    backing_off = bool(self._delay)
+                if backing_off or self.pending_count >= self.batch_size:
+                    continue
+                wait = self.flush_interval
+
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def _count(self, status: str) -> int:
+        """Count entries with a status; the caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT COUNT(*) FROM outbox WHERE status = ?", (status,)
+        ).fetchone()
+        return int(row[0])
+
+    def _submit(self, rows: List[_Row]) -> Tuple[int, Optional[SteadfastException]]:
+        """Send a batch, halving it while the API refuses it.
+
+        Returns:
+            Tuple of (orders whose outcome was recorded; the error that
+            stopped sending, if the remaining orders should be retried)
+        """
+        self._mark_sending(rows)
+        try:
+            response = self.orders.create_bulk(
+                [json.loads(payload) for _, _, payload in rows]
+            )
+        except SteadfastException as e:
+            if _is_retryable(e):
+                return 0, e
+            if len(rows) == 1:
+                self._record_failure(rows, str(e))
+                return 1, None
+            # Isolate the orders the API refuses instead of failing them all
+            half = len(rows) // 2
+            first, error = self._submit(rows[:half])
+            if error is not None:
+                return first, error
+            second, error = self._submit(rows[half:])
+            return first + second, error
+
+        self._record_results(rows, response.results)
+        return len(rows), None
+
+    def _mark_sending(self, rows: List[_Row]) -> None:
+        """Store the idempotency key of a batch before it is sent."""
+        key = idempotency_key(invoice for _, invoice, _ in rows)
+        self._update(
+            "UPDATE outbox SET idempotency_key = ? WHERE id = ?",
+            [(key, row[0]) for row in rows],
+        )
+
+    def _confirm_interrupted(self, rows: List[_Row]) -> List[int]:
+        """Look up orders whose earlier send was interrupted.
+
+        With a ledger on the order module, create_bulk() confirms them
+        itself. Otherwise orders the API already has are recorded as sent.
+
+        Returns:
+            IDs of the entries recorded as sent
+
+        Raises:
+            SteadfastException: If a lookup fails
+        """
+        if self.orders.ledger is not None:
+            return []
+
+        tracking = TrackingModule(self.orders.http_client)
+        lookups = dict(tracking.iter_statuses([row[1] for row in rows], "invoice"))
+        created = []
+        for row in rows:
+            result = lookups[row[1]]
+            if isinstance(result, NotFoundError):
+                continue
+            if isinstance(result, SteadfastException):
+                raise result
+            created.append(row)
+        if created:
+            self._update(
+                "UPDATE outbox SET status = 'sent', attempts = attempts + 1, "
+                "error = NULL, updated_at = ? WHERE id = ?",
+                [(_now(), row[0]) for row in created],
+            )
+            self._notify(created)
+        return [row[0] for row in created]
+
+    def _back_off(self, retry_after: Optional[float] = None) -> float:
+        """Grow the backoff delay and schedule the next attempt."""
+        with self._lock:
+            self._delay = self.backoff.compute_delay(self._delay, retry_after)
+            self._retry_at = self._clock() + self._delay
+            return self._delay
+
+    def _defer(self, rows: List[_Row], error: SteadfastException) -> None:
+        """Keep the unrecorded orders of a batch queued and back off."""
+        retry_after = (
+            error.retry_after if isinstance(error, (NetworkError, APIError)) else None
+        )
+        delay = self._back_off(retry_after)
+        self.logger.warning(
+            f"Outbox batch of {len(rows)} orders failed ({error}); "
+            f"retrying in {delay:.1f} seconds"
+        )
+        self._update(
+            "UPDATE outbox SET attempts = attempts + 1, error = ?, updated_at = ? "
+            "WHERE id = ? AND status = 'pending'",
+            [(str(error), _now(), row[0]) for row in rows],
+        )
+
+    def _record_failure(self, rows: List[_Row], error: str) -> None:
+        """Mark a batch the API refused as failed."""
+        self._update(
+            "UPDATE outbox SET status = 'failed', attempts = attempts + 1, "
+            "error = ?, updated_at = ? WHERE id = ?",
+            [(error, _now(), row[0]) for row in rows],
+        )
+        self._notify(rows)
+
+    def _record_results(
+        self, rows: List[_Row], results: Sequence[BulkOrderResult]
+    ) -> None:
+        """Store each order's bulk result."""
+        by_invoice = {result.invoice: result for result in results}
+        updated_at = _now()
+        updates: List[Tuple[Any, ...]] = []
+        for entry_id, invoice, _ in rows:
+            result = by_invoice.get(invoice)
+            if result is None:
+                updates.append(
+                    ("failed", None, None, "No result returned", updated_at, entry_id)
+                )
+                continue
+            status = "sent" if result.status in _SENT_STATUSES else "failed"
+            updates.append(
+                (
+                    status,
+                    result.consignment_id,
+                    result.tracking_code,
+                    result.error,
+                    updated_at,
+                    entry_id,
+                )
+            )
+
+        self._update(
+            "UPDATE outbox SET status = ?, attempts = attempts + 1, "
+            "consignment_id = ?, tracking_code = ?, error = ?, updated_at = ? "
+            "WHERE id = ?",
+            updates,
+        )
+        self._notify(rows)
+
+    def _update(self, statement: str, params: List[Tuple[Any, ...]]) -> None:
+        """Run an UPDATE for several entries in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(statement, params)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _notify(self, rows: List[_Row]) -> None:
+        """Pass the recorded entries to the on_result callback."""
+        if self.on_result is None:
+            return
+        for entry_id, _, _ in rows:
+            entry = self.get(entry_id)
+            if entry is not None:
+                self.on_result(entry)
+
+
+def _is_retryable(error: SteadfastException) -> bool:
+    """Return True for failures that say nothing about the orders themselves."""
+    if isinstance(error, (NetworkError, AuthenticationError)):
+        return True
+    return isinstance(error, APIError) and (
+        error.status_code == 429 or (error.status_code or 0) >= 500
+    )
+
+
+def _now() -> str:
+    """Return the current UTC time in ISO 8601 format."""
+    return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,250 @@
+"""Iterators that walk every page of a paginated list endpoint."""
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .exceptions import ValidationError
+
+_T = TypeVar("_T")
+
+Response = Dict[str, Any]
+Since = Union[str, date, datetime]
+
+
+def page_params(page: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Validate a page number and return its query parameters.
+
+    Raises:
+        ValidationError: If page is not a positive integer
+    """
+    if page is None:
+        return None
+    if not isinstance(page, int) or page < 1:
+        raise ValidationError("Page must be a positive integer", "page")
+
+    return {"page": page}
+
+
+def next_page(response: Response, page: int) -> Optional[int]:
+    """Return the page after ``page``, or None if it was the last one.
+
+    Understands Laravel-style pagination: ``next_page_url``, or
+    ``current_page`` with ``last_page``. A response without either, or
+    without items, is treated as the last page.
+    """
+    if not response.get("data"):
+        return None
+    if "next_page_url" in response:
+        return page + 1 if response["next_page_url"] else None
+    if "last_page" in response:
+        current = int(response.get("current_page", page))
+        return current + 1 if current < int(response["last_page"]) else None
+    return None
+
+
+def _timestamp(value: Since) -> datetime:
+    """Parse an ISO 8601 date or time as an aware UTC-based datetime."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    elif not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class _PageIteratorBase:
+    """Options and item filtering shared by the sync and async iterators."""
+
+    def __init__(
+        self,
+        parse: Callable[[Dict[str, Any]], Any],
+        start_page: int,
+        since: Optional[Since],
+        prefetch: bool,
+    ) -> None:
+        if not isinstance(start_page, int) or start_page < 1:
+            raise ValidationError("Start page must be a positive integer", "start_page")
+        try:
+            self._since = None if since is None else _timestamp(since)
+        except ValueError:
+            raise ValidationError(f"Invalid since date: {since!r}", "since")
+
+        self._parse = parse
+        self._prefetch = prefetch
+        self._start_page = start_page
+        self.page = start_page
+        self.pages_fetched = 0
+
+    def _wanted(self, item: Dict[str, Any]) -> bool:
+        """Return True unless the item was created before ``since``."""
+        if self._since is None or not item.get("created_at"):
+            return True
+        try:
+            return _timestamp(item["created_at"]) >= self._since
+        except ValueError:
+            return True
+
+
+class PageIterator(_PageIteratorBase, Iterator[_T]):
+    """Items of every page of a list endpoint, in order.
+
+    While the items of one page are being consumed, the next page is
+    fetched on a background thread. ``page`` is the page of the item last
+    returned; pass it as ``start_page`` to resume after an interruption
+    (items of that page are returned again).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Response],
+        parse: Callable[[Dict[str, Any]], _T],
+        start_page: int = 1,
+        since: Optional[Since] = None,
+        prefetch: bool = True,
+    ) -> None:
+        """Initialize page iterator.
+
+        Args:
+            fetch: Fetches one page by number
+            parse: Builds the model for one item
+            start_page: First page to fetch
+            since: Skip items created before this date or time
+            prefetch: Fetch the next page while the current one is consumed
+
+        Raises:
+            ValidationError: If start_page or since is invalid
+        """
+        super().__init__(parse, start_page, since, prefetch)
+        self._fetch = fetch
+        self._items = self._generate()
+
+    def __iter__(self) -> "PageIterator[_T]":
+        return self
+
+    def __next__(self) -> _T:
+        return next(self._items)
+
+    def close(self) -> None:
+        """Stop iterating and cancel any prefetch in progress."""
+        self._items.close()
+
+    def _generate(self) -> Generator[_T, None, None]:
+        """Yield the wanted items of every page."""
+        for page, response in self._pages():
+            self.page = page
+            for item in response.get("data", []):
+                if self._wanted(item):
+                    yield self._parse(item)
+
+    def _pages(self) -> Generator[Tuple[int, Response], None, None]:
+        """Yield (page number, response) for every page."""
+        executor = ThreadPoolExecutor(max_workers=1) if self._prefetch else None
+        pending: Optional["Future[Response]"] = None
+        page = self._start_page
+        try:
+            response = self._fetch(page)
+            while True:
+                self.pages_fetched += 1
+                following = next_page(response, page)
+                if following is not None and executor is not None:
+                    pending = executor.submit(self._fetch, following)
+
+                yield page, response
+
+                if following is None:
+                    return
+                if pending is not None:
+                    response, pending = pending.result(), None
+                else:
+                    response = self._fetch(following)
+                page = following
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+class AsyncPageIterator(_PageIteratorBase, AsyncIterator[_T]):
+    """Async counterpart of PageIterator; the next page is fetched as a task."""
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Awaitable[Response]],
+        parse: Callable[[Dict[str, Any]], _T],
+        start_page: int = 1,
+        since: Optional[Since] = None,
+        prefetch: bool = True,
+    ) -> None:
+        """Initialize async page iterator.
+
+        Args:
+            fetch: Coroutine function fetching one page by number
+            parse: Builds the model for one item
+            start_page: First page to fetch
+            since: Skip items created before this date or time
+            prefetch: Fetch the next page while the current one is consumed
+
+        Raises:
+            ValidationError: If start_page or since is invalid
+        """
+        super().__init__(parse, start_page, since, prefetch)
+        self._fetch = fetch
+        self._items = self._generate()
+
+    def __aiter__(self) -> "AsyncPageIterator[_T]":
+        return self
+
+    async def __anext__(self) -> _T:
+        return await self._items.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop iterating and cancel any prefetch in progress."""
+        await self._items.aclose()
+
+    async def _generate(self) -> AsyncGenerator[_T, None]:
+        """Yield the wanted items of every page."""
+        async for page, response in self._pages():
+            self.page = page
+            for item in response.get("data", []):
+                if self._wanted(item):
+                    yield self._parse(item)
+
+    async def _pages(self) -> AsyncGenerator[Tuple[int, Response], None]:
+        """Yield (page number, response) for every page."""
+        pending: Optional["asyncio.Future[Response]"] = None
+        page = self._start_page
+        try:
+            response = await self._fetch(page)
+            while True:
+                self.pages_fetched += 1
+                following = next_page(response, page)
+                if following is not None and self._prefetch:
+                    pending = asyncio.ensure_future(self._fetch(following))
+
+                yield page, response
+
+                if following is None:
+                    return
+                if pending is not None:
+                    response, pending = await pending, None
+                else:
+                    response = await self._fetch(following)
+                page = following
+        finally:
+            if pending is not None:
+                pending.cancel()
@@ -0,0 +1,253 @@
+"""Client-side token-bucket rate limiting for Steadfast SDK."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .exceptions import ConfigurationError
+
+
+@dataclass
+class RateLimit:
+    """Token-bucket limit: ``rate`` requests per second, bursts of ``burst``."""
+
+    rate: float
+    burst: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ConfigurationError("Rate limit must be greater than zero")
+        if self.burst is None:
+            self.burst = max(1.0, self.rate)
+        elif self.burst < 1:
+            raise ConfigurationError("Rate limit burst must be at least 1")
+
+    @property
+    def capacity(self) -> float:
+        """Maximum number of tokens the bucket holds."""
+        return float(self.burst or 1.0)
+
+
+class InMemoryBackend:
+    """Token state held in process memory, shared between threads."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize in-memory backend.
+
+        Args:
+            clock: Monotonic time source in seconds
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def reserve(self, key: str, limit: RateLimit) -> float:
+        """Take one token from a bucket, going into debt if necessary.
+
+        Args:
+            key: Bucket name
+            limit: Limit applied to the bucket
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = self._clock()
+            tokens, updated = self._buckets.get(key, (limit.capacity, now))
+            tokens, wait = _take_token(tokens, now - updated, limit)
+            self._buckets[key] = (tokens, now)
+            return wait
+
+
+class SQLiteBackend:
+    """Token state stored in SQLite so several processes share one budget.
+
+    Every reservation runs in an ``IMMEDIATE`` transaction, which SQLite
+    serialises across processes using its file lock.
+    """
+
+    def __init__(self, path: str, lock_timeout: float = 10.0) -> None:
+        """Initialize SQLite backend.
+
+        Args:
+            path: Database file shared by all participating processes
+            lock_timeout: Seconds to wait for the database lock
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path,
+            timeout=lock_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def reserve(self, key: str, limit: RateLimit) -> float:
+        """Take one token from a bucket, going into debt if necessary.
+
+        Args:
+            key: Bucket name
+            limit: Limit applied to the bucket
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Wall-clock time, since monotonic clocks differ per process
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                tokens, updated = row if row else (limit.capacity, now)
+                tokens, wait = _take_token(tokens, max(0.0, now - updated), limit)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit_buckets "
+                    "(key, tokens, updated) VALUES (?, ?, ?)",
+                    (key, tokens, now),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return wait
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+Backend = Union[InMemoryBackend, SQLiteBackend]
+
+
+def _take_token(tokens: float, elapsed: float, limit: RateLimit) -> Tuple[float, float]:
+    """Refill a bucket for ``elapsed`` seconds and take one token.
+
+    Returns:
+        Tuple of (remaining tokens, seconds to wait)
+    """
+    tokens = min(limit.capacity, tokens + elapsed * limit.rate) - 1.0
+    wait = -tokens / limit.rate if tokens < 0 else 0.0
+    return tokens, wait
+
+
+class RateLimiter:
+    """Global and per-endpoint token-bucket limiter.
+
+    Endpoint limits are keyed by path prefix; the longest matching prefix
+    applies, in addition to the global limit. For example::
+
+        RateLimiter(
+            rate=20,
+            endpoint_limits={
+                "/status_by_": 10,
+                "/create_bulk_order": RateLimit(rate=1, burst=2),
+            },
+        )
+    """
+
+    def __init__(
+        self,
+        rate: Optional[Union[float, RateLimit]] = None,
+        endpoint_limits: Optional[Dict[str, Union[float, RateLimit]]] = None,
+        backend: Optional[Backend] = None,
+        namespace: str = "steadfast",
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            rate: Global limit in requests per second (None for no limit)
+            endpoint_limits: Limits keyed by endpoint path prefix
+            backend: Token state backend (defaults to in-memory)
+            namespace: Prefix for bucket keys, e.g. one per account
+        """
+        self.global_limit = _as_limit(rate) if rate is not None else None
+        self.endpoint_limits = {
+            "/" + prefix.lstrip("/"): _as_limit(limit)
+            for prefix, limit in (endpoint_limits or {}).items()
+        }
+        # Longest prefix first so the most specific limit wins
+        self._prefixes = sorted(self.endpoint_limits, key=len, reverse=True)
+        self.backend: Backend = backend or InMemoryBackend()
+        self.namespace = namespace
+
+    def _buckets_for(self, endpoint: str) -> List[Tuple[str, RateLimit]]:
+        """Return the (key, limit) pairs that apply to an endpoint."""
+        buckets = []
+        if self.global_limit is not None:
+            buckets.append((f"{self.namespace}:*", self.global_limit))
+
+        path = "/" + endpoint.lstrip("/")
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                buckets.append(
+                    (f"{self.namespace}:{prefix}", self.endpoint_limits[prefix])
+                )
+                break
+
+        return buckets
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserve capacity for one request without waiting.
+
+        Args:
+            endpoint: API endpoint about to be called
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        wait = 0.0
+        for key, limit in self._buckets_for(endpoint):
+            wait = max(wait, self.backend.reserve(key, limit))
+        return wait
+
+    def acquire(self, endpoint: str) -> float:
+        """Block until a request to ``endpoint`` may be sent.
+
+        Args:
+            endpoint: API endpoint about to be called
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, endpoint: str) -> float:
+        """Wait, without blocking the event loop, until a request may be sent.
+
+        Reservations on a backend other than InMemoryBackend may block on
+        I/O or a file lock, so they run in the loop's default executor.
+
+        Args:
+            endpoint: API endpoint about to be called
+
+        Returns:
+            Seconds spent waiting
+        """
+        if isinstance(self.backend, InMemoryBackend):
+            wait = self.reserve(endpoint)
+        else:
+            loop = asyncio.get_running_loop()
+            wait = await loop.run_in_executor(None, self.reserve, endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+def _as_limit(limit: Union[float, RateLimit]) -> RateLimit:
+    """Coerce a plain requests-per-second number into a RateLimit."""
+    if isinstance(limit, RateLimit):
+        return limit
+    return RateLimit(rate=float(limit))
@@ -0,0 +1,83 @@
+"""Streaming order readers for Steadfast SDK."""
+
+import csv
+import json
+import os
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, Union
+
+from .exceptions import ValidationError
+
+Source = Union[str, "os.PathLike[str]", IO[str]]
+
+# CSV columns converted from text to int when they hold a whole number
+_INTEGER_COLUMNS = ("delivery_type", "total_lot")
+
+
+def read_orders_csv(
+    source: Source, encoding: str = "utf-8", delimiter: str = ","
+) -> Iterator[Dict[str, Any]]:
+    """Yield order dictionaries from a CSV file, one row at a time.
+
+    The header row names the order fields (``invoice``, ``recipient_name``,
+    ``cod_amount``, ...). Empty cells are omitted and ``delivery_type`` and
+    ``total_lot`` are converted to integers; values are otherwise left for
+    order validation.
+
+    Args:
+        source: File path or open text file
+        encoding: File encoding when a path is given
+        delimiter: Field delimiter
+
+    Yields:
+        Order dictionaries suitable for create_bulk_stream()
+    """
+    with _open_source(source, encoding) as handle:
+        for row in csv.DictReader(handle, delimiter=delimiter):
+            order: Dict[str, Any] = {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if key and value and value.strip()
+            }
+            for column in _INTEGER_COLUMNS:
+                if column in order and order[column].isdigit():
+                    order[column] = int(order[column])
+            yield order
+
+
+def read_orders_jsonl(
+    source: Source, encoding: str = "utf-8"
+) -> Iterator[Dict[str, Any]]:
+    """Yield order dictionaries from a JSON Lines file, one line at a time.
+
+    Args:
+        source: File path or open text file
+        encoding: File encoding when a path is given
+
+    Yields:
+        Order dictionaries suitable for create_bulk_stream()
+
+    Raises:
+        ValidationError: If a line is not a JSON object
+    """
+    with _open_source(source, encoding) as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                order = json.loads(line)
+            except ValueError as e:
+                raise ValidationError(f"Line {line_number}: invalid JSON ({e})")
+            if not isinstance(order, dict):
+                raise ValidationError(f"Line {line_number}: expected a JSON object")
+            yield order
+
+
+@contextmanager
+def _open_source(source: Source, encoding: str) -> Iterator[IO[str]]:
+    """Open a path, or pass through an already open file without closing it."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding=encoding, newline="") as handle:
+            yield handle
+    else:
+        yield source
@@ -0,0 +1,218 @@
+"""Retry policy and retry budget for Steadfast SDK."""
+
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Union
+
+from .exceptions import ConfigurationError
+
+# Statuses that signal a transient upstream condition
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class Resend:
+    """Returned by a ``before_retry`` hook to retry with a changed request."""
+
+    data: Dict[str, Any]
+    headers: Dict[str, str]
+
+
+# What a before_retry hook, called with the error that failed the previous
+# attempt, returns: None to resend the request unchanged, a Resend to send a
+# changed request, or a response to return without resending
+RetryHookResult = Union[None, Resend, Dict[str, Any]]
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent request volume.
+
+    Within a sliding ``ttl`` window, retries are allowed while
+    ``retries < min_retries_per_second * ttl + ratio * requests``. With the
+    defaults, retries add at most about 10% extra load once traffic is
+    steady, so retry storms cannot multiply load during an outage.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries_per_second: float = 2.0,
+        ttl: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retries allowed per original request
+            min_retries_per_second: Retries always allowed at low traffic
+            ttl: Length of the sliding window in seconds
+            clock: Monotonic time source in seconds
+        """
+        if ratio < 0 or min_retries_per_second < 0 or ttl <= 0:
+            raise ConfigurationError("Invalid retry budget configuration")
+
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _expire(self, now: float) -> None:
+        """Drop events that fell out of the window."""
+        cutoff = now - self.ttl
+        for events in (self._requests, self._retries):
+            while events and events[0] <= cutoff:
+                events.popleft()
+
+    def record_request(self) -> None:
+        """Record an original (non-retry) request."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_withdraw(self) -> bool:
+        """Spend budget for one retry.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted
+        """
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            reserve = self.min_retries_per_second * self.ttl
+            allowed = reserve + self.ratio * len(self._requests)
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """Decides which failures are retried and how long to wait.
+
+    Delays use decorrelated jitter: each delay is drawn uniformly from
+    ``[base_delay, previous_delay * 3]`` and capped at ``max_delay``. A
+    server-supplied ``Retry-After`` takes precedence.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.3,
+        max_delay: float = 20.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        max_retry_after: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+        random_func: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Maximum retry attempts per request
+            base_delay: Minimum delay between attempts in seconds
+            max_delay: Maximum computed delay in seconds
+            retry_statuses: HTTP status codes that are retried
+            max_retry_after: Longest Retry-After honoured; longer waits are
+                not retried and are reported to the caller instead
+            budget: Retry budget (defaults to a fresh RetryBudget)
+            random_func: Uniform random source, for deterministic tests
+        """
+        if max_retries < 0 or base_delay < 0 or max_delay < base_delay:
+            raise ConfigurationError("Invalid retry policy configuration")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+        self.budget = budget if budget is not None else RetryBudget()
+        self._random = random_func
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Return True if a response status should be retried."""
+        return status_code in self.retry_statuses
+
+    def compute_delay(
+        self, previous_delay: float = 0.0, retry_after: Optional[float] = None
+    ) -> float:
+        """Return the delay before the next attempt.
+
+        Args:
+            previous_delay: Delay used before the previous attempt (0 if none)
+            retry_after: Seconds requested by the server, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None:
+            return retry_after
+
+        upper = max(self.base_delay, previous_delay * 3)
+        return min(self.max_delay, self._random(self.base_delay, upper))
+
+    def next_delay(
+        self,
+        attempt: int,
+        previous_delay: float = 0.0,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """Decide whether to retry and, if so, how long to wait first.
+
+        Spends retry budget when a retry is granted.
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            previous_delay: Delay used before the failed attempt
+            retry_after: Seconds requested by the server, if any
+
+        Returns:
+            Delay in seconds, or None if the request must not be retried
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return None
+
+        if not self.budget.try_withdraw():
+            return None
+
+        return self.compute_delay(previous_delay, retry_after)
+
+    @staticmethod
+    def parse_retry_after(value: Any) -> Optional[float]:
+        """Parse a Retry-After header (delta-seconds or HTTP-date).
+
+        Args:
+            value: Header value
+
+        Returns:
+            Seconds to wait, or None if absent or unparseable
+        """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return max(0.0, float(value))
+
+        if not isinstance(value, str) or not value.strip():
+            return None
+
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at is None:
+            return None
+
+        return max(0.0, retry_at.timestamp() - time.time())
@@ -1,16 +1,27 @@
 """Input validators for Steadfast SDK."""
 
+import math
 import re
-from typing import Union
+from typing import Any, Dict, Mapping, Union
 from .exceptions import ValidationError
 
+# Compiled once; re's own pattern cache still costs a lookup per call
+_INVOICE_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+_NON_DIGITS = re.compile(r"\D")
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_DELIVERY_TYPES = (0, 1)
+_PASSTHROUGH_FIELDS = ("note", "item_description", "total_lot")
+# Shared by validate_order and validate_cod_amount so create(), create_bulk()
+# and OrderModule.validate_bulk() report a missing amount identically
+_COD_AMOUNT_REQUIRED = "COD amount is required"
+
 
 def validate_invoice(value: str) -> str:
     """Validate invoice format: alphanumeric, hyphens, underscores."""
     if not value or not isinstance(value, str):
         raise ValidationError("Invoice cannot be empty", "invoice")
 
-    if not re.match(r"^[a-zA-Z0-9_-]+$", value):
+    if not _INVOICE_PATTERN.match(value):
         raise ValidationError(
             "Invoice must contain only alphanumeric characters, "
             "hyphens, and underscores",
@@ -25,7 +36,7 @@ def validate_phone(value: str) -> str:
     if not value or not isinstance(value, str):
         raise ValidationError("Phone number cannot be empty", "phone")
 
-    phone = re.sub(r"\D", "", value)  # Remove non-digits
+    phone = _NON_DIGITS.sub("", value)  # Remove non-digits
 
     if len(phone) != 11:
         raise ValidationError("Phone number must be exactly 11 digits", "phone")
@@ -64,23 +75,26 @@ def validate_email(value: str) -> str:
     if not value or not isinstance(value, str):
         raise ValidationError("Email cannot be empty", "email")
 
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    if not re.match(email_pattern, value):
+    if not _EMAIL_PATTERN.match(value):
         raise ValidationError("Invalid email format", "email")
 
     return value.strip()
 
 
 def validate_cod_amount(value: Union[int, float]) -> float:
-    """Validate COD amount: numeric, >= 0."""
+    """Validate COD amount: finite number, >= 0."""
     if value is None:
-        raise ValidationError("COD amount cannot be None", "cod_amount")
+        raise ValidationError(_COD_AMOUNT_REQUIRED, "cod_amount")
 
     try:
         amount = float(value)
     except (ValueError, TypeError):
         raise ValidationError("COD amount must be numeric", "cod_amount")
 
+    # NaN and infinity parse as floats but are not amounts
+    if not math.isfinite(amount):
+        raise ValidationError("COD amount must be a finite number", "cod_amount")
+
     if amount < 0:
         raise ValidationError("COD amount cannot be negative", "cod_amount")
 
@@ -89,7 +103,7 @@ def validate_cod_amount(value: Union[int, float]) -> float:
 
 def validate_delivery_type(value: int) -> int:
     """Validate delivery type: 0 or 1."""
-    if value not in [0, 1]:
+    if value not in _DELIVERY_TYPES:
         raise ValidationError(
             "Delivery type must be 0 (home) or 1 (point)", "delivery_type"
         )
@@ -117,3 +131,81 @@ def validate_identifier_type(value: str) -> str:
         )
 
     return value
+
+
+def validate_order(order: Mapping[str, Any]) -> Dict[str, Any]:
+    """Validate a whole order dictionary in one pass.
+
+    Equivalent to running the field validators above over the order's
+    fields, with the same error messages and fields, but with the checks
+    for required fields inlined.
+
+    Args:
+        order: Order fields, as accepted by create_bulk()
+
+    Returns:
+        Validated order dictionary
+
+    Raises:
+        ValidationError: On the first invalid field
+    """
+    get = order.get
+    invoice = get("invoice")
+    recipient_name = get("recipient_name")
+    recipient_phone = get("recipient_phone")
+    recipient_address = get("recipient_address")
+    cod_amount = get("cod_amount")
+
+    if not (invoice and recipient_name and recipient_phone and recipient_address):
+        raise ValidationError("Missing required fields")
+
+    if cod_amount is None:
+        raise ValidationError(_COD_AMOUNT_REQUIRED, "cod_amount")
+
+    invoice = str(invoice)
+    if not _INVOICE_PATTERN.match(invoice):
+        raise ValidationError(
+            "Invoice must contain only alphanumeric characters, "
+            "hyphens, and underscores",
+            "invoice",
+        )
+
+    name = str(recipient_name).strip()
+    if len(name) > 100:
+        raise ValidationError(
+            "Recipient name cannot exceed 100 characters", "recipient_name"
+        )
+
+    phone = _NON_DIGITS.sub("", str(recipient_phone))
+    if len(phone) != 11:
+        raise ValidationError("Phone number must be exactly 11 digits", "phone")
+
+    address = str(recipient_address).strip()
+    if len(address) > 250:
+        raise ValidationError("Address cannot exceed 250 characters", "address")
+
+    delivery_type = get("delivery_type", 0)
+    validated: Dict[str, Any] = {
+        "invoice": invoice.strip(),
+        "recipient_name": name,
+        "recipient_phone": phone,
+        "recipient_address": address,
+        "cod_amount": validate_cod_amount(cod_amount),
+        "delivery_type": validate_delivery_type(delivery_type),
+    }
+
+    # Optional fields are rare; reuse the field validators
+    alternative_phone = get("alternative_phone")
+    if alternative_phone:
+        validated["alternative_phone"] = validate_phone(alternative_phone)
+
+    recipient_email = get("recipient_email")
+    if recipient_email:
+        validated["recipient_email"] = validate_email(recipient_email)
+
+    for field in _PASSTHROUGH_FIELDS:
+        value = get(field)
+        if value is not None:
+            validated[field] = value
+
+    return validated
@@ -0,0 +1,497 @@
+"""Adaptive delivery status polling for many orders at once."""
+
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from .cache import TERMINAL_STATUSES
+from .exceptions import (
+    ConfigurationError,
+    NotFoundError,
+    SteadfastException,
+    ValidationError,
+)
+from .models import OrderStatus, StatusChange
+from .modules.tracking import (
+    AsyncTrackingModule,
+    Identifier,
+    StatusResult,
+    TrackingModule,
+)
+from .validators import validate_identifier_type
+
+ChangeCallback = Callable[[StatusChange], None]
+ErrorCallback = Callable[[Identifier, SteadfastException], None]
+
+_WatchKey = Tuple[str, Identifier]
+
+# Poll errors that will not go away by polling again; the order is dropped
+PERMANENT_ERRORS = (NotFoundError, ValidationError)
+
+# Base polling intervals in seconds for statuses that can still change
+DEFAULT_INTERVALS: Mapping[str, float] = {
+    "in_review": 300.0,
+    "pending": 900.0,
+    "hold": 1800.0,
+    "unknown": 1800.0,
+}
+
+
+class PollingPolicy:
+    """Chooses how long to wait before polling an order again.
+
+    The wait starts at a per-status base interval and grows with the time
+    since the order's status last changed, so orders that sit in one state
+    for days are polled less often than ones that just moved. A small
+    random jitter keeps thousands of orders from being polled in lockstep.
+    """
+
+    def __init__(
+        self,
+        intervals: Optional[Mapping[str, float]] = None,
+        approval_pending_interval: float = 600.0,
+        default_interval: float = 900.0,
+        age_factor: float = 0.1,
+        max_interval: float = 6 * 3600.0,
+        error_interval: float = 300.0,
+        jitter: float = 0.1,
+        random_func: Callable[[float, float], float] = random.uniform,
+    ) -> None:
+        """Initialize polling policy.
+
+        Args:
+            intervals: Base intervals in seconds keyed by delivery status
+                (defaults to DEFAULT_INTERVALS)
+            approval_pending_interval: Base interval for
+                ``*_approval_pending`` statuses
+            default_interval: Base interval for any other status
+            age_factor: Seconds added per second since the last change
+            max_interval: Longest interval between polls
+            error_interval: Wait after a failed poll
+            jitter: Random spread as a fraction of the interval (0-1)
+            random_func: Uniform random source, for deterministic tests
+        """
+        if not 0 <= jitter < 1 or age_factor < 0 or max_interval <= 0:
+            raise ConfigurationError("Invalid polling policy configuration")
+
+        self.intervals = dict(DEFAULT_INTERVALS if intervals is None else intervals)
+        self.approval_pending_interval = approval_pending_interval
+        self.default_interval = default_interval
+        self.age_factor = age_factor
+        self.max_interval = max_interval
+        self.error_interval = error_interval
+        self.jitter = jitter
+        self._random = random_func
+
+    def base_interval(self, delivery_status: str) -> float:
+        """Return the base interval for a delivery status."""
+        if delivery_status in self.intervals:
+            return self.intervals[delivery_status]
+        if delivery_status.endswith("_approval_pending"):
+            return self.approval_pending_interval
+        return self.default_interval
+
+    def interval(self, delivery_status: str, age: float) -> float:
+        """Return the wait before the next poll.
+
+        Args:
+            delivery_status: Last status seen
+            age: Seconds since the status last changed
+
+        Returns:
+            Delay in seconds
+        """
+        interval = self.base_interval(delivery_status) + self.age_factor * age
+        return self._spread(min(self.max_interval, interval))
+
+    def retry_interval(self) -> float:
+        """Return the wait after a failed poll."""
+        return self._spread(self.error_interval)
+
+    def _spread(self, interval: float) -> float:
+        """Apply jitter to an interval."""
+        if not self.jitter:
+            return interval
+        return interval * self._random(1 - self.jitter, 1 + self.jitter)
+
+
+class _Watch:
+    """Polling state for one watched order."""
+
+    def __init__(
+        self, identifier: Identifier, identifier_type: str, status: Optional[str]
+    ) -> None:
+        self.identifier = identifier
+        self.identifier_type = identifier_type
+        self.status = status
+        self.changed_at = 0.0
+        self.entry = 0  # Sequence number of the live heap entry
+
+
+class _StatusWatcherBase:
+    """Scheduling shared by the sync and async watchers.
+
+    Due times live in a min-heap of ``(due, sequence, key)`` entries.
+    Rescheduling or unwatching leaves the old entry in place; it is skipped
+    when popped because its sequence number no longer matches the watch.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[PollingPolicy],
+        on_change: Optional[ChangeCallback],
+        on_error: Optional[ErrorCallback],
+        concurrency: int,
+        clock: Callable[[], float],
+    ) -> None:
+        if concurrency < 1:
+            raise ConfigurationError("concurrency must be at least 1")
+
+        self.policy = policy or PollingPolicy()
+        self.on_change = on_change
+        self.on_error = on_error
+        self.concurrency = concurrency
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, _WatchKey]] = []
+        self._watches: Dict[_WatchKey, _Watch] = {}
+        self._sequence = itertools.count(1)
+        self._stopped = False
+
+    def watch(
+        self,
+        identifier: Identifier,
+        identifier_type: str = "consignment_id",
+        delivery_status: Optional[str] = None,
+    ) -> None:
+        """Start watching an order.
+
+        Args:
+            identifier: Consignment ID, invoice or tracking code
+            identifier_type: "consignment_id", "invoice" or "tracking_code"
+            delivery_status: Status already known, if any; without one the
+                order is polled right away
+
+        Raises:
+            ValidationError: If identifier_type is invalid
+        """
+        validate_identifier_type(identifier_type)
+        now = self._clock()
+        watch = _Watch(identifier, identifier_type, delivery_status)
+        watch.changed_at = now
+        due = now
+        if delivery_status is not None:
+            due += self.policy.interval(delivery_status, 0.0)
+
+        with self._lock:
+            self._watches[(identifier_type, identifier)] = watch
+            self._schedule(watch, due)
+        self._wake()
+
+    def unwatch(
+        self, identifier: Identifier, identifier_type: str = "consignment_id"
+    ) -> None:
+        """Stop watching an order.
+
+        Args:
+            identifier: Consignment ID, invoice or tracking code
+            identifier_type: "consignment_id", "invoice" or "tracking_code"
+        """
+        with self._lock:
+            self._watches.pop((identifier_type, identifier), None)
+
+    def stop(self) -> None:
+        """Make a running events() or run() loop return.
+
+        If no loop is running, the next one returns immediately.
+        """
+        self._stopped = True
+        self._wake()
+
+    def next_due(self) -> Optional[float]:
+        """Return seconds until the next poll, or None if nothing is watched."""
+        with self._lock:
+            while self._heap:
+                due, entry, key = self._heap[0]
+                watch = self._watches.get(key)
+                if watch is not None and watch.entry == entry:
+                    return max(0.0, due - self._clock())
+                heapq.heappop(self._heap)
+            return None
+
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def _wake(self) -> None:
+        """Interrupt the loop's wait so it re-reads the schedule."""
+
+    def _schedule(self, watch: _Watch, due: float) -> None:
+        """Push a heap entry for a watch; the caller holds the lock."""
+        watch.entry = next(self._sequence)
+        heapq.heappush(
+            self._heap, (due, watch.entry, (watch.identifier_type, watch.identifier))
+        )
+
+    def _pop_due(self) -> Dict[str, List[Identifier]]:
+        """Remove every due watch from the heap, grouped by identifier type."""
+        now = self._clock()
+        due_watches: Dict[str, List[Identifier]] = {}
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, entry, key = heapq.heappop(self._heap)
+                watch = self._watches.get(key)
+                if watch is not None and watch.entry == entry:
+                    watch.entry = 0  # In flight; not in the heap
+                    due_watches.setdefault(key[0], []).append(key[1])
+        return due_watches
+
+    def _restore(self, due_watches: Dict[str, List[Identifier]]) -> None:
+        """Reschedule popped watches a failed poll round left unrecorded."""
+        retry_at = self._clock() + self.policy.retry_interval()
+        with self._lock:
+            for identifier_type, identifiers in due_watches.items():
+                for identifier in identifiers:
+                    watch = self._watches.get((identifier_type, identifier))
+                    if watch is not None and watch.entry == 0:
+                        self._schedule(watch, retry_at)
+
+    def _record(
+        self, identifier_type: str, identifier: Identifier, result: StatusResult
+    ) -> Optional[StatusChange]:
+        """Apply a poll result, reschedule the watch and notify callbacks."""
+        now = self._clock()
+        with self._lock:
+            watch = self._watches.get((identifier_type, identifier))
+            if watch is None or watch.entry != 0:
+                return None  # Unwatched or re-watched while in flight
+
+            if isinstance(result, OrderStatus):
+                change = self._apply_status(watch, result, now)
+            elif isinstance(result, PERMANENT_ERRORS):
+                del self._watches[(identifier_type, identifier)]
+                change = None
+            else:
+                self._schedule(watch, now + self.policy.retry_interval())
+                change = None
+
+        if change is not None and self.on_change is not None:
+            self.on_change(change)
+        if not isinstance(result, OrderStatus) and self.on_error is not None:
+            self.on_error(identifier, result)
+        return change
+
+    def _apply_status(
+        self, watch: _Watch, status: OrderStatus, now: float
+    ) -> Optional[StatusChange]:
+        """Update a watch with a fresh status; the caller holds the lock."""
+        previous = watch.status
+        final = status.delivery_status in TERMINAL_STATUSES
+        if status.delivery_status != previous:
+            watch.status = status.delivery_status
+            watch.changed_at = now
+
+        if final:
+            del self._watches[(watch.identifier_type, watch.identifier)]
+        else:
+            age = now - watch.changed_at
+            self._schedule(
+                watch, now + self.policy.interval(status.delivery_status, age)
+            )
+
+        if status.delivery_status == previous and not final:
+            return None
+        return StatusChange(
+            identifier=watch.identifier,
+            identifier_type=watch.identifier_type,
+            previous_status=previous,
+            status=status,
+            final=final,
+        )
+
+
+class StatusWatcher(_StatusWatcherBase):
+    """Polls the delivery status of many orders from a single loop.
+
+    Orders are kept in a priority queue ordered by when they are next due.
+    Each poll picks the next interval from the order's status and the time
+    since it last changed (see PollingPolicy). Orders that reach a terminal
+    status (delivered, partial_delivered, cancelled) are dropped, and so
+    are orders whose lookup fails with NotFoundError or ValidationError.
+    Due orders are looked up together with tracking.iter_statuses(), so
+    the client's rate limiter, retries and circuit breaker apply.
+
+    Example::
+
+        watcher = StatusWatcher(client.tracking, on_change=print)
+        for consignment_id in open_consignments:
+            watcher.watch(consignment_id)
+        watcher.run()  # returns once every order is final, or on stop()
+    """
+
+    def __init__(
+        self,
+        tracking: TrackingModule,
+        policy: Optional[PollingPolicy] = None,
+        on_change: Optional[ChangeCallback] = None,
+        on_error: Optional[ErrorCallback] = None,
+        concurrency: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize status watcher.
+
+        Args:
+            tracking: Tracking module used for lookups
+            policy: Polling policy (defaults to PollingPolicy())
+            on_change: Called with each StatusChange
+            on_error: Called with ``(identifier, error)`` when a poll fails;
+                the order is polled again after ``policy.error_interval``,
+                or dropped if the error is permanent (PERMANENT_ERRORS)
+            concurrency: Maximum lookups in flight during one poll round
+            clock: Monotonic time source in seconds
+        """
+        super().__init__(policy, on_change, on_error, concurrency, clock)
+        self.tracking = tracking
+        self._wakeup = threading.Event()
+
+    def _wake(self) -> None:
+        self._wakeup.set()
+
+    def poll_due(self) -> List[StatusChange]:
+        """Poll every order that is due now.
+
+        Returns:
+            Status changes seen in this round
+        """
+        changes = []
+        due_watches = self._pop_due()
+        try:
+            for identifier_type, identifiers in due_watches.items():
+                results = self.tracking.iter_statuses(
+                    identifiers, identifier_type, self.concurrency
+                )
+                for identifier, result in results:
+                    change = self._record(identifier_type, identifier, result)
+                    if change is not None:
+                        changes.append(change)
+        finally:
+            self._restore(due_watches)
+        return changes
+
+    def events(self) -> Iterator[StatusChange]:
+        """Poll orders as they fall due, yielding status changes.
+
+        Returns once no order is left to watch or stop() is called.
+
+        Yields:
+            StatusChange for every observed change
+        """
+        try:
+            while not self._stopped:
+                wait = self.next_due()
+                if wait is None:
+                    return
+                if wait > 0:
+                    self._wakeup.wait(wait)
+                    self._wakeup.clear()
+                    continue
+                yield from self.poll_due()
+        finally:
+            self._stopped = False  # The stop request is used up
+
+    def run(self) -> None:
+        """Poll until every order is final or stop() is called.
+
+        Changes are delivered through the ``on_change`` callback.
+        """
+        for _ in self.events():
+            pass
+
+
+class AsyncStatusWatcher(_StatusWatcherBase):
+    """Polls the delivery status of many orders from one event loop.
+
+    See StatusWatcher; events() is an async iterator and run() a coroutine.
+    """
+
+    def __init__(
+        self,
+        tracking: AsyncTrackingModule,
+        policy: Optional[PollingPolicy] = None,
+        on_change: Optional[ChangeCallback] = None,
+        on_error: Optional[ErrorCallback] = None,
+        concurrency: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize async status watcher.
+
+        See StatusWatcher for argument details.
+        """
+        super().__init__(policy, on_change, on_error, concurrency, clock)
+        self.tracking = tracking
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def poll_due(self) -> List[StatusChange]:
+        """Poll every order that is due now.
+
+        Returns:
+            Status changes seen in this round
+        """
+        changes = []
+        due_watches = self._pop_due()
+        try:
+            for identifier_type, identifiers in due_watches.items():
+                results = self.tracking.iter_statuses(
+                    identifiers, identifier_type, self.concurrency
+                )
+                async for identifier, result in results:
+                    change = self._record(identifier_type, identifier, result)
+                    if change is not None:
+                        changes.append(change)
+        finally:
+            self._restore(due_watches)
+        return changes
+
+    async def events(self) -> AsyncIterator[StatusChange]:
+        """Poll orders as they fall due, yielding status changes.
+
+        Returns once no order is left to watch or stop() is called.
+        """
+        self._wakeup = asyncio.Event()
+        try:
+            while not self._stopped:
+                wait = self.next_due()
+                if wait is None:
+                    return
+                if wait > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wakeup.clear()
+                    continue
+                for change in await self.poll_due():
+                    yield change
+        finally:
+            self._stopped = False  # The stop request is used up
+
+    async def run(self) -> None:
+        """Poll until every order is final or stop() is called."""
+        async for _ in self.events():
+            pass
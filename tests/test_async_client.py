@@ -0,0 +1,726 @@
+"""Tests for the asyncio client and HTTP transport."""
+
+import asyncio
+import gzip
+import json
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from steadfast.async_client import AsyncSteadfastClient  # noqa: E402
+from steadfast.async_http_client import AsyncHTTPClient  # noqa: E402
+from steadfast.batching import AsyncOrderBatcher  # noqa: E402
+from steadfast.cache import StatusCache  # noqa: E402
+from steadfast.coalesce import RequestCoalescer  # noqa: E402
+from steadfast.compression import RequestCompressor  # noqa: E402
+from steadfast.models import (  # noqa: E402
+    Order,
+    OrderStatus,
+    Balance,
+    BulkOrderResponse,
+    PoliceStationList,
+)
+from steadfast.modules.order import AsyncOrderModule, idempotency_key  # noqa: E402
+from steadfast.retry import RetryPolicy  # noqa: E402
+from steadfast.exceptions import (  # noqa: E402
+    APIError,
+    DuplicateOrderError,
+    NetworkError,
+    NotFoundError,
+    ValidationError,
+)
+
+
+def make_transport(
+    handler: Callable[[Any], Any], calls: List[Any]
+) -> "httpx.MockTransport":
+    """Create a mock transport that records requests."""
+
+    def record(request: Any) -> Any:
+        calls.append(request)
+        return handler(request)
+
+    return httpx.MockTransport(record)
+
+
+def json_response(status_code: int, body: Dict[str, Any]) -> Any:
+    """Build an httpx JSON response."""
+    return httpx.Response(status_code, json=body)
+
+
+class TestAsyncHTTPClient:
+    """Test AsyncHTTPClient class."""
+
+    def test_get_success(self) -> None:
+        """Test successful GET request."""
+        calls: List[Any] = []
+        transport = make_transport(lambda r: json_response(200, {"ok": 1}), calls)
+
+        async def run() -> Dict[str, Any]:
+            async with AsyncHTTPClient(
+                "https://api.example.com/", transport=transport
+            ) as client:
+                return await client.get("/test", params={"page": 2})
+
+        assert asyncio.run(run()) == {"ok": 1}
+        assert str(calls[0].url) == "https://api.example.com/test?page=2"
+        assert calls[0].method == "GET"
+
+    def test_post_sends_json(self) -> None:
+        """Test POST sends JSON body with content type."""
+        calls: List[Any] = []
+        transport = make_transport(lambda r: json_response(200, {"id": 1}), calls)
+
+        async def run() -> Dict[str, Any]:
+            async with AsyncHTTPClient(
+                "https://api.example.com", transport=transport
+            ) as client:
+                return await client.post("/create", data={"name": "test"})
+
+        assert asyncio.run(run()) == {"id": 1}
+        assert json.loads(calls[0].content) == {"name": "test"}
+        assert calls[0].headers["Content-Type"] == "application/json"
+
+    @pytest.mark.parametrize(
+        "status_code,exc_type",
+        [(404, NotFoundError), (400, APIError), (500, APIError)],
+    )
+    def test_error_mapping(self, status_code: int, exc_type: type) -> None:
+        """Test HTTP errors map to the same exceptions as the sync client."""
+        transport = make_transport(
+            lambda r: json_response(status_code, {"message": "boom"}), []
+        )
+
+        async def run() -> None:
+            async with AsyncHTTPClient(
+                "https://api.example.com", transport=transport
+            ) as client:
+                await client.get("/fail")
+
+        with pytest.raises(exc_type) as exc_info:
+            asyncio.run(run())
+        assert "boom" in str(exc_info.value)
+
+    def test_retries_on_connect_error(self) -> None:
+        """Test transient transport errors are retried."""
+        calls: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            if len(calls) < 3:
+                raise httpx.ConnectError("refused", request=request)
+            return json_response(200, {"ok": True})
+
+        transport = make_transport(handler, calls)
+
+        async def run() -> Dict[str, Any]:
+            async with AsyncHTTPClient(
+                "https://api.example.com",
+                transport=transport,
+                max_retries=2,
+                retry_backoff=0,
+            ) as client:
+                return await client.get("/test")
+
+        assert asyncio.run(run()) == {"ok": True}
+        assert len(calls) == 3
+
+    def test_retries_exhausted(self) -> None:
+        """Test NetworkError once retries are exhausted."""
+
+        def handler(request: Any) -> Any:
+            raise httpx.ReadTimeout("slow", request=request)
+
+        transport = make_transport(handler, [])
+
+        async def run() -> None:
+            async with AsyncHTTPClient(
+                "https://api.example.com",
+                transport=transport,
+                max_retries=1,
+                retry_backoff=0,
+            ) as client:
+                await client.get("/test")
+
+        with pytest.raises(NetworkError):
+            asyncio.run(run())
+
+    def test_retries_throttled_response(self) -> None:
+        """Test 429 responses are retried after Retry-After."""
+        calls: List[Any] = []
+        sleeps: List[float] = []
+
+        def handler(request: Any) -> Any:
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "1"}, json={})
+            return json_response(200, {"ok": True})
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        async def run() -> Dict[str, Any]:
+            async with AsyncHTTPClient(
+                "https://api.example.com", transport=make_transport(handler, calls)
+            ) as client:
+                client._sleep_before_retry = fake_sleep  # type: ignore
+                return await client.get("/status_by_cid/1")
+
+        assert asyncio.run(run()) == {"ok": True}
+        assert sleeps == [1.0]
+
+    def test_cancellation_propagates(self) -> None:
+        """Test cancelling the awaiting task aborts the request."""
+
+        async def run() -> None:
+            client = AsyncHTTPClient(
+                "https://api.example.com",
+                transport=make_transport(lambda r: json_response(200, {}), []),
+            )
+
+            async def slow_request(*args: Any, **kwargs: Any) -> Any:
+                await asyncio.sleep(10)
+
+            client.session.request = slow_request  # type: ignore
+            task = asyncio.ensure_future(client.get("/slow"))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await client.aclose()
+
+        asyncio.run(run())
+
+
+class TestAsyncSteadfastClient:
+    """Test AsyncSteadfastClient and its modules."""
+
+    def make_client(self, routes: Dict[str, Dict[str, Any]]) -> AsyncSteadfastClient:
+        """Create a client answering from a path -> body mapping."""
+        transport = make_transport(lambda r: json_response(200, routes[r.url.path]), [])
+        return AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            base_url="https://api.example.com",
+            transport=transport,
+        )
+
+    def test_module_properties(self) -> None:
+        """Test modules are lazily created and share one HTTP client."""
+        client = self.make_client({})
+
+        assert isinstance(client.orders, AsyncOrderModule)
+        assert client.orders is client.orders
+        assert client.tracking.http_client is client.balance.http_client
+        assert client.returns.http_client is client.payments.http_client
+        assert client.locations.http_client is client._http_client
+        asyncio.run(client.aclose())
+
+    def test_create_order(self, sample_order_response: Dict[str, Any]) -> None:
+        """Test async order creation reuses validation and models."""
+        client = self.make_client({"/create_order": sample_order_response})
+
+        async def run() -> Order:
+            async with client:
+                return await client.orders.create(
+                    invoice="ORD-2024-001",
+                    recipient_name="John Smith",
+                    recipient_phone="01234567890",
+                    recipient_address="House 123, Dhaka",
+                    cod_amount=1060,
+                )
+
+        order = asyncio.run(run())
+        assert isinstance(order, Order)
+        assert order.consignment_id == 123
+
+    def test_create_order_validation(self) -> None:
+        """Test validation errors are raised before any request."""
+        client = self.make_client({})
+
+        async def run() -> None:
+            async with client:
+                await client.orders.create(
+                    invoice="ORD 1",
+                    recipient_name="John",
+                    recipient_phone="01234567890",
+                    recipient_address="Dhaka",
+                    cod_amount=0,
+                )
+
+        with pytest.raises(ValidationError):
+            asyncio.run(run())
+
+    def test_create_bulk(self) -> None:
+        """Test async bulk order creation."""
+        result = {
+            "invoice": "INV-1",
+            "recipient_name": "John",
+            "recipient_address": "Dhaka",
+            "recipient_phone": "01234567890",
+            "cod_amount": 100,
+            "consignment_id": 1,
+            "status": "success",
+        }
+        client = self.make_client({"/create_bulk_order": {"results": [result]}})
+
+        async def run() -> BulkOrderResponse:
+            async with client:
+                return await client.orders.create_bulk(
+                    [
+                        {
+                            "invoice": "INV-1",
+                            "recipient_name": "John",
+                            "recipient_phone": "01234567890",
+                            "recipient_address": "Dhaka",
+                            "cod_amount": 100,
+                        }
+                    ]
+                )
+
+        response = asyncio.run(run())
+        assert response.results[0].consignment_id == 1
+
+    def test_tracking_balance_and_locations(
+        self,
+        sample_tracking_data: Dict[str, Any],
+        sample_balance_data: Dict[str, Any],
+        sample_police_station_data: Dict[str, Any],
+    ) -> None:
+        """Test read-only modules over the async transport."""
+        client = self.make_client(
+            {
+                "/status_by_cid/123": sample_tracking_data,
+                "/status_by_trackingcode/ABC": sample_tracking_data,
+                "/get_balance": sample_balance_data,
+                "/location/police-stations": sample_police_station_data,
+            }
+        )
+
+        async def run() -> List[Any]:
+            async with client:
+                return list(
+                    await asyncio.gather(
+                        client.tracking.get_status_by_consignment_id(123),
+                        client.tracking.get_status_by_tracking_code(" ABC "),
+                        client.balance.get_current_balance(),
+                        client.locations.get_police_stations(),
+                    )
+                )
+
+        status, by_code, balance, stations = asyncio.run(run())
+        assert isinstance(status, OrderStatus)
+        assert by_code.delivery_status == "in_transit"
+        assert isinstance(balance, Balance)
+        assert balance.current_balance == 5000.50
+        assert isinstance(stations, PoliceStationList)
+        assert len(stations.data) == 2
+
+    def test_payments_and_returns(
+        self,
+        sample_payment_data: Dict[str, Any],
+        sample_return_request_data: Dict[str, Any],
+    ) -> None:
+        """Test payment and return request modules."""
+        client = self.make_client(
+            {
+                "/payment/1": sample_payment_data,
+                "/payment/list": {"data": [sample_payment_data]},
+                "/return-request/store": sample_return_request_data,
+                "/return-request/list": {"data": [sample_return_request_data]},
+            }
+        )
+
+        async def run() -> List[Any]:
+            async with client:
+                return [
+                    await client.payments.get(1),
+                    await client.payments.list(),
+                    await client.returns.create(123, reason="Damaged"),
+                    await client.returns.list(),
+                ]
+
+        details, payments, created, returns = asyncio.run(run())
+        assert len(details.consignments) == 2
+        assert payments.data[0].amount == 5000.50
+        assert created.reason == "Damaged"
+        assert returns.data[0].consignment_id == 123
+
+    def test_rate_limiter_awaited(self) -> None:
+        """Test the async transport awaits the shared rate limiter."""
+        from unittest.mock import AsyncMock, Mock
+
+        from steadfast.rate_limit import RateLimiter
+
+        limiter = Mock(spec=RateLimiter)
+        limiter.acquire_async = AsyncMock(return_value=0.0)
+        transport = make_transport(lambda r: json_response(200, {}), [])
+
+        async def run() -> None:
+            async with AsyncHTTPClient(
+                "https://api.example.com", transport=transport, rate_limiter=limiter
+            ) as client:
+                await client.get("/get_balance")
+
+        asyncio.run(run())
+        limiter.acquire_async.assert_awaited_once_with("/get_balance")
+
+    def test_create_bulk_many(self) -> None:
+        """Test async chunked bulk creation preserves input order."""
+        calls: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            orders = json.loads(request.content)["orders"]
+            if orders[0]["invoice"] == "INV-2":
+                return json_response(502, {"message": "Bad gateway"})
+            return json_response(
+                200, {"results": [dict(o, status="success") for o in orders]}
+            )
+
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+            max_retries=0,
+        )
+        orders = [
+            {
+                "invoice": f"INV-{i}",
+                "recipient_name": "John",
+                "recipient_phone": "01234567890",
+                "recipient_address": "Dhaka",
+                "cod_amount": i,
+            }
+            for i in range(5)
+        ]
+
+        async def run() -> BulkOrderResponse:
+            async with client:
+                return await client.orders.create_bulk_many(
+                    orders, chunk_size=2, concurrency=2
+                )
+
+        response = asyncio.run(run())
+        assert [r.invoice for r in response.results] == [o["invoice"] for o in orders]
+        assert [r.status for r in response.results] == [
+            "success",
+            "success",
+            "error",
+            "error",
+            "success",
+        ]
+        assert [c.size for c in response.chunks] == [2, 2, 1]
+        assert len(calls) == 3
+
+    def test_create_bulk_stream(self) -> None:
+        """Test async streaming bulk creation yields results in input order."""
+        calls: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            orders = json.loads(request.content)["orders"]
+            return json_response(
+                200, {"results": [dict(o, status="success") for o in orders]}
+            )
+
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+        )
+        orders = (
+            {
+                "invoice": f"INV-{i}",
+                "recipient_name": "John",
+                "recipient_phone": "01234567890",
+                "recipient_address": "Dhaka",
+                "cod_amount": i,
+            }
+            for i in range(5)
+        )
+
+        async def run() -> List[str]:
+            async with client:
+                stream = client.orders.create_bulk_stream(
+                    orders, chunk_size=2, concurrency=2
+                )
+                return [result.invoice async for result in stream]
+
+        assert asyncio.run(run()) == [f"INV-{i}" for i in range(5)]
+        assert len(calls) == 3
+
+    def test_create_bulk_skip_invalid(self) -> None:
+        """Test async bulk creation can skip invalid orders."""
+        calls: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            orders = json.loads(request.content)["orders"]
+            return json_response(
+                200, {"results": [dict(o, status="success") for o in orders]}
+            )
+
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+        )
+        orders = [
+            {
+                "invoice": f"INV-{i}",
+                "recipient_name": "John",
+                "recipient_phone": "01234567890" if i != 1 else "123",
+                "recipient_address": "Dhaka",
+                "cod_amount": i,
+            }
+            for i in range(3)
+        ]
+
+        async def run() -> BulkOrderResponse:
+            async with client:
+                return await client.orders.create_bulk(orders, skip_invalid=True)
+
+        response = asyncio.run(run())
+        assert [r.invoice for r in response.results] == ["INV-0", "INV-2"]
+        assert [r.index for r in response.rejected] == [1]
+        assert len(calls) == 1
+
+    def test_get_statuses(self) -> None:
+        """Test async bulk status lookup maps identifiers to outcomes."""
+        calls: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            if request.url.path.endswith("/404"):
+                return json_response(404, {"message": "Consignment not found"})
+            return json_response(200, {"status": 200, "delivery_status": "pending"})
+
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+        )
+
+        async def run() -> Dict[Any, Any]:
+            async with client:
+                return await client.tracking.get_statuses([3, 404, 1], concurrency=2)
+
+        results = asyncio.run(run())
+        assert list(results) == [3, 404, 1]
+        assert results[3].delivery_status == "pending"
+        assert isinstance(results[404], NotFoundError)
+        assert len(calls) == 3
+
+    def test_status_cache(self) -> None:
+        """Test the async tracking module uses the client's status cache."""
+        calls: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            return json_response(200, {"status": 200, "delivery_status": "delivered"})
+
+        cache = StatusCache()
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+            status_cache=cache,
+        )
+
+        async def run() -> None:
+            async with client:
+                await client.tracking.get_status_by_consignment_id(1)
+                await client.tracking.get_status_by_consignment_id(1)
+
+        asyncio.run(run())
+        assert len(calls) == 1
+        assert cache.hits == 1
+
+    def test_coalescer(self) -> None:
+        """Test concurrent identical GETs on the async client are coalesced."""
+        calls: List[Any] = []
+        coalescer = RequestCoalescer()
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(
+                lambda r: json_response(200, {"status": 200, "current_balance": 7}),
+                calls,
+            ),
+            coalescer=coalescer,
+        )
+
+        async def run() -> List[Any]:
+            async with client:
+                return await asyncio.gather(
+                    *(client.balance.get_current_balance() for _ in range(3))
+                )
+
+        balances = asyncio.run(run())
+        assert [balance.current_balance for balance in balances] == [7, 7, 7]
+        assert len(calls) == 1
+        assert coalescer.coalesced == 2
+
+    def test_create_order_confirmed_before_resend(self) -> None:
+        """Test a timed-out async create found by invoice is reported, not resent."""
+        calls: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            if request.method == "POST":
+                raise httpx.ReadTimeout("slow", request=request)
+            return json_response(200, {"status": 200, "delivery_status": "in_review"})
+
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0),
+        )
+
+        async def run() -> Order:
+            async with client:
+                return await client.orders.create(
+                    invoice="ORD-1",
+                    recipient_name="John Smith",
+                    recipient_phone="01234567890",
+                    recipient_address="House 123, Dhaka",
+                    cod_amount=100,
+                )
+
+        with pytest.raises(DuplicateOrderError) as exc_info:
+            asyncio.run(run())
+
+        assert exc_info.value.invoice == "ORD-1"
+        assert exc_info.value.consignment_id is None
+        assert [(c.method, c.url.path) for c in calls] == [
+            ("POST", "/v1/create_order"),
+            ("GET", "/v1/status_by_invoice/ORD-1"),
+        ]
+        assert calls[0].headers["Idempotency-Key"] == idempotency_key(["ORD-1"])
+
+    def test_order_batcher(self) -> None:
+        """Test concurrent async creates are sent as one bulk request."""
+        calls: List[Any] = []
+
+        def handler(request: Any) -> Any:
+            orders = json.loads(request.content)["orders"]
+            return json_response(
+                200,
+                {
+                    "results": [
+                        dict(order, consignment_id=i + 1, status="success")
+                        for i, order in enumerate(orders)
+                    ]
+                },
+            )
+
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+        )
+
+        async def run() -> List[Any]:
+            async with client:
+                async with AsyncOrderBatcher(client.orders, max_delay=0.01) as batcher:
+                    return await asyncio.gather(
+                        *(
+                            batcher.create(
+                                invoice=f"ORD-{i}",
+                                recipient_name="John Smith",
+                                recipient_phone="01234567890",
+                                recipient_address="House 123, Dhaka",
+                                cod_amount=100,
+                            )
+                            for i in range(3)
+                        )
+                    )
+
+        orders = asyncio.run(run())
+        assert [(order.invoice, order.consignment_id) for order in orders] == [
+            ("ORD-0", 1),
+            ("ORD-1", 2),
+            ("ORD-2", 3),
+        ]
+        assert len(calls) == 1
+
+    def test_request_compression(self) -> None:
+        """Test large async request bodies are sent gzipped."""
+        calls: List[Any] = []
+        compressor = RequestCompressor(threshold=256)
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(lambda r: json_response(200, {}), calls),
+            compressor=compressor,
+        )
+        payload = {"orders": [{"invoice": f"INV-{i}"} for i in range(50)]}
+
+        async def run() -> None:
+            async with client:
+                await client._http_client.post("/create_bulk_order", data=payload)
+
+        asyncio.run(run())
+        assert calls[0].headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(calls[0].content)) == payload
+        assert compressor.compressed == 1
+
+    def test_iter_payments(self) -> None:
+        """Test iter_payments walks every page and prefetches the next."""
+        calls: List[Any] = []
+        pages = {
+            "1": {"data": [{"id": 1}, {"id": 2}], "current_page": 1, "last_page": 2},
+            "2": {"data": [{"id": 3}], "current_page": 2, "last_page": 2},
+        }
+
+        def handler(request: Any) -> Any:
+            return json_response(200, pages[request.url.params["page"]])
+
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+        )
+
+        async def run() -> List[int]:
+            async with client:
+                payments = client.payments.iter_payments()
+                ids = [(await payments.__anext__()).id]
+                # Page 2 was requested before page 1 was consumed
+                await asyncio.sleep(0)
+                assert len(calls) == 2
+                ids += [payment.id async for payment in payments]
+                assert payments.page == 2
+                return ids
+
+        assert asyncio.run(run()) == [1, 2, 3]
+        assert [r.url.params["page"] for r in calls] == ["1", "2"]
+
+    def test_payments_get_many(self) -> None:
+        """Test get_many fetches payment details and retries failures."""
+        calls: List[Any] = []
+        failures = {"2": 1}
+
+        def handler(request: Any) -> Any:
+            payment_id = request.url.path.rsplit("/", 1)[1]
+            if failures.get(payment_id):
+                failures[payment_id] -= 1
+                return json_response(500, {"message": "Server error"})
+            return json_response(200, {"id": int(payment_id), "amount": 10})
+
+        client = AsyncSteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            transport=make_transport(handler, calls),
+            retry_policy=RetryPolicy(max_retries=0),
+        )
+
+        async def run() -> Dict[int, Any]:
+            async with client:
+                results = client.payments.get_many(
+                    [1, 2, 3],
+                    concurrency=2,
+                    retry_policy=RetryPolicy(base_delay=0, max_delay=0),
+                )
+                return {r.payment_id: r async for r in results}
+
+        results = asyncio.run(run())
+        assert [results[i].details.id for i in (1, 2, 3)] == [1, 2, 3]
+        assert results[2].attempts == 2
+        assert len(calls) == 4
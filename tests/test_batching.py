@@ -0,0 +1,201 @@
+"""Tests for the order batcher."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from steadfast.batching import OrderBatcher
+from steadfast.exceptions import (
+    APIError,
+    ConfigurationError,
+    DuplicateOrderError,
+    NetworkError,
+    ValidationError,
+)
+from steadfast.ledger import OrderLedger
+from steadfast.models import Order
+from steadfast.modules.order import OrderModule
+
+
+def make_order(i: int) -> Dict[str, Any]:
+    """Build a valid order dictionary."""
+    return {
+        "invoice": f"INV-{i}",
+        "recipient_name": f"Customer {i}",
+        "recipient_phone": "01711111111",
+        "recipient_address": f"Address {i}, Dhaka",
+        "cod_amount": i,
+    }
+
+
+def bulk_response(endpoint: str, data: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+    """Answer a bulk request with one success result per order, in reverse."""
+    return {
+        "results": [
+            dict(
+                order,
+                consignment_id=1000 + int(order["cod_amount"]),
+                tracking_code=f"TRK-{int(order['cod_amount'])}",
+                status="success",
+            )
+            for order in reversed(data["orders"])
+        ]
+    }
+
+
+class TestOrderBatcher:
+    """Test OrderBatcher."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.http_client = Mock()
+        self.http_client.post.side_effect = bulk_response
+        self.orders = OrderModule(self.http_client)
+
+    def sent_batches(self) -> List[List[str]]:
+        """Return the invoices of every bulk request sent."""
+        return [
+            [order["invoice"] for order in call.kwargs["data"]["orders"]]
+            for call in self.http_client.post.call_args_list
+        ]
+
+    def test_concurrent_creates_share_one_request(self) -> None:
+        """Test concurrent callers are sent together and get their own order."""
+        with OrderBatcher(self.orders, max_batch_size=4, max_delay=5) as batcher:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                orders = list(
+                    executor.map(lambda i: batcher.create(**make_order(i)), range(4))
+                )
+
+        batches = self.sent_batches()
+        assert len(batches) == 1
+        assert sorted(batches[0]) == [f"INV-{i}" for i in range(4)]
+        for i, order in enumerate(orders):
+            assert isinstance(order, Order)
+            assert order.invoice == f"INV-{i}"
+            assert order.consignment_id == 1000 + i
+            assert order.tracking_code == f"TRK-{i}"
+
+    def test_max_delay_sends_partial_batch(self) -> None:
+        """Test a lone order is sent once max_delay passes."""
+        with OrderBatcher(self.orders, max_batch_size=10, max_delay=0.01) as batcher:
+            order = batcher.create(**make_order(1))
+
+        assert order.consignment_id == 1001
+        assert self.sent_batches() == [["INV-1"]]
+
+    def test_full_batches_are_split(self) -> None:
+        """Test orders beyond max_batch_size go into the next request."""
+        batcher = OrderBatcher(self.orders, max_batch_size=2, max_delay=5)
+        futures = [batcher.submit(make_order(i)) for i in range(5)]
+        batcher.close()
+
+        assert [future.result().invoice for future in futures] == [
+            f"INV-{i}" for i in range(5)
+        ]
+        assert sorted(len(batch) for batch in self.sent_batches()) == [1, 2, 2]
+
+    def test_flush_sends_without_waiting(self) -> None:
+        """Test flush() sends the collected orders immediately."""
+        batcher = OrderBatcher(self.orders, max_batch_size=10, max_delay=60)
+        future = batcher.submit(make_order(1))
+        batcher.flush()
+
+        assert future.result(timeout=5).invoice == "INV-1"
+        batcher.close()
+
+    def test_invalid_order_raises_at_submit(self) -> None:
+        """Test validation errors reach the caller without a request."""
+        with OrderBatcher(self.orders) as batcher:
+            with pytest.raises(ValidationError):
+                batcher.submit(dict(make_order(1), recipient_phone="123"))
+
+        self.http_client.post.assert_not_called()
+
+    def test_per_order_error(self) -> None:
+        """Test a rejected order fails only its own caller."""
+
+        def partial(endpoint: str, data: Dict[str, Any], **kwargs: Any) -> Any:
+            response = bulk_response(endpoint, data)
+            for result in response["results"]:
+                if result["invoice"] == "INV-1":
+                    result.update(
+                        status="error", consignment_id=None, error="Bad address"
+                    )
+            return response
+
+        self.http_client.post.side_effect = partial
+        batcher = OrderBatcher(self.orders, max_delay=5)
+        ok = batcher.submit(make_order(0))
+        bad = batcher.submit(make_order(1))
+        batcher.close()
+
+        assert ok.result().consignment_id == 1000
+        with pytest.raises(APIError, match="Bad address"):
+            bad.result()
+
+    def test_batch_failure_fails_every_caller(self) -> None:
+        """Test an error for the whole request reaches every caller."""
+        self.http_client.post.side_effect = NetworkError("Connection reset")
+        batcher = OrderBatcher(self.orders, max_delay=5)
+        futures = [batcher.submit(make_order(i)) for i in range(3)]
+        batcher.close()
+
+        for future in futures:
+            with pytest.raises(NetworkError):
+                future.result()
+
+    def test_duplicate_from_ledger(self) -> None:
+        """Test an invoice already in the ledger raises DuplicateOrderError."""
+        ledger = OrderLedger()
+        self.orders = OrderModule(self.http_client, ledger)
+        with OrderBatcher(self.orders, max_delay=0) as batcher:
+            batcher.create(**make_order(1))
+            with pytest.raises(DuplicateOrderError) as exc_info:
+                batcher.create(**make_order(1))
+
+        assert exc_info.value.consignment_id == 1001
+        assert self.http_client.post.call_count == 1
+
+    def test_cancelled_order_is_not_sent(self) -> None:
+        """Test an order cancelled before sending is left out."""
+        batcher = OrderBatcher(self.orders, max_delay=60)
+        kept = batcher.submit(make_order(0))
+        cancelled = batcher.submit(make_order(1))
+        assert cancelled.cancel()
+        batcher.close()
+
+        assert kept.result().invoice == "INV-0"
+        assert self.sent_batches() == [["INV-0"]]
+
+    def test_submit_after_close(self) -> None:
+        """Test submitting to a closed batcher is rejected."""
+        batcher = OrderBatcher(self.orders)
+        batcher.close()
+
+        with pytest.raises(ConfigurationError):
+            batcher.submit(make_order(1))
+
+    def test_waits_for_max_delay(self) -> None:
+        """Test the dispatcher waits for max_delay before sending."""
+        batcher = OrderBatcher(self.orders, max_batch_size=10, max_delay=0.2)
+        future = batcher.submit(make_order(1))
+        time.sleep(0.05)
+
+        assert not future.done()
+        assert future.result(timeout=5).invoice == "INV-1"
+        batcher.close()
+
+    def test_invalid_arguments(self) -> None:
+        """Test out-of-range settings are rejected."""
+        with pytest.raises(ValidationError):
+            OrderBatcher(self.orders, max_batch_size=0)
+        with pytest.raises(ValidationError):
+            OrderBatcher(self.orders, max_batch_size=501)
+        with pytest.raises(ValidationError):
+            OrderBatcher(self.orders, max_delay=-1)
+        with pytest.raises(ValidationError):
+            OrderBatcher(self.orders, max_in_flight=0)
@@ -0,0 +1,128 @@
+"""Tests for the tracking status cache."""
+
+from typing import Dict
+
+import pytest
+
+from steadfast.cache import StatusCache
+from steadfast.exceptions import ConfigurationError
+from steadfast.models import OrderStatus
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def status(delivery_status: str) -> OrderStatus:
+    """Build an OrderStatus."""
+    return OrderStatus(status=200, delivery_status=delivery_status)
+
+
+class TestStatusCache:
+    """Test StatusCache."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.cache = StatusCache(
+            max_entries=3,
+            approval_pending_ttl=600,
+            active_ttl=60,
+            default_ttl=120,
+            clock=self.clock,
+        )
+
+    @pytest.mark.parametrize(
+        "delivery_status,ttl",
+        [
+            ("delivered", None),
+            ("partial_delivered", None),
+            ("cancelled", None),
+            ("delivered_approval_pending", 600),
+            ("cancelled_approval_pending", 600),
+            ("pending", 60),
+            ("in_review", 60),
+            ("hold", 120),
+            ("unknown", 120),
+        ],
+    )
+    def test_ttl_by_status(self, delivery_status: str, ttl: object) -> None:
+        """Test TTLs depend on the delivery status."""
+        assert self.cache.ttl_for(delivery_status) == ttl
+
+    def test_expiry(self) -> None:
+        """Test entries expire after their status's TTL."""
+        self.cache.set("/status_by_cid/1", status("pending"))
+        self.cache.set("/status_by_cid/2", status("delivered"))
+
+        self.clock.now = 59
+        assert self.cache.get("/status_by_cid/1") == status("pending")
+
+        self.clock.now = 10**9
+        assert self.cache.get("/status_by_cid/1") is None
+        assert self.cache.get("/status_by_cid/2") == status("delivered")
+        assert len(self.cache) == 1
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted at capacity."""
+        for key in ("a", "b", "c"):
+            self.cache.set(key, status("delivered"))
+        self.cache.get("a")
+
+        self.cache.set("d", status("delivered"))
+
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") is not None
+        assert self.cache.evictions == 1
+        assert len(self.cache) == 3
+
+    def test_hit_miss_counters(self) -> None:
+        """Test hits, misses and hit rate are tracked."""
+        self.cache.set("a", status("delivered"))
+        self.cache.get("a")
+        self.cache.get("a")
+        self.cache.get("b")
+
+        assert (self.cache.hits, self.cache.misses) == (2, 1)
+        assert self.cache.hit_rate == pytest.approx(2 / 3)
+
+        self.cache.clear()
+        assert (len(self.cache), self.cache.hits, self.cache.hit_rate) == (0, 0, 0.0)
+
+    def test_returns_copies(self) -> None:
+        """Test mutating a returned status does not change the cache."""
+        self.cache.set("a", status("delivered"))
+        cached = self.cache.get("a")
+        assert cached is not None
+        cached.delivery_status = "changed"
+
+        assert self.cache.get("a") == status("delivered")
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        """Test a zero TTL skips caching for that status."""
+        cache = StatusCache(active_ttl=0)
+        cache.set("a", status("pending"))
+
+        assert len(cache) == 0
+
+    def test_invalidate(self) -> None:
+        """Test a single entry can be dropped."""
+        self.cache.set("a", status("delivered"))
+        self.cache.invalidate("a")
+        self.cache.invalidate("missing")
+
+        assert self.cache.get("a") is None
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_entries": 0}, {"active_ttl": -1}, {"default_ttl": -5}]
+    )
+    def test_invalid_configuration(self, kwargs: Dict[str, int]) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(ConfigurationError):
+            StatusCache(**kwargs)
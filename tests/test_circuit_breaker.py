@@ -0,0 +1,205 @@
+"""Tests for the per-endpoint circuit breaker."""
+
+import json
+import asyncio
+from typing import List, Tuple
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from steadfast.circuit_breaker import CircuitBreaker, CircuitState, endpoint_template
+from steadfast.exceptions import (
+    APIError,
+    CircuitOpenError,
+    ConfigurationError,
+    NetworkError,
+    NotFoundError,
+    ValidationError,
+)
+from steadfast.http_client import HTTPClient
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestEndpointTemplate:
+    """Test endpoint_template()."""
+
+    @pytest.mark.parametrize(
+        "endpoint,expected",
+        [
+            ("/status_by_cid/1424107", "/status_by_cid/{id}"),
+            ("status_by_invoice/ORD-2024-001", "/status_by_invoice/{invoice}"),
+            (
+                "/status_by_trackingcode/15BAEB8A",
+                "/status_by_trackingcode/{tracking_code}",
+            ),
+            ("/payment/42", "/payment/{id}"),
+            ("/payment/list", "/payment/list"),
+            ("/return-request/7", "/return-request/{id}"),
+            ("/create_bulk_order", "/create_bulk_order"),
+        ],
+    )
+    def test_templates(self, endpoint: str, expected: str) -> None:
+        """Test identifiers are collapsed into placeholders."""
+        assert endpoint_template(endpoint) == expected
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state machine."""
+
+    def setup_method(self) -> None:
+        """Set up breaker with a controllable clock."""
+        self.clock = FakeClock()
+        self.changes: List[Tuple[str, str, str]] = []
+        self.breaker = CircuitBreaker(
+            failure_rate_threshold=0.5,
+            minimum_calls=4,
+            window_size=4,
+            open_timeout=10,
+            on_state_change=lambda *change: self.changes.append(change),
+            clock=self.clock,
+        )
+
+    def fail(self, endpoint: str, error: Exception) -> None:
+        """Record one failed call."""
+        self.breaker.record(self.breaker.before_call(endpoint), error)
+
+    def succeed(self, endpoint: str) -> None:
+        """Record one successful call."""
+        self.breaker.record(self.breaker.before_call(endpoint))
+
+    def test_opens_at_failure_rate(self) -> None:
+        """Test the circuit opens once the failure rate is reached."""
+        self.succeed("/status_by_cid/1")
+        self.succeed("/status_by_cid/2")
+        self.fail("/status_by_cid/3", NetworkError("down"))
+        assert self.breaker.state("/status_by_cid/9") == CircuitState.CLOSED
+
+        self.fail("/status_by_cid/4", APIError("bad gateway", 502))
+
+        assert self.breaker.state("/status_by_cid/9") == CircuitState.OPEN
+        assert self.changes == [("/status_by_cid/{id}", "closed", "open")]
+
+    def test_open_fails_fast_per_endpoint(self) -> None:
+        """Test only the failing endpoint template is rejected."""
+        for i in range(4):
+            self.fail(f"/status_by_cid/{i + 1}", NetworkError("down"))
+
+        self.clock.now = 3
+        with pytest.raises(CircuitOpenError) as exc_info:
+            self.breaker.before_call("/status_by_cid/99")
+        assert exc_info.value.endpoint == "/status_by_cid/{id}"
+        assert exc_info.value.retry_after == 7
+
+        assert self.breaker.before_call("/create_bulk_order") == "/create_bulk_order"
+
+    def test_client_errors_are_not_failures(self) -> None:
+        """Test 4xx-style errors do not trip the breaker."""
+        for error in (
+            NotFoundError("missing"),
+            ValidationError("bad"),
+            APIError("bad request", 400),
+            APIError("bad request", 422),
+        ):
+            self.fail("/status_by_invoice/X", error)
+
+        assert self.breaker.state("/status_by_invoice/X") == CircuitState.CLOSED
+
+    def test_half_open_success_closes(self) -> None:
+        """Test a successful trial call closes the circuit."""
+        for _ in range(4):
+            self.fail("/get_balance", NetworkError("down"))
+
+        self.clock.now = 10
+        assert self.breaker.state("/get_balance") == CircuitState.HALF_OPEN
+        circuit = self.breaker.before_call("/get_balance")
+        with pytest.raises(CircuitOpenError):
+            self.breaker.before_call("/get_balance")  # only one trial call
+
+        self.breaker.record(circuit)
+
+        assert self.breaker.state("/get_balance") == CircuitState.CLOSED
+        assert self.changes[-2:] == [
+            ("/get_balance", "open", "half_open"),
+            ("/get_balance", "half_open", "closed"),
+        ]
+
+    def test_half_open_failure_reopens(self) -> None:
+        """Test a failed trial call re-opens the circuit."""
+        for _ in range(4):
+            self.fail("/get_balance", NetworkError("down"))
+
+        self.clock.now = 10
+        self.fail("/get_balance", NetworkError("still down"))
+
+        assert self.breaker.state("/get_balance") == CircuitState.OPEN
+        self.clock.now = 15
+        with pytest.raises(CircuitOpenError):
+            self.breaker.before_call("/get_balance")
+
+    def test_cancellation_releases_trial_slot(self) -> None:
+        """Test non-SDK errors free the half-open slot without an outcome."""
+        for _ in range(4):
+            self.fail("/get_balance", NetworkError("down"))
+
+        self.clock.now = 10
+        self.breaker.record(
+            self.breaker.before_call("/get_balance"), asyncio.CancelledError()
+        )
+
+        assert self.breaker.state("/get_balance") == CircuitState.HALF_OPEN
+        self.succeed("/get_balance")
+        assert self.breaker.state("/get_balance") == CircuitState.CLOSED
+
+    def test_invalid_configuration(self) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(ConfigurationError):
+            CircuitBreaker(failure_rate_threshold=0)
+        with pytest.raises(ConfigurationError):
+            CircuitBreaker(minimum_calls=10, window_size=5)
+        with pytest.raises(ConfigurationError):
+            CircuitBreaker(half_open_max_calls=0)
+
+
+class TestHTTPClientCircuitBreaker:
+    """Test HTTPClient integration."""
+
+    @patch("requests.Session.request")
+    def test_open_circuit_skips_request(self, mock_request: Mock) -> None:
+        """Test requests fail fast without retries once the circuit opens."""
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+        client = HTTPClient(
+            "https://api.example.com", max_retries=0, circuit_breaker=breaker
+        )
+        mock_request.side_effect = ConnectionError("down")
+
+        for _ in range(2):
+            with pytest.raises(NetworkError):
+                client.get("/status_by_cid/1")
+        assert mock_request.call_count == 2
+
+        with pytest.raises(CircuitOpenError):
+            client.get("/status_by_cid/2")
+        assert mock_request.call_count == 2
+
+    @patch("requests.Session.request")
+    def test_success_recorded(self, mock_request: Mock) -> None:
+        """Test successful responses keep the circuit closed."""
+        breaker = Mock(spec=CircuitBreaker)
+        breaker.before_call.return_value = "/get_balance"
+        client = HTTPClient("https://api.example.com", circuit_breaker=breaker)
+        mock_request.return_value = Mock(ok=True, content=json.dumps({}).encode())
+
+        client.get("/get_balance")
+
+        breaker.before_call.assert_called_once_with("/get_balance")
+        breaker.record.assert_called_once_with("/get_balance")
@@ -3,6 +3,7 @@
 import os
 from unittest.mock import patch
 import pytest
+from steadfast.cache import StatusCache
 from steadfast.client import SteadfastClient
 from steadfast.modules.order import OrderModule
 from steadfast.modules.tracking import TrackingModule
@@ -173,3 +174,38 @@ class TestSteadfastClientModuleProperties:
 
         _ = client.tracking
         assert client._tracking is not None
+
+
+class TestSteadfastClientLifecycle:
+    """Tests for client connection lifecycle."""
+
+    def test_pool_options_forwarded(self) -> None:
+        """Test pool options are passed to the HTTP client."""
+        client = SteadfastClient(
+            api_key="test_api_key",
+            secret_key="test_secret_key",
+            pool_maxsize=50,
+            pool_block=True,
+        )
+
+        assert client._http_client.pool_maxsize == 50
+        assert client._http_client.pool_block is True
+
+    def test_context_manager_closes_session(self) -> None:
+        """Test leaving the context closes the HTTP session."""
+        with patch("steadfast.http_client.HTTPClient.close") as mock_close:
+            with SteadfastClient(
+                api_key="test_api_key", secret_key="test_secret_key"
+            ) as client:
+                assert isinstance(client, SteadfastClient)
+
+        mock_close.assert_called_once()
+
+    def test_status_cache_forwarded(self) -> None:
+        """Test the status cache is given to the tracking module."""
+        cache = StatusCache()
+        client = SteadfastClient(
+            api_key="test_api_key", secret_key="test_secret_key", status_cache=cache
+        )
+
+        assert client.tracking.cache is cache
@@ -0,0 +1,187 @@
+"""Tests for request coalescing."""
+
+import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from steadfast.coalesce import RequestCoalescer
+from steadfast.exceptions import NetworkError
+from steadfast.http_client import HTTPClient
+
+
+class TestRequestCoalescer:
+    """Test RequestCoalescer."""
+
+    def test_concurrent_callers_share_one_call(self) -> None:
+        """Test identical in-flight calls run once and every caller gets a copy."""
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        calls: List[int] = []
+
+        def fetch() -> Dict[str, Any]:
+            calls.append(1)
+            release.wait(5)
+            return {"current_balance": 100}
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(coalescer.do, "/get_balance", fetch) for _ in range(5)
+            ]
+            while coalescer.executed + coalescer.coalesced < 5:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert coalescer.executed == 1
+        assert coalescer.coalesced == 4
+        assert all(result == {"current_balance": 100} for result in results)
+        assert len({id(result) for result in results}) == 5
+        assert coalescer.in_flight == 0
+
+    def test_sequential_calls_are_not_cached(self) -> None:
+        """Test a finished call is not reused by later callers."""
+        coalescer = RequestCoalescer()
+        fetch = Mock(return_value={"ok": 1})
+
+        coalescer.do("key", fetch)
+        coalescer.do("key", fetch)
+
+        assert fetch.call_count == 2
+        assert coalescer.coalesced == 0
+
+    def test_different_keys_are_independent(self) -> None:
+        """Test calls with different keys are never shared."""
+        coalescer = RequestCoalescer()
+
+        assert coalescer.do("a", lambda: {"key": "a"}) == {"key": "a"}
+        assert coalescer.do("b", lambda: {"key": "b"}) == {"key": "b"}
+        assert coalescer.executed == 2
+
+    def test_error_is_shared(self) -> None:
+        """Test waiting callers receive the leading call's error."""
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+
+        def fetch() -> Dict[str, Any]:
+            release.wait(5)
+            raise NetworkError("Network error: timed out")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(coalescer.do, "key", fetch) for _ in range(3)]
+            while coalescer.executed + coalescer.coalesced < 3:
+                threading.Event().wait(0.001)
+            release.set()
+
+            for future in futures:
+                with pytest.raises(NetworkError):
+                    future.result()
+
+        assert coalescer.in_flight == 0
+
+    def test_async_callers_share_one_call(self) -> None:
+        """Test identical concurrent coroutines await a single call."""
+        coalescer = RequestCoalescer()
+        calls: List[int] = []
+
+        async def fetch() -> Dict[str, Any]:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"status": 200}
+
+        async def run() -> List[Dict[str, Any]]:
+            return await asyncio.gather(
+                *(coalescer.do_async("key", fetch) for _ in range(4))
+            )
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert results == [{"status": 200}] * 4
+        assert (coalescer.executed, coalescer.coalesced) == (1, 3)
+        assert coalescer.in_flight == 0
+
+    def test_async_cancelled_caller_does_not_cancel_others(self) -> None:
+        """Test cancelling one waiter leaves the shared call running."""
+        coalescer = RequestCoalescer()
+
+        async def fetch() -> Dict[str, Any]:
+            await asyncio.sleep(0.02)
+            return {"status": 200}
+
+        async def run() -> Dict[str, Any]:
+            first = asyncio.ensure_future(coalescer.do_async("key", fetch))
+            second = asyncio.ensure_future(coalescer.do_async("key", fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        assert asyncio.run(run()) == {"status": 200}
+
+    def test_async_error_is_shared(self) -> None:
+        """Test every waiting coroutine receives the shared error."""
+        coalescer = RequestCoalescer()
+
+        async def fetch() -> Dict[str, Any]:
+            await asyncio.sleep(0)
+            raise NetworkError("Network error: timed out")
+
+        async def run() -> List[Any]:
+            return await asyncio.gather(
+                *(coalescer.do_async("key", fetch) for _ in range(2)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(result, NetworkError) for result in results)
+
+
+class TestHTTPClientCoalescing:
+    """Test HTTPClient with a coalescer."""
+
+    @patch("requests.Session.request")
+    def test_identical_gets_coalesced(self, mock_request: Mock) -> None:
+        """Test concurrent identical GETs make one upstream request."""
+        release = threading.Event()
+
+        def respond(**kwargs: Any) -> Mock:
+            release.wait(5)
+            return Mock(ok=True, content=json.dumps({"current_balance": 5}).encode())
+
+        mock_request.side_effect = respond
+        coalescer = RequestCoalescer()
+        client = HTTPClient("https://api.example.com", coalescer=coalescer)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(client.get, "/get_balance", params={"a": 1})
+                for _ in range(4)
+            ]
+            while coalescer.executed + coalescer.coalesced < 4:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert mock_request.call_count == 1
+        assert results == [{"current_balance": 5}] * 4
+        assert coalescer.coalesced == 3
+
+    @patch("requests.Session.request")
+    def test_params_and_posts_not_shared(self, mock_request: Mock) -> None:
+        """Test the key includes params and POSTs are never coalesced."""
+        mock_request.return_value = Mock(ok=True, content=json.dumps({}).encode())
+        client = HTTPClient("https://api.example.com", coalescer=RequestCoalescer())
+
+        key_a = client._coalesce_key("/x", None, {"page": 1, "size": 2})
+        key_b = client._coalesce_key("x", {}, {"size": 2, "page": 1})
+        key_c = client._coalesce_key("/x", None, {"page": 2})
+        client.post("/x", data={"a": 1})
+
+        assert key_a == key_b
+        assert key_a != key_c
+        assert mock_request.call_count == 1
@@ -0,0 +1,120 @@
+"""Tests for JSON codecs."""
+
+import json
+from typing import Any, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from steadfast.codec import CODEC_NAMES, JSONCodec, get_codec
+from steadfast.exceptions import APIError, ConfigurationError
+from steadfast.http_client import HTTPClient
+
+
+def installed_codecs() -> List[str]:
+    """Return the names of the codecs importable here."""
+    names = []
+    for name in CODEC_NAMES:
+        try:
+            get_codec(name)
+        except ConfigurationError:
+            continue
+        names.append(name)
+    return names
+
+
+PAYLOAD = {
+    "orders": [
+        {
+            "invoice": "INV-1",
+            "recipient_name": "Rahim Uddin",
+            "recipient_address": "বাড়ি ১২, ঢাকা",
+            "cod_amount": 1500.5,
+            "delivery_type": 0,
+            "note": None,
+        }
+    ]
+}
+
+
+class TestGetCodec:
+    """Test codec selection."""
+
+    def test_default_is_first_installed(self) -> None:
+        """Test the default codec is the most preferred installed backend."""
+        assert get_codec().name == installed_codecs()[0]
+
+    def test_stdlib_always_available(self) -> None:
+        """Test the stdlib codec is always installed."""
+        assert "json" in installed_codecs()
+
+    def test_unknown_codec(self) -> None:
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ConfigurationError, match="must be one of"):
+            get_codec("simplejson")
+
+    def test_missing_codec(self) -> None:
+        """Test naming a backend that is not installed is rejected."""
+        with patch("steadfast.codec.ujson", None):
+            with pytest.raises(ConfigurationError, match="not installed"):
+                get_codec("ujson")
+
+    def test_falls_back_to_stdlib(self) -> None:
+        """Test the stdlib codec is used when no fast backend is installed."""
+        with patch("steadfast.codec.orjson", None), patch(
+            "steadfast.codec.ujson", None
+        ):
+            assert get_codec().name == "json"
+
+
+@pytest.mark.parametrize("name", installed_codecs())
+class TestJSONCodec:
+    """Test every installed codec behaves the same."""
+
+    def test_round_trip(self, name: str) -> None:
+        """Test encoding to bytes and decoding back."""
+        codec = get_codec(name)
+        encoded = codec.dumps(PAYLOAD)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == PAYLOAD
+        assert json.loads(encoded) == PAYLOAD
+
+    def test_decodes_stdlib_output(self, name: str) -> None:
+        """Test decoding what the stdlib encoder produces."""
+        assert get_codec(name).loads(json.dumps(PAYLOAD).encode()) == PAYLOAD
+
+    def test_invalid_input_raises_value_error(self, name: str) -> None:
+        """Test malformed bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            get_codec(name).loads(b"<html>Bad Gateway</html>")
+
+
+class TestHTTPClientCodec:
+    """Test HTTPClient encodes and decodes with its codec."""
+
+    @patch("requests.Session.request")
+    def test_custom_codec(self, mock_request: Mock) -> None:
+        """Test the configured codec handles both bodies."""
+        calls: List[Any] = []
+
+        def loads(content: Any) -> Any:
+            calls.append(content)
+            return json.loads(content)
+
+        codec = JSONCodec("custom", lambda data: b'{"encoded":true}', loads)
+        mock_request.return_value = Mock(ok=True, content=b'{"id":1}')
+        client = HTTPClient("https://api.example.com", codec=codec)
+
+        assert client.post("/create", data={"a": 1}) == {"id": 1}
+        assert mock_request.call_args.kwargs["data"] == b'{"encoded":true}'
+        assert calls == [b'{"id":1}']
+
+    @patch("requests.Session.request")
+    def test_invalid_json_response(self, mock_request: Mock) -> None:
+        """Test a body the codec cannot decode raises APIError."""
+        mock_request.return_value = Mock(ok=True, content=b"not json")
+        client = HTTPClient("https://api.example.com", codec=get_codec("json"))
+
+        with pytest.raises(APIError, match="Invalid JSON response"):
+            client.get("/balance")
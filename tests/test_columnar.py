@@ -0,0 +1,129 @@
+"""Tests for columnar bulk order results."""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from steadfast.columnar import NO_CONSIGNMENT_ID, BulkOrderColumns
+from steadfast.exceptions import ConfigurationError
+from steadfast.models import BulkOrderResponse, BulkOrderResult
+
+np = pytest.importorskip("numpy")
+
+
+def make_records() -> List[Dict[str, Any]]:
+    """Build raw create_bulk_order results: success, error, duplicate."""
+    base = {
+        "recipient_name": "John",
+        "recipient_address": "Dhaka",
+        "recipient_phone": "01234567890",
+    }
+    return [
+        dict(
+            base,
+            invoice="INV-1",
+            cod_amount=100,
+            consignment_id=11,
+            tracking_code="T11",
+            status="success",
+        ),
+        dict(base, invoice="INV-2", cod_amount=200.5, error="Bad phone"),
+        dict(base, invoice="INV-3", cod_amount=0, status="duplicate"),
+    ]
+
+
+class TestBulkOrderColumns:
+    """Test BulkOrderColumns."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.columns = BulkOrderColumns.from_records(make_records())
+
+    def test_columns(self) -> None:
+        """Test results are stored as parallel columns."""
+        assert len(self.columns) == 3
+        assert self.columns.invoice == ["INV-1", "INV-2", "INV-3"]
+        assert self.columns.status == ["success", "error", "duplicate"]
+        assert list(self.columns.consignment_id) == [11, NO_CONSIGNMENT_ID, 0]
+        assert list(self.columns.cod_amount) == [100.0, 200.5, 0.0]
+        assert list(self.columns.success_mask) == [1, 0, 0]
+        assert self.columns.succeeded == 1
+        assert self.columns.failed_count == 1
+
+    def test_rows_built_on_access(self) -> None:
+        """Test rows come back as the same BulkOrderResult objects."""
+        results = [BulkOrderResult(**record) for record in make_records()]
+        columns = BulkOrderColumns.from_response(BulkOrderResponse(results=results))
+
+        assert list(columns) == results
+        assert columns[-1] == results[-1]
+        assert columns[1:] == results[1:]
+        assert columns[1].consignment_id is None
+        with pytest.raises(IndexError):
+            columns[3]
+
+    def test_failed_view(self) -> None:
+        """Test failed() lists only the error rows."""
+        failed = self.columns.failed()
+
+        assert len(failed) == 1
+        assert failed[0].invoice == "INV-2"
+        assert failed[0].error == "Bad phone"
+
+    def test_by_invoice_view(self) -> None:
+        """Test by_invoice() maps invoices to rows."""
+        by_invoice = self.columns.by_invoice()
+
+        assert by_invoice["INV-1"].consignment_id == 11
+        assert "INV-4" not in by_invoice
+        assert list(by_invoice) == ["INV-1", "INV-2", "INV-3"]
+
+    def test_to_numpy_shares_numeric_memory(self) -> None:
+        """Test numeric columns are exported without copying."""
+        arrays = self.columns.to_numpy()
+
+        assert arrays["consignment_id"].dtype == np.int64
+        assert arrays["success"].tolist() == [True, False, False]
+        assert arrays["invoice"].tolist() == ["INV-1", "INV-2", "INV-3"]
+        self.columns.cod_amount[0] = 999.0
+        assert arrays["cod_amount"][0] == 999.0
+
+    def test_numpy_views_are_read_only(self) -> None:
+        """Test the shared numeric arrays cannot be written through."""
+        arrays = self.columns.to_numpy()
+
+        for name in ("consignment_id", "cod_amount", "success"):
+            assert not arrays[name].flags.writeable
+        with pytest.raises(ValueError):
+            arrays["success"][1] = True
+        assert self.columns.succeeded == 1
+
+    def test_extend(self) -> None:
+        """Test appending another container keeps indexes consistent."""
+        self.columns.extend(BulkOrderColumns.from_records(make_records()[1:2]))
+
+        assert len(self.columns) == 4
+        assert self.columns.failed_count == 2
+        assert [r.invoice for r in self.columns.failed()] == ["INV-2", "INV-2"]
+        assert self.columns.by_invoice()["INV-2"] == self.columns[3]
+
+    def test_to_pandas(self) -> None:
+        """Test the DataFrame has one row per result."""
+        pytest.importorskip("pandas")
+        frame = self.columns.to_pandas()
+
+        assert frame.shape[0] == 3
+        assert frame.loc[frame["success"], "invoice"].tolist() == ["INV-1"]
+
+    def test_to_arrow(self) -> None:
+        """Test the Arrow export, or the error when pyarrow is missing."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            with pytest.raises(ConfigurationError, match="pyarrow"):
+                self.columns.to_arrow()
+            return
+
+        table = self.columns.to_arrow()
+        assert table.num_rows == 3
+        assert table.column("invoice").to_pylist() == ["INV-1", "INV-2", "INV-3"]
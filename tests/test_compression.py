@@ -0,0 +1,156 @@
+"""Tests for request body compression."""
+
+import gzip
+import json
+from typing import Any, Dict
+from unittest.mock import Mock, patch
+
+from requests.exceptions import Timeout
+
+import pytest
+
+from steadfast.compression import RequestCompressor
+from steadfast.exceptions import ConfigurationError
+from steadfast.http_client import HTTPClient
+
+
+def large_payload(count: int = 50) -> Dict[str, Any]:
+    """Build a bulk payload well over the default threshold."""
+    return {
+        "orders": [
+            {
+                "invoice": f"INV-{i}",
+                "recipient_address": f"House {i}, Road 5, Dhanmondi, Dhaka",
+                "note": "Call before delivery",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+class TestRequestCompressor:
+    """Test RequestCompressor."""
+
+    def test_compress_round_trip(self) -> None:
+        """Test compressed bodies decompress to the original."""
+        compressor = RequestCompressor()
+        body = json.dumps(large_payload()).encode()
+
+        compressed = compressor.compress(body)
+
+        assert gzip.decompress(compressed) == body
+        assert compressor.compressed == 1
+        assert compressor.bytes_in == len(body)
+        assert compressor.bytes_out == len(compressed)
+        assert compressor.ratio < 0.5
+
+    def test_output_is_deterministic(self) -> None:
+        """Test the same body always compresses to the same bytes."""
+        compressor = RequestCompressor()
+        body = json.dumps(large_payload()).encode()
+
+        assert compressor.compress(body) == compressor.compress(body)
+
+    def test_time_is_recorded(self) -> None:
+        """Test time spent compressing is accumulated."""
+        ticks = iter([1.0, 1.25, 2.0, 2.5])
+        compressor = RequestCompressor(clock=lambda: next(ticks))
+
+        compressor.compress(b"x" * 2000)
+        compressor.compress(b"x" * 2000)
+
+        assert compressor.seconds == pytest.approx(0.75)
+
+    def test_threshold_and_switch(self) -> None:
+        """Test only large bodies are compressed, and only when enabled."""
+        compressor = RequestCompressor(threshold=100)
+
+        assert compressor.should_compress(b"x" * 100)
+        assert not compressor.should_compress(b"x" * 99)
+        compressor.enabled = False
+        assert not compressor.should_compress(b"x" * 1000)
+
+    def test_invalid_settings(self) -> None:
+        """Test out-of-range settings are rejected."""
+        with pytest.raises(ConfigurationError):
+            RequestCompressor(threshold=-1)
+        with pytest.raises(ConfigurationError):
+            RequestCompressor(level=0)
+        with pytest.raises(ConfigurationError):
+            RequestCompressor(level=10)
+
+
+class TestHTTPClientCompression:
+    """Test HTTPClient sends compressed bodies."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.compressor = RequestCompressor(threshold=512)
+        self.client = HTTPClient("https://api.example.com", compressor=self.compressor)
+
+    @patch("requests.Session.request")
+    def test_large_body_gzipped(self, mock_request: Mock) -> None:
+        """Test a large payload is sent gzipped with Content-Encoding."""
+        mock_request.return_value = Mock(ok=True, content=b"{}")
+        payload = large_payload()
+
+        self.client.post("/create_bulk_order", data=payload)
+
+        kwargs = mock_request.call_args.kwargs
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["data"])) == payload
+        assert self.compressor.compressed == 1
+
+    @patch("requests.Session.request")
+    def test_small_body_sent_as_is(self, mock_request: Mock) -> None:
+        """Test a payload under the threshold is not compressed."""
+        mock_request.return_value = Mock(ok=True, content=b"{}")
+
+        self.client.post("/create_order", data={"invoice": "INV-1"})
+
+        kwargs = mock_request.call_args.kwargs
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert json.loads(kwargs["data"]) == {"invoice": "INV-1"}
+        assert self.compressor.skipped == 1
+
+    @patch("requests.Session.request")
+    def test_disabled_compressor(self, mock_request: Mock) -> None:
+        """Test turning the compressor off sends bodies uncompressed."""
+        mock_request.return_value = Mock(ok=True, content=b"{}")
+        self.compressor.enabled = False
+
+        self.client.post("/create_bulk_order", data=large_payload())
+
+        kwargs = mock_request.call_args.kwargs
+        assert "Content-Encoding" not in kwargs["headers"]
+        assert json.loads(kwargs["data"]) == large_payload()
+        assert self.compressor.compressed == 0
+
+    @patch("requests.Session.request")
+    def test_get_requests_untouched(self, mock_request: Mock) -> None:
+        """Test requests without a body are not counted."""
+        mock_request.return_value = Mock(ok=True, content=b"{}")
+
+        self.client.get("/get_balance")
+
+        assert mock_request.call_args.kwargs["data"] is None
+        assert self.compressor.compressed == self.compressor.skipped == 0
+
+    @patch("time.sleep")
+    @patch("requests.Session.request")
+    def test_retry_reuses_encoded_body(
+        self, mock_request: Mock, mock_sleep: Mock
+    ) -> None:
+        """Test a resend without payload changes is not compressed again."""
+        mock_request.side_effect = [
+            Timeout("Request timeout"),
+            Mock(ok=True, content=b"{}"),
+        ]
+        hook = Mock(return_value=None)
+
+        self.client.post("/create_bulk_order", data=large_payload(), before_retry=hook)
+
+        first, second = mock_request.call_args_list
+        assert first.kwargs["data"] == second.kwargs["data"]
+        assert hook.call_count == 1
+        assert self.compressor.compressed == 1
@@ -0,0 +1,104 @@
+"""Tests for bounded fan-out helpers."""
+
+import asyncio
+import threading
+import time
+from typing import Any, List, Tuple
+
+import pytest
+
+from steadfast.concurrency import fan_out, fan_out_async
+from steadfast.exceptions import NotFoundError, ValidationError
+
+
+class TestFanOut:
+    """Test fan_out."""
+
+    def test_bounds_calls_in_flight(self) -> None:
+        """Test no more than ``concurrency`` calls run at once."""
+        lock = threading.Lock()
+        active: List[int] = [0]
+        peak: List[int] = [0]
+
+        def work(item: int) -> int:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return item * 2
+
+        results = dict(fan_out(work, range(20), concurrency=3))
+
+        assert results == {i: i * 2 for i in range(20)}
+        assert peak[0] <= 3
+
+    def test_reads_items_lazily(self) -> None:
+        """Test items are pulled only as slots free up."""
+        pulled: List[int] = []
+
+        def items() -> Any:
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        iterator = fan_out(lambda item: item, items(), concurrency=2)
+        next(iterator)
+
+        assert len(pulled) <= 4
+        iterator.close()
+
+    def test_sdk_errors_are_returned(self) -> None:
+        """Test SDK errors become per-item outcomes."""
+
+        def work(item: int) -> int:
+            if item == 2:
+                raise NotFoundError("missing")
+            return item
+
+        results = dict(fan_out(work, [1, 2, 3], concurrency=2))
+
+        assert results[1] == 1 and results[3] == 3
+        assert isinstance(results[2], NotFoundError)
+
+    def test_other_errors_propagate(self) -> None:
+        """Test non-SDK exceptions are raised to the caller."""
+
+        def work(item: int) -> int:
+            raise KeyError(item)
+
+        with pytest.raises(KeyError):
+            list(fan_out(work, [1], concurrency=1))
+
+    def test_invalid_concurrency(self) -> None:
+        """Test concurrency must be positive."""
+        with pytest.raises(ValidationError):
+            fan_out(lambda item: item, [1], concurrency=0)
+
+
+class TestFanOutAsync:
+    """Test fan_out_async."""
+
+    def test_bounds_tasks_and_returns_errors(self) -> None:
+        """Test tasks are bounded and SDK errors returned per item."""
+        active: List[int] = [0]
+        peak: List[int] = [0]
+
+        async def work(item: int) -> int:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.001)
+            active[0] -= 1
+            if item == 5:
+                raise NotFoundError("missing")
+            return item
+
+        async def run() -> List[Tuple[int, Any]]:
+            return [pair async for pair in fan_out_async(work, range(10), 4)]
+
+        results = dict(asyncio.run(run()))
+
+        assert peak[0] <= 4
+        assert isinstance(results.pop(5), NotFoundError)
+        assert results == {i: i for i in range(10) if i != 5}
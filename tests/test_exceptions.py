@@ -7,6 +7,7 @@ from steadfast.exceptions import (
     NotFoundError,
     APIError,
     NetworkError,
+    CircuitOpenError,
     ConfigurationError,
 )
 
@@ -109,6 +110,18 @@ class TestNetworkError:
         assert isinstance(exc, SteadfastException)
 
 
+class TestCircuitOpenError:
+    """Test circuit open error."""
+
+    def test_is_network_error(self) -> None:
+        """Test it is caught by existing NetworkError handlers."""
+        exc = CircuitOpenError("Circuit open", "/status_by_cid/{id}", retry_after=5)
+        assert isinstance(exc, NetworkError)
+        assert exc.endpoint == "/status_by_cid/{id}"
+        assert exc.retry_after == 5
+        assert "retry after 5s" in str(exc)
+
+
 class TestConfigurationError:
     """Test configuration error."""
 
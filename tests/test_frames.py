@@ -0,0 +1,230 @@
+"""Tests for vectorized DataFrame order validation."""
+
+from typing import Any, Dict
+from unittest.mock import Mock, patch
+
+import pytest
+
+from steadfast import frames
+from steadfast.exceptions import ConfigurationError, ValidationError
+from steadfast.frames import OrderErrorCode, error_fields, validate_orders_frame
+from steadfast.models import BulkOrderResponse, RejectedOrder, ValidationIssue
+from steadfast.modules.order import OrderModule
+from steadfast.validators import validate_order
+
+pd = pytest.importorskip("pandas")
+
+
+def make_frame() -> Any:
+    """Build a frame with one valid row and several invalid ones."""
+    return pd.DataFrame(
+        {
+            "invoice": ["INV-1", "bad invoice", None, "INV-4", "INV-5"],
+            "recipient_name": [" John ", "Jane", "Jim", "x" * 101, "Joe"],
+            "recipient_phone": [
+                "017-1111-1111",
+                "0171",
+                "01711111111",
+                "01711111111",
+                "01822222222",
+            ],
+            "recipient_address": ["Dhaka", "Dhaka", "Dhaka", "Dhaka", "Sylhet"],
+            "cod_amount": [100, "abc", -1, 50, "25.5"],
+            "delivery_type": [0, 1, 2, None, 1],
+            "note": ["Fragile", None, None, None, None],
+            "total_lot": [2, None, None, None, None],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+
+class TestValidateOrdersFrame:
+    """Test validate_orders_frame."""
+
+    def test_mask_and_error_codes(self) -> None:
+        """Test every failing field is flagged per row."""
+        result = validate_orders_frame(make_frame())
+
+        assert result.valid.tolist() == [True, False, False, False, True]
+        assert result.valid.index.tolist() == [10, 11, 12, 13, 14]
+        assert not result.is_valid
+        codes = result.error_codes.tolist()
+        assert codes[0] == OrderErrorCode.OK
+        assert error_fields(codes[1]) == ["invoice", "recipient_phone", "cod_amount"]
+        assert error_fields(codes[2]) == ["invoice", "cod_amount", "delivery_type"]
+        assert error_fields(codes[3]) == ["recipient_name"]
+
+    def test_valid_orders_match_row_validator(self) -> None:
+        """Test valid rows normalise exactly like validate_order."""
+        frame = make_frame()
+
+        orders = validate_orders_frame(frame).valid_orders()
+
+        assert orders == [
+            validate_order(
+                {
+                    "invoice": "INV-1",
+                    "recipient_name": " John ",
+                    "recipient_phone": "017-1111-1111",
+                    "recipient_address": "Dhaka",
+                    "cod_amount": 100,
+                    "delivery_type": 0,
+                    "note": "Fragile",
+                    "total_lot": 2,
+                }
+            ),
+            validate_order(
+                {
+                    "invoice": "INV-5",
+                    "recipient_name": "Joe",
+                    "recipient_phone": "01822222222",
+                    "recipient_address": "Sylhet",
+                    "cod_amount": "25.5",
+                    "delivery_type": 1,
+                }
+            ),
+        ]
+        assert type(orders[0]["total_lot"]) is int
+
+    @pytest.mark.parametrize(
+        "cod_amount",
+        [100, 0, "25.5", -1, "abc", None, float("nan"), float("inf"), "-inf"],
+    )
+    def test_cod_amount_matches_row_validator(self, cod_amount: Any) -> None:
+        """Test a COD amount is rejected exactly when validate_order rejects it."""
+        order = {
+            "invoice": "INV-1",
+            "recipient_name": "John",
+            "recipient_phone": "01711111111",
+            "recipient_address": "Dhaka",
+            "cod_amount": cod_amount,
+        }
+        try:
+            validate_order(order)
+        except ValidationError as e:
+            assert e.field == "cod_amount"
+            expected = False
+        else:
+            expected = True
+
+        result = validate_orders_frame(pd.DataFrame([order], dtype=object))
+
+        assert result.valid.tolist() == [expected]
+
+    def test_blank_name_and_address_flagged(self) -> None:
+        """Test names and addresses that are blank after stripping are flagged."""
+        frame = (
+            make_frame().iloc[[0]].assign(recipient_name="   ", recipient_address=" ")
+        )
+
+        result = validate_orders_frame(frame)
+
+        assert error_fields(int(result.error_codes.iloc[0])) == [
+            "recipient_name",
+            "recipient_address",
+        ]
+
+    def test_rejected_rows(self) -> None:
+        """Test rejected rows keep their input values and row positions."""
+        rejected = validate_orders_frame(make_frame()).rejected()
+
+        assert [r.index for r in rejected] == [1, 2, 3]
+        assert rejected[0].order["invoice"] == "bad invoice"
+        assert rejected[0].order["cod_amount"] == "abc"
+        assert "note" not in rejected[0].order
+        assert [i.field for i in rejected[2].issues] == ["recipient_name"]
+        assert all(i.index == 3 for i in rejected[2].issues)
+
+    def test_optional_contact_columns(self) -> None:
+        """Test alternative phone and email are checked only when present."""
+        frame = pd.DataFrame(
+            {
+                "invoice": ["INV-1", "INV-2", "INV-3"],
+                "recipient_name": ["A", "B", "C"],
+                "recipient_phone": ["01711111111"] * 3,
+                "recipient_address": ["Dhaka"] * 3,
+                "cod_amount": [0, 0, 0],
+                "alternative_phone": [None, "123", "01822222222"],
+                "recipient_email": ["a@example.com", None, "nope"],
+            }
+        )
+
+        result = validate_orders_frame(frame)
+
+        assert [error_fields(c) for c in result.error_codes] == [
+            [],
+            ["alternative_phone"],
+            ["recipient_email"],
+        ]
+        assert result.valid_orders()[0]["recipient_email"] == "a@example.com"
+        assert "alternative_phone" not in result.valid_orders()[0]
+
+    def test_missing_columns(self) -> None:
+        """Test absent required columns flag every row."""
+        result = validate_orders_frame(pd.DataFrame({"invoice": ["INV-1"]}))
+
+        assert error_fields(int(result.error_codes.iloc[0])) == [
+            "recipient_name",
+            "recipient_phone",
+            "recipient_address",
+            "cod_amount",
+        ]
+
+    def test_requires_pandas(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a clear error is raised without the pandas extra."""
+        monkeypatch.setattr(frames, "pd", None)
+
+        with pytest.raises(ConfigurationError, match="pandas"):
+            validate_orders_frame(make_frame())
+
+
+class TestCreateBulkFromFrame:
+    """Test OrderModule.create_bulk_from_frame."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+
+        def post(endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+            return {"results": [dict(o, status="success") for o in data["orders"]]}
+
+        self.mock_http_client = Mock()
+        self.mock_http_client.post.side_effect = post
+        self.order_module = OrderModule(self.mock_http_client)
+
+    def test_submits_valid_rows(self) -> None:
+        """Test valid rows are sent and invalid rows returned."""
+        response = self.order_module.create_bulk_from_frame(make_frame())
+
+        sent = self.mock_http_client.post.call_args.kwargs["data"]["orders"]
+        assert [o["invoice"] for o in sent] == ["INV-1", "INV-5"]
+        assert [r.invoice for r in response.results] == ["INV-1", "INV-5"]
+        assert [r.index for r in response.rejected] == [1, 2, 3]
+        assert len(response.chunks) == 1
+
+    def test_keeps_rows_rejected_while_sending(self) -> None:
+        """Test rows create_bulk_many rejects are added at their frame positions."""
+        late = RejectedOrder(
+            index=1,
+            order={"invoice": "INV-5"},
+            issues=[ValidationIssue(1, "recipient_name", "Recipient name missing")],
+        )
+        with patch.object(
+            self.order_module,
+            "create_bulk_many",
+            return_value=BulkOrderResponse(results=[], rejected=[late]),
+        ):
+            response = self.order_module.create_bulk_from_frame(make_frame())
+
+        assert [r.index for r in response.rejected] == [1, 2, 3, 4]
+        assert response.rejected[3].order == {"invoice": "INV-5"}
+        assert [i.index for i in response.rejected[3].issues] == [4]
+
+    def test_no_valid_rows(self) -> None:
+        """Test nothing is sent when every row is invalid."""
+        frame = make_frame().iloc[1:4]
+
+        response = self.order_module.create_bulk_from_frame(frame)
+
+        assert response.results == []
+        assert len(response.rejected) == 3
+        self.mock_http_client.post.assert_not_called()
@@ -7,6 +7,7 @@ import pytest
 from requests.exceptions import ConnectionError, Timeout, RequestException
 
 from steadfast.http_client import HTTPClient
+from steadfast.retry import Resend, RetryBudget, RetryPolicy
 from steadfast.exceptions import (
     APIError,
     NetworkError,
@@ -34,12 +35,12 @@ class TestHTTPClient:
         assert client.timeout == 60
         assert client.max_retries == 5
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_success(self, mock_request: Mock) -> None:
         """Test successful GET request."""
         mock_response = Mock()
         mock_response.ok = True
-        mock_response.json.return_value = {"status": "success"}
+        mock_response.content = json.dumps({"status": "success"}).encode()
         mock_request.return_value = mock_response
 
         result = self.client.get("/test", headers={"Auth": "token"})
@@ -50,16 +51,16 @@ class TestHTTPClient:
             url="https://api.example.com/test",
             headers={"Auth": "token"},
             params=None,
-            json=None,
+            data=None,
             timeout=30,
         )
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_post_success(self, mock_request: Mock) -> None:
         """Test successful POST request."""
         mock_response = Mock()
         mock_response.ok = True
-        mock_response.json.return_value = {"id": 123}
+        mock_response.content = json.dumps({"id": 123}).encode()
         mock_request.return_value = mock_response
 
         data = {"name": "test"}
@@ -71,16 +72,16 @@ class TestHTTPClient:
             url="https://api.example.com/create",
             headers={"Content-Type": "application/json"},
             params=None,
-            json=data,
+            data=self.client.codec.dumps(data),
             timeout=30,
         )
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_with_params(self, mock_request: Mock) -> None:
         """Test GET request with query parameters."""
         mock_response = Mock()
         mock_response.ok = True
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps({"data": []}).encode()
         mock_request.return_value = mock_response
 
         params = {"page": 1, "limit": 10}
@@ -92,17 +93,17 @@ class TestHTTPClient:
             url="https://api.example.com/list",
             headers={},
             params=params,
-            json=None,
+            data=None,
             timeout=30,
         )
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_404_error(self, mock_request: Mock) -> None:
         """Test 404 Not Found error."""
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 404
-        mock_response.json.return_value = {"message": "Resource not found"}
+        mock_response.content = json.dumps({"message": "Resource not found"}).encode()
         mock_request.return_value = mock_response
 
         with pytest.raises(NotFoundError) as exc_info:
@@ -110,13 +111,13 @@ class TestHTTPClient:
 
         assert "Resource not found" in str(exc_info.value)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_401_error(self, mock_request: Mock) -> None:
         """Test 401 Authentication error."""
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 401
-        mock_response.json.return_value = {"error": "Invalid credentials"}
+        mock_response.content = json.dumps({"error": "Invalid credentials"}).encode()
         mock_request.return_value = mock_response
 
         with pytest.raises(AuthenticationError) as exc_info:
@@ -124,13 +125,13 @@ class TestHTTPClient:
 
         assert "Invalid credentials" in str(exc_info.value)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_api_error_with_status_code(self, mock_request: Mock) -> None:
         """Test API error with status code."""
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 400
-        mock_response.json.return_value = {"message": "Bad request"}
+        mock_response.content = json.dumps({"message": "Bad request"}).encode()
         mock_request.return_value = mock_response
 
         with pytest.raises(APIError) as exc_info:
@@ -139,13 +140,13 @@ class TestHTTPClient:
         assert exc_info.value.status_code == 400
         assert "Bad request" in str(exc_info.value)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_api_error_no_json(self, mock_request: Mock) -> None:
         """Test API error when response is not JSON."""
         mock_response = Mock()
         mock_response.ok = False
         mock_response.status_code = 500
-        mock_response.json.side_effect = json.JSONDecodeError("", "", 0)
+        mock_response.content = b"<html>Server Error</html>"
         mock_response.text = "Internal Server Error"
         mock_request.return_value = mock_response
 
@@ -154,12 +155,12 @@ class TestHTTPClient:
 
         assert "Internal Server Error" in str(exc_info.value)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_invalid_json_response(self, mock_request: Mock) -> None:
         """Test invalid JSON response."""
         mock_response = Mock()
         mock_response.ok = True
-        mock_response.json.side_effect = json.JSONDecodeError("", "", 0)
+        mock_response.content = b"<html>Server Error</html>"
         mock_request.return_value = mock_response
 
         with pytest.raises(APIError) as exc_info:
@@ -167,7 +168,7 @@ class TestHTTPClient:
 
         assert "Invalid JSON response" in str(exc_info.value)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_connection_error_no_retry(self, mock_request: Mock) -> None:
         """Test connection error without retry."""
         mock_request.side_effect = ConnectionError("Connection failed")
@@ -178,13 +179,13 @@ class TestHTTPClient:
         assert "Network error" in str(exc_info.value)
         assert mock_request.call_count == 3  # Initial + 2 retries
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_timeout_error_with_retry(self, mock_request: Mock) -> None:
         """Test timeout error with retry logic."""
         mock_request.side_effect = [
             Timeout("Request timeout"),
             Timeout("Request timeout"),
-            Mock(ok=True, json=lambda: {"success": True}),
+            Mock(ok=True, content=json.dumps({"success": True}).encode()),
         ]
 
         with patch("time.sleep"):  # Mock sleep to speed up test
@@ -193,7 +194,50 @@ class TestHTTPClient:
         assert result == {"success": True}
         assert mock_request.call_count == 3
 
-    @patch("requests.request")
+    @patch("time.sleep")
+    @patch("requests.Session.request")
+    def test_before_retry_hook(self, mock_request: Mock, mock_sleep: Mock) -> None:
+        """Test the hook runs before each retry and can replace the resend."""
+        mock_request.side_effect = [
+            Timeout("Request timeout"),
+            Timeout("Request timeout"),
+        ]
+        hook = Mock(side_effect=[None, {"results": []}])
+
+        result = self.client.post("/create_bulk_order", data={}, before_retry=hook)
+
+        assert result == {"results": []}
+        assert hook.call_count == 2
+        assert mock_request.call_count == 2
+        assert all(isinstance(c.args[0], NetworkError) for c in hook.call_args_list)
+
+    @patch("time.sleep")
+    @patch("requests.Session.request")
+    def test_before_retry_resend(self, mock_request: Mock, mock_sleep: Mock) -> None:
+        """Test a Resend from the hook replaces the payload and headers."""
+        mock_request.side_effect = [
+            Timeout("Request timeout"),
+            Mock(ok=True, content=json.dumps({"success": True}).encode()),
+        ]
+        headers = {"Idempotency-Key": "a"}
+        hook = Mock(return_value=Resend({"orders": [2]}, {"Idempotency-Key": "b"}))
+
+        self.client.post(
+            "/create_bulk_order",
+            headers=headers,
+            data={"orders": [1, 2]},
+            before_retry=hook,
+        )
+
+        first, second = mock_request.call_args_list
+        assert json.loads(first.kwargs["data"]) == {"orders": [1, 2]}
+        assert first.kwargs["headers"]["Idempotency-Key"] == "a"
+        assert json.loads(second.kwargs["data"]) == {"orders": [2]}
+        assert second.kwargs["headers"]["Idempotency-Key"] == "b"
+        assert second.kwargs["headers"]["Content-Type"] == "application/json"
+        assert headers == {"Idempotency-Key": "a"}
+
+    @patch("requests.Session.request")
     def test_request_exception(self, mock_request: Mock) -> None:
         """Test general request exception."""
         mock_request.side_effect = RequestException("Request failed")
@@ -203,19 +247,115 @@ class TestHTTPClient:
 
         assert "Request failed" in str(exc_info.value)
 
-    @patch("time.sleep")
-    def test_exponential_backoff(self, mock_sleep: Mock) -> None:
-        """Test exponential backoff calculation."""
+    def test_backoff_uses_retry_policy(self) -> None:
+        """Test retry delays come from the decorrelated-jitter policy."""
         client = HTTPClient("https://api.example.com", retry_backoff=0.5)
 
-        client._exponential_backoff(0)
-        mock_sleep.assert_called_with(0.5)
+        assert client.retry_policy.base_delay == 0.5
+        assert client.retry_backoff == 0.5
+
+        delays = []
+        previous = 0.0
+        for _ in range(5):
+            previous = client.retry_policy.compute_delay(previous)
+            delays.append(previous)
+
+        assert all(0.5 <= delay <= client.retry_policy.max_delay for delay in delays)
+
+    @patch("time.sleep")
+    @patch("requests.Session.request")
+    def test_retry_after_honoured(self, mock_request: Mock, mock_sleep: Mock) -> None:
+        """Test 429 responses are retried after the server's Retry-After."""
+        throttled = Mock(ok=False, status_code=429, headers={"Retry-After": "2"})
+        throttled.content = json.dumps({"message": "Too many requests"}).encode()
+        mock_request.side_effect = [
+            throttled,
+            Mock(ok=True, content=json.dumps({"a": 1}).encode()),
+        ]
+
+        assert self.client.get("/status_by_cid/1") == {"a": 1}
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("time.sleep")
+    @patch("requests.Session.request")
+    def test_retryable_status_exhausted(
+        self, mock_request: Mock, mock_sleep: Mock
+    ) -> None:
+        """Test exhausted 503 retries raise the APIError with retry_after."""
+        unavailable = Mock(ok=False, status_code=503, headers={"Retry-After": "1.5"})
+        unavailable.content = json.dumps({"message": "Maintenance"}).encode()
+        mock_request.return_value = unavailable
+
+        with pytest.raises(APIError) as exc_info:
+            self.client.get("/get_balance")
+
+        assert mock_request.call_count == 3
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.retry_after == 2
+        assert "Maintenance" in str(exc_info.value)
+
+    @patch("requests.Session.request")
+    def test_long_retry_after_not_retried(self, mock_request: Mock) -> None:
+        """Test a Retry-After beyond the policy cap is surfaced immediately."""
+        throttled = Mock(ok=False, status_code=429, headers={"Retry-After": "3600"})
+        throttled.content = json.dumps({}).encode()
+        mock_request.return_value = throttled
+
+        with pytest.raises(APIError) as exc_info:
+            self.client.get("/get_balance")
+
+        assert mock_request.call_count == 1
+        assert exc_info.value.retry_after == 3600
+
+    @patch("requests.Session.request")
+    def test_server_error_not_retried(self, mock_request: Mock) -> None:
+        """Test 500 responses are not retried."""
+        error = Mock(ok=False, status_code=500, headers={})
+        error.content = json.dumps({"message": "Boom"}).encode()
+        mock_request.return_value = error
 
-        client._exponential_backoff(1)
-        mock_sleep.assert_called_with(1.0)
+        with pytest.raises(APIError):
+            self.client.get("/get_balance")
 
-        client._exponential_backoff(2)
-        mock_sleep.assert_called_with(2.0)
+        assert mock_request.call_count == 1
+
+    @patch("requests.Session.request")
+    def test_retryable_status_without_retries(self, mock_request: Mock) -> None:
+        """Test a 502 with retries disabled raises APIError as before."""
+        client = HTTPClient("https://api.example.com", max_retries=0)
+        error = Mock(ok=False, status_code=502, headers={})
+        error.content = json.dumps({"message": "Bad gateway"}).encode()
+        mock_request.return_value = error
+
+        with pytest.raises(APIError) as exc_info:
+            client.get("/get_balance")
+
+        assert exc_info.value.status_code == 502
+        assert exc_info.value.retry_after is None
+        assert mock_request.call_count == 1
+
+    @patch("time.sleep")
+    @patch("requests.Session.request")
+    def test_retry_budget_limits_retries(
+        self, mock_request: Mock, mock_sleep: Mock
+    ) -> None:
+        """Test an exhausted retry budget stops further retries."""
+        policy = RetryPolicy(
+            max_retries=3,
+            base_delay=0,
+            budget=RetryBudget(ratio=0, min_retries_per_second=0.1, ttl=10),
+        )
+        client = HTTPClient("https://api.example.com", retry_policy=policy)
+        mock_request.side_effect = ConnectionError("down")
+
+        with pytest.raises(NetworkError):
+            client.get("/test")
+        assert mock_request.call_count == 2  # one retry allowed by the budget
+
+        mock_request.reset_mock()
+        with pytest.raises(NetworkError):
+            client.get("/test")
+        assert mock_request.call_count == 1
 
     def test_should_retry_logic(self) -> None:
         """Test retry decision logic."""
@@ -229,10 +369,10 @@ class TestHTTPClient:
         # Should not retry on other exceptions
         assert self.client._should_retry(ValueError(), 0) is False
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_url_construction(self, mock_request: Mock) -> None:
         """Test URL construction with different endpoint formats."""
-        mock_response = Mock(ok=True, json=lambda: {})
+        mock_response = Mock(ok=True, content=json.dumps({}).encode())
         mock_request.return_value = mock_response
 
         # Test with leading slash
@@ -242,7 +382,7 @@ class TestHTTPClient:
             url="https://api.example.com/api/test",
             headers={},
             params=None,
-            json=None,
+            data=None,
             timeout=30,
         )
 
@@ -253,14 +393,14 @@ class TestHTTPClient:
             url="https://api.example.com/api/test",
             headers={},
             params=None,
-            json=None,
+            data=None,
             timeout=30,
         )
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_content_type_header(self, mock_request: Mock) -> None:
         """Test Content-Type header is set for POST with data."""
-        mock_response = Mock(ok=True, json=lambda: {})
+        mock_response = Mock(ok=True, content=json.dumps({}).encode())
         mock_request.return_value = mock_response
 
         # POST with data should set Content-Type
@@ -279,3 +419,40 @@ class TestHTTPClient:
         )
         args, kwargs = mock_request.call_args
         assert kwargs["headers"]["Content-Type"] == "custom"
+
+    def test_session_pool_configuration(self) -> None:
+        """Test the session mounts a sized, reusable connection pool."""
+        client = HTTPClient(
+            "https://api.example.com",
+            pool_connections=4,
+            pool_maxsize=32,
+            pool_block=True,
+        )
+
+        adapter = client.session.get_adapter("https://api.example.com/test")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+        assert client.session.headers["Connection"] == "keep-alive"
+
+    @patch("requests.Session.request")
+    def test_session_reused_across_requests(self, mock_request: Mock) -> None:
+        """Test every request goes through the same long-lived session."""
+        mock_request.return_value = Mock(ok=True, content=json.dumps({}).encode())
+        session = self.client.session
+
+        self.client.get("/one")
+        self.client.post("/two", data={"key": "value"})
+
+        assert self.client.session is session
+        assert mock_request.call_count == 2
+
+    def test_close_and_context_manager(self) -> None:
+        """Test close() releases the session, also via context manager."""
+        with patch("requests.Session.close") as mock_close:
+            with HTTPClient("https://api.example.com") as client:
+                assert isinstance(client, HTTPClient)
+            mock_close.assert_called_once()
+
+            client.close()
+            assert mock_close.call_count == 2
@@ -0,0 +1,97 @@
+"""Tests for lazily decoded response models."""
+
+import pickle
+from dataclasses import replace
+from typing import Any, Dict, List
+
+import pytest
+
+from steadfast.models import Payment
+from steadfast.modules.payment import LazyPayment
+from steadfast.lazy import LazyList
+
+
+class TestLazyModel:
+    """Test models that decode fields on first read."""
+
+    def test_fields_decoded_on_first_read(self) -> None:
+        """Test a field is decoded once and then stored."""
+        item = {"id": 7, "amount": "12.5"}
+        payment = LazyPayment(item)
+
+        assert payment.amount == 12.5
+        item["amount"] = "99"
+        assert payment.amount == 12.5
+        assert payment.id == 7
+        assert payment.created_at is None
+
+    def test_behaves_like_model(self) -> None:
+        """Test lazy instances are model instances with the usual repr."""
+        payment = LazyPayment({"id": 1, "amount": 3})
+
+        assert isinstance(payment, Payment)
+        assert repr(payment) == (
+            "LazyPayment(id=1, amount=3.0, created_at=None, updated_at=None)"
+        )
+        assert payment == LazyPayment({"id": 1, "amount": 3})
+        assert pickle.loads(pickle.dumps(payment)) == payment
+
+    def test_equal_to_eager_model(self) -> None:
+        """Test lazy and eager instances with the same fields are equal."""
+        lazy = LazyPayment({"id": 1, "amount": "2.5"})
+        eager = Payment(id=1, amount=2.5)
+
+        assert lazy == eager
+        assert eager == lazy
+        assert lazy != Payment(id=1, amount=3.0)
+        assert Payment(id=2, amount=2.5) != lazy
+
+    def test_replace(self) -> None:
+        """Test dataclasses.replace() builds a lazy instance from fields."""
+        lazy = LazyPayment({"id": 1, "amount": 2, "created_at": "2026-01-01"})
+
+        changed = replace(lazy, amount=3.0)
+
+        assert isinstance(changed, LazyPayment)
+        assert changed == Payment(id=1, amount=3.0, created_at="2026-01-01")
+        assert lazy.amount == 2.0
+        with pytest.raises(TypeError):
+            LazyPayment({"id": 1}, amount=3.0)
+
+    def test_unknown_attribute(self) -> None:
+        """Test names that are not fields still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            LazyPayment({}).reference  # type: ignore[attr-defined]
+
+
+class TestLazyList:
+    """Test LazyList."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.built: List[Dict[str, Any]] = []
+
+        def build(item: Dict[str, Any]) -> int:
+            self.built.append(item)
+            return int(item["n"])
+
+        self.items = LazyList([{"n": i} for i in range(5)], build)
+
+    def test_items_built_on_access(self) -> None:
+        """Test only the items read are built, and each only once."""
+        assert len(self.items) == 5
+        assert self.built == []
+
+        assert self.items[3] == 3
+        assert self.items[-2] == 3
+        assert self.built == [{"n": 3}]
+
+    def test_sequence_interface(self) -> None:
+        """Test iteration, slicing and comparison with lists."""
+        assert list(self.items) == [0, 1, 2, 3, 4]
+        assert self.items[1:3] == [1, 2]
+        assert self.items == [0, 1, 2, 3, 4]
+        assert 4 in self.items
+        assert repr(self.items) == "[0, 1, 2, 3, 4]"
+        with pytest.raises(IndexError):
+            self.items[5]
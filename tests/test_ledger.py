@@ -0,0 +1,135 @@
+"""Tests for the local order ledger."""
+
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from steadfast.exceptions import ValidationError
+from steadfast.ledger import OrderLedger
+from steadfast.models import BulkOrderResult, Order
+
+
+def make_order(invoice: str, consignment_id: int, tracking_code: str) -> Order:
+    """Build a created Order."""
+    return Order(
+        consignment_id=consignment_id,
+        invoice=invoice,
+        tracking_code=tracking_code,
+        recipient_name="John Smith",
+        recipient_phone="01234567890",
+        recipient_address="House 123, Dhaka",
+        cod_amount=1060.0,
+        status="in_review",
+    )
+
+
+class TestOrderLedger:
+    """Test OrderLedger."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.ledger = OrderLedger()
+
+    def teardown_method(self) -> None:
+        """Close the ledger."""
+        self.ledger.close()
+
+    def test_lookup_by_every_identifier(self) -> None:
+        """Test an order can be found by invoice, consignment ID or tracking code."""
+        assert self.ledger.record(make_order("ORD-1", 1424107, "15BAEB8A"))
+
+        by_invoice = self.ledger.get_by_invoice("ORD-1")
+        assert by_invoice is not None
+        assert by_invoice.consignment_id == 1424107
+        assert by_invoice.tracking_code == "15BAEB8A"
+        assert by_invoice.cod_amount == 1060.0
+        assert self.ledger.get_by_consignment_id(1424107) == by_invoice
+        assert self.ledger.get_by_tracking_code("15BAEB8A") == by_invoice
+        assert self.ledger.get("15BAEB8A", "tracking_code") == by_invoice
+
+    def test_missing_order(self) -> None:
+        """Test unknown identifiers return None."""
+        assert self.ledger.get_by_invoice("NOPE") is None
+        assert "NOPE" not in self.ledger
+        assert len(self.ledger) == 0
+
+    def test_failed_bulk_results_are_ignored(self) -> None:
+        """Test only results with a consignment ID are recorded."""
+        results = [
+            BulkOrderResult("A", "n", "a", "01711111111", 1.0, consignment_id=1),
+            BulkOrderResult("B", "n", "a", "01711111111", 1.0, error="Bad phone"),
+        ]
+
+        assert self.ledger.record_many(results) == 1
+        assert "A" in self.ledger
+        assert "B" not in self.ledger
+
+    def test_rerecording_replaces_entry(self) -> None:
+        """Test recording an invoice again keeps one, updated entry."""
+        self.ledger.record(make_order("ORD-1", 1, "AAA"))
+        self.ledger.record(make_order("ORD-1", 2, "BBB"))
+
+        assert len(self.ledger) == 1
+        assert self.ledger.get_by_consignment_id(1) is None
+        assert self.ledger.get_by_consignment_id(2) is not None
+
+    def test_conflicting_identifiers_raise(self) -> None:
+        """Test a consignment ID recorded for another invoice is not overwritten."""
+        self.ledger.record(make_order("ORD-1", 1, "AAA"))
+        self.ledger.record(make_order("ORD-2", 2, "BBB"))
+
+        with pytest.raises(sqlite3.IntegrityError):
+            self.ledger.record_many(
+                [make_order("ORD-3", 3, "CCC"), make_order("ORD-1", 2, "AAA")]
+            )
+
+        assert len(self.ledger) == 2
+        assert self.ledger.get_by_consignment_id(2) == self.ledger.get("ORD-2")
+
+    def test_reserve_is_exclusive(self) -> None:
+        """Test a reserved, pending or recorded invoice cannot be reserved again."""
+        assert self.ledger.reserve(["ORD-1", "ORD-2"], "k1") == set()
+        assert self.ledger.reserve(["ORD-2", "ORD-3"], "k2") == {"ORD-2"}
+        assert self.ledger.get_pending(["ORD-3"]) == set()
+
+        self.ledger.release(["ORD-1", "ORD-2"])
+        assert self.ledger.reserve(["ORD-2"], "k2") == {"ORD-2"}
+        assert self.ledger.reserve(["ORD-2"], "k2", takeover=["ORD-2"]) == set()
+
+        self.ledger.record(make_order("ORD-4", 4, "DDD"))
+        assert self.ledger.reserve(["ORD-4"], "k3", takeover=["ORD-4"]) == {"ORD-4"}
+
+    def test_reserve_repeated_invoice(self) -> None:
+        """Test an invoice repeated in one submission is reserved once."""
+        assert self.ledger.reserve(["ORD-1", "ORD-1"], "k1") == set()
+        assert self.ledger.get_pending(["ORD-1"]) == {"ORD-1"}
+        assert self.ledger.reserve(["ORD-1"], "k2") == {"ORD-1"}
+
+    def test_get_many(self) -> None:
+        """Test batched lookups return only the recorded invoices."""
+        self.ledger.record_many(
+            make_order(f"ORD-{i}", i, f"T{i}") for i in range(0, 1200, 2)
+        )
+
+        found = self.ledger.get_many(f"ORD-{i}" for i in range(1200))
+
+        assert len(found) == 600
+        assert found["ORD-10"].consignment_id == 10
+        assert "ORD-11" not in found
+
+    def test_invalid_identifier_type(self) -> None:
+        """Test unknown identifier types are rejected."""
+        with pytest.raises(ValidationError):
+            self.ledger.get("x", "phone")
+
+    def test_persists_to_file(self) -> None:
+        """Test a file-backed ledger survives reopening."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ledger.db")
+            with OrderLedger(path) as ledger:
+                ledger.record(make_order("ORD-1", 1, "AAA"))
+
+            with OrderLedger(path) as ledger:
+                assert "ORD-1" in ledger
@@ -3,7 +3,7 @@
 from unittest.mock import Mock
 import pytest
 from steadfast.modules.location import LocationModule
-from steadfast.models import PoliceStationList
+from steadfast.models import PoliceStation, PoliceStationList
 from steadfast.exceptions import APIError
 
 
@@ -149,3 +149,19 @@ class TestLocationGetPoliceStations:
         assert result.data[0].id == 1
         assert result.data[99].id == 100
         assert result.data[50].name == "Station 51"
+
+    def test_get_police_stations_lazy(
+        self, location_module: LocationModule, mock_http_client: Mock
+    ) -> None:
+        """Test lazy mode builds stations only when they are read."""
+        data = [{"id": i, "name": f"Station {i}"} for i in range(1, 101)]
+        mock_http_client.get.return_value = {"data": data}
+
+        result = location_module.get_police_stations(lazy=True)
+
+        assert len(result.data) == 100
+        assert result.data[50].name == "Station 51"
+        assert result.data[50].location == ""
+        assert isinstance(result.data[50], PoliceStation)
+        assert [station.id for station in result.data][-1] == 100
+        assert result == location_module.get_police_stations()
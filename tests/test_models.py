@@ -1,9 +1,17 @@
 """Tests for data models."""
 
+import pickle
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
 from steadfast.models import (
     Order,
     BulkOrderResult,
     BulkOrderResponse,
+    OrderValidationReport,
+    RejectedOrder,
+    ValidationIssue,
     OrderStatus,
     Balance,
     ReturnRequest,
@@ -13,8 +21,23 @@ from steadfast.models import (
     PaymentList,
     PoliceStation,
     PoliceStationList,
+    FrozenOrder,
+    FrozenBulkOrderResult,
+    FrozenOrderStatus,
+    FrozenReturnRequest,
+    FrozenPayment,
+    FrozenPoliceStation,
 )
 
+SLOTTED = [
+    (Order, FrozenOrder),
+    (BulkOrderResult, FrozenBulkOrderResult),
+    (OrderStatus, FrozenOrderStatus),
+    (ReturnRequest, FrozenReturnRequest),
+    (Payment, FrozenPayment),
+    (PoliceStation, FrozenPoliceStation),
+]
+
 
 class TestOrder:
     """Test Order dataclass."""
@@ -125,6 +148,31 @@ class TestBulkOrderResponse:
         assert response.results[1].status == "error"
 
 
+class TestOrderValidationReport:
+    """Test OrderValidationReport dataclass."""
+
+    def test_issues_are_flattened_in_order(self) -> None:
+        """Test issues from every rejected order are listed together."""
+        first = ValidationIssue(index=1, field="invoice", message="bad")
+        second = ValidationIssue(index=1, field="cod_amount", message="bad")
+        third = ValidationIssue(index=3, field="recipient_phone", message="bad")
+        report = OrderValidationReport(
+            valid_orders=[{"invoice": "ORD-001"}],
+            rejected=[
+                RejectedOrder(index=1, order={}, issues=[first, second]),
+                RejectedOrder(index=3, order={}, issues=[third]),
+            ],
+        )
+        assert not report.is_valid
+        assert report.issues == [first, second, third]
+
+    def test_empty_report_is_valid(self) -> None:
+        """Test a report without rejected orders is valid."""
+        report = OrderValidationReport(valid_orders=[], rejected=[])
+        assert report.is_valid
+        assert report.issues == []
+
+
 class TestOrderStatus:
     """Test OrderStatus dataclass."""
 
@@ -228,3 +276,48 @@ class TestPoliceStationList:
         station_list = PoliceStationList(data=[station])
         assert len(station_list.data) == 1
         assert station_list.data[0].name == "Dhanmondi PS"
+
+
+class TestSlottedModels:
+    """Test the slotted high-volume models and their frozen variants."""
+
+    @pytest.mark.parametrize("model", [model for pair in SLOTTED for model in pair])
+    def test_no_instance_dict(self, model: type) -> None:
+        """Test instances carry no per-instance __dict__."""
+        assert "__dict__" not in dir(model)
+        assert "__slots__" in vars(model)
+
+    def test_constructor_and_defaults_unchanged(self) -> None:
+        """Test keyword construction and defaults behave as before."""
+        request = ReturnRequest(id=1, user_id=2, consignment_id=3)
+        assert request.status == "pending"
+        assert request.reason is None
+
+        result = BulkOrderResult("INV-1", "John", "Dhaka", "01234567890", 100.0)
+        assert result.status == "error"
+        result.status = "success"
+        assert replace(result, consignment_id=9).consignment_id == 9
+
+    def test_unknown_attribute_rejected(self) -> None:
+        """Test attributes outside the fields cannot be added."""
+        status = OrderStatus(status=200, delivery_status="pending")
+        with pytest.raises(AttributeError):
+            status.extra = 1  # type: ignore[attr-defined]
+
+    def test_frozen_variant(self) -> None:
+        """Test frozen variants are immutable, hashable and equal by value."""
+        status = FrozenOrderStatus(status=200, delivery_status="delivered")
+        with pytest.raises(FrozenInstanceError):
+            status.delivery_status = "cancelled"  # type: ignore[misc]
+
+        assert status == FrozenOrderStatus(200, "delivered")
+        assert len({status, FrozenOrderStatus(200, "delivered")}) == 1
+        assert FrozenReturnRequest(id=1, user_id=2, consignment_id=3).status == (
+            "pending"
+        )
+
+    @pytest.mark.parametrize("model", [OrderStatus, FrozenOrderStatus])
+    def test_pickle_round_trip(self, model: type) -> None:
+        """Test slotted and frozen instances survive pickling."""
+        status = model(status=200, delivery_status="in_review")
+        assert pickle.loads(pickle.dumps(status)) == status
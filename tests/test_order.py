@@ -1,12 +1,25 @@
 """Tests for Order module."""
 
-from unittest.mock import Mock
+import json
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from unittest.mock import ANY, Mock, patch
 
 import pytest
+from requests.exceptions import ConnectionError, Timeout
 
-from steadfast.modules.order import OrderModule
+from steadfast.columnar import BulkOrderColumns
+from steadfast.http_client import HTTPClient
+from steadfast.ledger import OrderLedger
+from steadfast.modules.order import OrderModule, idempotency_key
 from steadfast.models import Order, BulkOrderResponse
-from steadfast.exceptions import ValidationError, APIError
+from steadfast.exceptions import (
+    APIError,
+    DuplicateOrderError,
+    NetworkError,
+    ValidationError,
+)
+from steadfast.retry import RetryPolicy
+from steadfast.validators import validate_order
 
 
 class TestOrderModule:
@@ -68,6 +81,8 @@ class TestOrderModule:
                 "delivery_type": 0,
                 "note": "Test note",
             },
+            headers={"Idempotency-Key": idempotency_key(["ORD-001"])},
+            before_retry=ANY,
         )
 
     def test_create_order_with_optional_fields(self) -> None:
@@ -316,3 +331,608 @@ class TestOrderModule:
         assert validated["note"] == "Test note"
         assert validated["item_description"] == "Electronics"
         assert validated["total_lot"] == 1
+
+
+def make_orders(count: int, prefix: str = "INV") -> List[Dict[str, Any]]:
+    """Build ``count`` valid order dictionaries."""
+    return [
+        {
+            "invoice": f"{prefix}-{i}",
+            "recipient_name": f"Customer {i}",
+            "recipient_phone": "01711111111",
+            "recipient_address": f"Address {i}, Dhaka",
+            "cod_amount": i,
+        }
+        for i in range(count)
+    ]
+
+
+def echo_bulk_response(
+    endpoint: str, data: Dict[str, Any], **kwargs: Any
+) -> Dict[str, Any]:
+    """Answer a bulk request with one success result per submitted order."""
+    return {
+        "results": [
+            dict(order, consignment_id=1000 + order["cod_amount"], status="success")
+            for order in data["orders"]
+        ]
+    }
+
+
+class TestOrderModuleChunkedBulk:
+    """Test OrderModule.create_bulk_many."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_http_client = Mock()
+        self.mock_http_client.post.side_effect = echo_bulk_response
+        self.order_module = OrderModule(self.mock_http_client)
+
+    def test_splits_into_chunks_in_input_order(self) -> None:
+        """Test orders are chunked and merged back in input order."""
+        orders = make_orders(1201)
+
+        response = self.order_module.create_bulk_many(orders, concurrency=3)
+
+        assert self.mock_http_client.post.call_count == 3
+        assert [r.invoice for r in response.results] == [o["invoice"] for o in orders]
+        assert [(c.index, c.start, c.size) for c in response.chunks] == [
+            (0, 0, 500),
+            (1, 500, 500),
+            (2, 1000, 201),
+        ]
+        assert all(c.error is None and c.elapsed >= 0 for c in response.chunks)
+
+    def test_failed_chunk_does_not_abort_others(self) -> None:
+        """Test a failing chunk yields error results while others succeed."""
+
+        def post(endpoint: str, data: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+            if data["orders"][0]["invoice"] == "INV-2":
+                raise APIError("Upstream failure", 502)
+            return echo_bulk_response(endpoint, data)
+
+        self.mock_http_client.post.side_effect = post
+
+        response = self.order_module.create_bulk_many(make_orders(6), chunk_size=2)
+
+        statuses = [r.status for r in response.results]
+        assert statuses == [
+            "success",
+            "success",
+            "error",
+            "error",
+            "success",
+            "success",
+        ]
+        assert response.results[2].invoice == "INV-2"
+        assert "Upstream failure" in (response.results[2].error or "")
+        assert response.chunks[1].error is not None
+        assert response.chunks[0].error is None
+
+    def test_columnar_results(self) -> None:
+        """Test columnar=True loads raw results without parsing row objects."""
+
+        def post(endpoint: str, data: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+            if data["orders"][0]["invoice"] == "INV-2":
+                raise APIError("Upstream failure", 502)
+            return echo_bulk_response(endpoint, data)
+
+        self.mock_http_client.post.side_effect = post
+
+        with patch.object(
+            OrderModule, "_parse_bulk_response", side_effect=AssertionError
+        ):
+            response = self.order_module.create_bulk_many(
+                make_orders(6), chunk_size=2, columnar=True
+            )
+
+        columns = response.results
+        assert isinstance(columns, BulkOrderColumns)
+        assert columns.invoice == [f"INV-{i}" for i in range(6)]
+        assert columns.status == ["success", "success", "error", "error"] + [
+            "success",
+            "success",
+        ]
+        assert list(columns.consignment_id) == [1000, 1001, 0, 0, 1004, 1005]
+        assert [r.invoice for r in columns.failed()] == ["INV-2", "INV-3"]
+        assert columns.by_invoice()["INV-5"].consignment_id == 1005
+
+    def test_invalid_order_rejected(self) -> None:
+        """Test an invalid order is rejected without failing its chunk."""
+        orders = make_orders(4)
+        orders[3]["recipient_phone"] = "123"
+
+        response = self.order_module.create_bulk_many(orders, chunk_size=2)
+
+        assert [r.invoice for r in response.results] == ["INV-0", "INV-1", "INV-2"]
+        assert [r.index for r in response.rejected] == [3]
+        assert [i.field for i in response.rejected[0].issues] == ["recipient_phone"]
+        assert response.rejected[0].issues[0].index == 3
+        assert response.chunks[1].error is None
+        assert self.mock_http_client.post.call_count == 2
+
+    @pytest.mark.parametrize(
+        "kwargs,field",
+        [
+            ({"chunk_size": 0}, "chunk_size"),
+            ({"chunk_size": 501}, "chunk_size"),
+            ({"concurrency": 0}, "concurrency"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: Dict[str, int], field: str) -> None:
+        """Test out-of-range arguments are rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            self.order_module.create_bulk_many(make_orders(1), **kwargs)
+        assert exc_info.value.field == field
+
+    def test_empty_orders(self) -> None:
+        """Test an empty order list is rejected."""
+        with pytest.raises(ValidationError):
+            self.order_module.create_bulk_many([])
+
+
+class TestOrderModuleBulkStream:
+    """Test OrderModule.create_bulk_stream."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_http_client = Mock()
+        self.mock_http_client.post.side_effect = echo_bulk_response
+        self.order_module = OrderModule(self.mock_http_client)
+
+    def test_consumes_input_lazily(self) -> None:
+        """Test orders are pulled one chunk at a time."""
+        pulled: List[int] = []
+
+        def generate() -> Iterator[Dict[str, Any]]:
+            for i, order in enumerate(make_orders(7)):
+                pulled.append(i)
+                yield order
+
+        stream = self.order_module.create_bulk_stream(generate(), chunk_size=3)
+
+        assert pulled == []
+        assert next(stream).invoice == "INV-0"
+        assert len(pulled) == 3
+        assert [r.invoice for r in stream] == [f"INV-{i}" for i in range(1, 7)]
+        assert self.mock_http_client.post.call_count == 3
+
+    def test_concurrent_results_in_input_order(self) -> None:
+        """Test results keep input order with several chunks in flight."""
+        results = list(
+            self.order_module.create_bulk_stream(
+                iter(make_orders(10)), chunk_size=2, concurrency=3
+            )
+        )
+
+        assert [r.invoice for r in results] == [f"INV-{i}" for i in range(10)]
+        assert all(r.status == "success" for r in results)
+
+    def test_invalid_order_yields_error(self) -> None:
+        """Test an invalid order yields an error result in its own row only."""
+        orders = make_orders(4)
+        orders[1]["recipient_phone"] = "123"
+
+        results = list(self.order_module.create_bulk_stream(orders, chunk_size=2))
+
+        assert [r.status for r in results] == ["success", "error", "success", "success"]
+        assert results[1].invoice == "INV-1"
+        assert (results[1].error or "").startswith("recipient_phone: ")
+
+    def test_invalid_arguments_raise_immediately(self) -> None:
+        """Test argument errors are raised before iteration starts."""
+        with pytest.raises(ValidationError):
+            self.order_module.create_bulk_stream(make_orders(1), chunk_size=0)
+
+    def test_empty_input(self) -> None:
+        """Test an empty iterable yields nothing and sends nothing."""
+        assert list(self.order_module.create_bulk_stream(iter([]))) == []
+        self.mock_http_client.post.assert_not_called()
+
+
+class TestOrderModuleValidationReport:
+    """Test error-collecting bulk validation."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_http_client = Mock()
+        self.mock_http_client.post.side_effect = echo_bulk_response
+        self.order_module = OrderModule(self.mock_http_client)
+
+    def test_validate_bulk_collects_every_issue(self) -> None:
+        """Test all failing fields of all orders are reported."""
+        orders = make_orders(4)
+        orders[1]["recipient_phone"] = "123"
+        orders[1]["cod_amount"] = -5
+        orders[3]["invoice"] = "INV 3!"
+        orders[3]["recipient_email"] = "not-an-email"
+        del orders[3]["recipient_name"]
+
+        report = self.order_module.validate_bulk(orders)
+
+        assert [o["invoice"] for o in report.valid_orders] == ["INV-0", "INV-2"]
+        assert [r.index for r in report.rejected] == [1, 3]
+        assert report.rejected[0].order is orders[1]
+        assert [(i.index, i.field) for i in report.issues] == [
+            (1, "recipient_phone"),
+            (1, "cod_amount"),
+            (3, "invoice"),
+            (3, "recipient_name"),
+            (3, "recipient_email"),
+        ]
+        assert report.issues[1].message == "COD amount cannot be negative"
+        self.mock_http_client.post.assert_not_called()
+
+    def test_validate_bulk_matches_single_order_validation(self) -> None:
+        """Test valid orders are normalised like create_bulk normalises them."""
+        order = make_orders(1)[0]
+        order.update(recipient_phone="017-1111-1111", note="Fragile", total_lot=2)
+
+        report = self.order_module.validate_bulk([order])
+
+        assert report.is_valid
+        assert report.valid_orders == [self.order_module._validate_order(**order)]
+
+    def test_validate_bulk_missing_cod_amount_message(self) -> None:
+        """Test a missing COD amount is reported as create_bulk() reports it."""
+        order = make_orders(1)[0]
+        del order["cod_amount"]
+
+        report = self.order_module.validate_bulk([order])
+        with pytest.raises(ValidationError) as exc_info:
+            self.order_module._validate_order(**order)
+
+        assert [(i.field, i.message) for i in report.issues] == [
+            ("cod_amount", exc_info.value.message)
+        ]
+        self.mock_http_client.post.assert_not_called()
+
+    def test_repeated_invoice_rejected(self) -> None:
+        """Test an invoice repeated within one bulk list is not sent twice."""
+        orders = make_orders(3)
+        orders[2]["invoice"] = "INV-0"
+
+        response = self.order_module.create_bulk(orders, skip_invalid=True)
+
+        sent = self.mock_http_client.post.call_args.kwargs["data"]["orders"]
+        assert [o["invoice"] for o in sent] == ["INV-0", "INV-1"]
+        assert [(i.index, i.field) for i in response.rejected[0].issues] == [
+            (2, "invoice")
+        ]
+        with pytest.raises(ValidationError, match="Order 3: Invoice INV-0 appears"):
+            self.order_module.create_bulk(orders)
+
+    def test_validate_bulk_rejects_non_dict(self) -> None:
+        """Test entries that are not dictionaries are reported."""
+        report = self.order_module.validate_bulk(["INV-1"])  # type: ignore[list-item]
+
+        assert report.issues[0].field == "order"
+
+    def test_create_bulk_skip_invalid_submits_valid_subset(self) -> None:
+        """Test only valid orders are sent and the rest are returned."""
+        orders = make_orders(3)
+        orders[1]["recipient_phone"] = "123"
+
+        response = self.order_module.create_bulk(orders, skip_invalid=True)
+
+        sent = self.mock_http_client.post.call_args.kwargs["data"]["orders"]
+        assert [o["invoice"] for o in sent] == ["INV-0", "INV-2"]
+        assert [r.invoice for r in response.results] == ["INV-0", "INV-2"]
+        assert [r.index for r in response.rejected] == [1]
+        assert response.rejected[0].issues[0].field == "recipient_phone"
+
+    def test_create_bulk_skip_invalid_all_rejected(self) -> None:
+        """Test no request is made when every order is invalid."""
+        orders = make_orders(2)
+        for order in orders:
+            order["cod_amount"] = "free"
+
+        response = self.order_module.create_bulk(orders, skip_invalid=True)
+
+        assert response.results == []
+        assert len(response.rejected) == 2
+        self.mock_http_client.post.assert_not_called()
+
+    def test_create_bulk_skip_invalid_still_checks_size(self) -> None:
+        """Test list size limits still raise."""
+        with pytest.raises(ValidationError):
+            self.order_module.create_bulk([], skip_invalid=True)
+        with pytest.raises(ValidationError):
+            self.order_module.create_bulk(make_orders(501), skip_invalid=True)
+
+
+class TestOrderModuleLedger:
+    """Test OrderModule with a ledger."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_http_client = Mock()
+        self.mock_http_client.post.side_effect = echo_bulk_response
+        self.ledger = OrderLedger()
+        self.order_module = OrderModule(self.mock_http_client, self.ledger)
+
+    def test_create_records_and_blocks_resubmission(self) -> None:
+        """Test created orders are recorded and their invoice not resent."""
+        self.mock_http_client.post.side_effect = None
+        self.mock_http_client.post.return_value = {
+            "consignment_id": 1424107,
+            "invoice": "ORD-001",
+            "tracking_code": "15BAEB8A",
+            "recipient_name": "John Smith",
+            "recipient_phone": "01234567890",
+            "recipient_address": "House 123, Dhaka",
+            "cod_amount": 1060.0,
+        }
+        kwargs: Dict[str, Any] = dict(
+            invoice="ORD-001",
+            recipient_name="John Smith",
+            recipient_phone="01234567890",
+            recipient_address="House 123, Dhaka",
+            cod_amount=1060,
+        )
+
+        self.order_module.create(**kwargs)
+        with pytest.raises(ValidationError, match="consignment 1424107"):
+            self.order_module.create(**kwargs)
+
+        assert self.mock_http_client.post.call_count == 1
+        assert self.ledger.get_by_tracking_code("15BAEB8A") is not None
+
+    def test_bulk_skips_submitted_invoices(self) -> None:
+        """Test already submitted orders are not resent and keep their place."""
+        self.order_module.create_bulk(make_orders(3)[1:2])
+
+        response = self.order_module.create_bulk(make_orders(3))
+
+        sent: List[Dict[str, Any]] = self.mock_http_client.post.call_args[1]["data"]
+        assert [order["invoice"] for order in sent["orders"]] == ["INV-0", "INV-2"]
+        assert [r.status for r in response.results] == [
+            "success",
+            "duplicate",
+            "success",
+        ]
+        assert response.results[1].consignment_id == 1001
+        assert len(self.ledger) == 3
+
+    def test_bulk_all_submitted_makes_no_request(self) -> None:
+        """Test a batch of known invoices is answered locally."""
+        self.order_module.create_bulk(make_orders(2))
+        self.mock_http_client.post.reset_mock()
+
+        response = self.order_module.create_bulk(make_orders(2))
+
+        self.mock_http_client.post.assert_not_called()
+        assert [r.status for r in response.results] == ["duplicate", "duplicate"]
+
+    def test_bulk_columnar_records_and_keeps_duplicates(self) -> None:
+        """Test columnar results are recorded and duplicates keep their place."""
+        self.order_module.create_bulk(make_orders(3)[1:2])
+
+        response = self.order_module.create_bulk(make_orders(3), columnar=True)
+
+        assert isinstance(response.results, BulkOrderColumns)
+        assert response.results.status == ["success", "duplicate", "success"]
+        assert list(response.results.consignment_id) == [1000, 1001, 1002]
+        assert self.ledger.get_by_consignment_id(1002) is not None
+        assert len(self.ledger) == 3
+
+    def test_skip_invalid_with_duplicates(self) -> None:
+        """Test rejected and duplicate orders combine in one response."""
+        self.order_module.create_bulk(make_orders(1))
+        orders = make_orders(3)
+        orders[2]["recipient_phone"] = "123"
+
+        response = self.order_module.create_bulk(orders, skip_invalid=True)
+
+        assert [r.invoice for r in response.results] == ["INV-0", "INV-1"]
+        assert [r.status for r in response.results] == ["duplicate", "success"]
+        assert [r.index for r in response.rejected] == [2]
+
+
+def status_response(status_code: int) -> Mock:
+    """Build a status_by_invoice HTTP response."""
+    response = Mock(ok=status_code == 200, status_code=status_code, headers={})
+    if status_code == 200:
+        response.content = json.dumps(
+            {"status": 200, "delivery_status": "in_review"}
+        ).encode()
+    else:
+        response.content = json.dumps({"message": "Consignment not found"}).encode()
+    return response
+
+
+class TestOrderModuleIdempotency:
+    """Test retried order creation is confirmed before resending."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.http_client = HTTPClient(
+            "https://api.example.com",
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0),
+        )
+        self.ledger = OrderLedger()
+        self.order_module = OrderModule(self.http_client, self.ledger)
+        self.requests: List[Tuple[str, str, Any, Dict[str, str]]] = []
+
+    def serve(self, *responses: Any) -> Callable[..., Any]:
+        """Answer requests in turn, recording (method, path, json, headers)."""
+        queue = list(responses)
+
+        def request(method: str, url: str, **kwargs: Any) -> Any:
+            path = url.replace("https://api.example.com", "")
+            self.requests.append(
+                (
+                    method,
+                    path,
+                    kwargs["data"] and json.loads(kwargs["data"]),
+                    dict(kwargs["headers"]),
+                )
+            )
+            response = queue.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        return request
+
+    def test_create_sends_idempotency_key(self) -> None:
+        """Test order creation carries a key derived from the invoice."""
+        assert idempotency_key(["ORD-1"]) == idempotency_key(["ORD-1"])
+        assert idempotency_key(["ORD-1"]) != idempotency_key(["ORD-2"])
+
+        created = dict(make_orders(1)[0], consignment_id=7, tracking_code="T7")
+        with patch(
+            "requests.Session.request",
+            side_effect=self.serve(Mock(ok=True, content=json.dumps(created).encode())),
+        ):
+            self.order_module.create(**make_orders(1)[0])
+
+        assert self.requests[0][3]["Idempotency-Key"] == idempotency_key(["INV-0"])
+        assert self.ledger.get_pending(["INV-0"]) == set()
+
+    def test_create_not_resent_when_already_created(self) -> None:
+        """Test a timed-out create found by status_by_invoice is not resent."""
+        with patch(
+            "requests.Session.request",
+            side_effect=self.serve(Timeout("timed out"), status_response(200)),
+        ), pytest.raises(DuplicateOrderError, match="in_review") as exc_info:
+            self.order_module.create(**make_orders(1)[0])
+
+        assert exc_info.value.invoice == "INV-0"
+        assert exc_info.value.consignment_id is None
+        assert [(method, path) for method, path, _, _ in self.requests] == [
+            ("POST", "/create_order"),
+            ("GET", "/status_by_invoice/INV-0"),
+        ]
+        entry = self.ledger.get_by_invoice("INV-0")
+        assert entry is not None and entry.consignment_id is None
+        assert self.ledger.get_pending(["INV-0"]) == set()
+
+        with pytest.raises(DuplicateOrderError, match=r"submitted$"):
+            self.order_module.create(**make_orders(1)[0])
+
+    def test_create_resent_when_not_created(self) -> None:
+        """Test a timed-out create is resent once the API confirms it is missing."""
+        created = dict(make_orders(1)[0], consignment_id=7, tracking_code="T7")
+        with patch(
+            "requests.Session.request",
+            side_effect=self.serve(
+                Timeout("timed out"),
+                status_response(404),
+                Mock(ok=True, content=json.dumps(created).encode()),
+            ),
+        ):
+            order = self.order_module.create(**make_orders(1)[0])
+
+        assert order.consignment_id == 7
+        assert [method for method, _, _, _ in self.requests] == ["POST", "GET", "POST"]
+        assert self.requests[0][3] == self.requests[2][3]
+
+    def test_bulk_resends_only_missing_orders(self) -> None:
+        """Test a retried bulk request drops orders the API already created."""
+        orders = make_orders(2)
+        with patch(
+            "requests.Session.request",
+            side_effect=self.serve(
+                Timeout("timed out"),
+                status_response(200),
+                status_response(404),
+                Mock(
+                    ok=True,
+                    content=json.dumps(
+                        echo_bulk_response("", {"orders": [validate_order(orders[1])]})
+                    ).encode(),
+                ),
+            ),
+        ):
+            response = self.order_module.create_bulk(orders)
+
+        resent = self.requests[-1]
+        assert [order["invoice"] for order in resent[2]["orders"]] == ["INV-1"]
+        assert resent[3]["Idempotency-Key"] == idempotency_key(["INV-1"])
+        assert [r.status for r in response.results] == ["duplicate", "success"]
+        assert response.results[0].consignment_id is None
+        assert "INV-0" in self.ledger
+        assert self.ledger.get_pending(["INV-0", "INV-1"]) == set()
+
+    def test_bulk_retry_after_429_skips_lookup(self) -> None:
+        """Test a rate-limited bulk request is resent without status lookups."""
+        orders = make_orders(2)
+        limited = Mock(ok=False, status_code=429, headers={}, content=b"{}", text="")
+        with patch(
+            "requests.Session.request",
+            side_effect=self.serve(
+                limited,
+                Mock(
+                    ok=True,
+                    content=json.dumps(
+                        echo_bulk_response(
+                            "", {"orders": [validate_order(o) for o in orders]}
+                        )
+                    ).encode(),
+                ),
+            ),
+        ):
+            response = self.order_module.create_bulk(orders)
+
+        assert [(method, path) for method, path, _, _ in self.requests] == [
+            ("POST", "/create_bulk_order"),
+            ("POST", "/create_bulk_order"),
+        ]
+        assert [r.status for r in response.results] == ["success", "success"]
+
+    def test_unconfirmed_lookup_failure_stops_retry(self) -> None:
+        """Test a failed confirmation aborts instead of risking a duplicate."""
+        with patch(
+            "requests.Session.request",
+            side_effect=self.serve(
+                Timeout("timed out"),
+                ConnectionError("down"),
+                ConnectionError("down"),
+                ConnectionError("down"),
+            ),
+        ):
+            with pytest.raises(NetworkError, match="Could not confirm"):
+                self.order_module.create_bulk(make_orders(1))
+
+        assert [method for method, _, _, _ in self.requests].count("POST") == 1
+        assert self.ledger.get_pending(["INV-0"]) == {"INV-0"}
+
+    def test_pending_submission_checked_before_sending(self) -> None:
+        """Test an unconfirmed earlier submission is looked up before resending."""
+        # Left pending by an earlier run that stopped before the response
+        self.ledger.reserve(["INV-0"], idempotency_key(["INV-0"]))
+        self.ledger.release(["INV-0"])
+
+        with patch(
+            "requests.Session.request", side_effect=self.serve(status_response(200))
+        ):
+            response = self.order_module.create_bulk(make_orders(1))
+
+        assert [method for method, _, _, _ in self.requests] == ["GET"]
+        assert [r.status for r in response.results] == ["duplicate"]
+        assert self.ledger.get_pending(["INV-0"]) == set()
+
+    def test_submission_in_flight_is_duplicate(self) -> None:
+        """Test an invoice another caller is sending is not sent again."""
+        self.ledger.reserve(["INV-0"], idempotency_key(["INV-0"]))
+        created = echo_bulk_response(
+            "", {"orders": [validate_order(make_orders(2)[1])]}
+        )
+
+        with patch(
+            "requests.Session.request",
+            side_effect=self.serve(
+                status_response(404),
+                status_response(404),
+                Mock(ok=True, content=json.dumps(created).encode()),
+            ),
+        ):
+            with pytest.raises(DuplicateOrderError, match="being submitted"):
+                self.order_module.create(**make_orders(1)[0])
+            response = self.order_module.create_bulk(make_orders(2))
+
+        assert [method for method, _, _, _ in self.requests] == ["GET", "GET", "POST"]
+        assert [o["invoice"] for o in self.requests[-1][2]["orders"]] == ["INV-1"]
+        assert [r.status for r in response.results] == ["duplicate", "success"]
+        assert self.ledger.get_pending(["INV-0"]) == {"INV-0"}
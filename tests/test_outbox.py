@@ -0,0 +1,222 @@
+"""Tests for the order outbox."""
+
+import os
+import tempfile
+import time
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from steadfast.exceptions import (
+    APIError,
+    NetworkError,
+    NotFoundError,
+    ValidationError,
+)
+from steadfast.models import OutboxEntry
+from steadfast.modules.order import OrderModule, idempotency_key
+from steadfast.outbox import OrderOutbox
+from steadfast.retry import RetryPolicy
+
+
+def make_order(i: int) -> Dict[str, Any]:
+    """Build a valid order dictionary."""
+    return {
+        "invoice": f"INV-{i}",
+        "recipient_name": f"Customer {i}",
+        "recipient_phone": "01711111111",
+        "recipient_address": f"Address {i}, Dhaka",
+        "cod_amount": i,
+    }
+
+
+def bulk_response(endpoint: str, data: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+    """Answer a bulk request with one success result per order."""
+    return {
+        "results": [
+            dict(order, consignment_id=1000 + order["cod_amount"], status="success")
+            for order in data["orders"]
+        ]
+    }
+
+
+class TestOrderOutbox:
+    """Test OrderOutbox."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.http_client = Mock()
+        self.http_client.post.side_effect = bulk_response
+        self.http_client.get.side_effect = NotFoundError("Consignment not found")
+        self.results: List[OutboxEntry] = []
+        self.outbox = OrderOutbox(
+            OrderModule(self.http_client),
+            batch_size=2,
+            backoff=RetryPolicy(base_delay=5, max_delay=60, random_func=max),
+            on_result=self.results.append,
+        )
+
+    def teardown_method(self) -> None:
+        """Close the outbox."""
+        self.outbox.close()
+
+    def test_enqueue_is_local(self) -> None:
+        """Test enqueue stores the order without calling the API."""
+        entry_id = self.outbox.enqueue(make_order(1))
+
+        entry = self.outbox.get(entry_id)
+        assert entry is not None
+        assert (entry.invoice, entry.status, entry.attempts) == ("INV-1", "pending", 0)
+        assert self.outbox.pending_count == 1
+        self.http_client.post.assert_not_called()
+
+    def test_invalid_order_rejected_at_enqueue(self) -> None:
+        """Test invalid orders are refused and nothing is queued."""
+        bad = dict(make_order(2), recipient_phone="123")
+
+        with pytest.raises(ValidationError, match="Order 2"):
+            self.outbox.enqueue_many([make_order(1), bad])
+
+        assert self.outbox.pending_count == 0
+
+    def test_flush_sends_batches_and_records_results(self) -> None:
+        """Test flush sends up to batch_size orders and stores each outcome."""
+        self.outbox.enqueue_many([make_order(i) for i in range(3)])
+
+        assert self.outbox.flush() == 2
+        assert self.outbox.flush() == 1
+        assert self.outbox.flush() == 0
+
+        assert self.http_client.post.call_count == 2
+        sent = self.outbox.entries("sent")
+        assert [entry.consignment_id for entry in sent] == [1000, 1001, 1002]
+        assert [entry.invoice for entry in self.results] == ["INV-0", "INV-1", "INV-2"]
+
+    def test_network_failure_keeps_batch_and_backs_off(self) -> None:
+        """Test an unreachable API leaves orders queued with growing backoff."""
+        self.http_client.post.side_effect = NetworkError("Connection refused")
+        self.outbox.enqueue(make_order(1))
+
+        assert self.outbox.flush() == 0
+        assert self.outbox.flush() == 0
+
+        entry = self.outbox.entries()[0]
+        assert (entry.status, entry.attempts) == ("pending", 2)
+        assert "Connection refused" in (entry.error or "")
+        assert entry.idempotency_key == idempotency_key(["INV-1"])
+        assert self.outbox._delay == 15
+        assert self.results == []
+
+        self.http_client.post.side_effect = bulk_response
+        assert self.outbox.flush() == 1
+        assert self.outbox.entries()[0].status == "sent"
+        assert self.outbox._delay == 0
+        # Each resend was preceded by a lookup of the interrupted order
+        assert self.http_client.get.call_count == 2
+
+    def test_interrupted_order_found_is_not_resent(self) -> None:
+        """Test an interrupted order the API already has is marked sent."""
+        self.http_client.post.side_effect = NetworkError("Read timed out")
+        self.outbox.enqueue_many([make_order(1), make_order(2)])
+        self.outbox.flush()
+
+        self.http_client.post.side_effect = bulk_response
+
+        def get(endpoint: str) -> Dict[str, Any]:
+            if endpoint.endswith("INV-1"):
+                return {"status": 200, "delivery_status": "in_review"}
+            raise NotFoundError("Consignment not found")
+
+        self.http_client.get.side_effect = get
+        assert self.outbox.flush() == 2
+
+        sent = self.http_client.post.call_args.kwargs["data"]["orders"]
+        assert [order["invoice"] for order in sent] == ["INV-2"]
+        assert [e.status for e in self.outbox.entries()] == ["sent", "sent"]
+        assert [e.invoice for e in self.results] == ["INV-1", "INV-2"]
+
+    def test_server_errors_are_retried(self) -> None:
+        """Test 5xx responses keep the batch queued."""
+        self.http_client.post.side_effect = APIError("Bad gateway", 502)
+        self.outbox.enqueue(make_order(1))
+
+        self.outbox.flush()
+
+        assert self.outbox.pending_count == 1
+
+    def test_rejected_batch_fails(self) -> None:
+        """Test a 4xx response marks the batch failed instead of retrying."""
+        self.http_client.post.side_effect = APIError("Unprocessable", 422)
+        self.outbox.enqueue(make_order(1))
+
+        assert self.outbox.flush() == 1
+
+        entry = self.outbox.entries()[0]
+        assert entry.status == "failed"
+        assert "Unprocessable" in (entry.error or "")
+        assert self.results == [entry]
+
+    def test_rejected_batch_split_per_order(self) -> None:
+        """Test only the orders the API refuses are marked failed."""
+
+        def post(endpoint: str, data: Dict[str, Any], **kwargs: Any) -> Any:
+            if any(order["invoice"] == "INV-2" for order in data["orders"]):
+                raise APIError("Unprocessable", 422)
+            return bulk_response(endpoint, data)
+
+        self.http_client.post.side_effect = post
+        self.outbox.enqueue_many([make_order(1), make_order(2)])
+
+        assert self.outbox.flush() == 2
+
+        statuses = [(e.invoice, e.status) for e in self.outbox.entries()]
+        assert statuses == [("INV-1", "sent"), ("INV-2", "failed")]
+        assert self.http_client.post.call_count == 3
+
+    def test_per_order_errors_recorded(self) -> None:
+        """Test orders the API rejects individually are marked failed."""
+        self.http_client.post.side_effect = lambda endpoint, data, **kwargs: {
+            "results": [
+                dict(data["orders"][0], consignment_id=1, status="success"),
+                dict(data["orders"][1], status="error", error="Duplicate invoice"),
+            ]
+        }
+        self.outbox.enqueue_many([make_order(1), make_order(2)])
+
+        self.outbox.flush()
+
+        statuses = [(e.status, e.error) for e in self.outbox.entries()]
+        assert statuses == [("sent", None), ("failed", "Duplicate invoice")]
+
+    def test_survives_restart(self) -> None:
+        """Test queued orders are sent by a new outbox on the same file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "outbox.db")
+            first = OrderOutbox(OrderModule(self.http_client), path=path)
+            first.enqueue(make_order(1))
+            first._conn.close()
+
+            second = OrderOutbox(OrderModule(self.http_client), path=path)
+            assert second.flush() == 1
+            assert second.entries()[0].status == "sent"
+            second.close()
+
+    def test_background_worker(self) -> None:
+        """Test the worker drains the queue without explicit flushes."""
+        outbox = OrderOutbox(
+            OrderModule(self.http_client), batch_size=2, flush_interval=0.01
+        )
+        with outbox:
+            outbox.enqueue_many([make_order(i) for i in range(5)])
+            deadline = time.monotonic() + 5
+            while outbox.pending_count and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert outbox.pending_count == 0
+            assert len(outbox.entries("sent")) == 5
+
+    def test_invalid_batch_size(self) -> None:
+        """Test batch sizes above the bulk limit are rejected."""
+        with pytest.raises(ValidationError):
+            OrderOutbox(OrderModule(self.http_client), batch_size=501)
@@ -1,10 +1,18 @@
 """Tests for payment module."""
 
+import threading
 from unittest.mock import Mock
 import pytest
 from steadfast.modules.payment import PaymentModule
 from steadfast.models import PaymentDetails, PaymentList
-from steadfast.exceptions import ValidationError, NotFoundError, APIError
+from steadfast.exceptions import (
+    ValidationError,
+    NotFoundError,
+    APIError,
+    NetworkError,
+    CircuitOpenError,
+)
+from steadfast.retry import RetryPolicy
 
 
 @pytest.fixture
@@ -51,7 +59,24 @@ class TestPaymentList:
         assert result.data[0].amount == 5000.50
         assert result.data[1].id == 2
         assert result.data[1].amount == 3000.00
-        mock_http_client.get.assert_called_once_with("/payment/list")
+        mock_http_client.get.assert_called_once_with("/payment/list", params=None)
+
+    def test_list_lazy(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test lazy mode matches the eager result."""
+        mock_http_client.get.return_value = {
+            "data": [{"id": 1, "amount": "5000.50"}, {"id": 2, "amount": 30}]
+        }
+        eager = payment_module.list()
+
+        result = payment_module.list(lazy=True)
+
+        assert result.data == eager.data
+        assert list(result.data) == eager.data
+        assert result == eager
+        assert result.data[0].amount == 5000.50
+        assert result.data[1].created_at is None
 
     def test_list_empty(
         self, payment_module: PaymentModule, mock_http_client: Mock
@@ -118,6 +143,134 @@ class TestPaymentList:
         assert result.data[0].amount == 2500.75
 
 
+def payment_pages(mock_http_client: Mock, *pages: list) -> None:
+    """Serve each list of payment IDs as a Laravel-style page."""
+
+    def get(endpoint: str, params: dict) -> dict:
+        page = params["page"]
+        return {
+            "data": [
+                {"id": i, "amount": 100, "created_at": f"2026-01-{i:02d}T10:00:00Z"}
+                for i in pages[page - 1]
+            ],
+            "current_page": page,
+            "last_page": len(pages),
+        }
+
+    mock_http_client.get.side_effect = get
+
+
+class TestPaymentPagination:
+    """Tests for list pages and iter_payments."""
+
+    def test_list_page(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test list() requests the given page."""
+        mock_http_client.get.return_value = {"data": []}
+
+        payment_module.list(page=3)
+
+        mock_http_client.get.assert_called_once_with(
+            "/payment/list", params={"page": 3}
+        )
+        with pytest.raises(ValidationError):
+            payment_module.list(page=0)
+
+    def test_iter_payments_walks_every_page(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test every page is fetched in order until the last page."""
+        payment_pages(mock_http_client, [1, 2], [3, 4], [5])
+
+        payments = payment_module.iter_payments()
+
+        assert [p.id for p in payments] == [1, 2, 3, 4, 5]
+        assert payments.page == 3
+        assert payments.pages_fetched == 3
+        assert [c.kwargs["params"] for c in mock_http_client.get.call_args_list] == [
+            {"page": 1},
+            {"page": 2},
+            {"page": 3},
+        ]
+
+    def test_iter_payments_prefetches_next_page(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test the next page is requested while the current one is consumed."""
+        requested = {1: threading.Event(), 2: threading.Event()}
+        payment_pages(mock_http_client, [1, 2], [3])
+        serve = mock_http_client.get.side_effect
+
+        def get(endpoint: str, params: dict) -> dict:
+            requested[params["page"]].set()
+            return serve(endpoint, params)
+
+        mock_http_client.get.side_effect = get
+        payments = payment_module.iter_payments()
+
+        assert next(payments).id == 1
+        assert requested[2].wait(timeout=5)
+        assert [p.id for p in payments] == [2, 3]
+
+    def test_iter_payments_without_prefetch(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test prefetch=False fetches a page only when it is needed."""
+        payment_pages(mock_http_client, [1, 2], [3])
+
+        payments = payment_module.iter_payments(prefetch=False)
+
+        assert next(payments).id == 1
+        assert mock_http_client.get.call_count == 1
+        assert [p.id for p in payments] == [2, 3]
+
+    def test_iter_payments_resume_and_since(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test resuming from a page and skipping older payments."""
+        payment_pages(mock_http_client, [1, 2], [3, 4], [5, 6])
+
+        payments = payment_module.iter_payments(start_page=2, since="2026-01-04")
+
+        assert [p.id for p in payments] == [4, 5, 6]
+        assert mock_http_client.get.call_args_list[0].kwargs["params"] == {"page": 2}
+
+    def test_iter_payments_single_page_response(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test a response without pagination keys is a single page."""
+        mock_http_client.get.return_value = {"data": [{"id": 1}, {"id": 2}]}
+
+        assert [p.id for p in payment_module.iter_payments()] == [1, 2]
+        mock_http_client.get.assert_called_once()
+
+    def test_iter_payments_close_stops_early(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test closing the iterator stops it."""
+        payment_pages(mock_http_client, [1, 2], [3])
+        payments = payment_module.iter_payments()
+        next(payments)
+
+        payments.close()
+
+        with pytest.raises(StopIteration):
+            next(payments)
+
+    def test_iter_payments_invalid_arguments(
+        self, payment_module: PaymentModule
+    ) -> None:
+        """Test an invalid start page or since date is rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            payment_module.iter_payments(start_page=0)
+        assert exc_info.value.field == "start_page"
+
+        with pytest.raises(ValidationError) as exc_info:
+            payment_module.iter_payments(since="yesterday")
+        assert exc_info.value.field == "since"
+
+
 class TestPaymentGet:
     """Tests for get method."""
 
@@ -215,3 +368,119 @@ class TestPaymentGet:
         result = payment_module.get(1)
 
         assert result.amount == 7500.99
+
+
+def details_by_endpoint(mock_http_client: Mock, failures: dict) -> None:
+    """Serve payment details, raising the queued errors for each endpoint first."""
+
+    def get(endpoint: str) -> dict:
+        queued = failures.get(endpoint)
+        if queued:
+            raise queued.pop(0)
+        payment_id = int(endpoint.rsplit("/", 1)[1])
+        return {"id": payment_id, "amount": 100, "consignments": [{"id": 1}]}
+
+    mock_http_client.get.side_effect = get
+
+
+class TestPaymentGetMany:
+    """Tests for get_many method."""
+
+    no_wait = RetryPolicy(max_retries=2, base_delay=0, max_delay=0)
+
+    def test_get_many_fetches_every_payment(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test each payment's details are fetched once, with timing."""
+        details_by_endpoint(mock_http_client, {})
+
+        results = list(payment_module.get_many([3, 1, 2, 1], concurrency=2))
+
+        assert sorted(r.payment_id for r in results) == [1, 2, 3]
+        assert mock_http_client.get.call_count == 3
+        for result in results:
+            assert result.ok
+            assert isinstance(result.details, PaymentDetails)
+            assert result.details.id == result.payment_id
+            assert result.attempts == 1
+            assert result.elapsed >= 0
+
+    def test_get_many_retries_failed_fetch(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test a transient failure is retried for that payment only."""
+        details_by_endpoint(
+            mock_http_client,
+            {"/payment/2": [NetworkError("reset"), APIError("busy", 503)]},
+        )
+
+        results = {
+            r.payment_id: r
+            for r in payment_module.get_many([1, 2], retry_policy=self.no_wait)
+        }
+
+        assert results[1].attempts == 1
+        assert results[2].ok
+        assert results[2].attempts == 3
+        assert mock_http_client.get.call_count == 4
+
+    def test_get_many_reports_errors(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test permanent errors are not retried and retries are bounded."""
+        details_by_endpoint(
+            mock_http_client,
+            {
+                "/payment/1": [NotFoundError("Payment not found")],
+                "/payment/2": [NetworkError("down") for _ in range(5)],
+            },
+        )
+
+        results = {
+            r.payment_id: r
+            for r in payment_module.get_many([1, 2, 0], retry_policy=self.no_wait)
+        }
+
+        assert isinstance(results[1].error, NotFoundError)
+        assert results[1].attempts == 1
+        assert isinstance(results[2].error, NetworkError)
+        assert results[2].attempts == 3
+        assert isinstance(results[0].error, ValidationError)
+        assert not any(r.ok for r in results.values())
+
+    def test_get_many_does_not_retry_open_circuit(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test an open circuit is reported without refetching."""
+        details_by_endpoint(
+            mock_http_client,
+            {"/payment/1": [CircuitOpenError("open", "/payment/1", retry_after=5)]},
+        )
+
+        (result,) = payment_module.get_many([1], retry_policy=self.no_wait)
+
+        assert isinstance(result.error, CircuitOpenError)
+        assert result.attempts == 1
+        assert mock_http_client.get.call_count == 1
+
+    def test_get_many_reads_ids_lazily(
+        self, payment_module: PaymentModule, mock_http_client: Mock
+    ) -> None:
+        """Test only a bounded number of IDs is read ahead of the consumer."""
+        details_by_endpoint(mock_http_client, {})
+        read = []
+
+        def ids():
+            for payment_id in range(1, 1001):
+                read.append(payment_id)
+                yield payment_id
+
+        results = payment_module.get_many(ids(), concurrency=4)
+        next(results)
+
+        assert len(read) <= 8
+
+    def test_get_many_invalid_concurrency(self, payment_module: PaymentModule) -> None:
+        """Test concurrency below 1 is rejected."""
+        with pytest.raises(ValidationError):
+            payment_module.get_many([1], concurrency=0)
@@ -0,0 +1,197 @@
+"""Tests for client-side rate limiting."""
+
+import json
+import asyncio
+import os
+import tempfile
+import threading
+from typing import List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from steadfast.exceptions import ConfigurationError
+from steadfast.http_client import HTTPClient
+from steadfast.rate_limit import (
+    InMemoryBackend,
+    RateLimit,
+    RateLimiter,
+    SQLiteBackend,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimit:
+    """Test RateLimit configuration."""
+
+    def test_default_burst(self) -> None:
+        """Test burst defaults to the rate, with a minimum of one."""
+        assert RateLimit(rate=5).burst == 5
+        assert RateLimit(rate=0.5).burst == 1.0
+
+    def test_invalid_values(self) -> None:
+        """Test invalid limits are rejected."""
+        with pytest.raises(ConfigurationError):
+            RateLimit(rate=0)
+        with pytest.raises(ConfigurationError):
+            RateLimit(rate=1, burst=0.5)
+
+
+class TestRateLimiter:
+    """Test RateLimiter class."""
+
+    def setup_method(self) -> None:
+        """Set up limiter with a controllable clock."""
+        self.clock = FakeClock()
+        self.backend = InMemoryBackend(clock=self.clock)
+
+    def test_burst_then_wait(self) -> None:
+        """Test tokens are spent, then callers are told to wait."""
+        limiter = RateLimiter(rate=RateLimit(rate=2, burst=2), backend=self.backend)
+
+        assert limiter.reserve("/get_balance") == 0
+        assert limiter.reserve("/get_balance") == 0
+        assert limiter.reserve("/get_balance") == pytest.approx(0.5)
+        assert limiter.reserve("/get_balance") == pytest.approx(1.0)
+
+    def test_refill_over_time(self) -> None:
+        """Test the bucket refills at the configured rate."""
+        limiter = RateLimiter(rate=RateLimit(rate=1, burst=1), backend=self.backend)
+
+        assert limiter.reserve("/get_balance") == 0
+        self.clock.now += 1.0
+        assert limiter.reserve("/get_balance") == 0
+        assert limiter.reserve("/get_balance") == pytest.approx(1.0)
+
+    def test_endpoint_limits_longest_prefix(self) -> None:
+        """Test the most specific endpoint prefix applies."""
+        limiter = RateLimiter(
+            endpoint_limits={
+                "status_by_": 1,
+                "/status_by_cid": RateLimit(rate=1, burst=3),
+            },
+            backend=self.backend,
+        )
+
+        for _ in range(3):
+            assert limiter.reserve("/status_by_cid/1") == 0
+        assert limiter.reserve("/status_by_cid/2") > 0
+
+        assert limiter.reserve("/status_by_invoice/INV-1") == 0
+        assert limiter.reserve("/status_by_invoice/INV-2") > 0
+
+        # Unmatched endpoints are unlimited without a global limit
+        for _ in range(10):
+            assert limiter.reserve("/create_bulk_order") == 0
+
+    def test_global_and_endpoint_limits_combine(self) -> None:
+        """Test the longest wait across global and endpoint buckets wins."""
+        limiter = RateLimiter(
+            rate=RateLimit(rate=10, burst=10),
+            endpoint_limits={"/create_bulk_order": RateLimit(rate=1, burst=1)},
+            backend=self.backend,
+        )
+
+        assert limiter.reserve("/create_bulk_order") == 0
+        assert limiter.reserve("/create_bulk_order") == pytest.approx(1.0)
+        assert limiter.reserve("/get_balance") == 0
+
+    @patch("time.sleep")
+    def test_acquire_sleeps(self, mock_sleep: Mock) -> None:
+        """Test blocking acquire sleeps for the reserved wait."""
+        limiter = RateLimiter(rate=RateLimit(rate=4, burst=1), backend=self.backend)
+
+        assert limiter.acquire("/x") == 0
+        assert limiter.acquire("/x") == pytest.approx(0.25)
+        mock_sleep.assert_called_once_with(pytest.approx(0.25))
+
+    def test_acquire_async(self) -> None:
+        """Test async acquire waits on the event loop."""
+        limiter = RateLimiter(rate=RateLimit(rate=4, burst=1), backend=self.backend)
+        sleeps: List[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        async def run() -> None:
+            with patch("asyncio.sleep", fake_sleep):
+                await limiter.acquire_async("/x")
+                await limiter.acquire_async("/x")
+
+        asyncio.run(run())
+        assert sleeps == [pytest.approx(0.25)]
+
+    def test_namespace_isolates_buckets(self) -> None:
+        """Test different namespaces do not share tokens."""
+        limit = RateLimit(rate=1, burst=1)
+        first = RateLimiter(rate=limit, backend=self.backend, namespace="a")
+        second = RateLimiter(rate=limit, backend=self.backend, namespace="b")
+
+        assert first.reserve("/x") == 0
+        assert second.reserve("/x") == 0
+
+
+class TestSQLiteBackend:
+    """Test the shared SQLite backend."""
+
+    def test_state_shared_between_connections(self) -> None:
+        """Test two backends on one file draw from the same bucket."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "limits.db")
+            first = SQLiteBackend(path)
+            second = SQLiteBackend(path)
+            limit = RateLimit(rate=0.1, burst=2)
+
+            assert first.reserve("acct:*", limit) == 0
+            assert second.reserve("acct:*", limit) == 0
+            assert first.reserve("acct:*", limit) > 0
+
+            first.close()
+            second.close()
+
+    def test_acquire_async_reserves_off_the_loop(self) -> None:
+        """Test async acquire runs SQLite reservations in an executor."""
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = SQLiteBackend(os.path.join(tmp, "limits.db"))
+            limiter = RateLimiter(rate=RateLimit(rate=100, burst=5), backend=backend)
+            threads: List[int] = []
+            reserve = backend.reserve
+
+            def recording_reserve(key: str, limit: RateLimit) -> float:
+                threads.append(threading.get_ident())
+                return reserve(key, limit)
+
+            backend.reserve = recording_reserve  # type: ignore[method-assign]
+
+            async def run() -> int:
+                await limiter.acquire_async("/x")
+                return threading.get_ident()
+
+            loop_thread = asyncio.run(run())
+            backend.close()
+
+        assert threads and loop_thread not in threads
+
+
+class TestHTTPClientRateLimiting:
+    """Test HTTPClient integration."""
+
+    @patch("requests.Session.request")
+    def test_every_attempt_acquires(self, mock_request: Mock) -> None:
+        """Test the limiter is consulted for each request attempt."""
+        limiter = Mock(spec=RateLimiter)
+        client = HTTPClient("https://api.example.com", rate_limiter=limiter)
+        mock_request.return_value = Mock(ok=True, content=json.dumps({}).encode())
+
+        client.get("/status_by_cid/1")
+
+        limiter.acquire.assert_called_once_with("/status_by_cid/1")
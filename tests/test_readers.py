@@ -0,0 +1,93 @@
+"""Tests for streaming order readers."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from steadfast.exceptions import ValidationError
+from steadfast.readers import read_orders_csv, read_orders_jsonl
+
+CSV_TEXT = (
+    "invoice,recipient_name,recipient_phone,recipient_address,cod_amount,"
+    "delivery_type,note\n"
+    "INV-1,John Doe,01711111111,Dhaka,100,0,Leave at door\n"
+    "INV-2,Jane Doe,01722222222,Chittagong,250.5,1,\n"
+)
+
+
+class TestReadOrdersCSV:
+    """Test read_orders_csv."""
+
+    def test_reads_rows_from_file_object(self) -> None:
+        """Test rows become order dictionaries."""
+        orders = list(read_orders_csv(io.StringIO(CSV_TEXT)))
+
+        assert orders == [
+            {
+                "invoice": "INV-1",
+                "recipient_name": "John Doe",
+                "recipient_phone": "01711111111",
+                "recipient_address": "Dhaka",
+                "cod_amount": "100",
+                "delivery_type": 0,
+                "note": "Leave at door",
+            },
+            {
+                "invoice": "INV-2",
+                "recipient_name": "Jane Doe",
+                "recipient_phone": "01722222222",
+                "recipient_address": "Chittagong",
+                "cod_amount": "250.5",
+                "delivery_type": 1,
+            },
+        ]
+
+    def test_reads_path_lazily(self, tmp_path: Path) -> None:
+        """Test a path is opened and read one row at a time."""
+        path = tmp_path / "orders.csv"
+        path.write_text(CSV_TEXT, encoding="utf-8")
+
+        reader = read_orders_csv(str(path))
+
+        assert next(reader)["invoice"] == "INV-1"
+        assert next(reader)["invoice"] == "INV-2"
+        with pytest.raises(StopIteration):
+            next(reader)
+
+    def test_custom_delimiter(self) -> None:
+        """Test a non-comma delimiter."""
+        text = "invoice;cod_amount\nINV-1;10\n"
+
+        orders = list(read_orders_csv(io.StringIO(text), delimiter=";"))
+
+        assert orders == [{"invoice": "INV-1", "cod_amount": "10"}]
+
+
+class TestReadOrdersJSONL:
+    """Test read_orders_jsonl."""
+
+    def test_reads_lines(self, tmp_path: Path) -> None:
+        """Test each line becomes an order and blank lines are skipped."""
+        path = tmp_path / "orders.jsonl"
+        path.write_text(
+            '{"invoice": "INV-1", "cod_amount": 100}\n\n{"invoice": "INV-2"}\n',
+            encoding="utf-8",
+        )
+
+        orders = list(read_orders_jsonl(path))
+
+        assert orders == [{"invoice": "INV-1", "cod_amount": 100}, {"invoice": "INV-2"}]
+
+    def test_invalid_json(self) -> None:
+        """Test malformed lines report their line number."""
+        reader = read_orders_jsonl(io.StringIO('{"invoice": "INV-1"}\n{oops\n'))
+
+        assert next(reader) == {"invoice": "INV-1"}
+        with pytest.raises(ValidationError, match="Line 2"):
+            next(reader)
+
+    def test_non_object_line(self) -> None:
+        """Test lines that are not objects are rejected."""
+        with pytest.raises(ValidationError, match="Line 1: expected a JSON object"):
+            list(read_orders_jsonl(io.StringIO("[1, 2]\n")))
@@ -0,0 +1,131 @@
+"""Tests for retry policy and retry budget."""
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from steadfast.exceptions import ConfigurationError
+from steadfast.retry import RetryBudget, RetryPolicy
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetryBudget:
+    """Test RetryBudget class."""
+
+    def test_reserve_then_ratio(self) -> None:
+        """Test the minimum reserve, then the per-request ratio."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.1, min_retries_per_second=0.1, ttl=10, clock=clock)
+
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is False
+
+        for _ in range(10):
+            budget.record_request()
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is False
+
+    def test_window_expires(self) -> None:
+        """Test retries leave the window after ttl seconds."""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0, min_retries_per_second=0.1, ttl=10, clock=clock)
+
+        assert budget.try_withdraw() is True
+        assert budget.try_withdraw() is False
+        clock.now = 10.5
+        assert budget.try_withdraw() is True
+
+    def test_invalid_configuration(self) -> None:
+        """Test invalid budget settings are rejected."""
+        with pytest.raises(ConfigurationError):
+            RetryBudget(ratio=-1)
+        with pytest.raises(ConfigurationError):
+            RetryBudget(ttl=0)
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy class."""
+
+    def test_retryable_statuses(self) -> None:
+        """Test default retryable statuses."""
+        policy = RetryPolicy()
+
+        for status in (429, 502, 503, 504):
+            assert policy.is_retryable_status(status) is True
+        for status in (400, 401, 404, 500):
+            assert policy.is_retryable_status(status) is False
+
+    def test_decorrelated_jitter_bounds(self) -> None:
+        """Test each delay is drawn from [base, previous * 3], capped."""
+        calls = []
+
+        def fake_uniform(low: float, high: float) -> float:
+            calls.append((low, high))
+            return high
+
+        policy = RetryPolicy(base_delay=0.5, max_delay=3.0, random_func=fake_uniform)
+
+        assert policy.compute_delay(0.0) == 0.5
+        assert policy.compute_delay(0.5) == 1.5
+        assert policy.compute_delay(1.5) == 3.0  # capped at max_delay
+        assert calls == [(0.5, 0.5), (0.5, 1.5), (0.5, 4.5)]
+
+    def test_retry_after_takes_precedence(self) -> None:
+        """Test server Retry-After overrides the computed delay."""
+        policy = RetryPolicy(base_delay=0.5)
+
+        assert policy.compute_delay(2.0, retry_after=7.0) == 7.0
+
+    def test_next_delay_limits(self) -> None:
+        """Test attempt, Retry-After cap and budget limits."""
+        policy = RetryPolicy(
+            max_retries=2,
+            max_retry_after=30,
+            budget=RetryBudget(ratio=0, min_retries_per_second=0.2, ttl=10),
+        )
+
+        assert policy.next_delay(2) is None
+        assert policy.next_delay(0, retry_after=31) is None
+        assert policy.next_delay(0, retry_after=5) == 5
+        assert policy.next_delay(1) is not None
+        assert policy.next_delay(0) is None  # budget of two retries spent
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("120", 120.0), (" 1.5 ", 1.5), (3, 3.0), ("-4", 0.0)],
+    )
+    def test_parse_retry_after_seconds(self, value: object, expected: float) -> None:
+        """Test delta-seconds Retry-After values."""
+        assert RetryPolicy.parse_retry_after(value) == expected
+
+    def test_parse_retry_after_http_date(self) -> None:
+        """Test HTTP-date Retry-After values."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        header = format_datetime(retry_at, usegmt=True)
+
+        delay = RetryPolicy.parse_retry_after(header)
+
+        assert delay is not None
+        assert 25 <= delay <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon", object(), True])
+    def test_parse_retry_after_invalid(self, value: object) -> None:
+        """Test missing or malformed values are ignored."""
+        assert RetryPolicy.parse_retry_after(value) is None
+
+    def test_invalid_configuration(self) -> None:
+        """Test invalid policy settings are rejected."""
+        with pytest.raises(ConfigurationError):
+            RetryPolicy(max_retries=-1)
+        with pytest.raises(ConfigurationError):
+            RetryPolicy(base_delay=5, max_delay=1)
@@ -45,7 +45,7 @@ class TestReturnRequestCreate:
         assert result.status == "pending"
         mock_http_client.post.assert_called_once_with(
             "/return-request/store",
-            {
+            data={
                 "identifier": 123,
                 "identifier_type": "consignment_id",
                 "reason": "Damaged",
@@ -101,7 +101,7 @@ class TestReturnRequestCreate:
 
         assert result.id == 4
         call_args = mock_http_client.post.call_args
-        assert "reason" not in call_args[0][1]
+        assert "reason" not in call_args[1]["data"]
 
     def test_create_invalid_identifier_type(
         self, return_request_module: ReturnRequestModule
@@ -261,7 +261,26 @@ class TestReturnRequestList:
         assert len(result.data) == 2
         assert result.data[0].id == 1
         assert result.data[1].id == 2
-        mock_http_client.get.assert_called_once_with("/return-request/list")
+        mock_http_client.get.assert_called_once_with(
+            "/return-request/list", params=None
+        )
+
+    def test_list_lazy(
+        self, return_request_module: ReturnRequestModule, mock_http_client: Mock
+    ) -> None:
+        """Test lazy mode decodes fields with the same defaults."""
+        mock_http_client.get.return_value = {
+            "data": [{"id": 1, "consignment_id": 123}, {"id": 2, "status": "done"}]
+        }
+
+        result = return_request_module.list(lazy=True)
+
+        assert [(r.id, r.status, r.reason) for r in result.data] == [
+            (1, "pending", None),
+            (2, "done", None),
+        ]
+        assert result.data[0].consignment_id == 123
+        assert result.data == return_request_module.list().data
 
     def test_list_empty(
         self, return_request_module: ReturnRequestModule, mock_http_client: Mock
@@ -311,3 +330,21 @@ class TestReturnRequestList:
         assert result.data[0].id == 1
         assert result.data[0].status == "pending"
         assert result.data[1].id == 2
+
+    def test_iter_returns(
+        self, return_request_module: ReturnRequestModule, mock_http_client: Mock
+    ) -> None:
+        """Test iter_returns follows next_page_url until it is empty."""
+        pages = {
+            1: {"data": [{"id": 1}], "next_page_url": "https://x/?page=2"},
+            2: {"data": [{"id": 2}], "next_page_url": None},
+        }
+        mock_http_client.get.side_effect = lambda endpoint, params: pages[
+            params["page"]
+        ]
+
+        returns = return_request_module.iter_returns()
+
+        assert [r.id for r in returns] == [1, 2]
+        assert returns.page == 2
+        assert mock_http_client.get.call_count == 2
@@ -1,10 +1,12 @@
 """Tests for Tracking module."""
 
 from typing import Dict, Any
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from steadfast.cache import StatusCache
+from steadfast.http_client import HTTPClient
 from steadfast.modules.tracking import TrackingModule
 from steadfast.models import OrderStatus
 from steadfast.exceptions import ValidationError, APIError, NotFoundError
@@ -235,3 +237,146 @@ class TestTrackingModule:
 
             status = self.tracking_module.get_status_by_consignment_id(123)
             assert status.delivery_status == delivery_status
+
+
+class TestTrackingModuleBulkLookup:
+    """Test TrackingModule.get_statuses and iter_statuses."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+
+        def get(endpoint: str) -> Dict[str, Any]:
+            if endpoint.endswith("/404"):
+                raise NotFoundError("Consignment not found")
+            return {"status": 200, "delivery_status": f"status {endpoint}"}
+
+        self.mock_http_client = Mock()
+        self.mock_http_client.get.side_effect = get
+        self.tracking_module = TrackingModule(self.mock_http_client)
+
+    def test_get_statuses_maps_identifiers_in_input_order(self) -> None:
+        """Test results are keyed by identifier in input order."""
+        ids = [30, 10, 404, 20, 10]
+
+        results = self.tracking_module.get_statuses(ids, concurrency=3)
+
+        assert list(results) == [30, 10, 404, 20]
+        status = results[30]
+        assert isinstance(status, OrderStatus)
+        assert status.delivery_status == "status /status_by_cid/30"
+        assert isinstance(results[404], NotFoundError)
+        assert self.mock_http_client.get.call_count == 4
+
+    @pytest.mark.parametrize(
+        "identifier_type,identifier,endpoint",
+        [
+            ("invoice", "INV-1", "/status_by_invoice/INV-1"),
+            ("tracking_code", " ABC123 ", "/status_by_trackingcode/ABC123"),
+        ],
+    )
+    def test_get_statuses_identifier_types(
+        self, identifier_type: str, identifier: str, endpoint: str
+    ) -> None:
+        """Test each identifier type uses its own endpoint."""
+        results = self.tracking_module.get_statuses([identifier], identifier_type)
+
+        self.mock_http_client.get.assert_called_once_with(endpoint)
+        assert isinstance(results[identifier], OrderStatus)
+
+    def test_invalid_identifier_is_reported_per_item(self) -> None:
+        """Test an invalid identifier fails alone."""
+        results = self.tracking_module.get_statuses([1, -5])
+
+        assert isinstance(results[1], OrderStatus)
+        assert isinstance(results[-5], ValidationError)
+
+    def test_invalid_identifier_type(self) -> None:
+        """Test an unknown identifier type is rejected up front."""
+        with pytest.raises(ValidationError):
+            self.tracking_module.iter_statuses([1], identifier_type="phone")
+
+    def test_iter_statuses_streams_results(self) -> None:
+        """Test results are yielded as lookups complete."""
+        pairs = list(self.tracking_module.iter_statuses(range(1, 6), concurrency=2))
+
+        assert sorted(identifier for identifier, _ in pairs) == [1, 2, 3, 4, 5]
+
+    def test_respects_rate_limiter(self) -> None:
+        """Test every lookup goes through the client's rate limiter."""
+        limiter = Mock()
+        client = HTTPClient("https://example.com", rate_limiter=limiter)
+        response = Mock(ok=True)
+        response.json.return_value = {"status": 200, "delivery_status": "pending"}
+
+        with patch("requests.Session.request", return_value=response):
+            results = TrackingModule(client).get_statuses([1, 2, 3], concurrency=2)
+
+        assert len(results) == 3
+        assert sorted(c.args[0] for c in limiter.acquire.call_args_list) == [
+            "/status_by_cid/1",
+            "/status_by_cid/2",
+            "/status_by_cid/3",
+        ]
+
+
+class TestTrackingModuleCache:
+    """Test TrackingModule with a StatusCache."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.mock_http_client = Mock()
+        self.cache = StatusCache()
+        self.tracking_module = TrackingModule(self.mock_http_client, self.cache)
+
+    def test_terminal_status_served_from_cache(self) -> None:
+        """Test a delivered status is fetched once."""
+        self.mock_http_client.get.return_value = {
+            "status": 200,
+            "delivery_status": "delivered",
+        }
+
+        first = self.tracking_module.get_status_by_consignment_id(1424107)
+        second = self.tracking_module.get_status_by_consignment_id(1424107)
+
+        assert first == second
+        self.mock_http_client.get.assert_called_once_with("/status_by_cid/1424107")
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_keys_by_identifier_type(self) -> None:
+        """Test the same value under different identifier types is separate."""
+        self.mock_http_client.get.return_value = {
+            "status": 200,
+            "delivery_status": "delivered",
+        }
+
+        self.tracking_module.get_status_by_invoice("ABC123")
+        self.tracking_module.get_status_by_tracking_code(" ABC123 ")
+        self.tracking_module.get_status_by_tracking_code("ABC123")
+
+        assert self.mock_http_client.get.call_count == 2
+
+    def test_errors_are_not_cached(self) -> None:
+        """Test failed lookups are retried on the next call."""
+        self.mock_http_client.get.side_effect = [
+            NotFoundError("Consignment not found"),
+            {"status": 200, "delivery_status": "pending"},
+        ]
+
+        with pytest.raises(NotFoundError):
+            self.tracking_module.get_status_by_consignment_id(1)
+        status = self.tracking_module.get_status_by_consignment_id(1)
+
+        assert status.delivery_status == "pending"
+
+    def test_bulk_lookup_uses_cache(self) -> None:
+        """Test get_statuses only fetches uncached identifiers."""
+        self.mock_http_client.get.return_value = {
+            "status": 200,
+            "delivery_status": "cancelled",
+        }
+        self.tracking_module.get_status_by_consignment_id(1)
+
+        results = self.tracking_module.get_statuses([1, 2])
+
+        assert len(results) == 2
+        assert self.mock_http_client.get.call_count == 2
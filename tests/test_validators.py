@@ -1,5 +1,7 @@
 """Tests for input validators."""
 
+from typing import Any, Dict
+
 import pytest
 from steadfast.validators import (
     validate_invoice,
@@ -11,6 +13,7 @@ from steadfast.validators import (
     validate_delivery_type,
     validate_consignment_id,
     validate_identifier_type,
+    validate_order,
 )
 from steadfast.exceptions import ValidationError
 
@@ -178,6 +181,14 @@ class TestValidateCodAmount:
         assert exc_info.value.field == "cod_amount"
         assert "must be numeric" in str(exc_info.value)
 
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), "-inf"])
+    def test_invalid_cod_amount_not_finite(self, value: Any) -> None:
+        """Test NaN and infinite COD amounts raise ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_cod_amount(value)
+        assert exc_info.value.field == "cod_amount"
+        assert "finite" in str(exc_info.value)
+
 
 class TestValidateDeliveryType:
     """Test delivery type validation."""
@@ -230,3 +241,92 @@ class TestValidateIdentifierType:
             validate_identifier_type("invalid")
         assert exc_info.value.field == "identifier_type"
         assert "must be one of" in str(exc_info.value)
+
+
+VALID_ORDER: Dict[str, Any] = {
+    "invoice": "ORD-001",
+    "recipient_name": "  John Doe ",
+    "recipient_phone": "017-1111-1111",
+    "recipient_address": " House 1, Dhaka ",
+    "cod_amount": 100,
+}
+
+
+def validate_fields(order: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate an order with the individual field validators."""
+    required = ("invoice", "recipient_name", "recipient_phone", "recipient_address")
+    if not all(order.get(field) for field in required):
+        raise ValidationError("Missing required fields")
+    if order.get("cod_amount") is None:
+        raise ValidationError("COD amount is required", "cod_amount")
+
+    validated = {
+        "invoice": validate_invoice(str(order["invoice"])),
+        "recipient_name": validate_recipient_name(str(order["recipient_name"])),
+        "recipient_phone": validate_phone(str(order["recipient_phone"])),
+        "recipient_address": validate_address(str(order["recipient_address"])),
+        "cod_amount": validate_cod_amount(order["cod_amount"]),
+        "delivery_type": validate_delivery_type(order.get("delivery_type", 0)),
+    }
+    if order.get("alternative_phone"):
+        validated["alternative_phone"] = validate_phone(order["alternative_phone"])
+    if order.get("recipient_email"):
+        validated["recipient_email"] = validate_email(order["recipient_email"])
+    for field in ("note", "item_description", "total_lot"):
+        if order.get(field) is not None:
+            validated[field] = order[field]
+    return validated
+
+
+class TestValidateOrder:
+    """Test single-pass order validation."""
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {},
+            {"invoice": 12345, "note": "Fragile", "total_lot": 0},
+            {"delivery_type": 1, "recipient_email": "john@example.com"},
+            {"alternative_phone": "01822222222", "item_description": None},
+            {"invoice": ""},
+            {"recipient_phone": None},
+            {"cod_amount": None},
+            {"invoice": "ORD 001"},
+            {"recipient_name": "x" * 101},
+            {"recipient_phone": "0171111111"},
+            {"recipient_address": "x" * 251},
+            {"cod_amount": "abc"},
+            {"cod_amount": -1},
+            {"cod_amount": float("nan")},
+            {"cod_amount": "inf"},
+            {"delivery_type": 2},
+            {"delivery_type": "0"},
+            {"alternative_phone": "123"},
+            {"recipient_email": "not-an-email"},
+            {"invoice": "ORD 001", "cod_amount": -1},
+        ],
+    )
+    def test_matches_field_validators(self, changes: Dict[str, Any]) -> None:
+        """Test results and errors match the individual validators."""
+        order = dict(VALID_ORDER, **changes)
+
+        try:
+            expected = validate_fields(order)
+        except ValidationError as e:
+            with pytest.raises(ValidationError) as exc_info:
+                validate_order(order)
+            assert exc_info.value.message == e.message
+            assert exc_info.value.field == e.field
+        else:
+            assert validate_order(order) == expected
+
+    def test_normalises_fields(self) -> None:
+        """Test whitespace is stripped and phone digits extracted."""
+        assert validate_order(VALID_ORDER) == {
+            "invoice": "ORD-001",
+            "recipient_name": "John Doe",
+            "recipient_phone": "01711111111",
+            "recipient_address": "House 1, Dhaka",
+            "cod_amount": 100.0,
+            "delivery_type": 0,
+        }
@@ -0,0 +1,311 @@
+"""Tests for the adaptive status watcher."""
+
+import asyncio
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from unittest.mock import Mock
+
+import pytest
+
+from steadfast.exceptions import (
+    APIError,
+    ConfigurationError,
+    NotFoundError,
+    ValidationError,
+)
+from steadfast.models import OrderStatus, StatusChange
+from steadfast.modules.tracking import TrackingModule
+from steadfast.watcher import AsyncStatusWatcher, PollingPolicy, StatusWatcher
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTracking:
+    """Tracking stand-in answering from a mutable status table."""
+
+    def __init__(self, statuses: Dict[Any, Any]) -> None:
+        self.statuses = statuses
+        self.polled: List[Any] = []
+
+    def iter_statuses(
+        self, identifiers: Iterable[Any], identifier_type: str, concurrency: int
+    ) -> Iterator[Tuple[Any, Any]]:
+        for identifier in identifiers:
+            self.polled.append(identifier)
+            value = self.statuses[identifier]
+            if isinstance(value, Exception):
+                yield identifier, value
+            else:
+                yield identifier, OrderStatus(status=200, delivery_status=value)
+
+
+def no_jitter_policy(**kwargs: Any) -> PollingPolicy:
+    """Build a deterministic policy."""
+    return PollingPolicy(jitter=0, **kwargs)
+
+
+class TestPollingPolicy:
+    """Test PollingPolicy."""
+
+    @pytest.mark.parametrize(
+        "delivery_status,interval",
+        [
+            ("in_review", 300),
+            ("pending", 900),
+            ("hold", 1800),
+            ("delivered_approval_pending", 600),
+            ("something_new", 900),
+        ],
+    )
+    def test_base_interval_by_status(
+        self, delivery_status: str, interval: float
+    ) -> None:
+        """Test base intervals depend on the status."""
+        assert no_jitter_policy().interval(delivery_status, 0) == interval
+
+    def test_interval_grows_with_age_and_is_capped(self) -> None:
+        """Test long-unchanged orders are polled less often."""
+        policy = no_jitter_policy(age_factor=0.5, max_interval=2000)
+
+        assert policy.interval("pending", 600) == 1200
+        assert policy.interval("pending", 10**6) == 2000
+
+    def test_jitter(self) -> None:
+        """Test jitter spreads intervals using the random source."""
+        policy = PollingPolicy(jitter=0.2, random_func=lambda low, high: high)
+
+        assert policy.interval("pending", 0) == pytest.approx(1080)
+
+    def test_invalid_configuration(self) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(ConfigurationError):
+            PollingPolicy(jitter=1.5)
+
+
+class TestStatusWatcher:
+    """Test StatusWatcher scheduling."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.tracking = FakeTracking({1: "pending", 2: "in_review", 3: "pending"})
+        self.changes: List[StatusChange] = []
+        self.watcher = StatusWatcher(
+            self.tracking,  # type: ignore[arg-type]
+            policy=no_jitter_policy(age_factor=0),
+            on_change=self.changes.append,
+            clock=self.clock,
+        )
+
+    def test_new_watches_are_polled_immediately(self) -> None:
+        """Test orders without a known status are due right away."""
+        for identifier in (1, 2):
+            self.watcher.watch(identifier)
+
+        changes = self.watcher.poll_due()
+
+        assert [(c.identifier, c.previous_status) for c in changes] == [
+            (1, None),
+            (2, None),
+        ]
+        assert changes == self.changes
+        assert self.watcher.next_due() == 300
+
+    def test_polls_in_due_order(self) -> None:
+        """Test orders are polled when their status-based interval elapses."""
+        for identifier in (1, 2, 3):
+            self.watcher.watch(identifier)
+        self.watcher.poll_due()
+        self.tracking.polled.clear()
+
+        self.clock.now = 300
+        assert self.watcher.poll_due() == []
+        assert self.tracking.polled == [2]
+
+        self.clock.now = 900
+        self.watcher.poll_due()
+        assert self.tracking.polled == [2, 2, 1, 3]
+
+    def test_terminal_status_stops_watching(self) -> None:
+        """Test a terminal status is reported once and the order dropped."""
+        self.watcher.watch(1, delivery_status="pending")
+        self.tracking.statuses[1] = "delivered"
+
+        self.clock.now = 900
+        changes = self.watcher.poll_due()
+
+        assert len(changes) == 1
+        assert changes[0].previous_status == "pending"
+        assert changes[0].status.delivery_status == "delivered"
+        assert changes[0].final
+        assert len(self.watcher) == 0
+        assert self.watcher.next_due() is None
+
+    def test_unchanged_status_is_not_reported(self) -> None:
+        """Test polls that see the same status emit nothing."""
+        self.watcher.watch(1, delivery_status="pending")
+
+        self.clock.now = 900
+        assert self.watcher.poll_due() == []
+        assert self.tracking.polled == [1]
+
+    def test_unwatch(self) -> None:
+        """Test unwatched orders are skipped."""
+        self.watcher.watch(1)
+        self.watcher.watch(2)
+        self.watcher.unwatch(1)
+
+        self.watcher.poll_due()
+
+        assert self.tracking.polled == [2]
+
+    def test_errors_are_retried_later(self) -> None:
+        """Test failed polls call on_error and reschedule the order."""
+        errors: List[Any] = []
+        self.watcher.on_error = lambda identifier, error: errors.append(identifier)
+        self.tracking.statuses[1] = APIError("Service unavailable", 503)
+        self.watcher.watch(1)
+
+        assert self.watcher.poll_due() == []
+        assert errors == [1]
+        assert self.watcher.next_due() == 300
+
+    def test_permanent_errors_drop_the_order(self) -> None:
+        """Test an order that cannot be found is reported once and dropped."""
+        errors: List[Any] = []
+        self.watcher.on_error = lambda identifier, error: errors.append(identifier)
+        self.tracking.statuses[1] = NotFoundError("Consignment not found")
+        self.watcher.watch(1)
+        self.watcher.watch(2)
+
+        self.watcher.poll_due()
+
+        assert errors == [1]
+        assert len(self.watcher) == 1
+        self.clock.now = 300
+        self.watcher.poll_due()
+        assert self.tracking.polled == [1, 2, 2]
+
+    def test_unexpected_error_keeps_watches(self) -> None:
+        """Test a round that raises reschedules the orders it took off the queue."""
+        self.watcher.watch(1)
+        self.watcher.watch(2)
+        self.tracking.statuses.clear()  # The lookup raises KeyError
+
+        with pytest.raises(KeyError):
+            self.watcher.poll_due()
+
+        assert len(self.watcher) == 2
+        assert self.watcher.next_due() == 300
+        self.tracking.statuses.update({1: "pending", 2: "pending"})
+        self.clock.now = 300
+        assert len(self.watcher.poll_due()) == 2
+
+    def test_age_slows_polling(self) -> None:
+        """Test intervals grow while the status stays the same."""
+        watcher = StatusWatcher(
+            self.tracking,  # type: ignore[arg-type]
+            policy=no_jitter_policy(age_factor=1.0),
+            clock=self.clock,
+        )
+        watcher.watch(1, delivery_status="pending")
+
+        self.clock.now = 900
+        watcher.poll_due()
+
+        assert watcher.next_due() == 900 + 900
+
+    def test_invalid_identifier_type(self) -> None:
+        """Test unknown identifier types are rejected."""
+        with pytest.raises(ValidationError):
+            self.watcher.watch("x", identifier_type="phone")
+
+    def test_events_until_all_final(self) -> None:
+        """Test the loop yields changes and returns once every order is final."""
+        tracking = FakeTracking({1: "delivered", 2: "cancelled"})
+        watcher = StatusWatcher(tracking)  # type: ignore[arg-type]
+        watcher.watch(1)
+        watcher.watch(2)
+
+        events = list(watcher.events())
+
+        assert [(e.identifier, e.final) for e in events] == [(1, True), (2, True)]
+
+    def test_stop(self) -> None:
+        """Test stop() ends a waiting loop."""
+        watcher = StatusWatcher(self.tracking)  # type: ignore[arg-type]
+        watcher.watch(1, delivery_status="pending")
+
+        thread = threading.Thread(target=watcher.run)
+        thread.start()
+        watcher.stop()
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+
+    def test_stop_before_loop_starts(self) -> None:
+        """Test a stop() issued before the loop starts is not lost."""
+        watcher = StatusWatcher(self.tracking)  # type: ignore[arg-type]
+        watcher.watch(1, delivery_status="pending")
+
+        watcher.stop()
+
+        assert list(watcher.events()) == []
+
+    def test_uses_tracking_module(self) -> None:
+        """Test polls go through TrackingModule.iter_statuses."""
+        http_client = Mock()
+        http_client.get.return_value = {"status": 200, "delivery_status": "delivered"}
+        watcher = StatusWatcher(TrackingModule(http_client))
+        watcher.watch("INV-1", identifier_type="invoice")
+
+        watcher.run()
+
+        http_client.get.assert_called_once_with("/status_by_invoice/INV-1")
+
+
+class TestAsyncStatusWatcher:
+    """Test AsyncStatusWatcher."""
+
+    def test_events_until_all_final(self) -> None:
+        """Test the async loop yields changes until every order is final."""
+        statuses = {1: "pending", 2: "delivered"}
+
+        class AsyncFakeTracking:
+            async def _pairs(self, identifiers: List[Any]) -> Any:
+                for identifier in identifiers:
+                    status = statuses[identifier]
+                    statuses[identifier] = "delivered"
+                    yield identifier, OrderStatus(200, status)
+
+            def iter_statuses(
+                self, identifiers: List[Any], identifier_type: str, concurrency: int
+            ) -> Any:
+                return self._pairs(identifiers)
+
+        watcher = AsyncStatusWatcher(
+            AsyncFakeTracking(),  # type: ignore[arg-type]
+            policy=PollingPolicy(intervals={"pending": 0.01}, jitter=0),
+        )
+        watcher.watch(1)
+        watcher.watch(2)
+
+        async def run() -> List[StatusChange]:
+            return [event async for event in watcher.events()]
+
+        events = asyncio.run(run())
+
+        assert [(e.identifier, e.status.delivery_status) for e in events] == [
+            (1, "pending"),
+            (2, "delivered"),
+            (1, "delivered"),
+        ]
+        assert len(watcher) == 0